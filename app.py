@@ -16,6 +16,7 @@ from flask import Flask
 from config.settings import BASE_DIR, SECRET_KEY, MAX_CONTENT_LENGTH, UPLOAD_FOLDER
 from utils.filters import register_filters
 from routes import main_bp, api_bp
+from services.generator_registry import warm_up_generators
 
 
 def create_app():
@@ -38,6 +39,9 @@ def create_app():
     app.register_blueprint(main_bp)
     app.register_blueprint(api_bp)
     
+    # Generator 모듈/클래스 미리 로드 (요청마다 모듈을 다시 실행하지 않도록)
+    warm_up_generators()
+    
     return app
 
 
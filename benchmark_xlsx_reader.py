@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+집계/분석 시트 디코딩 벤치마크
+
+pd.read_excel(openpyxl) 경로와 services/xlsx_stream_reader 경로의 소요 시간을 비교하고,
+두 결과 DataFrame이 동일한지 확인합니다.
+
+사용법:
+    python benchmark_xlsx_reader.py <분석표.xlsx> [반복횟수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent
+sys.path.append(str(project_root))
+
+from services.workbook_snapshot import is_data_sheet
+from services.xlsx_stream_reader import StreamingExcelFile
+
+
+def _time_call(func, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    excel_path = sys.argv[1]
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    with StreamingExcelFile(excel_path) as stream_xl:
+        sheet_names = [name for name in stream_xl.sheet_names if is_data_sheet(name)]
+        print(f"[벤치마크] 파일: {excel_path}")
+        print(f"[벤치마크] 대상 시트: {len(sheet_names)}개, 반복: {repeat}회 (최솟값 기준)")
+
+        pandas_time, pandas_frames = _time_call(
+            lambda: pd.read_excel(excel_path, sheet_name=sheet_names, header=None),
+            repeat
+        )
+        stream_time, stream_frames = _time_call(
+            lambda: stream_xl.parse(sheet_names, header=None),
+            repeat
+        )
+
+    mismatched = [name for name in sheet_names if not pandas_frames[name].equals(stream_frames[name])]
+
+    print(f"  pd.read_excel      : {pandas_time:8.3f}s")
+    print(f"  xlsx_stream_reader : {stream_time:8.3f}s")
+    if stream_time > 0:
+        print(f"  속도 향상          : {pandas_time / stream_time:8.2f}x")
+    if mismatched:
+        print(f"  ⚠️ 결과 불일치 시트: {mismatched}")
+    else:
+        print(f"  ✅ 모든 시트 결과 동일")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+부문 보도자료 설정의 컴파일된 명세 (ReportSpec)
+
+SECTOR_REPORTS의 dict 설정은 생성기를 만들 때마다 다시 조회/검증되었습니다. 이 모듈은 설정을
+import 시점에 한 번 읽기 전용 __slots__ 객체로 변환합니다.
+
+- 컬럼 인덱스(집계/분석 시트), 분기 컬럼 매핑, 메타 컬럼, name_mapping을 미리 해석
+- 필수 항목(name_mapping, aggregation_structure) 검증은 컴파일 시 한 번만 수행하고,
+  실패 사유(error)는 보관했다가 해당 부문 생성기를 만들 때 ValueError로 알림
+- 매핑 값은 MappingProxyType (수정이 필요하면 호출자가 dict()로 복사)
+- 원본 설정(config)은 중첩 dict/list까지 읽기 전용으로 복사해 보관 (SECTOR_REPORTS를 나중에
+  수정해도 명세와 어긋나지 않고, 생성기끼리 공유하는 설정을 한 생성기가 바꿀 수 없음)
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+
+class _FrozenSlots:
+    """생성 후 속성 변경을 막는 __slots__ 기반 클래스"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__}는 읽기 전용입니다: {name}")
+
+    def _init(self, **values) -> None:
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+
+def freeze_config(value: Any) -> Any:
+    """설정 값 읽기 전용 복사 (dict → MappingProxyType, list/tuple → tuple, set → frozenset, 중첩 포함)"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_config(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_config(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze_config(item) for item in value)
+    return value
+
+
+def _column_index(value: Any, label: str) -> Optional[int]:
+    """0-based 컬럼 인덱스 검증 (None 허용)"""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"컬럼 인덱스가 올바르지 않습니다: {label}={value!r}")
+    return value
+
+
+class ColumnSpec(_FrozenSlots):
+    """한 시트의 기간 컬럼 인덱스 (target/전년/2년 전/3년 전 + 분기 컬럼)"""
+
+    __slots__ = ('target_col', 'prev_y_col', 'prev_prev_y_col', 'prev_prev_prev_y_col', 'quarterly_cols')
+
+    def __init__(self, columns: Optional[Mapping[str, Any]]):
+        columns = columns or {}
+        quarterly = columns.get('quarterly_cols') or {}
+        self._init(
+            target_col=_column_index(columns.get('target_col'), 'target_col'),
+            prev_y_col=_column_index(columns.get('prev_y_col'), 'prev_y_col'),
+            prev_prev_y_col=_column_index(columns.get('prev_prev_y_col'), 'prev_prev_y_col'),
+            prev_prev_prev_y_col=_column_index(columns.get('prev_prev_prev_y_col'), 'prev_prev_prev_y_col'),
+            quarterly_cols=MappingProxyType({
+                key: _column_index(col, f"quarterly_cols[{key}]") for key, col in quarterly.items()
+            }),
+        )
+
+
+class ReportSpec(_FrozenSlots):
+    """부문 보도자료 한 건의 컴파일된 설정 (읽기 전용)"""
+
+    __slots__ = (
+        'id', 'report_id', 'name', 'config', 'error',
+        'name_mapping', 'metadata_cols',
+        'aggregation_sheet', 'aggregation_range', 'header_included', 'header_rows', 'total_code',
+        'region_name_col', 'industry_code_col', 'industry_name_col', 'data_start_row',
+        'aggregation_columns', 'analysis_sheet', 'analysis_columns',
+    )
+
+    def __init__(self, config: Dict[str, Any]):
+        report_id = config.get('report_id', config.get('id'))
+        name = config.get('name', report_id)
+
+        error = None
+        if 'name_mapping' not in config:
+            error = f"[{name}] ❌ 설정에서 'name_mapping'을 찾을 수 없습니다. 기본값 사용 금지."
+        elif 'aggregation_structure' not in config:
+            error = f"[{name}] ❌ 설정에서 'aggregation_structure'를 찾을 수 없습니다. 기본값 사용 금지."
+
+        # metadata_columns는 컬럼 존재 여부 힌트일 뿐, 키워드 탐색에는 기본 키워드 목록을 사용
+        meta = config.get('metadata_columns', {})
+        if isinstance(meta, dict):
+            metadata_cols = dict(meta)
+        elif isinstance(meta, list):
+            metadata_cols = {c: c for c in meta}
+        else:
+            metadata_cols = {}
+
+        agg_struct = config.get('aggregation_structure') or {}
+        header_rows = config.get('header_rows', 1)
+        # aggregation_structure.data_start_row 우선 (0도 유효한 값이므로 is not None 체크)
+        data_start_row = agg_struct.get('data_start_row')
+        if data_start_row is None:
+            data_start_row = config.get('data_start_row', header_rows)
+
+        agg_range = config.get('aggregation_range')
+        try:
+            aggregation_columns = ColumnSpec(config.get('aggregation_columns') or config.get('column_indices'))
+            analysis_columns = ColumnSpec(config.get('analysis_columns') or config.get('analysis_column_indices'))
+            region_name_col = _column_index(agg_struct.get('region_name_col'), 'region_name_col')
+            industry_code_col = _column_index(agg_struct.get('industry_code_col'), 'industry_code_col')
+            industry_name_col = _column_index(
+                config.get('industry_name_col') or agg_struct.get('industry_name_col'), 'industry_name_col'
+            )
+        except ValueError as e:
+            error = error or f"[{name}] ❌ {e}"
+            aggregation_columns = analysis_columns = ColumnSpec(None)
+            region_name_col = industry_code_col = industry_name_col = None
+
+        self._init(
+            id=config.get('id'),
+            report_id=report_id,
+            name=name,
+            config=freeze_config(config),
+            error=error,
+            name_mapping=MappingProxyType(dict(config.get('name_mapping') or {})),
+            metadata_cols=MappingProxyType(metadata_cols),
+            aggregation_sheet=agg_struct.get('sheet'),
+            aggregation_range=MappingProxyType(dict(agg_range)) if isinstance(agg_range, dict) else None,
+            header_included=bool(config.get('header_included')),
+            header_rows=header_rows,
+            total_code=agg_struct.get('total_code'),
+            region_name_col=region_name_col,
+            industry_code_col=industry_code_col,
+            industry_name_col=industry_name_col,
+            data_start_row=data_start_row,
+            aggregation_columns=aggregation_columns,
+            analysis_sheet=config.get('analysis_sheet'),
+            analysis_columns=analysis_columns,
+        )
+
+    def validate(self) -> 'ReportSpec':
+        """필수 설정 누락/오류가 있으면 ValueError"""
+        if self.error:
+            raise ValueError(self.error)
+        return self
+
+    def __repr__(self) -> str:
+        return f"ReportSpec({self.report_id!r}, sheet={self.aggregation_sheet!r})"
+
+
+class ReportSpecIndex:
+    """id/report_id/별칭 → ReportSpec 조회표 (컴파일 시 한 번 구성)"""
+
+    # 일부 호출에서 쓰는 이전 이름
+    ALIASES = {
+        'mining': 'manufacturing',
+    }
+
+    def __init__(self, configs: Iterable[Dict[str, Any]]):
+        self.specs = tuple(ReportSpec(config) for config in configs)
+        lookup: Dict[str, ReportSpec] = {}
+        for spec in self.specs:
+            # 설정 순서상 먼저 나온 항목 우선 (기존 순차 탐색과 동일)
+            for key in (spec.id, spec.config.get('report_id')):
+                if key is not None:
+                    lookup.setdefault(key, spec)
+        self._lookup = MappingProxyType(lookup)
+
+    def get(self, report_type: str) -> ReportSpec:
+        spec = self._lookup.get(self.ALIASES.get(report_type, report_type))
+        if spec is None:
+            raise ValueError(f"Unknown report type: {report_type}")
+        return spec
+
+    def __iter__(self):
+        return iter(self.specs)
+
+
+def compile_report_specs(configs: Iterable[Dict[str, Any]]) -> ReportSpecIndex:
+    """보도자료 설정 목록 → ReportSpecIndex"""
+    return ReportSpecIndex(configs)
@@ -10,6 +10,7 @@ from pathlib import Path
 import csv
 
 from config.table_locations import load_table_locations
+from config.report_specs import ReportSpec, compile_report_specs
 
 
 def _load_export_name_mapping() -> dict[str, str]:
@@ -591,9 +592,59 @@ def _apply_table_locations_to_sector_reports() -> None:
 
 _apply_table_locations_to_sector_reports()
 
+
+def get_report_sheet_dependencies() -> dict[str, list[str]]:
+    """보도자료 ID → 입력 시트 목록 (증분 재생성 시 변경 여부 판단용)
+
+    부문별은 집계/분석 시트, 요약은 해당 부문들의 시트, 시도별·요약 개요는 전체 부문 시트에 의존
+    """
+    summary_sectors: dict[str, list[str]] = {
+        'summary_production': ['manufacturing', 'service'],
+        'summary_consumption': ['consumption', 'construction'],
+        'summary_trade_price': ['export', 'import', 'price'],
+        'summary_employment': ['employment', 'unemployment', 'migration'],
+    }
+    dependencies: dict[str, list[str]] = {}
+    all_sector_sheets: list[str] = []
+    for config in SECTOR_REPORTS:
+        sheets: list[str] = []
+        candidates = [
+            (config.get('aggregation_structure') or {}).get('sheet'),
+            config.get('analysis_sheet'),
+            config.get('sheet'),
+        ]
+        for sheet_name in candidates:
+            if sheet_name and sheet_name not in sheets:
+                sheets.append(sheet_name)
+        dependencies[config['id']] = sheets
+        for sheet_name in sheets:
+            if sheet_name not in all_sector_sheets:
+                all_sector_sheets.append(sheet_name)
+
+    for config in SUMMARY_REPORTS + _ALL_REGIONAL_REPORTS:
+        sector_ids = summary_sectors.get(config['id'])
+        if sector_ids is None:
+            dependencies[config['id']] = list(all_sector_sheets)
+        else:
+            dependencies[config['id']] = [
+                sheet_name for sector_id in sector_ids for sheet_name in dependencies[sector_id]
+            ]
+    return dependencies
+
+
+REPORT_SHEET_DEPENDENCIES = get_report_sheet_dependencies()
+
 # 전체 보도자료 순서 (부문별 → 요약)
 REPORT_ORDER = SECTOR_REPORTS + SUMMARY_REPORTS
 
+# 부문 보도자료 설정의 컴파일된 명세 (import 시 한 번 해석/검증, 생성기가 공유)
+SECTOR_REPORT_SPECS = compile_report_specs(SECTOR_REPORTS)
+
+
+def get_report_spec(report_type: str) -> ReportSpec:
+    """id/report_id/별칭(mining 등)으로 부문 명세 조회 (없으면 ValueError)"""
+    return SECTOR_REPORT_SPECS.get(report_type)
+
 # ===== 통계표 보도자료 목록 =====
 # 주의: 고객사 요청으로 통계표 섹션 전체(통계표, GRDP, 부록)를 생성하지 않기로 결정됨
 # 실무자는 요약, 부문별, 시도별의 표와 나레이션만 사용함
@@ -23,7 +23,9 @@ EXPORT_FOLDER = BASE_DIR / 'exports'  # 한글 불러오기용 HTML 및 이미
 TEMP_DIR = EXPORT_FOLDER / '_temp'
 TEMP_OUTPUT_DIR = TEMP_DIR / 'output'
 TEMP_REGIONAL_OUTPUT_DIR = TEMP_DIR / 'regional_output'
-TEMP_CALCULATED_DIR = TEMP_DIR / 'calculated'
+TEMP_CALCULATED_DIR = TEMP_DIR / 'calculated'  # 업로드 SHA-256 기준 수식 계산 결과 저장소
+TEMP_SIDECAR_DIR = TEMP_DIR / 'sidecar'  # 업로드 SHA-256 기준 디코딩 시트 캐시
+TEMP_BUILD_DIR = TEMP_DIR / 'build'  # 보도자료 입력 해시 기준 생성 결과 저장소 (증분 재생성)
 
 # 폴더 생성
 UPLOAD_FOLDER.mkdir(parents=True, exist_ok=True)
@@ -32,9 +34,33 @@ EXPORT_FOLDER.mkdir(parents=True, exist_ok=True)
 TEMP_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 TEMP_REGIONAL_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 TEMP_CALCULATED_DIR.mkdir(parents=True, exist_ok=True)
+TEMP_SIDECAR_DIR.mkdir(parents=True, exist_ok=True)
+TEMP_BUILD_DIR.mkdir(parents=True, exist_ok=True)
 SCHEMAS_DIR.mkdir(parents=True, exist_ok=True)
 
 # Flask 설정
 SECRET_KEY = 'capstone_secret_key_2025'
 MAX_CONTENT_LENGTH = 50 * 1024 * 1024  # 50MB max
 
+# 사이드카 캐시 설정
+SIDECAR_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # 1GB 초과 시 오래된 항목부터 삭제
+
+# 계산된 워크북 저장소 설정 (services/calculated_store, TEMP_CALCULATED_DIR)
+CALCULATED_STORE_MAX_BYTES = 512 * 1024 * 1024  # 512MB 초과 시 오래 사용되지 않은 항목부터 삭제
+
+# 증분 재생성 결과 저장소 설정 (services/incremental_build, TEMP_BUILD_DIR)
+BUILD_STORE_MAX_BYTES = 256 * 1024 * 1024  # 256MB 초과 시 오래 사용되지 않은 항목부터 삭제
+
+# 시트 디코딩 설정
+USE_STREAMING_XLSX_READER = True  # xlsx는 services/xlsx_stream_reader로 직접 파싱 (실패 시 pandas로 대체)
+SNAPSHOT_DECODE_WORKERS = int(os.environ.get('SNAPSHOT_DECODE_WORKERS', '0'))  # 0이면 CPU 코어 수, 1이면 직렬
+SNAPSHOT_PARALLEL_MIN_BYTES = 5 * 1024 * 1024  # 5MB 미만 파일은 직렬 디코딩
+SNAPSHOT_CACHE_MAX_BYTES = int(os.environ.get('SNAPSHOT_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))  # 워크북 스냅샷 캐시 전체 추정 메모리 상한
+SNAPSHOT_CACHE_MAX_ENTRIES = int(os.environ.get('SNAPSHOT_CACHE_MAX_ENTRIES', '8'))  # 스냅샷을 보관하는 파일 수 상한
+LAZY_WORKBOOK_MAX_BYTES = int(os.environ.get('LAZY_WORKBOOK_MAX_BYTES', str(256 * 1024 * 1024)))  # 워크북 프록시당 디코딩 시트 메모리 상한
+
+# 엑셀 객체 캐시 설정 (services/excel_cache)
+EXCEL_CACHE_MAX_BYTES = int(os.environ.get('EXCEL_CACHE_MAX_BYTES', str(1024 * 1024 * 1024)))  # 캐시 전체 추정 메모리 상한
+EXCEL_CACHE_MAX_ENTRIES = int(os.environ.get('EXCEL_CACHE_MAX_ENTRIES', '16'))  # 열린 파일 핸들 항목 수 상한
+EXCEL_CACHE_TTL_SECONDS = int(os.environ.get('EXCEL_CACHE_TTL_SECONDS', str(60 * 60)))  # 이 시간 동안 사용되지 않은 업로드는 정리
+SECTOR_DATA_CACHE_MAX_ENTRIES = int(os.environ.get('SECTOR_DATA_CACHE_MAX_ENTRIES', '128'))  # 부문별 처리 결과 항목 수 상한 (파일 × 부문)
@@ -16,7 +16,8 @@ from pathlib import Path
 from config.settings import EXPORT_FOLDER
 from config.reports import SECTOR_REPORTS, REGIONAL_REPORTS, SUMMARY_REPORTS
 from services.excel_cache import get_excel_file
-from services.report_generator import generate_report_html, generate_regional_report_html
+from services.report_generator import generate_report_html, generate_regional_reports_html
+from services.summary_data import SummaryDataService
 from utils.excel_utils import extract_year_quarter_from_excel
 
 
@@ -277,21 +278,22 @@ def _generate_pages(excel_path: str, year: int, quarter: int):
             continue
         sector_pages.append({'title': report_name, 'report_id': report_id, 'html': html_content})
 
+    regional_results = generate_regional_reports_html(
+        excel_path,
+        [region.get('name', region.get('id', 'Unknown')) for region in REGIONAL_REPORTS],
+        year=year,
+        quarter=quarter,
+        excel_file=excel_file,
+    )
     for region in REGIONAL_REPORTS:
         region_name = region.get('name', region.get('id', 'Unknown'))
-        html_content, error = generate_regional_report_html(
-            excel_path,
-            region_name,
-            is_reference=False,
-            year=year,
-            quarter=quarter,
-            excel_file=excel_file,
-        )
+        html_content, error = regional_results[region_name]
         if error or html_content is None:
             errors.append({'report_id': region.get('id', 'Unknown'), 'name': f'시도별-{region_name}', 'error': str(error)})
             continue
         regional_pages.append({'title': f'시도별-{region_name}', 'report_id': region.get('id', ''), 'html': html_content})
 
+    summary_service = SummaryDataService(excel_path, year, quarter, excel_file=excel_file)
     for report in SUMMARY_REPORTS:
         report_id = report.get('id')
         report_name = report.get('name', report_id)
@@ -302,6 +304,7 @@ def _generate_pages(excel_path: str, year: int, quarter: int):
             quarter,
             None,
             excel_file=excel_file,
+            summary_service=summary_service,
         )
         if error or html_content is None:
             errors.append({'report_id': report_id, 'name': report_name, 'error': str(error)})
@@ -19,7 +19,7 @@ import pandas as pd
 
 from config.settings import BASE_DIR, TEMPLATES_DIR, TEMP_OUTPUT_DIR, TEMP_REGIONAL_OUTPUT_DIR
 from config.reports import REPORT_ORDER, SECTOR_REPORTS, SUMMARY_REPORTS, REGIONAL_REPORTS
-from services.report_generator import generate_regional_report_html, generate_report_html
+from services.report_generator import generate_regional_reports_html, generate_report_html
 from utils.filters import is_missing, format_value
 from utils.text_utils import get_josa, get_terms, get_comparative_terms
 
@@ -391,17 +391,17 @@ class ReportGenerator:
         # 2) 시도별 보도자료 생성 (부문별 결과를 활용)
         TEMP_REGIONAL_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         output_dir = TEMP_REGIONAL_OUTPUT_DIR
+        regional_results = generate_regional_reports_html(
+            str(self.excel_path),
+            [region.get('name', region.get('id', 'Unknown')) for region in REGIONAL_REPORTS],
+            year=year,
+            quarter=quarter
+        )
         for region in REGIONAL_REPORTS:
             region_name = region.get('name', region.get('id', 'Unknown'))
             region_id = region.get('id', 'Unknown')
             try:
-                html_content, error = generate_regional_report_html(
-                    str(self.excel_path),
-                    region_name,
-                    is_reference=False,
-                    year=year,
-                    quarter=quarter
-                )
+                html_content, error = regional_results[region_name]
                 if error:
                     results['errors'].append({
                         'report_id': region_id,
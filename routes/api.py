@@ -96,11 +96,17 @@ from utils.excel_utils import extract_year_quarter_from_excel
 from services.report_generator import (
     generate_report_html,
     generate_regional_report_html,
+    generate_regional_reports_html,
     generate_statistics_report_html,
     generate_individual_statistics_html
 )
-from services.excel_processor import preprocess_excel, check_available_methods, get_recommended_method
-from services.excel_cache import set_cached_calculated_path
+from services.excel_processor import preprocess_excel_in_memory, register_calculated_values, check_available_methods, get_recommended_method
+from services.workbook_snapshot import get_workbook_snapshot, seed_workbook_snapshot
+from services.summary_data import SummaryDataService
+from services.sidecar_cache import compute_file_sha256, load_sidecar, save_sidecar
+from services.incremental_build import IncrementalBuild
+from services.sheet_reads import track_sheet_reads
+from services.workbook_sniffer import close_workbook_sniffer
 # from data_converter import DataConverter  # 레거시 모듈 - 더 이상 사용하지 않음
 import openpyxl
 
@@ -263,6 +269,9 @@ def cleanup_temp_artifacts(excel_path: str | None = None) -> None:
     try:
         import shutil
         from services.excel_cache import clear_excel_cache
+        from services.formula_overlay import clear_formula_overlay_cache
+        from services.sector_dataset import clear_sector_datasets
+        from services.workbook_snapshot import clear_snapshot_cache
 
         # 임시 파일 삭제 로직 비활성화
         # for temp_dir in (TEMP_OUTPUT_DIR, TEMP_REGIONAL_OUTPUT_DIR, TEMP_CALCULATED_DIR):
@@ -281,8 +290,11 @@ def cleanup_temp_artifacts(excel_path: str | None = None) -> None:
 
         # 캐시에서 계산 경로 제거만 수행 (파일 삭제는 안함)
         if excel_path:
-            # clear_excel_cache는 이미 services/excel_cache.py에서 비활성화됨
+            # 사용 중인 작업이 있으면 핸들은 그 작업이 끝날 때 닫힘
             clear_excel_cache(excel_path, preserve_calculated_path=False)
+            clear_sector_datasets(excel_path)
+            clear_snapshot_cache(excel_path)
+            clear_formula_overlay_cache(excel_path)
     except Exception as e:
         print(f"[경고] 임시 파일 정리 중 오류: {e}")
 
@@ -418,18 +430,38 @@ def upload_excel():
         print(f"[업로드] 분석표 업로드: {filename}")
         print(f"{'='*50}")
         
-        # 수식 계산 전처리 (분석 시트의 수식을 계산)
-        print(f"[전처리] 엑셀 수식 계산 시작...")
-        processed_path, preprocess_success, preprocess_msg = preprocess_excel(str(filepath))
-        
-        if preprocess_success:
-            print(f"[전처리] 성공: {preprocess_msg}")
-            # 전처리된 파일 경로 사용
-            filepath = Path(processed_path)
-            # 전처리된 결과를 전역 캐시에 등록 (분석 시트 재계산 방지)
-            set_cached_calculated_path(str(filepath), str(filepath))
+        # 동일 파일 재업로드 확인 (SHA-256 사이드카 캐시)
+        file_digest = None
+        sidecar = None
+        try:
+            file_digest = compute_file_sha256(str(filepath))
+            sidecar = load_sidecar(file_digest)
+        except Exception as e:
+            print(f"[사이드카] 캐시 확인 실패 (전처리 진행): {e}")
+        
+        if sidecar:
+            # 디코딩된 집계/계산된 분석 시트를 그대로 복원 (전처리/파싱 생략)
+            print(f"[사이드카] 캐시 적중: {file_digest[:12]} - 전처리 및 시트 파싱 생략")
+            seed_workbook_snapshot(str(filepath), sidecar['sheet_names'], sidecar['frames'])
+            # 계산값 출처 등록 (스냅샷이 캐시에서 밀려나 다시 만들어져도 같은 계산값 사용)
+            register_calculated_values(str(filepath))
         else:
-            print(f"[전처리] {preprocess_msg} - generator fallback 로직 사용")
+            # 수식 계산 전처리 (분석 시트의 수식을 메모리에서 계산하여 스냅샷에 반영, 파일 저장 없음)
+            print(f"[전처리] 엑셀 수식 계산 시작...")
+            preprocess_success, preprocess_msg = preprocess_excel_in_memory(str(filepath))
+            
+            if preprocess_success:
+                print(f"[전처리] 성공: {preprocess_msg}")
+            else:
+                print(f"[전처리] {preprocess_msg} - generator fallback 로직 사용")
+                # 계산되지 않은 분석 시트는 사이드카에 저장하지 않음
+                file_digest = None
+            
+            # 워크북 스냅샷 생성: 집계/분석 시트를 한 번만 디코딩하여 이후 모든 생성 단계가 공유
+            try:
+                get_workbook_snapshot(str(filepath)).preload()
+            except Exception as e:
+                print(f"[업로드] 워크북 스냅샷 사전 로드 실패 (시트별 지연 로드로 진행): {e}")
         
         # 연도/분기 추출 (선택적 - 실패해도 계속 진행, 실제 데이터 처리 시 추출)
         year, quarter = None, None
@@ -440,6 +472,21 @@ def upload_excel():
             # 연도/분기 추출 실패해도 계속 진행 (보도자료 생성 시 데이터에서 추출)
             print(f"[업로드] 연도/분기 추출 실패 (계속 진행): {str(e)}")
             print(f"[업로드] 보도자료 생성 시 데이터에서 연도/분기를 추출합니다.")
+        finally:
+            # 유형/연도 확인에 사용한 zip 핸들 해제 (업로드 폴더 정리 시 파일 잠금 방지)
+            close_workbook_sniffer(str(filepath))
+        
+        # 디코딩된 시트를 사이드카 캐시에 저장 (다음 동일 파일 업로드 시 재사용)
+        if not sidecar and file_digest:
+            try:
+                snapshot = get_workbook_snapshot(str(filepath))
+                save_sidecar(
+                    file_digest,
+                    snapshot.sheet_names,
+                    snapshot.get_decoded_frames()
+                )
+            except Exception as e:
+                print(f"[사이드카] 캐시 저장 실패 (계속 진행): {e}")
         
         # 세션에 저장 (파일 수정 시간 포함)
         session['excel_path'] = str(filepath)
@@ -671,7 +718,7 @@ def _generate_all_reports_core(year, quarter, cleanup_after=True, excel_path=Non
         cleanup_after: 작업 후 정리 여부
         excel_path: 엑셀 파일 경로 (백그라운드 스레드에서는 직접 전달, 일반 요청에서는 세션에서 가져옴)
     """
-    from services.excel_cache import get_excel_file, clear_excel_cache
+    from services.excel_cache import get_excel_file, clear_excel_cache, acquire_excel_file, release_excel_file
 
     # excel_path가 전달되지 않으면 세션에서 가져옴 (동기 모드일 때)
     if excel_path is None:
@@ -711,17 +758,44 @@ def _generate_all_reports_core(year, quarter, cleanup_after=True, excel_path=Non
             'cleanup': cleanup_after
         }
 
+    # 이전 생성 결과 중 입력 시트가 바뀌지 않은 보도자료는 재사용
+    incremental = None
+    try:
+        incremental = IncrementalBuild(excel_path, year, quarter)
+    except Exception as e:
+        print(f"[증분 생성] 초기화 실패, 전체 재생성: {e}")
+
+    # 생성 중에는 이 파일의 캐시 핸들이 제거/닫히지 않도록 보호
+    acquire_excel_file(excel_path)
     try:
         for report_config in SECTOR_REPORTS:
             try:
                 report_name = report_config.get('name', report_config.get('id', 'Unknown'))
                 report_id = report_config.get('id', 'Unknown')
 
+                report_name_safe = report_config.get('name', 'unknown')
+                if not report_name_safe or not isinstance(report_name_safe, str):
+                    report_name_safe = 'unknown'
+                report_name_safe = report_name_safe.replace('/', '_').replace('\\', '_').replace('..', '_')
+                output_path = TEMP_OUTPUT_DIR / f"{report_name_safe}_output.html"
+
+                report_digest = None
+                if incremental is not None:
+                    report_digest = incremental.report_digest(
+                        report_id, report_config.get('template'), report_config.get('generator')
+                    )
+                    reused_path = incremental.try_reuse(report_id, report_digest, output_path)
+                    if reused_path:
+                        print(f"[보도자료 생성] 변경 없음, 이전 결과 재사용: {report_name} → {reused_path}")
+                        generated_reports.append({'report_id': report_id, 'name': report_name, 'path': reused_path})
+                        continue
+
                 print(f"[보도자료 생성] 시작: {report_name} ({report_id})")
 
-                html_content, error, _ = generate_report_html(
-                    excel_path, report_config, year, quarter, None, excel_file=excel_file
-                )
+                with track_sheet_reads() as sheet_reads:
+                    html_content, error, _ = generate_report_html(
+                        excel_path, report_config, year, quarter, None, excel_file=excel_file
+                    )
 
                 if error:
                     import traceback
@@ -735,17 +809,13 @@ def _generate_all_reports_core(year, quarter, cleanup_after=True, excel_path=Non
                     errors.append({'report_id': report_id, 'report_name': report_name, 'error': 'HTML 내용이 None입니다'})
                 else:
                     try:
-                        report_name_safe = report_config.get('name', 'unknown')
-                        if not report_name_safe or not isinstance(report_name_safe, str):
-                            report_name_safe = 'unknown'
-                        report_name_safe = report_name_safe.replace('/', '_').replace('\\', '_').replace('..', '_')
-                        TEMP_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-                        output_path = TEMP_OUTPUT_DIR / f"{report_name_safe}_output.html"
                         output_path.parent.mkdir(parents=True, exist_ok=True)
                         with open(output_path, 'w', encoding='utf-8') as f:
                             f.write(html_content if html_content else '<!-- Empty content -->')
                         print(f"[보도자료 생성] 성공: {report_name} → {output_path}")
                         generated_reports.append({'report_id': report_id, 'name': report_name, 'path': str(output_path)})
+                        if incremental is not None:
+                            incremental.record(report_id, report_digest, str(output_path), sheet_reads)
                     except Exception as write_error:
                         import traceback
                         error_msg = f"{report_name} 파일 저장 실패: {str(write_error)}"
@@ -764,18 +834,49 @@ def _generate_all_reports_core(year, quarter, cleanup_after=True, excel_path=Non
         TEMP_REGIONAL_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         output_dir = TEMP_REGIONAL_OUTPUT_DIR
 
+        # 변경 없는 지역은 이전 결과 재사용, 나머지는 한 번에 생성 (RegionalReportGenerator 공유)
+        pending_regions = []
         for region_config in REGIONAL_REPORTS:
+            region_name = region_config.get('name', region_config.get('id', 'Unknown'))
+            region_id = region_config.get('id', 'Unknown')
+            region_name_safe = region_name.replace('/', '_').replace('\\', '_').replace('..', '_')
+            region_output_path = output_dir / f"{region_name_safe}_output.html"
+            region_digest = None
+            if incremental is not None:
+                region_digest = incremental.report_digest(
+                    region_id, 'regional_economy_by_region_template.html', 'unified_generator.py'
+                )
+                reused_path = incremental.try_reuse(region_id, region_digest, region_output_path)
+                if reused_path:
+                    print(f"[시도별 보도자료 생성] 변경 없음, 이전 결과 재사용: {region_name} → {reused_path}")
+                    generated_reports.append({'report_id': region_id, 'name': f'시도별-{region_name}', 'path': reused_path})
+                    continue
+            pending_regions.append((region_config, region_digest))
+
+        regional_results = {}
+        regional_sheet_reads = set()
+        if pending_regions:
+            pending_names = [config.get('name', config.get('id', 'Unknown')) for config, _ in pending_regions]
+            print(f"[시도별 보도자료 생성] 시작: {', '.join(pending_names)}")
+            # 한 번에 생성하므로 지역별로 나눌 수 없는 읽기 기록은 모든 지역에 공통으로 저장
+            with track_sheet_reads() as regional_sheet_reads:
+                regional_results = generate_regional_reports_html(
+                    excel_path,
+                    pending_names,
+                    year=year,
+                    quarter=quarter,
+                    excel_file=excel_file
+                )
+
+        for region_config, region_digest in pending_regions:
             try:
                 region_name = region_config.get('name', region_config.get('id', 'Unknown'))
                 region_id = region_config.get('id', 'Unknown')
-                print(f"[시도별 보도자료 생성] 시작: {region_name} ({region_id})")
-                html_content, error = generate_regional_report_html(excel_path, region_name, is_reference=False, year=year, quarter=quarter, excel_file=excel_file)
+                html_content, error = regional_results.get(region_name, (None, '생성 결과가 없습니다'))
 
                 if error:
-                    import traceback
                     error_msg = f"{region_name} 생성 실패: {error}"
                     print(f"[ERROR] {error_msg}")
-                    traceback.print_exc()
                     errors.append({'report_id': region_id, 'report_name': f'시도별-{region_name}', 'error': str(error)})
                 elif html_content is None:
                     error_msg = f"{region_name} 생성 실패: HTML 내용이 None입니다"
@@ -790,6 +891,8 @@ def _generate_all_reports_core(year, quarter, cleanup_after=True, excel_path=Non
                             f.write(html_content if html_content else '<!-- Empty content -->')
                         print(f"[시도별 보도자료 생성] 성공: {region_name} → {output_path}")
                         generated_reports.append({'report_id': region_id, 'name': f'시도별-{region_name}', 'path': str(output_path)})
+                        if incremental is not None:
+                            incremental.record(region_id, region_digest, str(output_path), regional_sheet_reads)
                     except Exception as write_error:
                         import traceback
                         error_msg = f"{region_name} 파일 저장 실패: {str(write_error)}"
@@ -805,16 +908,39 @@ def _generate_all_reports_core(year, quarter, cleanup_after=True, excel_path=Non
                 continue
 
         print(f"[보도자료 생성] 요약 보도자료 생성 시작...")
+        # 요약 보도자료들이 공유하는 데이터 서비스 (차트/페이지 데이터는 한 번만 계산)
+        summary_service = None
         for report_config in SUMMARY_REPORTS:
             try:
                 report_name = report_config.get('name', report_config.get('id', 'Unknown'))
                 report_id = report_config.get('id', 'Unknown')
 
+                report_name_safe = report_config.get('name', 'unknown')
+                if not report_name_safe or not isinstance(report_name_safe, str):
+                    report_name_safe = 'unknown'
+                report_name_safe = report_name_safe.replace('/', '_').replace('\\', '_').replace('..', '_')
+                output_path = TEMP_OUTPUT_DIR / f"{report_name_safe}_output.html"
+
+                report_digest = None
+                if incremental is not None:
+                    report_digest = incremental.report_digest(
+                        report_id, report_config.get('template'), report_config.get('generator')
+                    )
+                    reused_path = incremental.try_reuse(report_id, report_digest, output_path)
+                    if reused_path:
+                        print(f"[보도자료 생성] 변경 없음, 이전 결과 재사용: {report_name} → {reused_path}")
+                        generated_reports.append({'report_id': report_id, 'name': report_name, 'path': reused_path})
+                        continue
+
                 print(f"[보도자료 생성] 시작: {report_name} ({report_id})")
 
-                html_content, error, _ = generate_report_html(
-                    excel_path, report_config, year, quarter, None, excel_file=excel_file
-                )
+                with track_sheet_reads() as sheet_reads:
+                    if summary_service is None:
+                        summary_service = SummaryDataService(excel_path, year, quarter, excel_file=excel_file)
+                    html_content, error, _ = generate_report_html(
+                        excel_path, report_config, year, quarter, None,
+                        excel_file=excel_file, summary_service=summary_service
+                    )
 
                 if error:
                     import traceback
@@ -828,17 +954,13 @@ def _generate_all_reports_core(year, quarter, cleanup_after=True, excel_path=Non
                     errors.append({'report_id': report_id, 'report_name': report_name, 'error': 'HTML 내용이 None입니다'})
                 else:
                     try:
-                        report_name_safe = report_config.get('name', 'unknown')
-                        if not report_name_safe or not isinstance(report_name_safe, str):
-                            report_name_safe = 'unknown'
-                        report_name_safe = report_name_safe.replace('/', '_').replace('\\', '_').replace('..', '_')
-                        TEMP_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-                        output_path = TEMP_OUTPUT_DIR / f"{report_name_safe}_output.html"
                         output_path.parent.mkdir(parents=True, exist_ok=True)
                         with open(output_path, 'w', encoding='utf-8') as f:
                             f.write(html_content if html_content else '<!-- Empty content -->')
                         print(f"[보도자료 생성] 성공: {report_name} → {output_path}")
                         generated_reports.append({'report_id': report_id, 'name': report_name, 'path': str(output_path)})
+                        if incremental is not None:
+                            incremental.record(report_id, report_digest, str(output_path), sheet_reads)
                     except Exception as write_error:
                         import traceback
                         error_msg = f"{report_name} 파일 저장 실패: {str(write_error)}"
@@ -853,6 +975,8 @@ def _generate_all_reports_core(year, quarter, cleanup_after=True, excel_path=Non
                 errors.append({'report_id': report_config.get('id', 'Unknown'), 'report_name': report_config.get('name', report_config.get('id', 'Unknown')), 'error': f"예외 발생: {error_message}"})
                 continue
     finally:
+        release_excel_file(excel_path)
+
         try:
             expected_count = len(SECTOR_REPORTS) + len(REGIONAL_REPORTS) + len(SUMMARY_REPORTS)
             result_missing = len(errors) > 0 or len(generated_reports) < expected_count
@@ -6,10 +6,12 @@
 from .report_generator import (
     generate_report_html,
     generate_regional_report_html,
+    generate_regional_reports_html,
     generate_statistics_report_html,
     generate_individual_statistics_html
 )
 from .summary_data import (
+    SummaryDataService,
     get_summary_overview_data,
     get_summary_table_data,
     get_production_summary_data,
@@ -21,8 +23,10 @@ from .summary_data import (
 __all__ = [
     'generate_report_html',
     'generate_regional_report_html',
+    'generate_regional_reports_html',
     'generate_statistics_report_html',
     'generate_individual_statistics_html',
+    'SummaryDataService',
     'get_summary_overview_data',
     'get_summary_table_data',
     'get_production_summary_data',
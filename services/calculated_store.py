@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+계산된 워크북 저장소 (파일 내용 해시 키)
+
+업로드 파일명에는 UUID가 붙으므로 경로+mtime 키로는 같은 분석표를 다시 올려도 수식을 다시
+계산하게 되고, 다른 워커 프로세스와도 결과를 공유할 수 없습니다. 이 저장소는 분석 시트의
+수식 계산 결과(formula_overlay)를 파일 SHA-256 키로 TEMP_CALCULATED_DIR 아래에 저장하여,
+같은 내용의 파일을 처리하는 모든 프로세스가 재사용하도록 합니다.
+
+- 항목: {sha256}.calc.pkl (분석 시트 값 배열, 계산된 셀, 수식 수)
+- 저장/인덱스/파일 잠금/용량 제한(CALCULATED_STORE_MAX_BYTES, LRU)은 content_store.ContentStore 사용
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from config.settings import TEMP_CALCULATED_DIR, CALCULATED_STORE_MAX_BYTES
+
+from .content_store import ContentStore
+
+
+# 수식 평가 방식/저장 형식이 바뀌면 올려서 기존 항목을 무효화
+CALCULATED_FORMAT_VERSION = 1
+CALCULATED_SUFFIX = '.calc.pkl'
+
+
+class CalculatedWorkbookStore:
+    """SHA-256 키 기반 수식 계산 결과 디스크 저장소 (Thread-safe, 프로세스 간 공유)"""
+
+    def __init__(self, store_dir: Path, max_bytes: int):
+        self._store = ContentStore(store_dir, CALCULATED_SUFFIX, max_bytes, label='계산 저장소')
+
+    @property
+    def store_dir(self) -> Path:
+        return self._store.store_dir
+
+    @property
+    def max_bytes(self) -> int:
+        return self._store.max_bytes
+
+    def load(self, file_digest: str) -> Optional[Dict[str, Any]]:
+        """
+        계산 결과 로드
+
+        Returns:
+            {'values': {시트명: ndarray}, 'resolved_cells': {시트명: {(행, 열): 값}}, 'formula_count': int}
+            또는 None (없거나 버전 불일치)
+        """
+        payload = self._store.load(file_digest, CALCULATED_FORMAT_VERSION)
+        if payload is None:
+            return None
+        for grid in payload['values'].values():
+            grid.flags.writeable = False
+        return payload
+
+    def save(
+        self,
+        file_digest: str,
+        values: Dict[str, np.ndarray],
+        resolved_cells: Dict[str, Dict[Tuple[int, int], Any]],
+        formula_count: int
+    ) -> Optional[Path]:
+        """계산 결과 저장 (원자적 기록 후 용량 정리)"""
+        payload = {
+            'version': CALCULATED_FORMAT_VERSION,
+            'sha256': file_digest,
+            'values': dict(values),
+            'resolved_cells': dict(resolved_cells),
+            'formula_count': formula_count,
+        }
+        meta = {
+            'resolved_count': sum(len(cells) for cells in resolved_cells.values()),
+            'formula_count': formula_count,
+        }
+        return self._store.save(file_digest, payload, meta=meta)
+
+    def get_store_info(self) -> Dict[str, Any]:
+        return self._store.get_info()
+
+
+# 전역 계산 저장소 인스턴스
+_calculated_store = CalculatedWorkbookStore(TEMP_CALCULATED_DIR, CALCULATED_STORE_MAX_BYTES)
+
+
+def load_calculated(file_digest: str) -> Optional[Dict[str, Any]]:
+    """전역 저장소에서 수식 계산 결과 로드"""
+    return _calculated_store.load(file_digest)
+
+
+def save_calculated(
+    file_digest: str,
+    values: Dict[str, np.ndarray],
+    resolved_cells: Dict[str, Dict[Tuple[int, int], Any]],
+    formula_count: int
+) -> Optional[Path]:
+    """전역 저장소에 수식 계산 결과 저장"""
+    return _calculated_store.save(file_digest, values, resolved_cells, formula_count)
+
+
+def get_calculated_store_info() -> Dict[str, Any]:
+    """계산 저장소 정보 반환"""
+    return _calculated_store.get_store_info()
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+내용 해시 키 디스크 저장소 (공용)
+
+사이드카 캐시(디코딩된 시트)와 계산 저장소(수식 계산 결과)가 함께 쓰는 저장 방식입니다.
+항목은 파일 SHA-256 등 내용 해시를 키로 한 pickle 파일이며, 여러 워커 프로세스가 같은
+디렉터리를 공유합니다.
+
+- 항목: {키}{suffix} (payload['version']이 기대 버전과 다르면 폐기)
+- 인덱스: _index.json (항목별 크기/최근 사용 시각/메타, 없거나 손상되면 디렉터리에서 재구성)
+- 기록: 임시 파일에 쓴 뒤 os.replace로 교체 (항목/인덱스 모두 원자적)
+- 잠금: 인덱스 읽기-수정-쓰기와 항목 삭제는 _index.lock 파일 잠금으로 프로세스 간 직렬화
+- 용량 제한: max_bytes 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+"""
+
+import json
+import os
+import pickle
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+INDEX_FILENAME = '_index.json'
+LOCK_FILENAME = '_index.lock'
+
+
+@contextmanager
+def file_lock(lock_path: Path) -> Iterator[None]:
+    """프로세스 간 배타 잠금 (POSIX: flock, Windows: msvcrt.locking)"""
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체 (다른 프로세스는 이전 또는 새 내용만 보게 됨)"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class ContentStore:
+    """내용 해시 키 pickle 항목 저장소 (Thread-safe, 프로세스 간 공유)"""
+
+    def __init__(self, store_dir: Path, suffix: str, max_bytes: int, label: str):
+        """
+        Args:
+            store_dir: 항목/인덱스를 둘 디렉터리
+            suffix: 항목 파일 확장자 (예: '.sidecar.pkl')
+            max_bytes: 전체 항목 용량 제한
+            label: 로그 태그 (예: '사이드카')
+        """
+        self.store_dir = Path(store_dir)
+        self.suffix = suffix
+        self.max_bytes = max_bytes
+        self.label = label
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self) -> Path:
+        return self.store_dir / INDEX_FILENAME
+
+    def entry_path(self, key: str) -> Path:
+        return self.store_dir / f"{key}{self.suffix}"
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """같은 프로세스의 스레드와 다른 프로세스를 모두 배제"""
+        with self._lock:
+            with file_lock(self.store_dir / LOCK_FILENAME):
+                yield
+
+    # ----- 인덱스 (잠금 보유 상태에서 호출) -----
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """인덱스 읽기 (다른 프로세스가 추가/삭제한 항목과 맞추기 위해 디렉터리 기준으로 보정)"""
+        index: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[{self.label}] 인덱스 손상, 재구성: {e}")
+
+        synced = {}
+        for path in self.store_dir.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            key = path.name[:-len(self.suffix)]
+            entry = index.get(key, {})
+            synced[key] = {
+                'bytes': stat.st_size,
+                'last_access': entry.get('last_access', stat.st_mtime),
+                'meta': entry.get('meta', {}),
+            }
+        return synced
+
+    def _write_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            data = json.dumps(index, ensure_ascii=False, indent=1).encode('utf-8')
+            atomic_write(self.index_path, data)
+        except Exception as e:
+            print(f"[{self.label}] 인덱스 저장 실패 (무시): {e}")
+
+    def _evict(self, index: Dict[str, Dict[str, Any]], keep: str) -> None:
+        """용량 제한 초과 시 가장 오래 사용되지 않은 항목부터 삭제 (방금 저장한 항목은 보존)"""
+        total_bytes = sum(entry['bytes'] for entry in index.values())
+        if total_bytes <= self.max_bytes:
+            return
+
+        for key, entry in sorted(index.items(), key=lambda item: item[1]['last_access']):
+            if total_bytes <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self.entry_path(key).unlink(missing_ok=True)
+            total_bytes -= entry['bytes']
+            del index[key]
+            print(f"[{self.label}] 용량 초과로 항목 삭제: {key[:12]}")
+
+    # ----- 조회/저장 -----
+
+    def load(self, key: str, version: Any) -> Optional[Dict[str, Any]]:
+        """
+        항목 로드 (최근 사용 시각 갱신)
+
+        Returns:
+            저장된 payload 또는 None (없거나 손상/버전 불일치)
+        """
+        entry_path = self.entry_path(key)
+        if not entry_path.exists():
+            return None
+
+        # 항목 파일은 원자적으로 교체되므로 잠금 없이 읽고, 폐기/인덱스 갱신만 잠금 안에서 수행
+        try:
+            with open(entry_path, 'rb') as f:
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[{self.label}] 항목 로드 실패, 삭제: {entry_path.name} ({e})")
+            payload = None
+
+        with self._locked():
+            if payload is None or payload.get('version') != version:
+                if payload is not None:
+                    print(f"[{self.label}] 버전 불일치로 항목 폐기: {entry_path.name}")
+                entry_path.unlink(missing_ok=True)
+                return None
+
+            index = self._read_index()
+            if key in index:
+                index[key]['last_access'] = time.time()
+                self._write_index(index)
+        return payload
+
+    def save(self, key: str, payload: Dict[str, Any], meta: Optional[Dict[str, Any]] = None) -> Optional[Path]:
+        """항목 저장 (원자적 기록 후 용량 정리)"""
+        entry_path = self.entry_path(key)
+        try:
+            data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"[{self.label}] 항목 직렬화 실패: {entry_path.name} ({e})")
+            return None
+
+        with self._locked():
+            try:
+                atomic_write(entry_path, data)
+            except Exception as e:
+                print(f"[{self.label}] 항목 저장 실패: {entry_path.name} ({e})")
+                return None
+
+            index = self._read_index()
+            if key in index:
+                index[key]['last_access'] = time.time()
+                index[key]['meta'] = dict(meta or {})
+            self._evict(index, keep=key)
+            self._write_index(index)
+        return entry_path
+
+    def get_info(self) -> Dict[str, Any]:
+        with self._locked():
+            index = self._read_index()
+        return {
+            'cached_files': len(index),
+            'total_bytes': sum(entry['bytes'] for entry in index.values()),
+            'max_bytes': self.max_bytes,
+        }
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+기여도 순위 엔진 (ContributionRanking)
+
+업종 기여도 순위(BaseGenerator.rank_by_contribution)와 수출/수입 품목 정렬은 지역·부문마다
+dict 리스트를 돌며 기여도를 계산하고 sorted()로 다시 정렬했습니다. 이 모듈은 지역 × 품목
+가중치/증감률 행렬을 받아 기여도와 비중을 한 번에 계산하고, 행별 순위 위치 배열을 반환합니다.
+
+- 기여도 = |증감률 × 가중치|, 비중 = 행(지역) 기여도 합계 대비 비율 (합계 0이면 0)
+- 순위: 기여도 내림차순, 같은 값은 원래 순서 유지 (sorted(..., reverse=True)와 같은 안정 정렬)
+- 지역별 품목 수가 달라 비는 칸(NaN)은 순위에서 제외
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+def pack_rows(rows: Sequence[Sequence[Optional[float]]]) -> np.ndarray:
+    """길이가 다른 행 목록 → (행 수 × 최대 길이) float64 행렬 (None/빈 칸 = NaN)"""
+    width = max((len(row) for row in rows), default=0)
+    matrix = np.full((len(rows), width), np.nan, dtype=np.float64)
+    for i, row in enumerate(rows):
+        if len(row):
+            matrix[i, :len(row)] = [np.nan if value is None else value for value in row]
+    return matrix
+
+
+def rank_descending(scores: np.ndarray, top_n: Optional[int] = None) -> List[np.ndarray]:
+    """
+    행별 점수 내림차순 위치 배열 (같은 점수는 열 순서 유지, NaN 제외)
+
+    Args:
+        scores: (행 × 열) 점수 행렬 (1차원이면 한 행으로 취급)
+        top_n: 행별 상위 개수 (None이면 전체)
+    """
+    scores = np.atleast_2d(np.asarray(scores, dtype=np.float64))
+    # NaN은 안정 정렬에서 맨 뒤로 가므로 행별 유효 개수만큼 앞에서 자름
+    order = np.argsort(-scores, axis=1, kind='stable')
+    counts = np.count_nonzero(~np.isnan(scores), axis=1)
+    if top_n is not None:
+        counts = np.minimum(counts, max(top_n, 0))
+    return [order[i, :count] for i, count in enumerate(counts.tolist())]
+
+
+class ContributionRanking:
+    """지역 × 품목 기여도/비중과 행별 순위 (계산 후 읽기 전용)"""
+
+    __slots__ = ('contributions', 'shares', 'order')
+
+    def __init__(self, growth: np.ndarray, weight: np.ndarray, top_n: Optional[int] = None):
+        """
+        Args:
+            growth: (지역 × 품목) 증감률 행렬
+            weight: growth와 같은 모양의 가중치 행렬
+            top_n: 지역별 순위 개수 (None이면 전체)
+        """
+        growth = np.atleast_2d(np.asarray(growth, dtype=np.float64))
+        weight = np.atleast_2d(np.asarray(weight, dtype=np.float64))
+        if growth.shape != weight.shape:
+            raise ValueError(f"증감률/가중치 행렬 모양이 다릅니다: {growth.shape} != {weight.shape}")
+
+        with np.errstate(invalid='ignore', over='ignore'):
+            contributions = np.abs(growth * weight)
+            totals = np.nansum(contributions, axis=1, keepdims=True)
+            shares = np.zeros_like(contributions)
+            np.divide(contributions, totals, out=shares, where=(totals > 0) & ~np.isnan(contributions))
+
+        for array in (contributions, shares):
+            array.flags.writeable = False
+        self.contributions = contributions
+        self.shares = shares
+        self.order = rank_descending(contributions, top_n)
+
+    def has_nan(self, row: int, length: int) -> bool:
+        """행의 앞 length칸에 계산 불가(NaN) 기여도가 있는지 (inf × 0 등)"""
+        return bool(np.isnan(self.contributions[row, :length]).any())
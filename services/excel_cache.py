@@ -3,59 +3,188 @@
 엑셀 파일 캐싱 서비스
 
 동일한 엑셀 파일을 여러 Generator가 읽을 때마다 다시 열지 않도록,
-엑셀 객체(ExcelFile, Workbook)를 한 번만 로드하고 재사용합니다.
+엑셀 객체(LazyWorkbook, Workbook)를 한 번만 로드하고 재사용합니다.
+LazyWorkbook은 시트를 처음 접근할 때만 디코딩하고 메모리 상한 내에서 보관합니다.
+
+캐시는 추정 메모리(디코딩된 시트 + 파일 크기) 기준 LRU로 상한을 유지하고,
+오래 사용되지 않은 업로드(TTL 초과)는 정리합니다. 생성 작업이 사용 중인 파일은
+lease(참조 카운트)로 보호하여, 제거되더라도 마지막 사용이 끝난 뒤에 닫습니다.
 """
 
-import pandas as pd
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, List, Set
 import threading
+import time
 from datetime import datetime
 
+from config.settings import (
+    EXCEL_CACHE_MAX_BYTES, EXCEL_CACHE_MAX_ENTRIES, EXCEL_CACHE_TTL_SECONDS, SECTOR_DATA_CACHE_MAX_ENTRIES
+)
+from .lazy_workbook import LazyWorkbook
+
+
+def _close_entry(entry: Dict[str, Any]) -> None:
+    """캐시 항목의 파일 핸들 닫기 (LazyWorkbook / openpyxl Workbook)"""
+    try:
+        if 'xl' in entry:
+            entry['xl'].close()
+        if 'wb' in entry:
+            entry['wb'].close()
+    except Exception as e:
+        print(f"[ExcelCache] 핸들 닫기 실패 (무시): {e}")
+
 
 class ExcelCache:
-    """엑셀 파일 캐싱 클래스 (Thread-safe)"""
+    """엑셀 파일 캐싱 클래스 (Thread-safe, 메모리 상한 LRU + TTL)"""
     
-    def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(
+        self,
+        max_bytes: int = EXCEL_CACHE_MAX_BYTES,
+        max_entries: int = EXCEL_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = EXCEL_CACHE_TTL_SECONDS
+    ):
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # 파일별 사용 중인 작업 수, 사용 중에 제거된 항목 (마지막 release 때 닫음)
+        self._leases: Dict[str, int] = {}
+        self._retired: Dict[str, List[Dict[str, Any]]] = {}
+        self.evictions = 0
+        # 같은 파일의 디코딩 데이터를 따로 보관하는 캐시(스냅샷 등)의 정리 함수
+        self._companion_evictors: List[Callable[[Optional[str]], None]] = []
     
-    def get_excel_file(self, excel_path: str, use_data_only: bool = True) -> Optional[pd.ExcelFile]:
+    def register_companion(self, evict: Callable[[Optional[str]], None]) -> None:
         """
-        엑셀 파일을 캐시에서 가져오거나 새로 로드
+        파일 항목이 제거될 때 함께 정리할 캐시 등록
+
+        evict(excel_path)는 ExcelCache lock을 보유한 상태에서 호출되므로 ExcelCache를 다시 호출하면 안 됩니다.
+        excel_path가 None이면 전체 정리입니다.
+        """
+        with self._lock:
+            if evict not in self._companion_evictors:
+                self._companion_evictors.append(evict)
+    
+    def _evict_companions(self, excel_path: Optional[str]) -> None:
+        for evict in self._companion_evictors:
+            try:
+                evict(excel_path)
+            except Exception as e:
+                print(f"[ExcelCache] 연관 캐시 정리 실패 (무시): {e}")
+    
+    @staticmethod
+    def _entry_bytes(entry: Dict[str, Any]) -> int:
+        """항목의 추정 메모리 (파일 핸들 항목만: 파일 크기 + 디코딩된 시트)"""
+        size = entry.get('file_bytes', 0)
+        if 'xl' in entry:
+            size += entry['xl'].resident_bytes
+        return size
+    
+    def _new_entry(self, excel_path: str, **values) -> Dict[str, Any]:
+        path = Path(excel_path)
+        stat = path.stat()
+        entry = {
+            'excel_path': str(excel_path),
+            'mtime': stat.st_mtime,
+            'timestamp': datetime.now(),
+            'last_access': time.monotonic(),
+            **values
+        }
+        if 'xl' in values or 'wb' in values:
+            entry['file_bytes'] = stat.st_size
+        return entry
+    
+    def _get_entry(self, cache_key: str, excel_path: str) -> Optional[Dict[str, Any]]:
+        """유효한 캐시 항목 조회 (파일이 수정되었거나 없으면 제거 후 None)"""
+        cache_entry = self._cache.get(cache_key)
+        if cache_entry is None:
+            return None
+        try:
+            file_mtime = Path(excel_path).stat().st_mtime
+        except OSError:
+            file_mtime = None
+        if cache_entry['mtime'] != file_mtime:
+            # 파일이 수정되었으면 캐시 무효화 (사용 중이면 작업 종료 후 닫음)
+            self._discard(cache_key)
+            return None
+        cache_entry['last_access'] = time.monotonic()
+        self._cache.move_to_end(cache_key)
+        return cache_entry
+    
+    def _discard(self, cache_key: str) -> None:
+        """항목 제거 (사용 중인 파일이면 닫기를 release 시점으로 미룸)"""
+        entry = self._cache.pop(cache_key, None)
+        if entry is None:
+            return
+        excel_path = entry['excel_path']
+        if self._leases.get(excel_path, 0) > 0:
+            self._retired.setdefault(excel_path, []).append(entry)
+        else:
+            _close_entry(entry)
+        if 'xl' in entry:
+            # 디코딩 시트를 보관하던 항목이 빠지면 같은 파일의 스냅샷 등도 정리
+            self._evict_companions(excel_path)
+    
+    def _enforce_limits(self, keep: Optional[str] = None) -> None:
+        """
+        TTL 초과 항목 정리 후, 항목 수/메모리 상한을 넘으면 오래 사용되지 않은 항목부터 제거
+
+        Args:
+            keep: 방금 반환할 항목 키 (상한을 넘어도 제거하지 않음)
+        """
+        now = time.monotonic()
+        for cache_key, entry in list(self._cache.items()):
+            if cache_key == keep or self._leases.get(entry['excel_path'], 0) > 0:
+                continue
+            if now - entry['last_access'] > self.ttl_seconds:
+                self._discard(cache_key)
+                self.evictions += 1
+        
+        handle_keys = [key for key, entry in self._cache.items() if 'xl' in entry or 'wb' in entry]
+        total_bytes = sum(self._entry_bytes(self._cache[key]) for key in handle_keys)
+        remaining = len(handle_keys)
+        for cache_key in handle_keys:
+            if total_bytes <= self.max_bytes and remaining <= self.max_entries:
+                break
+            entry = self._cache[cache_key]
+            if cache_key == keep or self._leases.get(entry['excel_path'], 0) > 0:
+                continue
+            total_bytes -= self._entry_bytes(entry)
+            remaining -= 1
+            self._discard(cache_key)
+            self.evictions += 1
+            print(f"[ExcelCache] 상한 초과로 캐시 해제: {entry['excel_path']}")
+    
+    def get_excel_file(self, excel_path: str, use_data_only: bool = True) -> Optional[LazyWorkbook]:
+        """
+        지연 로딩 워크북 프록시를 캐시에서 가져오거나 새로 생성 (시트는 접근 시에만 디코딩)
         
         Args:
             excel_path: 엑셀 파일 경로
             use_data_only: data_only=True로 읽을지 여부 (기본값: True, 계산된 값 읽기)
         
         Returns:
-            ExcelFile 객체 또는 None
+            LazyWorkbook 객체 (pd.ExcelFile 호환) 또는 None
         """
         cache_key = f"{excel_path}:data_only={use_data_only}"
         
         with self._lock:
-            # 캐시 확인
-            if cache_key in self._cache:
-                cache_entry = self._cache[cache_key]
-                file_mtime = Path(excel_path).stat().st_mtime
-                
-                # 파일이 수정되지 않았으면 캐시된 객체 반환
-                if cache_entry['mtime'] == file_mtime:
-                    return cache_entry['xl']
-                else:
-                    # 파일이 수정되었으면 캐시 무효화
-                    del self._cache[cache_key]
+            # 캐시 확인 (파일이 수정되지 않았으면 캐시된 객체 반환)
+            cache_entry = self._get_entry(cache_key, excel_path)
+            if cache_entry is not None:
+                return cache_entry['xl']
             
             # 캐시에 없거나 무효화된 경우 새로 로드
             try:
-                xl = pd.ExcelFile(excel_path)
+                xl = LazyWorkbook(excel_path)
+                xl.sheet_names  # 워크북 구조만 확인 (시트 파싱 없음)
                 
                 # 캐시에 저장
-                self._cache[cache_key] = {
-                    'xl': xl,
-                    'mtime': Path(excel_path).stat().st_mtime,
-                    'timestamp': datetime.now()
-                }
+                self._cache[cache_key] = self._new_entry(excel_path, xl=xl)
+                self._enforce_limits(keep=cache_key)
                 
                 return xl
             except Exception as e:
@@ -66,6 +195,9 @@ class ExcelCache:
         """
         openpyxl Workbook을 캐시에서 가져오거나 새로 로드
         
+        파일에 저장된 값만 읽으므로, 메모리에서 계산한 분석 시트 수식 값(formula_overlay)은
+        포함되지 않습니다. 계산값이 필요하면 formula_overlay.get_calculated_snapshot을 사용하세요.
+        
         Args:
             excel_path: 엑셀 파일 경로
             data_only: data_only 옵션 (기본값: True)
@@ -81,28 +213,18 @@ class ExcelCache:
         cache_key = f"{excel_path}:openpyxl:data_only={data_only}"
         
         with self._lock:
-            # 캐시 확인
-            if cache_key in self._cache:
-                cache_entry = self._cache[cache_key]
-                file_mtime = Path(excel_path).stat().st_mtime
-                
-                # 파일이 수정되지 않았으면 캐시된 객체 반환
-                if cache_entry['mtime'] == file_mtime:
-                    return cache_entry['wb']
-                else:
-                    # 파일이 수정되었으면 캐시 무효화
-                    del self._cache[cache_key]
+            # 캐시 확인 (파일이 수정되지 않았으면 캐시된 객체 반환)
+            cache_entry = self._get_entry(cache_key, excel_path)
+            if cache_entry is not None:
+                return cache_entry['wb']
             
             # 캐시에 없거나 무효화된 경우 새로 로드
             try:
                 wb = openpyxl.load_workbook(excel_path, data_only=data_only, read_only=True)
                 
                 # 캐시에 저장
-                self._cache[cache_key] = {
-                    'wb': wb,
-                    'mtime': Path(excel_path).stat().st_mtime,
-                    'timestamp': datetime.now()
-                }
+                self._cache[cache_key] = self._new_entry(excel_path, wb=wb)
+                self._enforce_limits(keep=cache_key)
                 
                 return wb
             except Exception as e:
@@ -116,20 +238,11 @@ class ExcelCache:
         cache_key = f"{excel_path}:calculated_path"
 
         with self._lock:
-            cache_entry = self._cache.get(cache_key)
+            cache_entry = self._get_entry(cache_key, excel_path)
             if not cache_entry:
                 return None
 
-            try:
-                file_mtime = Path(excel_path).stat().st_mtime
-            except OSError:
-                del self._cache[cache_key]
-                return None
-
             calculated_path = cache_entry.get('calculated_path')
-            if cache_entry.get('mtime') != file_mtime:
-                del self._cache[cache_key]
-                return None
             if not calculated_path or not Path(calculated_path).exists():
                 del self._cache[cache_key]
                 return None
@@ -143,71 +256,97 @@ class ExcelCache:
         cache_key = f"{excel_path}:calculated_path"
 
         try:
-            file_mtime = Path(excel_path).stat().st_mtime
+            entry = self._new_entry(excel_path, calculated_path=calculated_path)
         except OSError:
             return
 
         with self._lock:
-            self._cache[cache_key] = {
-                'calculated_path': calculated_path,
-                'mtime': file_mtime,
-                'timestamp': datetime.now()
-            }
+            self._cache[cache_key] = entry
+            self._enforce_limits(keep=cache_key)
+    
+    def acquire(self, excel_path: str) -> None:
+        """작업 시작: 이 파일의 캐시 항목을 제거/닫기 대상에서 보호"""
+        with self._lock:
+            excel_path = str(excel_path)
+            self._leases[excel_path] = self._leases.get(excel_path, 0) + 1
+    
+    def release(self, excel_path: str) -> None:
+        """작업 종료: 마지막 사용이 끝나면 사용 중에 제거된 항목을 닫음"""
+        with self._lock:
+            excel_path = str(excel_path)
+            count = self._leases.get(excel_path, 0) - 1
+            if count > 0:
+                self._leases[excel_path] = count
+                return
+            self._leases.pop(excel_path, None)
+            for entry in self._retired.pop(excel_path, []):
+                _close_entry(entry)
+            self._enforce_limits()
+    
+    def get_leased_paths(self) -> Set[str]:
+        """현재 생성 작업이 사용 중인 파일 경로"""
+        with self._lock:
+            return set(self._leases)
+    
+    @contextmanager
+    def lease(self, excel_path: str):
+        """with 블록 동안 파일의 캐시 항목 보호"""
+        self.acquire(excel_path)
+        try:
+            yield
+        finally:
+            self.release(excel_path)
     
     def clear_cache(self, excel_path: Optional[str] = None, preserve_calculated_path: bool = False):
         """
-        캐시 정리 (비활성화됨)
+        캐시 정리
+        
+        사용 중(lease)인 파일의 핸들은 캐시에서만 제거하고, 작업이 끝날 때 닫습니다.
         
-        안전성을 위해 캐시 정리를 수행하지 않습니다.
+        Args:
+            excel_path: 정리할 파일 경로 (None이면 전체)
+            preserve_calculated_path: 계산된 파일 경로 항목은 유지할지 여부
         """
         with self._lock:
-            # 캐시 정리 로직 비활성화
-            # 메모리 누수보다 안정성을 우선시함
-            pass
-            
-            # if excel_path:
-            #     # 특정 파일의 모든 캐시 항목 제거
-            #     keys_to_remove = [k for k in self._cache.keys() if k.startswith(excel_path)]
-            #     if preserve_calculated_path:
-            #         keys_to_remove = [k for k in keys_to_remove if not k.endswith(':calculated_path')]
-            #     for key in keys_to_remove:
-            #         try:
-            #             # openpyxl Workbook은 명시적으로 닫아야 함
-            #             entry = self._cache[key]
-            #             if 'wb' in entry:
-            #                 entry['wb'].close()
-            #         except:
-            #             pass
-            #         del self._cache[key]
-            # else:
-            #     # 전체 캐시 정리
-            #     for entry in self._cache.values():
-            #         try:
-            #             if 'wb' in entry:
-            #                 entry['wb'].close()
-            #         except:
-            #             pass
-            #     self._cache.clear()
+            keys_to_remove = [
+                key for key, entry in self._cache.items()
+                if excel_path is None or entry['excel_path'] == str(excel_path)
+            ]
+            if preserve_calculated_path:
+                keys_to_remove = [k for k in keys_to_remove if not k.endswith(':calculated_path')]
+            for key in keys_to_remove:
+                self._discard(key)
+            self._evict_companions(str(excel_path) if excel_path else None)
     
     def get_cache_info(self) -> Dict[str, Any]:
         """캐시 정보 반환"""
         with self._lock:
             return {
                 'cache_size': len(self._cache),
-                'cached_files': list(set(k.split(':')[0] for k in self._cache.keys()))
+                'cached_files': list(set(entry['excel_path'] for entry in self._cache.values())),
+                'resident_bytes': sum(
+                    entry['xl'].resident_bytes for entry in self._cache.values() if 'xl' in entry
+                ),
+                'estimated_bytes': sum(self._entry_bytes(entry) for entry in self._cache.values()),
+                'max_bytes': self.max_bytes,
+                'leased_files': dict(self._leases),
+                'retired_entries': sum(len(entries) for entries in self._retired.values()),
+                'evictions': self.evictions
             }
 
 
 class SectorDataCache:
-    """부문별 처리 결과 캐싱 (Thread-safe, 메모리 전용)"""
+    """부문별 처리 결과 캐싱 (Thread-safe, 메모리 전용, 항목 수 기준 LRU)"""
 
-    def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, max_entries: int = SECTOR_DATA_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # (경로, 연도, 분기, report_id) → {'data', 'mtime', 'timestamp'}
+        self._cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
         self._lock = threading.Lock()
 
     @staticmethod
-    def _build_key(excel_path: str, year: Optional[int], quarter: Optional[int], report_id: str) -> str:
-        return f"{excel_path}:y={year}:q={quarter}:report={report_id}"
+    def _build_key(excel_path: str, year: Optional[int], quarter: Optional[int], report_id: str) -> tuple:
+        return (str(excel_path), year, quarter, report_id)
 
     def get_sector_data(self, excel_path: str, year: Optional[int], quarter: Optional[int], report_id: str) -> Optional[Dict[str, Any]]:
         if not report_id:
@@ -229,6 +368,7 @@ class SectorDataCache:
                 del self._cache[cache_key]
                 return None
 
+            self._cache.move_to_end(cache_key)
             return cache_entry.get('data')
 
     def set_sector_data(
@@ -254,23 +394,26 @@ class SectorDataCache:
                 'mtime': file_mtime,
                 'timestamp': datetime.now()
             }
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
 
     def clear_cache(self, excel_path: Optional[str] = None) -> None:
-        """캐시 정리 (비활성화됨)"""
-        pass
-        # with self._lock:
-        #     if excel_path:
-        #         keys_to_remove = [k for k in self._cache.keys() if k.startswith(excel_path)]
-        #         for key in keys_to_remove:
-        #             del self._cache[key]
-        #     else:
-        #         self._cache.clear()
+        """캐시 정리 (경로 지정 시 해당 파일의 항목만)"""
+        with self._lock:
+            if excel_path is None:
+                self._cache.clear()
+                return
+            path_key = str(excel_path)
+            for key in [k for k in self._cache if k[0] == path_key]:
+                del self._cache[key]
 
     def get_cache_info(self) -> Dict[str, Any]:
         with self._lock:
             return {
                 'cache_size': len(self._cache),
-                'cached_files': list(set(k.split(':')[0] for k in self._cache.keys()))
+                'max_entries': self.max_entries,
+                'cached_files': list(set(key[0] for key in self._cache))
             }
 
 
@@ -279,8 +422,8 @@ _excel_cache = ExcelCache()
 _sector_data_cache = SectorDataCache()
 
 
-def get_excel_file(excel_path: str, use_data_only: bool = True) -> Optional[pd.ExcelFile]:
-    """전역 캐시에서 ExcelFile 가져오기"""
+def get_excel_file(excel_path: str, use_data_only: bool = True) -> Optional[LazyWorkbook]:
+    """전역 캐시에서 지연 로딩 워크북 프록시 가져오기"""
     return _excel_cache.get_excel_file(excel_path, use_data_only)
 
 
@@ -299,10 +442,41 @@ def set_cached_calculated_path(excel_path: str, calculated_path: str):
     _excel_cache.set_calculated_path(excel_path, calculated_path)
 
 
+def acquire_excel_file(excel_path: str) -> None:
+    """생성 작업 시작 - 파일의 캐시 항목(열린 핸들)을 제거/닫기로부터 보호"""
+    _excel_cache.acquire(excel_path)
+
+
+def release_excel_file(excel_path: str) -> None:
+    """생성 작업 종료 - acquire_excel_file과 짝을 맞춰 호출"""
+    _excel_cache.release(excel_path)
+
+
+def excel_file_lease(excel_path: str):
+    """with 블록 동안 파일의 캐시 항목 보호 (acquire/release 컨텍스트)"""
+    return _excel_cache.lease(excel_path)
+
+
+def get_leased_paths() -> Set[str]:
+    """생성 작업이 사용 중인 파일 경로 (연관 캐시의 상한 정리에서 제외할 대상)"""
+    return _excel_cache.get_leased_paths()
+
+
+def register_companion_cache(evict: Callable[[Optional[str]], None]) -> None:
+    """전역 캐시가 파일 항목을 제거할 때 함께 정리할 캐시 등록"""
+    _excel_cache.register_companion(evict)
+
+
 def clear_excel_cache(excel_path: Optional[str] = None, preserve_calculated_path: bool = False):
-    """전역 캐시 정리"""
+    """
+    전역 캐시 정리
+
+    preserve_calculated_path=True(일괄 생성 후 핸들만 정리)이면 부문별 처리 결과도 남겨
+    이후 개별 보도자료 요청에서 재사용합니다.
+    """
     _excel_cache.clear_cache(excel_path, preserve_calculated_path)
-    _sector_data_cache.clear_cache(excel_path)
+    if not preserve_calculated_path:
+        _sector_data_cache.clear_cache(excel_path)
 
 
 def get_cache_info() -> Dict[str, Any]:
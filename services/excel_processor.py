@@ -3,6 +3,8 @@
 Excel 파일 전처리 서비스
 
 업로드된 엑셀 파일의 수식을 계산하여 분석 시트의 값을 채웁니다.
+업로드/생성 과정은 preprocess_excel_in_memory(파일 저장 없음)를 사용하고,
+preprocess_excel은 계산된 xlsx 파일이 명시적으로 필요할 때만 사용합니다.
 """
 
 import os
@@ -209,109 +211,39 @@ def _try_openpyxl_data_only(excel_path: str, output_path: str) -> Tuple[str, boo
 
 def _try_openpyxl_calculation(excel_path: str, output_path: str) -> Tuple[str, bool, str]:
     """
-    openpyxl을 사용하여 시트 간 참조 수식 계산 (백엔드 직접 계산)
+    시트 간 참조 수식을 계산하여 xlsx로 저장 (명시적으로 계산된 파일이 필요한 경우에만 사용)
     
-    분석 시트의 수식이 집계 시트를 참조하는 경우:
-    ='시트이름'!셀주소 형태의 간단한 참조를 백엔드에서 직접 계산하여 매핑
-    
-    주의: 이 방법은 data_only=True로 읽을 수 없는 경우에만 사용됩니다.
-    대부분의 경우 _try_openpyxl_data_only가 더 빠르고 효율적입니다.
+    수식 해석은 메모리 내 오버레이(services.formula_overlay)와 같은 결과를 사용하며,
+    이 함수는 그 결과를 파일에 기록하는 역할만 합니다.
+    생성 과정에서는 파일을 저장하지 않고 get_calculated_snapshot()을 사용합니다.
     """
     try:
         import openpyxl
-        import re
+        from .formula_overlay import get_formula_overlay
         
         print(f"[openpyxl] 백엔드 직접 계산 시작 (시트 간 참조 매핑)...")
         
-        # 분석 시트 → 집계 시트 매핑
-        analysis_aggregate_mapping = {
-            'A 분석': 'A(광공업생산)집계',
-            'B 분석': 'B(서비스업생산)집계',
-            'C 분석': 'C(소비)집계',
-            'D(고용률)분석': 'D(고용률)집계',
-            'D(실업)분석': 'D(실업)집계',
-            'E(지출목적물가) 분석': 'E(지출목적물가)집계',
-            'E(품목성질물가)분석': 'E(품목성질물가)집계',
-            "F'분석": "F'(건설)집계",
-            'G 분석': 'G(수출)집계',
-            'H 분석': 'H(수입)집계',
-        }
+        overlay = get_formula_overlay(excel_path)
+        calculated_count = overlay.resolved_count
+        if calculated_count == 0:
+            return excel_path, False, "계산할 수식 없음"
         
         # 원본 파일 복사 (원본 보존)
         if excel_path != output_path:
             shutil.copy2(excel_path, output_path)
         
-        # 수식 포함 모드로 열기
+        # 수식 포함 모드로 열어 해석된 셀만 값으로 대체
         wb = openpyxl.load_workbook(output_path, data_only=False)
-        
-        # 집계 시트 데이터 캐싱 (값 모드로 읽기)
-        wb_data = openpyxl.load_workbook(output_path, data_only=True, read_only=True)
-        aggregate_cache = {}
-        
-        # 필요한 집계 시트만 미리 캐싱
-        required_aggregate_sheets = set(analysis_aggregate_mapping.values())
-        for aggregate_sheet in required_aggregate_sheets:
-            if aggregate_sheet in wb_data.sheetnames:
-                ws_agg = wb_data[aggregate_sheet]
-                sheet_data = {}
-                # 값이 있는 셀만 저장 (성능 최적화)
-                for row in ws_agg.iter_rows(min_row=1, max_row=min(ws_agg.max_row, 1000), values_only=False):
-                    for cell in row:
-                        if cell.value is not None:
-                            sheet_data[(cell.row, cell.column)] = cell.value
-                aggregate_cache[aggregate_sheet] = sheet_data
-        
-        wb_data.close()
-        
-        # 분석 시트의 수식을 값으로 대체
-        calculated_count = 0
-        formula_count = 0
-        
-        # 열 문자를 숫자로 변환
-        def col_letter_to_number(col_letter: str) -> int:
-            col = 0
-            for i, c in enumerate(reversed(col_letter)):
-                col += (ord(c) - ord('A') + 1) * (26 ** i)
-            return col
-        
-        for analysis_sheet, aggregate_sheet in analysis_aggregate_mapping.items():
-            if analysis_sheet not in wb.sheetnames or aggregate_sheet not in aggregate_cache:
-                continue
-            
-            ws_analysis = wb[analysis_sheet]
-            agg_data = aggregate_cache[aggregate_sheet]
-            
-            # 수식이 있는 셀만 처리
-            for row in ws_analysis.iter_rows(min_row=1, max_row=min(ws_analysis.max_row, 1000)):
-                for cell in row:
-                    if cell.value is None:
-                        continue
-                    
-                    val = str(cell.value)
-                    if val.startswith('='):
-                        formula_count += 1
-                        # 집계 시트 참조 파싱: ='시트이름'!셀주소
-                        match = re.match(r"^='?([^'!]+)'?!([A-Z]+)(\d+)$", val)
-                        if match:
-                            ref_sheet = match.group(1)
-                            ref_col_letter = match.group(2)
-                            ref_row = int(match.group(3))
-                            ref_col = col_letter_to_number(ref_col_letter)
-                            
-                            if ref_sheet in aggregate_cache:
-                                ref_value = aggregate_cache[ref_sheet].get((ref_row, ref_col))
-                                if ref_value is not None:
-                                    cell.value = ref_value
-                                    calculated_count += 1
+        for sheet_name, cells in overlay.resolved_cells.items():
+            ws = wb[sheet_name]
+            for (row_idx, col_idx), value in cells.items():
+                ws.cell(row=row_idx + 1, column=col_idx + 1).value = value
         
         wb.save(output_path)
         wb.close()
         
-        if calculated_count > 0:
-            print(f"[openpyxl] 백엔드 직접 계산 완료: {calculated_count}개 셀")
-            return output_path, True, f"백엔드 직접 계산 완료 ({calculated_count}개 수식)"
-        else:
-            return excel_path, False, "계산할 수식 없음"
+        print(f"[openpyxl] 백엔드 직접 계산 완료: {calculated_count}개 셀")
+        return output_path, True, f"백엔드 직접 계산 완료 ({calculated_count}개 수식)"
         
     except ImportError:
         return excel_path, False, "openpyxl 미설치"
@@ -320,6 +252,81 @@ def _try_openpyxl_calculation(excel_path: str, output_path: str) -> Tuple[str, b
         return excel_path, False, f"openpyxl 계산 오류: {str(e)}"
 
 
+def _has_cached_values(excel_path: str) -> bool:
+    """
+    수식 계산값이 이미 저장된 파일인지 확인 (처음 3개 시트의 첫 10행/10열만 읽음)
+    
+    _try_openpyxl_data_only와 같은 기준이지만 워크북 전체를 로드하지 않습니다.
+    """
+    import math
+    from .workbook_sniffer import get_workbook_sniffer
+    
+    sniffer = get_workbook_sniffer(excel_path)
+    for sheet_name in sniffer.sheet_names[:3]:
+        for value in sniffer.read_cells(sheet_name, (0, 10, 0, 10)).values():
+            if isinstance(value, str) or (isinstance(value, float) and math.isnan(value)):
+                continue
+            return True
+    return False
+
+
+def register_calculated_values(excel_path: str, has_cached_values: Optional[bool] = None) -> None:
+    """
+    분석 시트 계산값의 출처 등록 (전처리 또는 사이드카 복원 후 호출)
+
+    - 파일 자체에 계산값이 저장되어 있으면 원본 경로를 계산된 경로로 등록
+    - 아니면 수식 오버레이 사용 파일로 등록 (원본 스냅샷/LazyWorkbook이 계산값을 반환)
+    """
+    from .excel_cache import set_cached_calculated_path
+    from .formula_overlay import register_formula_overlay
+
+    if has_cached_values is None:
+        try:
+            has_cached_values = _has_cached_values(excel_path)
+        except Exception as e:
+            print(f"[전처리] 계산값 확인 실패, 수식 오버레이 사용: {e}")
+            has_cached_values = False
+    if has_cached_values:
+        set_cached_calculated_path(excel_path, excel_path)
+    else:
+        register_formula_overlay(excel_path)
+
+
+def preprocess_excel_in_memory(excel_path: str) -> Tuple[bool, str]:
+    """
+    업로드 파일 전처리 (파일 복사/저장 없음)
+    
+    1. 계산값이 이미 저장된 파일이면 그대로 사용
+    2. 아니면 분석 시트 수식을 메모리에서 해석하여 워크북 스냅샷에 반영
+    
+    Returns:
+        Tuple[bool, str]: (성공 여부, 메시지) - 성공 시 원본 경로의 스냅샷이 계산값을 가짐
+    """
+    from .formula_overlay import get_calculated_snapshot, get_formula_overlay
+    
+    try:
+        if _has_cached_values(excel_path):
+            print(f"[전처리] 수식 계산값이 저장된 파일 - 그대로 사용")
+            register_calculated_values(excel_path, has_cached_values=True)
+            return True, "저장된 계산값 사용"
+    except Exception as e:
+        print(f"[전처리] 계산값 확인 실패, 메모리 내 계산 시도: {e}")
+    
+    try:
+        overlay = get_formula_overlay(excel_path)
+    except Exception as e:
+        print(f"[수식 오버레이] 오류: {e}")
+        return False, f"수식 계산 실패 - fallback 모드 ({e})"
+    
+    if overlay.resolved_count == 0:
+        return False, "수식 계산 실패 - fallback 모드"
+    
+    # 원본 스냅샷(및 이후 다시 만들어지는 스냅샷, LazyWorkbook)이 계산값을 쓰도록 등록 후 반영
+    register_calculated_values(excel_path, has_cached_values=False)
+    get_calculated_snapshot(excel_path)
+    return True, f"메모리 내 수식 계산 완료 ({overlay.resolved_count}개 수식)"
+
+
 def check_available_methods() -> dict:
     """사용 가능한 수식 계산 방법 확인"""
     methods = {
@@ -0,0 +1,641 @@
+# -*- coding: utf-8 -*-
+"""
+분석 시트 수식 평가기 (의존성 그래프 + NumPy 일괄 평가)
+
+분석 시트의 수식을 한 번씩 파싱하여 의존성 그래프를 만들고, 위상 정렬한 단계(level)별로
+같은 형태(상대 참조 기준)의 수식을 묶어 NumPy 배열 연산으로 한꺼번에 계산합니다.
+
+지원 범위
+- 셀/범위 참조 (다른 시트, $ 절대 참조 포함)
+- 사칙연산, 거듭제곱(^), 단항 +/-, 백분율(%), 비교 연산(=, <>, <, >, <=, >=)
+- 함수: SUM, IF, ROUND
+
+지원하지 않는 수식(다른 함수, 문자열 연결 등)이나 오류(#DIV/0! 등)가 나는 셀,
+순환 참조 셀은 계산하지 않으며 이를 참조하는 수식도 계산하지 않습니다.
+"""
+
+import math
+import re
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class UnsupportedFormulaError(ValueError):
+    """평가기가 지원하지 않는 수식"""
+
+
+# 셀 값 종류
+EMPTY, NUMBER, TEXT, ERROR, BOOL = 0, 1, 2, 3, 4
+
+SUPPORTED_FUNCTIONS = {'SUM', 'IF', 'ROUND'}
+
+_TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<string>"(?:[^"]|"")*")
+      | (?P<sheet>(?:'(?:[^']|'')+'|[^\s'!:(),+\-*/^&=<>"%$]+)!)
+      | (?P<cell>\$?[A-Za-z]{1,3}\$?\d+)
+      | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<func>[A-Za-z][A-Za-z0-9.]*(?=\s*\())
+      | (?P<bool>(?:TRUE|FALSE)\b)
+      | (?P<op><=|>=|<>|[-+*/^&=<>%(),:])
+    )""", re.VERBOSE | re.IGNORECASE)
+
+_CELL_PATTERN = re.compile(r'(\$?)([A-Za-z]{1,3})(\$?)(\d+)')
+
+_COMPARISON_OPS = ('=', '<>', '<', '>', '<=', '>=')
+
+
+def _col_letter_to_index(col_letter: str) -> int:
+    """'AB' → 27 (0-based)"""
+    col = 0
+    for ch in col_letter.upper():
+        col = col * 26 + (ord(ch) - ord('A') + 1)
+    return col - 1
+
+
+def _tokenize(formula: str) -> List[Tuple[str, str]]:
+    tokens = []
+    pos = 0
+    text = formula.rstrip()
+    while pos < len(text):
+        match = _TOKEN_PATTERN.match(text, pos)
+        if not match or match.end() == pos:
+            raise UnsupportedFormulaError(f"해석할 수 없는 수식: {formula}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """
+    수식 → AST (튜플)
+
+    참조는 수식이 있는 셀(anchor) 기준 상대 위치로 저장하므로, 같은 형태로 복사된 수식은
+    같은 AST가 되어 한 묶음으로 평가됩니다.
+    - ('num', 값) / ('str', 값) / ('bool', 값)
+    - ('ref', 시트, 행, 열, 행절대, 열절대)  - 절대가 아니면 anchor 기준 offset
+    - ('range', 시트, 행1, 열1, 행1절대, 열1절대, 행2, 열2, 행2절대, 열2절대)
+    - ('neg', x) / ('pct', x) / ('bin', 연산자, a, b) / ('func', 이름, (인자...))
+    """
+
+    def __init__(self, formula: str, sheet_name: str, row: int, col: int):
+        body = formula[1:] if formula.startswith('=') else formula
+        self.formula = formula
+        self.tokens = _tokenize(body)
+        self.pos = 0
+        self.sheet_name = sheet_name
+        self.row = row
+        self.col = col
+
+    def parse(self):
+        node = self._comparison()
+        if self.pos != len(self.tokens):
+            raise UnsupportedFormulaError(f"해석할 수 없는 수식: {self.formula}")
+        return node
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _take_op(self, *ops: str) -> Optional[str]:
+        token = self._peek()
+        if token and token[0] == 'op' and token[1] in ops:
+            self.pos += 1
+            return token[1]
+        return None
+
+    def _expect_op(self, op: str) -> None:
+        if not self._take_op(op):
+            raise UnsupportedFormulaError(f"해석할 수 없는 수식: {self.formula}")
+
+    def _comparison(self):
+        node = self._additive()
+        while True:
+            op = self._take_op(*_COMPARISON_OPS)
+            if not op:
+                return node
+            node = ('bin', op, node, self._additive())
+
+    def _additive(self):
+        node = self._multiplicative()
+        while True:
+            op = self._take_op('+', '-')
+            if not op:
+                return node
+            node = ('bin', op, node, self._multiplicative())
+
+    def _multiplicative(self):
+        node = self._power()
+        while True:
+            op = self._take_op('*', '/')
+            if not op:
+                return node
+            node = ('bin', op, node, self._power())
+
+    def _power(self):
+        node = self._unary()
+        while self._take_op('^'):
+            node = ('bin', '^', node, self._unary())
+        return node
+
+    def _unary(self):
+        # 엑셀은 단항 부호가 거듭제곱보다 우선 (=-2^2 → 4)
+        op = self._take_op('-', '+')
+        if op == '-':
+            return ('neg', self._unary())
+        if op == '+':
+            return self._unary()
+        node = self._primary()
+        while self._take_op('%'):
+            node = ('pct', node)
+        return node
+
+    def _reference(self, sheet_name: str, cell_text: str):
+        col_abs, col_letter, row_abs, row_text = _CELL_PATTERN.fullmatch(cell_text).groups()
+        row = int(row_text) - 1
+        col = _col_letter_to_index(col_letter)
+        return (
+            row if row_abs else row - self.row,
+            col if col_abs else col - self.col,
+            bool(row_abs),
+            bool(col_abs),
+        )
+
+    def _primary(self):
+        token = self._peek()
+        if token is None:
+            raise UnsupportedFormulaError(f"해석할 수 없는 수식: {self.formula}")
+        kind, text = token
+        self.pos += 1
+
+        if kind == 'number':
+            return ('num', float(text))
+        if kind == 'string':
+            return ('str', text[1:-1].replace('""', '"'))
+        if kind == 'bool':
+            return ('bool', text.upper() == 'TRUE')
+        if kind in ('sheet', 'cell'):
+            sheet_name = self.sheet_name
+            if kind == 'sheet':
+                sheet_name = text[:-1]
+                if sheet_name.startswith("'"):
+                    sheet_name = sheet_name[1:-1].replace("''", "'")
+                token = self._peek()
+                if token is None or token[0] != 'cell':
+                    raise UnsupportedFormulaError(f"해석할 수 없는 참조: {self.formula}")
+                self.pos += 1
+                text = token[1]
+            start = self._reference(sheet_name, text)
+            if self._take_op(':'):
+                token = self._peek()
+                if token is None or token[0] != 'cell':
+                    raise UnsupportedFormulaError(f"해석할 수 없는 범위: {self.formula}")
+                self.pos += 1
+                end = self._reference(sheet_name, token[1])
+                return ('range', sheet_name) + start + end
+            return ('ref', sheet_name) + start
+        if kind == 'func':
+            name = text.upper()
+            if name not in SUPPORTED_FUNCTIONS:
+                raise UnsupportedFormulaError(f"지원하지 않는 함수: {name}")
+            self._expect_op('(')
+            args = []
+            if not self._take_op(')'):
+                while True:
+                    args.append(self._comparison())
+                    if self._take_op(')'):
+                        break
+                    self._expect_op(',')
+            return self._check_function(name, tuple(args))
+        if kind == 'op' and text == '(':
+            node = self._comparison()
+            self._expect_op(')')
+            return node
+        raise UnsupportedFormulaError(f"해석할 수 없는 수식: {self.formula}")
+
+    def _check_function(self, name: str, args: tuple):
+        if name == 'IF' and len(args) not in (2, 3):
+            raise UnsupportedFormulaError("IF 인자 수 오류")
+        if name == 'ROUND' and len(args) != 2:
+            raise UnsupportedFormulaError("ROUND 인자 수 오류")
+        if name == 'SUM' and not args:
+            raise UnsupportedFormulaError("SUM 인자 없음")
+        for arg in args:
+            if arg[0] == 'range' and name != 'SUM':
+                raise UnsupportedFormulaError(f"{name}의 범위 인자는 지원하지 않습니다")
+        return ('func', name, args)
+
+
+def parse_formula(formula: str, sheet_name: str, row: int, col: int):
+    """
+    수식 문자열을 상대 참조 AST로 파싱
+
+    Raises:
+        UnsupportedFormulaError: 지원하지 않는 수식
+    """
+    node = _Parser(formula, sheet_name, row, col).parse()
+    if node[0] == 'range':
+        raise UnsupportedFormulaError(f"범위 단독 수식은 지원하지 않습니다: {formula}")
+    return node
+
+
+def _iter_references(node):
+    """AST 안의 ('ref' | 'range') 노드 순회"""
+    kind = node[0]
+    if kind in ('ref', 'range'):
+        yield node
+    elif kind in ('neg', 'pct'):
+        yield from _iter_references(node[1])
+    elif kind == 'bin':
+        yield from _iter_references(node[2])
+        yield from _iter_references(node[3])
+    elif kind == 'func':
+        for arg in node[2]:
+            yield from _iter_references(arg)
+
+
+def _absolute(offset: int, is_abs: bool, anchor: int) -> int:
+    return offset if is_abs else anchor + offset
+
+
+def _cell_kind(value: Any) -> int:
+    if value is None:
+        return EMPTY
+    if isinstance(value, (bool, np.bool_)):
+        return BOOL
+    if isinstance(value, (int, float, np.number)):
+        return EMPTY if isinstance(value, float) and math.isnan(value) else NUMBER
+    if isinstance(value, (datetime, date, time)):
+        return EMPTY if value != value else NUMBER  # NaT
+    if isinstance(value, str):
+        return ERROR if value.startswith('=') else TEXT
+    return ERROR
+
+
+def _cell_number(value: Any) -> float:
+    if isinstance(value, (datetime, date, time)):
+        from openpyxl.utils.datetime import to_excel
+        return float(to_excel(value))
+    return float(value)
+
+
+class _SheetStore:
+    """시트 값 배열 (종류/숫자/원래 값)"""
+
+    __slots__ = ('kind', 'num', 'obj')
+
+    def __init__(self, values: np.ndarray):
+        shape = values.shape
+        flat = values.ravel()
+        self.kind = np.fromiter((_cell_kind(v) for v in flat), dtype=np.int8, count=flat.size).reshape(shape)
+        self.num = np.full(shape, np.nan, dtype=np.float64)
+        numeric = (self.kind == NUMBER) | (self.kind == BOOL)
+        if numeric.any():
+            self.num[numeric] = [_cell_number(v) for v in values[numeric]]
+        self.obj = np.array(values, dtype=object, copy=True)
+
+    def gather(self, rows: np.ndarray, cols: np.ndarray):
+        """(rows, cols) 위치 값 (시트 범위 밖은 빈 셀)"""
+        n_rows, n_cols = self.kind.shape
+        valid = (rows >= 0) & (rows < n_rows) & (cols >= 0) & (cols < n_cols)
+        kind = np.zeros(rows.shape, dtype=np.int8)
+        num = np.full(rows.shape, np.nan, dtype=np.float64)
+        obj = np.full(rows.shape, None, dtype=object)
+        r, c = rows[valid], cols[valid]
+        kind[valid] = self.kind[r, c]
+        num[valid] = self.num[r, c]
+        obj[valid] = self.obj[r, c]
+        return kind, num, obj
+
+    def store(self, rows: np.ndarray, cols: np.ndarray, kind, num, obj) -> None:
+        self.kind[rows, cols] = kind
+        self.num[rows, cols] = num
+        self.obj[rows, cols] = obj
+
+
+class _BatchEvaluator:
+    """같은 AST를 가진 수식들을 anchor 배열 기준으로 일괄 평가"""
+
+    def __init__(self, stores: Dict[str, _SheetStore], rows: np.ndarray, cols: np.ndarray):
+        self.stores = stores
+        self.rows = rows
+        self.cols = cols
+        self.size = len(rows)
+
+    def _const(self, kind: int, num: float = np.nan, obj: Any = None):
+        return (
+            np.full(self.size, kind, dtype=np.int8),
+            np.full(self.size, num, dtype=np.float64),
+            np.full(self.size, obj, dtype=object),
+        )
+
+    def _gather(self, sheet_name: str, rows: np.ndarray, cols: np.ndarray):
+        store = self.stores.get(sheet_name)
+        if store is None:
+            # 없는 시트 참조 (#REF!)
+            return (
+                np.full(rows.shape, ERROR, dtype=np.int8),
+                np.full(rows.shape, np.nan, dtype=np.float64),
+                np.full(rows.shape, None, dtype=object),
+            )
+        return store.gather(rows, cols)
+
+    def _ref_positions(self, node):
+        _, _, row, col, row_abs, col_abs = node
+        rows = np.full(self.size, row) if row_abs else self.rows + row
+        cols = np.full(self.size, col) if col_abs else self.cols + col
+        return rows, cols
+
+    def _range_positions(self, node):
+        _, _, r1, c1, r1_abs, c1_abs, r2, c2, r2_abs, c2_abs = node
+        top = np.full(self.size, r1) if r1_abs else self.rows + r1
+        left = np.full(self.size, c1) if c1_abs else self.cols + c1
+        bottom = np.full(self.size, r2) if r2_abs else self.rows + r2
+        right = np.full(self.size, c2) if c2_abs else self.cols + c2
+        top, bottom = np.minimum(top, bottom), np.maximum(top, bottom)
+        left, right = np.minimum(left, right), np.maximum(left, right)
+        height = int((bottom - top).max()) + 1
+        width = int((right - left).max()) + 1
+        dr, dc = np.meshgrid(np.arange(height), np.arange(width), indexing='ij')
+        rows = top[:, None, None] + dr[None]
+        cols = left[:, None, None] + dc[None]
+        inside = (rows <= bottom[:, None, None]) & (cols <= right[:, None, None])
+        return rows, cols, inside
+
+    @staticmethod
+    def _to_number(value):
+        """산술 연산용 숫자 변환 (빈 셀 0, 숫자 문자열 변환, 그 외 오류)"""
+        kind, num, obj = value
+        num = np.where(kind == EMPTY, 0.0, num)
+        error = kind == ERROR
+        text = kind == TEXT
+        if text.any():
+            for i in np.flatnonzero(text):
+                try:
+                    num[i] = float(str(obj[i]).strip())
+                except ValueError:
+                    error[i] = True
+        return num, error
+
+    def _number_result(self, num: np.ndarray, error: np.ndarray):
+        error = error | ~np.isfinite(num)
+        kind = np.where(error, ERROR, NUMBER).astype(np.int8)
+        return kind, np.where(error, np.nan, num), np.full(self.size, None, dtype=object)
+
+    def evaluate(self, node):
+        kind = node[0]
+        if kind == 'num':
+            return self._const(NUMBER, node[1])
+        if kind == 'str':
+            return self._const(TEXT, obj=node[1])
+        if kind == 'bool':
+            return self._const(BOOL, float(node[1]), node[1])
+        if kind == 'ref':
+            return self._gather(node[1], *self._ref_positions(node))
+        if kind == 'neg':
+            num, error = self._to_number(self.evaluate(node[1]))
+            return self._number_result(-num, error)
+        if kind == 'pct':
+            num, error = self._to_number(self.evaluate(node[1]))
+            return self._number_result(num / 100.0, error)
+        if kind == 'bin':
+            return self._binary(node[1], self.evaluate(node[2]), self.evaluate(node[3]))
+        if kind == 'func':
+            return getattr(self, f'_func_{node[1].lower()}')(node[2])
+        raise UnsupportedFormulaError(f"지원하지 않는 노드: {kind}")
+
+    def _binary(self, op: str, left, right):
+        if op in _COMPARISON_OPS:
+            return self._compare(op, left, right)
+        a, a_error = self._to_number(left)
+        b, b_error = self._to_number(right)
+        error = a_error | b_error
+        with np.errstate(all='ignore'):
+            if op == '+':
+                result = a + b
+            elif op == '-':
+                result = a - b
+            elif op == '*':
+                result = a * b
+            elif op == '/':
+                error = error | (b == 0)
+                result = a / np.where(b == 0, 1.0, b)
+            else:
+                result = np.power(a, b)
+        return self._number_result(result, error)
+
+    def _compare(self, op: str, left, right):
+        """엑셀 비교 규칙: 숫자 < 문자열 < 논리값, 문자열은 대소문자 무시"""
+        l_kind, l_num, l_obj = left
+        r_kind, r_num, r_obj = right
+        rank = {EMPTY: 0, NUMBER: 0, TEXT: 1, BOOL: 2, ERROR: 3}
+        l_rank = np.vectorize(rank.get, otypes=[np.int8])(l_kind)
+        r_rank = np.vectorize(rank.get, otypes=[np.int8])(r_kind)
+        error = (l_kind == ERROR) | (r_kind == ERROR)
+
+        # 비교 키: 순위가 다르면 순위, 같으면 숫자/문자열 값으로 -1/0/1
+        order = np.sign(l_rank - r_rank).astype(np.float64)
+        same = (l_rank == r_rank) & ~error
+        numeric = same & (l_rank != 1)
+        with np.errstate(invalid='ignore'):
+            l_val = np.where(l_kind == EMPTY, 0.0, l_num)
+            r_val = np.where(r_kind == EMPTY, 0.0, r_num)
+            order[numeric] = np.sign(l_val[numeric] - r_val[numeric])
+        for i in np.flatnonzero(same & (l_rank == 1)):
+            a, b = str(l_obj[i]).lower(), str(r_obj[i]).lower()
+            order[i] = (a > b) - (a < b)
+
+        result = {
+            '=': order == 0, '<>': order != 0, '<': order < 0,
+            '>': order > 0, '<=': order <= 0, '>=': order >= 0,
+        }[op]
+        kind = np.where(error, ERROR, BOOL).astype(np.int8)
+        obj = np.array([bool(v) for v in result], dtype=object) if self.size else np.empty(0, dtype=object)
+        obj[error] = None
+        return kind, np.where(error, np.nan, result.astype(np.float64)), obj
+
+    def _func_sum(self, args):
+        total = np.zeros(self.size, dtype=np.float64)
+        error = np.zeros(self.size, dtype=bool)
+        for arg in args:
+            if arg[0] in ('ref', 'range'):
+                # 참조 인자는 숫자 셀만 합산 (문자열/논리값/빈 셀 무시)
+                if arg[0] == 'ref':
+                    rows, cols = self._ref_positions(arg)
+                    rows, cols = rows[:, None], cols[:, None]
+                    inside = np.ones(rows.shape, dtype=bool)
+                else:
+                    rows, cols, inside = self._range_positions(arg)
+                kind, num, _ = self._gather(arg[1], rows, cols)
+                kind = np.where(inside, kind, EMPTY)
+                axes = tuple(range(1, kind.ndim))
+                error |= (kind == ERROR).any(axis=axes)
+                total += np.where(kind == NUMBER, num, 0.0).sum(axis=axes)
+            else:
+                num, arg_error = self._to_number(self.evaluate(arg))
+                total += np.where(arg_error, 0.0, num)
+                error |= arg_error
+        return self._number_result(total, error)
+
+    def _func_if(self, args):
+        c_kind, c_num, _ = self.evaluate(args[0])
+        error = (c_kind == ERROR) | (c_kind == TEXT)
+        condition = np.where(c_kind == EMPTY, False, np.nan_to_num(c_num) != 0)
+        when_true = self.evaluate(args[1])
+        when_false = self.evaluate(args[2]) if len(args) == 3 else self._const(BOOL, 0.0, False)
+        kind = np.where(condition, when_true[0], when_false[0]).astype(np.int8)
+        num = np.where(condition, when_true[1], when_false[1])
+        obj = np.where(condition, when_true[2], when_false[2])
+        kind[error] = ERROR
+        return kind, num, obj
+
+    def _func_round(self, args):
+        value, value_error = self._to_number(self.evaluate(args[0]))
+        digits, digits_error = self._to_number(self.evaluate(args[1]))
+        digits = np.trunc(np.nan_to_num(digits))
+        with np.errstate(all='ignore'):
+            factor = np.power(10.0, digits)
+            # 엑셀 ROUND는 0.5를 0에서 먼 쪽으로 반올림 (부동소수 오차 보정 후 처리)
+            scaled = np.round(np.abs(value) * factor, 9)
+            result = np.sign(value) * np.floor(scaled + 0.5) / factor
+        return self._number_result(result, value_error | digits_error)
+
+
+def _to_python(kind: int, num: float, obj: Any) -> Any:
+    if kind == BOOL:
+        return bool(obj) if obj is not None else bool(num)
+    if kind == TEXT:
+        return obj
+    if obj is not None and not isinstance(obj, float):
+        return obj
+    return float(num)
+
+
+def evaluate_formula_grids(
+    grids: Dict[str, np.ndarray],
+    load_values: Callable[[str, int, int], Optional[np.ndarray]]
+) -> Tuple[Dict[str, Dict[Tuple[int, int], Any]], int]:
+    """
+    시트별 값 배열(수식은 '=...' 문자열)의 모든 수식을 평가
+
+    Args:
+        grids: 평가 대상 시트 {시트명: object ndarray (0-based)}
+        load_values: 그 외 참조 시트 값 로더 (시트명, 필요한 행 수, 열 수) → object ndarray 또는 None
+
+    Returns:
+        ({시트명: {(행, 열): 값}}, 전체 수식 수) - 계산되지 않은 수식 셀은 포함하지 않음
+    """
+    # 1. 수식 파싱 (셀별 한 번)
+    nodes: List[Tuple[str, int, int, Any]] = []
+    formula_masks: Dict[str, np.ndarray] = {}
+    for sheet_name, grid in grids.items():
+        mask = np.zeros(grid.shape, dtype=bool)
+        for row, col in zip(*np.nonzero(np.vectorize(
+            lambda v: isinstance(v, str) and v.startswith('='), otypes=[bool]
+        )(grid) if grid.size else np.zeros((0, 0), dtype=bool))):
+            row, col = int(row), int(col)
+            mask[row, col] = True
+            try:
+                ast = parse_formula(grid[row, col], sheet_name, row, col)
+            except UnsupportedFormulaError:
+                ast = None
+            nodes.append((sheet_name, row, col, ast))
+        formula_masks[sheet_name] = mask
+    if not nodes:
+        return {}, 0
+
+    # 2. 참조 시트 값 적재 (평가 대상 외 시트는 참조되는 범위까지만)
+    extents: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    for sheet_name, row, col, ast in nodes:
+        if ast is None:
+            continue
+        for ref in _iter_references(ast):
+            corners = [(ref[2], ref[3], ref[4], ref[5])]
+            if ref[0] == 'range':
+                corners.append((ref[6], ref[7], ref[8], ref[9]))
+            for r, c, r_abs, c_abs in corners:
+                extent = extents[ref[1]]
+                extent[0] = max(extent[0], _absolute(r, r_abs, row) + 1)
+                extent[1] = max(extent[1], _absolute(c, c_abs, col) + 1)
+
+    stores: Dict[str, _SheetStore] = {name: _SheetStore(grid) for name, grid in grids.items()}
+    for sheet_name, (n_rows, n_cols) in extents.items():
+        if sheet_name in stores:
+            continue
+        values = load_values(sheet_name, n_rows, n_cols)
+        if values is not None:
+            stores[sheet_name] = _SheetStore(values)
+
+    # 3. 의존성 그래프 (수식 셀 → 수식 셀)
+    node_index = {(sheet_name, row, col): i for i, (sheet_name, row, col, _) in enumerate(nodes)}
+    dependents: List[List[int]] = [[] for _ in nodes]
+    indegree = np.zeros(len(nodes), dtype=np.int64)
+    for i, (sheet_name, row, col, ast) in enumerate(nodes):
+        if ast is None:
+            continue
+        deps = set()
+        for ref in _iter_references(ast):
+            mask = formula_masks.get(ref[1])
+            if mask is None:
+                continue
+            r1, c1 = _absolute(ref[2], ref[4], row), _absolute(ref[3], ref[5], col)
+            if ref[0] == 'range':
+                r2, c2 = _absolute(ref[6], ref[8], row), _absolute(ref[7], ref[9], col)
+                r1, r2 = sorted((r1, r2))
+                c1, c2 = sorted((c1, c2))
+            else:
+                r2, c2 = r1, c1
+            if r1 < 0 or c1 < 0:
+                continue
+            for dr, dc in zip(*np.nonzero(mask[r1:r2 + 1, c1:c2 + 1])):
+                deps.add(node_index[(ref[1], r1 + int(dr), c1 + int(dc))])
+        for dep in deps:
+            dependents[dep].append(i)
+        indegree[i] = len(deps)
+
+    # 4. 위상 정렬 단계별 일괄 평가 (같은 시트/같은 AST 묶음)
+    results: Dict[str, Dict[Tuple[int, int], Any]] = defaultdict(dict)
+    level = [i for i in range(len(nodes)) if indegree[i] == 0]
+    while level:
+        groups: Dict[Tuple[str, Any], List[int]] = defaultdict(list)
+        for i in level:
+            sheet_name, _, _, ast = nodes[i]
+            groups[(sheet_name, ast)].append(i)
+
+        for (sheet_name, ast), members in groups.items():
+            rows = np.array([nodes[i][1] for i in members], dtype=np.int64)
+            cols = np.array([nodes[i][2] for i in members], dtype=np.int64)
+            size = len(members)
+            if ast is None:
+                kind = np.full(size, ERROR, dtype=np.int8)
+                num = np.full(size, np.nan)
+                obj = np.full(size, None, dtype=object)
+            else:
+                try:
+                    kind, num, obj = _BatchEvaluator(stores, rows, cols).evaluate(ast)
+                except Exception:
+                    kind = np.full(size, ERROR, dtype=np.int8)
+                    num = np.full(size, np.nan)
+                    obj = np.full(size, None, dtype=object)
+                if ast[0] != 'ref':
+                    # 빈 셀은 단독 참조일 때만 빈 값으로 두고, 함수/연산 결과에서는 0
+                    empty = kind == EMPTY
+                    kind = np.where(empty, NUMBER, kind).astype(np.int8)
+                    num = np.where(empty, 0.0, num)
+            stores[sheet_name].store(rows, cols, kind, num, obj)
+            sheet_results = results[sheet_name]
+            for j in np.flatnonzero((kind != ERROR) & (kind != EMPTY)):
+                sheet_results[(int(rows[j]), int(cols[j]))] = _to_python(kind[j], num[j], obj[j])
+
+        next_level = []
+        for i in level:
+            for dependent in dependents[i]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+
+    return dict(results), len(nodes)
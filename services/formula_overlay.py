@@ -0,0 +1,475 @@
+# -*- coding: utf-8 -*-
+"""
+메모리 내 수식 계산 오버레이
+
+분석 시트의 수식을 의존성 그래프 평가기(services.formula_evaluator)로 계산한 결과를
+시트별 값 배열(ndarray)로 보관하고, 이를 DataFrame으로 만들어 스냅샷에 바로 공급합니다.
+계산된 xlsx를 복사/저장한 뒤 다시 파싱하던 과정을 대체하며, xlsx 파일은
+명시적으로 요청한 경우(preprocess_excel)에만 저장합니다.
+
+해석 결과는 기존 방식(수식 셀을 값으로 바꿔 저장한 파일을 다시 읽은 결과)과 같은 형태입니다.
+- 계산된 수식 셀: 계산값 (='집계시트'!셀 단독 참조는 참조한 값 그대로)
+- 계산되지 않은 수식 셀: 빈 셀 (openpyxl 저장 시 계산값이 남지 않음)
+- 그 외 셀: 원래 값
+
+같은 내용의 파일(SHA-256 동일)은 경로가 달라도 계산 결과를 재사용하며, 결과는
+계산 저장소(services.calculated_store)를 통해 다른 프로세스와도 공유합니다.
+"""
+
+import math
+import threading
+import weakref
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.settings import SNAPSHOT_CACHE_MAX_ENTRIES
+from .excel_cache import register_companion_cache
+from .formula_evaluator import evaluate_formula_grids
+from .xlsx_stream_reader import SheetArrays
+
+
+# 수식 계산 대상 시트 (시트명에 포함된 문자열)
+ANALYSIS_SHEET_KEYWORD = '분석'
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _is_formula(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith('=')
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+
+
+def _cell_mask(grid: np.ndarray, predicate) -> np.ndarray:
+    """셀별 조건 마스크 (빈 배열도 처리)"""
+    if not grid.size:
+        return np.zeros(grid.shape, dtype=bool)
+    return np.vectorize(predicate, otypes=[bool])(grid)
+
+
+def _grid_to_frame(grid: np.ndarray) -> pd.DataFrame:
+    """값 배열(object)을 pd.read_excel(header=None)과 같은 타입 추론으로 DataFrame 변환"""
+    filled = ~_cell_mask(grid, _is_empty)
+    if not filled.any():
+        return pd.DataFrame()
+    # 후행 빈 행/열 제거 (pd.read_excel과 동일)
+    n_rows = int(np.flatnonzero(filled.any(axis=1)).max()) + 1
+    n_cols = int(np.flatnonzero(filled.any(axis=0)).max()) + 1
+    grid = grid[:n_rows, :n_cols]
+    filled = filled[:n_rows, :n_cols]
+
+    is_number = filled & _cell_mask(grid, _is_number)
+    values = np.full(grid.shape, np.nan, dtype=np.float64)
+    values[is_number] = grid[is_number].astype(np.float64)
+    labels = np.full(grid.shape, None, dtype=object)
+    is_label = filled & ~is_number
+    labels[is_label] = grid[is_label]
+    return SheetArrays(values, labels, 0, 0).to_frame()
+
+
+class FormulaOverlay:
+    """분석 시트별 수식 해석 결과 (값 배열은 0-based, 공유 객체이므로 수정 금지)"""
+
+    def __init__(
+        self,
+        excel_path: str,
+        values: Dict[str, np.ndarray],
+        resolved_cells: Dict[str, Dict[Tuple[int, int], Any]],
+        formula_count: int
+    ):
+        self.excel_path = str(excel_path)
+        self.mtime = Path(excel_path).stat().st_mtime
+        self.values = values
+        self.resolved_cells = resolved_cells
+        self.formula_count = formula_count
+        self._frames: Optional[Dict[str, pd.DataFrame]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def resolved_count(self) -> int:
+        return sum(len(cells) for cells in self.resolved_cells.values())
+
+    def to_frames(self) -> Dict[str, pd.DataFrame]:
+        """분석 시트별 DataFrame (header=None, 한 번만 생성)"""
+        with self._lock:
+            if self._frames is None:
+                self._frames = {name: _grid_to_frame(grid) for name, grid in self.values.items()}
+            return self._frames
+
+
+def _read_formula_grid(ws) -> np.ndarray:
+    """read_only 워크시트 → 값 배열 (배열 수식은 수식 문자열로 변환)"""
+    from openpyxl.worksheet.formula import ArrayFormula
+
+    rows = [list(row) for row in ws.iter_rows(values_only=True)]
+    width = max((len(row) for row in rows), default=0)
+    grid = np.full((len(rows), width), None, dtype=object)
+    for row_idx, row in enumerate(rows):
+        grid[row_idx, :len(row)] = [
+            value.text if isinstance(value, ArrayFormula) else value for value in row
+        ]
+    return grid
+
+
+def build_formula_overlay(excel_path: str, snapshot=None) -> FormulaOverlay:
+    """
+    분석 시트의 수식을 메모리에서 계산 (파일 복사/저장 없음)
+
+    - 수식: openpyxl read_only(data_only=False)로 분석 시트만 순회
+    - 참조 값: 분석 시트끼리는 계산 결과, 그 외 시트는 워크북 스냅샷의 값
+      (data_only와 동일한 저장된 계산값, 참조되는 범위까지만)
+
+    Args:
+        snapshot: 참조 값을 읽을 스냅샷 (None이면 전역 캐시의 스냅샷)
+    """
+    import openpyxl
+    from .workbook_snapshot import get_workbook_snapshot
+
+    if snapshot is None:
+        snapshot = get_workbook_snapshot(excel_path)
+
+    def _load_values(sheet_name: str, n_rows: int, n_cols: int) -> Optional[np.ndarray]:
+        if not snapshot.has_sheet(sheet_name):
+            return None
+        return snapshot._get_range_by_bounds(sheet_name, (0, n_rows, 0, n_cols)).to_numpy(dtype=object)
+
+    wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=False)
+    try:
+        grids = {
+            sheet_name: _read_formula_grid(wb[sheet_name])
+            for sheet_name in wb.sheetnames
+            if ANALYSIS_SHEET_KEYWORD in sheet_name
+        }
+    finally:
+        wb.close()
+
+    resolved_cells, formula_count = evaluate_formula_grids(grids, _load_values)
+
+    overlay_values: Dict[str, np.ndarray] = {}
+    for sheet_name, grid in grids.items():
+        # 계산되지 않은 수식 셀은 빈 셀
+        grid[_cell_mask(grid, _is_formula)] = None
+        resolved = resolved_cells.setdefault(sheet_name, {})
+        for (row_idx, col_idx), value in resolved.items():
+            grid[row_idx, col_idx] = value
+        grid.flags.writeable = False
+        overlay_values[sheet_name] = grid
+
+    overlay = FormulaOverlay(excel_path, overlay_values, resolved_cells, formula_count)
+    print(f"[수식 오버레이] 메모리 내 계산 완료: {overlay.resolved_count}/{formula_count}개 수식")
+    return overlay
+
+
+class FormulaOverlayCache:
+    """
+    파일별 수식 오버레이 및 계산값 스냅샷 캐시 (Thread-safe)
+
+    업로드 전처리에서 계산값을 쓰기로 한 파일은 register()로 등록합니다. 등록된 파일은
+    원본 스냅샷 자체에 계산값을 반영하며, 스냅샷이 캐시에서 밀려나 다시 만들어지거나
+    LazyWorkbook으로 시트를 읽는 경우에도 같은 계산값을 돌려줍니다.
+
+    파일별 항목은 max_entries개까지 LRU로 보관하고, ExcelCache가 파일 항목을 제거하면
+    evict()로 함께 제거됩니다 (등록 정보와 내용 해시별 결과는 유지되어 다시 계산하지 않음).
+
+    lock 순서: 계산용 _lock은 계산 중 스냅샷/ExcelCache를 호출할 수 있으므로, ExcelCache가
+    lock을 보유한 채 호출하는 evict()는 항목 dict만 보호하는 _entries_lock만 사용합니다.
+    _entries_lock을 보유한 채 다른 캐시나 스냅샷을 호출하지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = 8, max_digests: int = 8, max_registered: int = 256):
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_entries = max_entries
+        # 파일 내용 해시별 계산 결과 (같은 파일을 다른 경로로 다시 올린 경우 재사용)
+        self._by_digest: "OrderedDict[str, FormulaOverlay]" = OrderedDict()
+        self.max_digests = max_digests
+        # 계산값을 원본 스냅샷/LazyWorkbook에 반영할 파일 경로 (오래된 등록부터 해제)
+        self._registered: "OrderedDict[str, None]" = OrderedDict()
+        self.max_registered = max_registered
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries_lock = threading.Lock()
+        # 현재 스레드에서 계산 중인 경로 (계산 중 만든 스냅샷에는 반영하지 않음)
+        self._local = threading.local()
+
+    def _building(self) -> set:
+        if not hasattr(self._local, 'paths'):
+            self._local.paths = set()
+        return self._local.paths
+
+    # ----- 항목 (_entries_lock) -----
+
+    def _lookup(self, cache_key: str, file_mtime: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """유효한 항목 조회 및 최근 사용 갱신"""
+        with self._entries_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+            if file_mtime is not None and entry['overlay'].mtime != file_mtime:
+                self._cache.pop(cache_key)
+                return None
+            self._cache.move_to_end(cache_key)
+            return entry
+
+    def _store(self, cache_key: str, overlay: FormulaOverlay) -> Dict[str, Any]:
+        entry = {
+            'overlay': overlay,
+            'snapshot': None,
+            'applied_to': None,
+            'timestamp': datetime.now()
+        }
+        with self._entries_lock:
+            self._cache[cache_key] = entry
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def _remember_digest(self, digest: str, overlay: FormulaOverlay) -> None:
+        with self._entries_lock:
+            self._by_digest[digest] = overlay
+            self._by_digest.move_to_end(digest)
+            while len(self._by_digest) > self.max_digests:
+                self._by_digest.popitem(last=False)
+
+    def _shared_by_digest(self, digest: str) -> Optional[FormulaOverlay]:
+        with self._entries_lock:
+            shared = self._by_digest.get(digest)
+            if shared is not None:
+                self._by_digest.move_to_end(digest)
+            return shared
+
+    # ----- 계산 (_lock) -----
+
+    def _build_or_reuse(self, excel_path: str, snapshot=None, build: bool = True) -> Optional[FormulaOverlay]:
+        """
+        같은 내용의 계산 결과를 메모리 → 디스크 저장소 순으로 찾고, 없으면 계산 후 저장
+
+        build=False이면 수식을 계산하지 않고 None을 반환합니다.
+        """
+        from .calculated_store import load_calculated, save_calculated
+        from .sidecar_cache import compute_file_sha256
+
+        digest = compute_file_sha256(excel_path)
+        shared = self._shared_by_digest(digest)
+        if shared is not None:
+            print(f"[수식 오버레이] 같은 내용의 계산 결과 재사용: {digest[:12]}")
+            return FormulaOverlay(excel_path, shared.values, shared.resolved_cells, shared.formula_count)
+
+        stored = load_calculated(digest)
+        if stored is not None:
+            print(f"[수식 오버레이] 계산 저장소 적중: {digest[:12]}")
+            overlay = FormulaOverlay(excel_path, stored['values'], stored['resolved_cells'], stored['formula_count'])
+        elif not build:
+            return None
+        else:
+            building = self._building()
+            building.add(excel_path)
+            try:
+                overlay = build_formula_overlay(excel_path, snapshot)
+            finally:
+                building.discard(excel_path)
+            save_calculated(digest, overlay.values, overlay.resolved_cells, overlay.formula_count)
+
+        self._remember_digest(digest, overlay)
+        return overlay
+
+    def get_overlay(self, excel_path: str, snapshot=None, build: bool = True) -> Optional[FormulaOverlay]:
+        """
+        파일의 수식 오버레이
+
+        Args:
+            snapshot: 계산 시 참조 값을 읽을 스냅샷 (None이면 전역 캐시의 스냅샷)
+            build: False이면 이미 계산된 결과(메모리/계산 저장소)만 사용하고 없으면 None
+        """
+        cache_key = str(excel_path)
+        file_mtime = Path(excel_path).stat().st_mtime
+        entry = self._lookup(cache_key, file_mtime)
+        if entry is not None:
+            return entry['overlay']
+        with self._lock:
+            entry = self._lookup(cache_key, file_mtime)
+            if entry is not None:
+                return entry['overlay']
+            overlay = self._build_or_reuse(cache_key, snapshot, build)
+            if overlay is None:
+                return None
+            self._store(cache_key, overlay)
+            return overlay
+
+    # ----- 원본 스냅샷/LazyWorkbook 반영 -----
+
+    def register(self, excel_path: str) -> None:
+        """파일의 원본 스냅샷/LazyWorkbook이 분석 시트 계산값을 쓰도록 등록"""
+        with self._entries_lock:
+            self._registered[str(excel_path)] = None
+            self._registered.move_to_end(str(excel_path))
+            while len(self._registered) > self.max_registered:
+                self._registered.popitem(last=False)
+
+    def is_registered(self, excel_path: str) -> bool:
+        return str(excel_path) in self._registered
+
+    def _attach(self, snapshot, overlay: FormulaOverlay) -> None:
+        """스냅샷에 계산값 반영 (같은 스냅샷에는 한 번만, 반영은 lock 밖에서)"""
+        entry = self._lookup(str(snapshot.excel_path))
+        applied = entry.get('applied_to') if entry else None
+        if applied is not None and applied() is snapshot:
+            return
+        snapshot.apply_frames(overlay.to_frames())
+        if entry is not None and entry['overlay'] is overlay:
+            entry['applied_to'] = weakref.ref(snapshot)
+
+    def attach_registered(self, snapshot) -> None:
+        """
+        새로 만든 원본 스냅샷에 등록된 파일의 계산값 반영 (스냅샷 캐시가 생성 직후 호출)
+
+        이 스냅샷을 참조 값으로 사용해 계산하므로 스냅샷 캐시를 다시 거치지 않습니다.
+        """
+        excel_path = snapshot.excel_path
+        if not self.is_registered(excel_path) or excel_path in self._building():
+            return
+        try:
+            overlay = self.get_overlay(excel_path, snapshot=snapshot)
+        except Exception as e:
+            print(f"[수식 오버레이] 스냅샷 재생성 시 계산값 반영 실패 (원본 값 사용): {e}")
+            return
+        if overlay is not None and overlay.resolved_count:
+            self._attach(snapshot, overlay)
+
+    def get_registered_frames(self, excel_path: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """등록된 파일의 분석 시트 계산값 DataFrame (이미 계산된 결과만 사용, 없으면 None)"""
+        if not self.is_registered(excel_path) or str(excel_path) in self._building():
+            return None
+        try:
+            overlay = self.get_overlay(excel_path, build=False)
+        except Exception as e:
+            print(f"[수식 오버레이] 계산값 조회 실패 (원본 값 사용): {e}")
+            return None
+        if overlay is None or not overlay.resolved_count:
+            return None
+        return overlay.to_frames()
+
+    def get_calculated_snapshot(self, excel_path: str):
+        """
+        분석 시트에 수식 계산값이 반영된 스냅샷
+
+        계산된 파일 경로가 등록되어 있으면 그 스냅샷을, 해석된 수식이 없으면 원본 스냅샷을 반환합니다.
+        register()된 파일은 원본 스냅샷에 계산값을 반영해 반환하고, 그 외에는 원본 스냅샷과
+        시트를 공유하는 별도 스냅샷을 만듭니다.
+        """
+        from .excel_cache import get_cached_calculated_path
+        from .workbook_snapshot import WorkbookSnapshot, get_workbook_snapshot
+
+        cached_path = get_cached_calculated_path(excel_path)
+        if cached_path:
+            return get_workbook_snapshot(cached_path)
+
+        overlay = self.get_overlay(excel_path)
+        if overlay.resolved_count == 0:
+            return get_workbook_snapshot(excel_path)
+
+        if self.is_registered(excel_path):
+            snapshot = get_workbook_snapshot(excel_path)
+            self._attach(snapshot, overlay)
+            return snapshot
+
+        entry = self._lookup(str(excel_path))
+        if entry is not None and entry['overlay'] is overlay and entry['snapshot'] is not None:
+            return entry['snapshot']
+        with self._lock:
+            entry = self._lookup(str(excel_path))
+            if entry is None or entry['overlay'] is not overlay:
+                # 그 사이 항목이 제거된 경우 다시 등록
+                entry = self._store(str(excel_path), overlay)
+            if entry['snapshot'] is None:
+                # 원본 스냅샷의 시트 목록을 공유하고, 분석 시트만 계산값으로 교체한 별도 스냅샷
+                original = get_workbook_snapshot(excel_path)
+                entry['snapshot'] = WorkbookSnapshot(
+                    str(excel_path),
+                    sheet_names=original.sheet_names,
+                    frames={**original.get_decoded_frames(), **overlay.to_frames()}
+                )
+            return entry['snapshot']
+
+    def evict(self, excel_path: Optional[str] = None) -> None:
+        """
+        파일 항목 제거 (ExcelCache가 파일 항목을 제거할 때 호출, None이면 전체)
+
+        등록 정보와 내용 해시별 결과는 남겨 두어, 다시 필요하면 계산 없이 복원합니다.
+        """
+        with self._entries_lock:
+            if excel_path is None:
+                self.evictions += len(self._cache)
+                self._cache.clear()
+            elif self._cache.pop(str(excel_path), None) is not None:
+                self.evictions += 1
+
+    def clear_cache(self, excel_path: Optional[str] = None) -> None:
+        with self._entries_lock:
+            if excel_path:
+                self._cache.pop(str(excel_path), None)
+                self._registered.pop(str(excel_path), None)
+            else:
+                self._cache.clear()
+                self._by_digest.clear()
+                self._registered.clear()
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        with self._entries_lock:
+            return {
+                'cached_files': list(self._cache),
+                'max_entries': self.max_entries,
+                'digests': len(self._by_digest),
+                'registered_files': len(self._registered),
+                'evictions': self.evictions,
+            }
+
+
+# 전역 오버레이 캐시 인스턴스 (ExcelCache가 파일 항목을 제거하면 함께 제거)
+_overlay_cache = FormulaOverlayCache(max_entries=SNAPSHOT_CACHE_MAX_ENTRIES)
+register_companion_cache(_overlay_cache.evict)
+
+
+def get_formula_overlay(excel_path: str) -> FormulaOverlay:
+    """전역 캐시에서 수식 오버레이 가져오기 (없으면 메모리에서 계산)"""
+    return _overlay_cache.get_overlay(excel_path)
+
+
+def get_calculated_snapshot(excel_path: str):
+    """분석 시트에 수식 계산값이 반영된 스냅샷 가져오기"""
+    return _overlay_cache.get_calculated_snapshot(excel_path)
+
+
+def register_formula_overlay(excel_path: str) -> None:
+    """파일의 원본 스냅샷/LazyWorkbook이 분석 시트 계산값을 쓰도록 등록"""
+    _overlay_cache.register(excel_path)
+
+
+def attach_registered_overlay(snapshot) -> None:
+    """등록된 파일이면 새 스냅샷에 분석 시트 계산값 반영"""
+    _overlay_cache.attach_registered(snapshot)
+
+
+def get_registered_overlay_frames(excel_path: str) -> Optional[Dict[str, pd.DataFrame]]:
+    """등록된 파일의 분석 시트 계산값 DataFrame (이미 계산된 결과만, 없으면 None)"""
+    return _overlay_cache.get_registered_frames(excel_path)
+
+
+def clear_formula_overlay_cache(excel_path: Optional[str] = None) -> None:
+    """수식 오버레이 캐시 정리"""
+    _overlay_cache.clear_cache(excel_path)
+
+
+def get_formula_overlay_cache_info() -> Dict[str, Any]:
+    """수식 오버레이 캐시 정보 반환"""
+    return _overlay_cache.get_cache_info()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Generator 모듈/클래스 레지스트리
+
+보도자료 한 건마다 spec_from_file_location + exec_module로 generator 모듈을 다시 실행하면
+모듈 전체를 재실행하는 비용이 들고, 매번 새 클래스 객체가 만들어져 클래스 단위 캐시
+(SectorDataset이 사용하는 UnifiedReportGenerator 등)와도 어긋납니다. 이 레지스트리는
+templates/ 아래 generator 모듈을 패키지 모듈(templates.<이름>)로 한 번만 import하고,
+config/reports.py의 class_name을 미리 해석해 보관합니다.
+
+- 모듈: 처음 요청 시 import, 이후 소스 파일 mtime이 바뀐 경우에만 reload (개발 중 수정 반영)
+- 클래스: (generator 파일명, class_name) 단위 보관, 모듈 reload 시 함께 무효화
+- 워밍업: warm_up_generators()로 앱 시작 시 설정에 등록된 generator를 미리 로드
+"""
+
+import importlib
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from config.settings import TEMPLATES_DIR
+
+
+def _find_generator_class(module) -> Optional[type]:
+    """class_name이 없을 때 모듈에서 Generator 클래스 자동 탐색 (BaseGenerator 제외)"""
+    for name in dir(module):
+        obj = getattr(module, name)
+        if isinstance(obj, type) and name.endswith('Generator') and name != 'BaseGenerator':
+            return obj
+    return None
+
+
+class GeneratorRegistry:
+    """프로세스 전역 generator 모듈/클래스 레지스트리 (Thread-safe)"""
+
+    def __init__(self, templates_dir=TEMPLATES_DIR, package: str = 'templates'):
+        self.templates_dir = templates_dir
+        self.package = package
+        # generator 파일명 → (모듈, 로드 시점 소스 mtime)
+        self._modules: Dict[str, Tuple[Any, float]] = {}
+        self._classes: Dict[Tuple[str, Optional[str]], Optional[type]] = {}
+        self._lock = threading.RLock()
+
+    def get_module(self, generator_name: str):
+        """generator 모듈 반환 (파일이 없으면 None, 소스가 바뀌었으면 reload)"""
+        generator_path = self.templates_dir / generator_name
+        try:
+            mtime = generator_path.stat().st_mtime
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._modules.get(generator_name)
+            if cached is not None and cached[1] == mtime:
+                return cached[0]
+
+            module_name = f"{self.package}.{generator_path.stem}"
+            if cached is None:
+                module = importlib.import_module(module_name)
+                print(f"[Generator 레지스트리] ✅ 모듈 로드: {generator_name}")
+            else:
+                module = importlib.reload(cached[0])
+                print(f"[Generator 레지스트리] 소스 변경으로 모듈 재로드: {generator_name}")
+
+            self._modules[generator_name] = (module, mtime)
+            for key in [k for k in self._classes if k[0] == generator_name]:
+                del self._classes[key]
+            return module
+
+    def get_class(self, generator_name: str, class_name: Optional[str] = None) -> Optional[type]:
+        """generator 클래스 반환 (class_name이 없거나 찾지 못하면 자동 탐색)"""
+        with self._lock:
+            module = self.get_module(generator_name)
+            if module is None:
+                return None
+            key = (generator_name, class_name)
+            if key not in self._classes:
+                generator_class = getattr(module, class_name, None) if class_name else None
+                if not isinstance(generator_class, type):
+                    generator_class = _find_generator_class(module)
+                self._classes[key] = generator_class
+            return self._classes[key]
+
+    def warm_up(self) -> Dict[str, Any]:
+        """설정에 등록된 generator 모듈과 class_name을 미리 로드"""
+        from config.reports import SECTOR_REPORTS, SUMMARY_REPORTS, REGIONAL_REPORTS
+
+        loaded = set()
+        failed = {}
+        for config in (*SECTOR_REPORTS, *SUMMARY_REPORTS, *REGIONAL_REPORTS):
+            generator_name = config.get('generator')
+            if not generator_name:
+                continue
+            try:
+                if self.get_class(generator_name, config.get('class_name')) is not None:
+                    loaded.add(generator_name)
+            except Exception as e:
+                failed[generator_name] = str(e)
+                print(f"[Generator 레지스트리] 워밍업 실패: {generator_name} ({e})")
+
+        # 시도별 보도자료는 설정 대신 unified_generator의 RegionalReportGenerator를 직접 사용
+        try:
+            if self.get_class('unified_generator.py', 'RegionalReportGenerator') is not None:
+                loaded.add('unified_generator.py')
+        except Exception as e:
+            failed['unified_generator.py'] = str(e)
+
+        with self._lock:
+            classes = len([c for c in self._classes.values() if c is not None])
+        print(f"[Generator 레지스트리] ✅ 워밍업 완료: 모듈 {len(loaded)}개, 클래스 {classes}개")
+        return {'modules': sorted(loaded), 'failed': failed}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._modules.clear()
+            self._classes.clear()
+
+    def get_info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'modules': {name: mtime for name, (_, mtime) in self._modules.items()},
+                'classes': [f"{name}:{cls.__name__}" for (name, _), cls in self._classes.items() if cls is not None],
+            }
+
+
+# 전역 generator 레지스트리 인스턴스
+_generator_registry = GeneratorRegistry()
+
+
+def get_generator_module(generator_name: str):
+    """전역 레지스트리에서 generator 모듈 가져오기 (없으면 None)"""
+    return _generator_registry.get_module(generator_name)
+
+
+def get_generator_class(generator_name: str, class_name: Optional[str] = None) -> Optional[type]:
+    """전역 레지스트리에서 generator 클래스 가져오기"""
+    return _generator_registry.get_class(generator_name, class_name)
+
+
+def warm_up_generators() -> Dict[str, Any]:
+    """앱 시작 시 generator 모듈/클래스 미리 로드"""
+    return _generator_registry.warm_up()
+
+
+def get_generator_registry_info() -> Dict[str, Any]:
+    """generator 레지스트리 정보 반환"""
+    return _generator_registry.get_info()
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+증분 재생성 서비스
+
+분석표를 일부 시트만 수정해 다시 업로드한 경우, 입력이 바뀐 보도자료만 다시 생성하고
+나머지는 이전에 생성해 둔 결과를 재사용합니다.
+
+- 시트 지문: 시트 전체 셀 값의 해시 (설정된 표 범위 밖 셀을 읽는 보도자료도 있으므로 범위로 줄이지 않음)
+- 의존성: config.reports.REPORT_SHEET_DEPENDENCIES (보도자료 → 입력 시트)
+  + 생성 중 실제로 읽은 시트 (services.sheet_reads로 추적, 재사용 전에 지문 재확인)
+- 보도자료 입력 해시: 연도/분기 + 설정 버전 + 코드 스탬프(config/services/utils/templates/routes 소스)
+  + 의존 시트 지문 + 템플릿/Generator 파일 해시
+- 저장: 입력 해시를 키로 TEMP_BUILD_DIR에 HTML과 부문별 결과(sector payload)를 함께 저장
+  (content_store.ContentStore - 파일 잠금/원자적 기록/LRU). 업로드마다 같은 내용이면 같은 항목을
+  가리키므로 동시에 여러 요청이 생성해도 서로의 기록을 덮어쓰지 않습니다.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from config.settings import BASE_DIR, TEMP_BUILD_DIR, TEMPLATES_DIR, BUILD_STORE_MAX_BYTES
+from config.reports import REPORT_SHEET_DEPENDENCIES, SECTOR_REPORTS
+
+from .content_store import ContentStore, atomic_write
+
+
+# 저장 형식이 바뀌면 올려서 기존 항목을 무효화
+BUILD_FORMAT_VERSION = 1
+BUILD_SUFFIX = '.build.pkl'
+MISSING_SHEET_FINGERPRINT = 'missing'
+# 보도자료 생성에 관여하는 코드 (수정되면 이전 결과를 재사용하지 않음)
+CODE_STAMP_DIRS = ('config', 'services', 'utils', 'templates', 'routes')
+CODE_STAMP_SUFFIXES = ('.py', '.html')
+
+
+def fingerprint_frame(df: Optional[pd.DataFrame]) -> str:
+    """DataFrame 셀 값 해시 (행/열 라벨과 크기 포함)"""
+    if df is None:
+        return MISSING_SHEET_FINGERPRINT
+    digest = hashlib.sha256()
+    digest.update(repr((df.shape, list(df.index[:1]), list(df.columns[:1]))).encode('utf-8'))
+    if not df.empty:
+        digest.update(pd.util.hash_pandas_object(df.astype(str), index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def compute_sheet_fingerprints(excel_path: str, sheet_names: Iterable[str]) -> Dict[str, str]:
+    """시트별 전체 셀 값 지문 계산 (워크북 스냅샷 재사용)"""
+    from .workbook_snapshot import get_workbook_snapshot
+
+    snapshot = get_workbook_snapshot(excel_path)
+    fingerprints = {}
+    for sheet_name in sheet_names:
+        if not snapshot.has_sheet(sheet_name):
+            fingerprints[sheet_name] = MISSING_SHEET_FINGERPRINT
+        else:
+            fingerprints[sheet_name] = fingerprint_frame(snapshot.get_sheet(sheet_name))
+    return fingerprints
+
+
+def get_code_stamp() -> str:
+    """보도자료 생성 코드 전체의 소스 해시"""
+    from .sidecar_cache import source_digest
+
+    paths = sorted(
+        path
+        for dir_name in CODE_STAMP_DIRS
+        for path in (BASE_DIR / dir_name).rglob('*')
+        if path.suffix in CODE_STAMP_SUFFIXES and '__pycache__' not in path.parts
+    )
+    return source_digest(paths)
+
+
+def _file_digest(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return MISSING_SHEET_FINGERPRINT
+
+
+class IncrementalBuild:
+    """보도자료 일괄 생성 시 변경되지 않은 결과 재사용 관리"""
+
+    def __init__(self, excel_path: str, year: int, quarter: int, store: Optional[ContentStore] = None):
+        from .sidecar_cache import get_version_stamp
+
+        self.excel_path = str(excel_path)
+        self.year = year
+        self.quarter = quarter
+        self._version = f"{get_version_stamp()}:{get_code_stamp()}"
+        self._store = store if store is not None else _build_store
+        self._file_digests: Dict[str, str] = {}
+
+        needed_sheets: List[str] = []
+        for sheets in REPORT_SHEET_DEPENDENCIES.values():
+            for sheet_name in sheets:
+                if sheet_name not in needed_sheets:
+                    needed_sheets.append(sheet_name)
+        self.sheet_fingerprints = compute_sheet_fingerprints(self.excel_path, needed_sheets)
+        self._sector_ids = {config['id'] for config in SECTOR_REPORTS}
+
+    def _cached_file_digest(self, path: Path) -> str:
+        key = str(path)
+        if key not in self._file_digests:
+            self._file_digests[key] = _file_digest(path)
+        return self._file_digests[key]
+
+    def _fingerprints_for(self, sheet_names: Iterable[str]) -> Dict[str, str]:
+        """시트 지문 (의존성 목록 밖 시트는 처음 요청될 때 계산)"""
+        missing = [name for name in sheet_names if name not in self.sheet_fingerprints]
+        if missing:
+            self.sheet_fingerprints.update(compute_sheet_fingerprints(self.excel_path, missing))
+        return {name: self.sheet_fingerprints[name] for name in sheet_names}
+
+    def report_digest(self, report_id: str, template_name: Optional[str], generator_name: Optional[str] = None) -> str:
+        """보도자료 입력 해시 (코드 스탬프 + 의존 시트 지문 + 템플릿/Generator 파일)"""
+        digest = hashlib.sha256()
+        digest.update(f"{self._version}:{self.year}:{self.quarter}:{report_id}".encode('utf-8'))
+        for sheet_name in REPORT_SHEET_DEPENDENCIES.get(report_id, []):
+            digest.update(f"{sheet_name}={self.sheet_fingerprints.get(sheet_name)}".encode('utf-8'))
+        for file_name in (template_name, generator_name):
+            if file_name:
+                digest.update(self._cached_file_digest(TEMPLATES_DIR / file_name).encode('utf-8'))
+        return digest.hexdigest()
+
+    def try_reuse(self, report_id: str, digest: str, output_path: Path) -> Optional[str]:
+        """
+        입력이 바뀌지 않은 보도자료의 이전 결과를 output_path에 기록하고 경로 반환 (없으면 None)
+
+        이전 생성 때 실제로 읽은 시트의 지문이 모두 같아야 재사용하며,
+        부문별 보도자료는 저장해 둔 sector payload를 캐시에 복원합니다.
+        """
+        entry = self._store.load(digest, BUILD_FORMAT_VERSION)
+        if not entry or entry.get('report_id') != report_id:
+            return None
+
+        read_fingerprints = entry.get('sheet_reads', {})
+        if self._fingerprints_for(read_fingerprints) != read_fingerprints:
+            print(f"[증분 생성] 생성 시 읽은 시트가 바뀌어 재생성: {report_id}")
+            return None
+
+        if report_id in self._sector_ids:
+            payload = entry.get('sector_payload')
+            if payload is None:
+                return None
+            try:
+                from .excel_cache import set_sector_data
+                set_sector_data(self.excel_path, self.year, self.quarter, report_id, payload)
+            except Exception as e:
+                print(f"[증분 생성] 부문별 캐시 복원 실패, 재생성: {report_id} ({e})")
+                return None
+
+        try:
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(output_path, entry['html'].encode('utf-8'))
+        except Exception as e:
+            print(f"[증분 생성] 이전 결과 기록 실패, 재생성: {report_id} ({e})")
+            return None
+        return str(output_path)
+
+    def record(
+        self,
+        report_id: str,
+        digest: str,
+        output_path: str,
+        sheet_reads: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        새로 생성한 보도자료 결과 저장 (부문별은 sector payload도 저장)
+
+        Args:
+            sheet_reads: 생성 중 실제로 읽은 시트 (track_sheet_reads 결과, 다음 재사용 시 지문 재확인)
+        """
+        try:
+            html = Path(output_path).read_text(encoding='utf-8')
+        except OSError as e:
+            print(f"[증분 생성] 생성 결과 읽기 실패: {report_id} ({e})")
+            return
+
+        entry: Dict[str, Any] = {
+            'version': BUILD_FORMAT_VERSION,
+            'report_id': report_id,
+            'html': html,
+            'sheet_reads': self._fingerprints_for(sorted(sheet_reads or ())),
+        }
+        if report_id in self._sector_ids:
+            from .excel_cache import get_sector_data
+            payload = get_sector_data(self.excel_path, self.year, self.quarter, report_id)
+            if payload is None:
+                # 시도별/요약에서 사용할 캐시를 복원할 수 없으므로 재사용 대상에서 제외
+                return
+            entry['sector_payload'] = payload
+        self._store.save(digest, entry, meta={'report_id': report_id})
+
+
+# 전역 증분 생성 결과 저장소
+_build_store = ContentStore(TEMP_BUILD_DIR, BUILD_SUFFIX, BUILD_STORE_MAX_BYTES, label='증분 생성')
+
+
+def get_build_store_info() -> Dict[str, Any]:
+    """증분 생성 결과 저장소 정보 반환"""
+    return _build_store.get_info()
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+지연 로딩 워크북 프록시
+
+ExcelCache가 pd.ExcelFile을 그대로 넘기면 이를 사용하는 쪽에서 시트 전체를 반복 파싱할 수
+있으므로, 대신 이 프록시를 넘깁니다.
+
+- sheet_names: workbook.xml만 읽어 반환 (시트 파싱 없음)
+- 시트는 처음 접근할 때만 디코딩하고, 디코딩된 시트는 바이트 상한 내에서 LRU로 보관
+- resident_bytes로 현재 보관 중인 시트 메모리 크기 보고
+
+pd.ExcelFile.parse와 같은 시그니처를 제공하며, os.PathLike이므로 pd.read_excel(프록시)도 동작합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .sheet_reads import note_sheet_read
+
+
+SheetKey = Union[str, int]
+
+
+def estimate_frame_bytes(df: pd.DataFrame) -> int:
+    """DataFrame 메모리 크기 (object 열의 문자열 포함)"""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def _head_frame(df: pd.DataFrame, nrows: int) -> pd.DataFrame:
+    """앞 nrows행 (nrows로 읽은 것처럼 후행 빈 행/열 제거)"""
+    head = df.iloc[:nrows]
+    filled = head.notna().to_numpy()
+    if not filled.any():
+        return pd.DataFrame()
+    n_rows = int(np.flatnonzero(filled.any(axis=1)).max()) + 1
+    n_cols = int(np.flatnonzero(filled.any(axis=0)).max()) + 1
+    return head.iloc[:n_rows, :n_cols]
+
+
+class LazyWorkbook:
+    """pd.ExcelFile 호환 지연 로딩 프록시 (Thread-safe)"""
+
+    def __init__(self, excel_path: str, max_bytes: Optional[int] = None):
+        """
+        Args:
+            excel_path: 엑셀 파일 경로
+            max_bytes: 디코딩된 시트 보관 상한 (None이면 LAZY_WORKBOOK_MAX_BYTES)
+        """
+        if max_bytes is None:
+            from config.settings import LAZY_WORKBOOK_MAX_BYTES
+            max_bytes = LAZY_WORKBOOK_MAX_BYTES
+        self.excel_path = str(excel_path)
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._frames: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self._frame_bytes: Dict[str, int] = {}
+        self._resident_bytes = 0
+        self._stream_reader = None
+        self._stream_reader_checked = False
+        self._pandas_file: Optional[pd.ExcelFile] = None
+        self._sheet_names: Optional[List[str]] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ----- pd.ExcelFile 호환 속성 -----
+
+    @property
+    def io(self) -> str:
+        return self.excel_path
+
+    def __fspath__(self) -> str:
+        return self.excel_path
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """시트 목록 (workbook.xml만 읽음)"""
+        with self._lock:
+            if self._sheet_names is None:
+                reader = self._get_stream_reader()
+                source = reader if reader is not None else self._get_pandas_file()
+                self._sheet_names = list(source.sheet_names)
+            return list(self._sheet_names)
+
+    # ----- 내부 리더 -----
+
+    def _get_stream_reader(self):
+        """xlsx 스트리밍 리더 (설정에서 꺼져 있거나 xlsx가 아니면 None)"""
+        if not self._stream_reader_checked:
+            self._stream_reader_checked = True
+            from config.settings import USE_STREAMING_XLSX_READER
+            if USE_STREAMING_XLSX_READER and Path(self.excel_path).suffix.lower() in ('.xlsx', '.xlsm'):
+                try:
+                    from .xlsx_stream_reader import StreamingExcelFile
+                    self._stream_reader = StreamingExcelFile(self.excel_path)
+                except Exception as e:
+                    print(f"[LazyWorkbook] 스트리밍 리더 사용 불가, pandas로 대체: {e}")
+        return self._stream_reader
+
+    def _get_pandas_file(self) -> pd.ExcelFile:
+        """header 지정 등 스트리밍 리더가 지원하지 않는 파싱에만 pd.ExcelFile을 연다."""
+        if self._pandas_file is None:
+            self._pandas_file = pd.ExcelFile(self.excel_path)
+        return self._pandas_file
+
+    def _resolve_sheet_name(self, sheet_name: SheetKey) -> str:
+        if isinstance(sheet_name, int):
+            return self.sheet_names[sheet_name]
+        if sheet_name not in self.sheet_names:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        return sheet_name
+
+    def _decode_sheet(self, sheet_name: str) -> pd.DataFrame:
+        reader = self._get_stream_reader()
+        if reader is not None:
+            try:
+                return reader.parse(sheet_name, header=None)
+            except Exception as e:
+                print(f"[LazyWorkbook] 스트리밍 디코딩 실패, pandas로 대체: {sheet_name} ({e})")
+        return self._get_pandas_file().parse(sheet_name, header=None)
+
+    def _get_overlay_frame(self, sheet_name: str) -> Optional[pd.DataFrame]:
+        """
+        업로드 전처리에서 계산값을 등록한 파일의 분석 시트 계산값 (없으면 None)
+
+        오버레이 캐시가 스냅샷을 거쳐 이 프록시를 사용할 수 있으므로 lock 밖에서 조회합니다.
+        """
+        from .formula_overlay import get_registered_overlay_frames
+
+        frames = get_registered_overlay_frames(self.excel_path)
+        return frames.get(sheet_name) if frames else None
+
+    # ----- 디코딩 시트 LRU -----
+
+    def get_sheet(self, sheet_name: SheetKey) -> pd.DataFrame:
+        """
+        시트 DataFrame 반환 (header=None, 처음 접근 시에만 디코딩, 공유 객체이므로 수정 금지)
+
+        Raises:
+            ValueError: 시트가 없는 경우
+        """
+        name = self._resolve_sheet_name(sheet_name)
+        note_sheet_read(name)
+        overlay_df = self._get_overlay_frame(name)
+        if overlay_df is not None:
+            return overlay_df
+
+        with self._lock:
+            df = self._frames.get(name)
+            if df is not None:
+                self._frames.move_to_end(name)
+                self.hits += 1
+                return df
+
+            self.misses += 1
+            df = self._decode_sheet(name)
+            size = estimate_frame_bytes(df)
+            self._frames[name] = df
+            self._frame_bytes[name] = size
+            self._resident_bytes += size
+            self._evict()
+            return df
+
+    def _evict(self) -> None:
+        """상한 초과 시 가장 오래 사용되지 않은 시트부터 해제 (방금 디코딩한 시트는 보존)"""
+        while self._resident_bytes > self.max_bytes and len(self._frames) > 1:
+            name, _ = self._frames.popitem(last=False)
+            self._resident_bytes -= self._frame_bytes.pop(name)
+            self.evictions += 1
+
+    @property
+    def resident_bytes(self) -> int:
+        """현재 보관 중인 디코딩 시트 메모리 크기"""
+        with self._lock:
+            return self._resident_bytes
+
+    def release(self, sheet_name: Optional[str] = None) -> None:
+        """디코딩된 시트 해제 (None이면 전체)"""
+        with self._lock:
+            names = list(self._frames) if sheet_name is None else [sheet_name]
+            for name in names:
+                if name in self._frames:
+                    del self._frames[name]
+                    self._resident_bytes -= self._frame_bytes.pop(name)
+
+    # ----- pd.ExcelFile 호환 메서드 -----
+
+    def parse(
+        self,
+        sheet_name: Union[SheetKey, List[SheetKey], None] = 0,
+        header: Optional[int] = 0,
+        nrows: Optional[int] = None,
+        **kwargs
+    ) -> Union[pd.DataFrame, Dict[SheetKey, pd.DataFrame]]:
+        """
+        pd.ExcelFile.parse 호환
+
+        header=None 전체 시트는 LRU 보관분을 반환하며(수정 금지), 그 외 옵션은 매번 새로 파싱합니다.
+        계산값이 등록된 분석 시트는 header=None이면 계산값을 반환합니다 (header 지정 시 원본 파일 값).
+        """
+        if isinstance(sheet_name, list) or sheet_name is None:
+            names = self.sheet_names if sheet_name is None else sheet_name
+            return {name: self.parse(name, header=header, nrows=nrows, **kwargs) for name in names}
+
+        note_sheet_read(self._resolve_sheet_name(sheet_name))
+        if header is None and not kwargs:
+            if nrows is None:
+                return self.get_sheet(sheet_name)
+            overlay_df = self._get_overlay_frame(self._resolve_sheet_name(sheet_name))
+            if overlay_df is not None:
+                return _head_frame(overlay_df, nrows)
+            reader = self._get_stream_reader()
+            if reader is not None:
+                try:
+                    return reader.parse(self._resolve_sheet_name(sheet_name), header=None, nrows=nrows)
+                except Exception as e:
+                    print(f"[LazyWorkbook] 스트리밍 디코딩 실패, pandas로 대체: {sheet_name} ({e})")
+        return self._get_pandas_file().parse(sheet_name, header=header, nrows=nrows, **kwargs)
+
+    def get_info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'excel_path': self.excel_path,
+                'decoded_sheets': list(self._frames),
+                'resident_bytes': self._resident_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self.release()
+            if self._stream_reader is not None:
+                self._stream_reader.close()
+                self._stream_reader = None
+                self._stream_reader_checked = False
+            if self._pandas_file is not None:
+                self._pandas_file.close()
+                self._pandas_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+시트 병렬 디코딩 서비스
+
+xlsx의 각 워크시트는 zip 안의 독립된 XML 파트이므로, 스냅샷 사전 로드 시 필요한
+시트들을 ProcessPoolExecutor로 나누어 디코딩합니다. 워커는 시트를 DataFrame까지 만들고
+(타입 추론 포함), float64 열은 공유 메모리(multiprocessing.shared_memory)에 기록하여
+부모 프로세스가 복사 없이 그 메모리를 그대로 DataFrame 열로 사용합니다.
+문자열 등 그 외 열만 일반 직렬화로 전달합니다.
+
+- 공유 메모리 블록은 스냅샷이 보관하고, 스냅샷이 캐시에서 해제될 때 이름을 해제(unlink)합니다.
+  블록을 참조하는 DataFrame이 남아 있으면 매핑은 마지막 참조가 사라질 때 닫힙니다.
+- 워커 풀은 스레드가 있는 Flask 서버에서 fork하지 않도록 forkserver(POSIX) 또는 spawn으로
+  시작하고, 프로세스 시작 비용을 줄이기 위해 한 번 만든 풀을 재사용합니다.
+
+작은 파일이거나 워커 수가 1 이하이면 직렬 모드로 동작합니다.
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .xlsx_stream_reader import XlsxStreamReader
+
+
+def _decode_sheet_worker(excel_path: str, sheet_name: str) -> dict:
+    """워커 프로세스: 시트를 DataFrame으로 디코딩하고 float64 열은 공유 메모리에 기록"""
+    reader = XlsxStreamReader(excel_path)
+    try:
+        df = reader.read_sheet(sheet_name)
+    finally:
+        reader.close()
+
+    float_positions = [i for i, dtype in enumerate(df.dtypes) if dtype == np.float64]
+    shm_name = None
+    if float_positions and len(df):
+        # 열 단위로 연속된 (열 수, 행 수) 배열 - 부모에서 각 행이 곧 DataFrame 열
+        shm = shared_memory.SharedMemory(create=True, size=len(float_positions) * len(df) * 8)
+        block = np.ndarray((len(float_positions), len(df)), dtype=np.float64, buffer=shm.buf)
+        for i, position in enumerate(float_positions):
+            block[i] = df.iloc[:, position].to_numpy()
+        del block
+        shm_name = shm.name
+        shm.close()
+    else:
+        float_positions = []
+
+    float_set = set(float_positions)
+    other_positions = [i for i in range(len(df.columns)) if i not in float_set]
+    return {
+        'shm_name': shm_name,
+        'n_rows': len(df),
+        'index': df.index,
+        'columns': df.columns,
+        'float_positions': float_positions,
+        'others': df.iloc[:, other_positions],
+    }
+
+
+class SharedBlock:
+    """부모 프로세스에 매핑된 공유 메모리 블록 (DataFrame float64 열의 저장소)"""
+
+    def __init__(self, shm_name: str, shape: Tuple[int, int]):
+        self.name = shm_name
+        self._shm = shared_memory.SharedMemory(name=shm_name)
+        self._unlinked = False
+        self.array = np.ndarray(shape, dtype=np.float64, buffer=self._shm.buf)
+        self.array.flags.writeable = False
+        # 배열(과 이를 참조하는 DataFrame 열)이 모두 사라진 뒤에 매핑 닫기
+        weakref.finalize(self.array, self._shm.close)
+        _live_blocks.add(self)
+
+    @property
+    def nbytes(self) -> int:
+        return self.array.nbytes
+
+    def unlink(self) -> None:
+        """공유 메모리 이름 해제 (이미 매핑된 DataFrame은 계속 사용 가능)"""
+        if self._unlinked:
+            return
+        self._unlinked = True
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# 아직 unlink되지 않은 블록 (프로세스 종료 시 정리)
+_live_blocks: "weakref.WeakSet[SharedBlock]" = weakref.WeakSet()
+
+
+def _unlink_live_blocks() -> None:
+    for block in list(_live_blocks):
+        block.unlink()
+
+
+atexit.register(_unlink_live_blocks)
+
+
+def _attach_frame(payload: dict) -> Tuple[pd.DataFrame, Optional[SharedBlock]]:
+    """워커 결과 → DataFrame (float64 열은 공유 메모리 뷰, 복사 없음)"""
+    float_positions = payload['float_positions']
+    block = None
+    if payload['shm_name']:
+        block = SharedBlock(payload['shm_name'], (len(float_positions), payload['n_rows']))
+
+    others = payload['others']
+    float_slots = {position: i for i, position in enumerate(float_positions)}
+    columns = {}
+    other_iter = iter(range(len(others.columns)))
+    for position in range(len(payload['columns'])):
+        if position in float_slots:
+            columns[position] = pd.Series(block.array[float_slots[position]], index=payload['index'], copy=False)
+        else:
+            columns[position] = others.iloc[:, next(other_iter)]
+    df = pd.DataFrame(columns, index=payload['index'], copy=False)
+    df.columns = payload['columns']
+    return df, block
+
+
+def _discard_payload(payload: dict) -> None:
+    """사용하지 않을 워커 결과의 공유 메모리 정리"""
+    if payload.get('shm_name'):
+        try:
+            shm = shared_memory.SharedMemory(name=payload['shm_name'])
+            shm.close()
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def resolve_worker_count(excel_path: str, task_count: int) -> int:
+    """
+    설정과 파일 크기로 워커 수 결정 (1이면 직렬 모드)
+
+    - SNAPSHOT_DECODE_WORKERS: 0 또는 None이면 CPU 코어 수
+    - SNAPSHOT_PARALLEL_MIN_BYTES: 이보다 작은 파일은 프로세스 생성 비용이 더 커서 직렬 처리
+    """
+    from config.settings import SNAPSHOT_DECODE_WORKERS, SNAPSHOT_PARALLEL_MIN_BYTES
+
+    if task_count < 2:
+        return 1
+    try:
+        if Path(excel_path).stat().st_size < SNAPSHOT_PARALLEL_MIN_BYTES:
+            return 1
+    except OSError:
+        return 1
+
+    workers = SNAPSHOT_DECODE_WORKERS or os.cpu_count() or 1
+    return max(1, min(workers, task_count))
+
+
+def _get_mp_context():
+    """스레드가 있는 부모를 fork하지 않는 시작 방식 (forkserver 우선, 없으면 spawn)"""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ProcessPoolExecutor:
+    """재사용하는 디코딩 워커 풀 (워커 수가 모자라면 다시 생성)"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers < max_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=_get_mp_context())
+            _executor_workers = max_workers
+        return _executor
+
+
+def _reset_executor() -> None:
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        _executor_workers = 0
+
+
+atexit.register(_reset_executor)
+
+
+def decode_sheets_parallel(
+    excel_path: str,
+    sheet_names: List[str],
+    max_workers: int
+) -> Tuple[Dict[str, pd.DataFrame], List[SharedBlock]]:
+    """
+    시트 디코딩 작업을 프로세스 풀로 분산
+
+    Returns:
+        ({시트명: DataFrame}, 공유 메모리 블록 목록) - 블록은 호출부가 보관하다가 unlink
+    """
+    executor = _get_executor(max_workers)
+    futures = {name: executor.submit(_decode_sheet_worker, str(excel_path), name) for name in sheet_names}
+    frames: Dict[str, pd.DataFrame] = {}
+    blocks: List[SharedBlock] = []
+    try:
+        for name, future in futures.items():
+            df, block = _attach_frame(future.result())
+            frames[name] = df
+            if block is not None:
+                blocks.append(block)
+    except Exception as e:
+        # 실패 시 이미 생성된 공유 메모리가 남지 않도록 정리
+        for block in blocks:
+            block.unlink()
+        for name, future in futures.items():
+            if name in frames:
+                continue
+            try:
+                _discard_payload(future.result())
+            except Exception:
+                pass
+        if isinstance(e, BrokenProcessPool):
+            _reset_executor()
+        raise
+    return frames, blocks
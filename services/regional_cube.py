@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+지역 × 지표 × 분기 큐브 (RegionalIndicatorCube)
+
+요약 페이지(차트/하단 표)와 시도별 보도자료는 같은 부문 테이블 데이터에서 지역별 값을 각자
+dict로 다시 모으고 있었습니다. 이 큐브는 부문 데이터셋(SectorDataset)의 결과를 한 번만
+NumPy 배열로 옮겨 두고, 각 페이지는 배열 조회/슬라이싱으로 필요한 값을 읽습니다.
+
+- 축: 지역(전국 + 17개 시도) × 지표(SECTOR_REPORTS 부문) × 분기(기준 연도 전후 창)
+- 층: value(지수/금액 등) / change(전년동기비) / rate(청년층 비율) / series(분기별 값)
+- 값 없음은 NaN, 테이블에 지역 행이 있었는지는 present 마스크로 구분
+- 시도별 보도자료용 지역 행(region_row)은 테이블의 value/change_rate 원본 값을 그대로 보관
+  (문자열 등도 변환하지 않음, 같은 지역 행이 여러 개면 첫 행 - 이전 테이블 탐색과 동일)
+- 지표 열은 처음 조회될 때 해당 부문 데이터셋의 테이블 데이터로 한 번만 채움 (Thread-safe)
+  전국 요약 값(nationwide_data)은 요약 차트가 처음 필요로 할 때 extract_all_data 결과에서 채움
+"""
+
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.reports import REGION_DISPLAY_MAPPING, SECTOR_REPORTS
+
+
+# 전국 + 17개 시도 (테이블 추출 순서와 동일)
+CUBE_REGIONS: Tuple[str, ...] = ('전국',) + tuple(REGION_DISPLAY_MAPPING)
+CUBE_INDICATORS: Tuple[str, ...] = tuple(config.get('report_id', config['id']) for config in SECTOR_REPORTS)
+
+# 분기 키 ('2025 3/4', '2025. 3/4', '2025_3Q' 등) → (연도, 분기)
+_PERIOD_RE = re.compile(r'(20\d{2})\D+([1-4])')
+
+Period = Tuple[int, int]
+
+
+def _period_of(key: Any) -> Optional[Period]:
+    match = _PERIOD_RE.search(str(key))
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def period_window(year: int, quarter: int) -> Tuple[Period, ...]:
+    """
+    큐브 분기 축: (year-4)년 1분기 ~ (year+1)년 4분기
+
+    설정된 분기 컬럼이 요청 분기보다 앞설 수 있어(예: 2/4 요청, 3/4 컬럼) 다음 해까지 포함합니다.
+    """
+    return tuple((y, q) for y in range(year - 4, year + 2) for q in range(1, 5))
+
+
+def _to_number(value: Any) -> float:
+    """셀 값 → float (None/변환 불가 → NaN)"""
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _first_present(row: Dict[str, Any], keys: Sequence[str]) -> Any:
+    for key in keys:
+        if row.get(key) is not None:
+            return row.get(key)
+    return None
+
+
+def _report_table_data(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """extract_all_data() 결과의 테이블 행 목록 (table_data, 없으면 table_df)"""
+    table_data = data.get('table_data') or []
+    if not table_data:
+        table_df = data.get('table_df')
+        if isinstance(table_df, pd.DataFrame):
+            try:
+                table_data = table_df.to_dict(orient='records')
+            except Exception:
+                table_data = []
+        elif isinstance(table_df, list):
+            table_data = table_df
+    return table_data
+
+
+def _number_or_none(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+class RegionalIndicatorCube:
+    """지역 × 지표 × 분기 배열 (지표 열 단위 지연 채움, 채운 뒤에는 읽기 전용으로 취급)"""
+
+    # 요약 차트와 같은 필드 우선순위
+    VALUE_KEYS = ('value', 'index', 'rate', 'employment_rate', 'amount')
+    CHANGE_KEYS = ('change_rate', 'growth_rate', 'change')
+    NATIONWIDE_CHANGE_KEYS = ('growth_rate', 'change_rate', 'change')
+    NATIONWIDE_VALUE_KEYS = ('production_index', 'index_value', 'value', 'rate', 'amount', 'employment_rate')
+
+    def __init__(
+        self,
+        loader: Callable[[str], Any],
+        year: int,
+        quarter: int,
+        regions: Sequence[str] = CUBE_REGIONS,
+        indicators: Sequence[str] = CUBE_INDICATORS
+    ):
+        """
+        Args:
+            loader: 지표(report_id) → 부문 데이터셋 (get_table_data(), get_report_data() 제공)
+        """
+        self.regions = tuple(regions)
+        self.indicators = tuple(indicators)
+        self.periods = period_window(year, quarter)
+        self.region_index = {region: i for i, region in enumerate(self.regions)}
+        self.indicator_index = {indicator: j for j, indicator in enumerate(self.indicators)}
+        self.period_index = {period: k for k, period in enumerate(self.periods)}
+
+        shape = (len(self.regions), len(self.indicators))
+        self.value = np.full(shape, np.nan)
+        self.change = np.full(shape, np.nan)
+        self.rate = np.full(shape, np.nan)
+        self.present = np.zeros(shape, dtype=bool)
+        self.series = np.full(shape + (len(self.periods),), np.nan)
+        self.nationwide_value = np.full(len(self.indicators), np.nan)
+        self.nationwide_change = np.full(len(self.indicators), np.nan)
+        # (지역 행 번호, 지표 열 번호) → 테이블 원본 {'value', 'change_rate'}
+        self._region_rows: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+        self._loader = loader
+        self._sources: Dict[int, Any] = {}
+        self._loaded = np.zeros(len(self.indicators), dtype=bool)
+        self._nationwide_loaded = np.zeros(len(self.indicators), dtype=bool)
+        self._lock = threading.RLock()
+
+    # ----- 채우기 -----
+
+    def _column(self, indicator: str) -> int:
+        """지표 열 번호 (처음 조회 시 부문 데이터셋에서 채움)"""
+        j = self.indicator_index.get(indicator)
+        if j is None:
+            raise ValueError(f"큐브에 없는 지표입니다: {indicator}")
+        if not self._loaded[j]:
+            with self._lock:
+                if not self._loaded[j]:
+                    source = self._loader(indicator)
+                    self._sources[j] = source
+                    table_data = source.get_table_data()
+                    if not table_data:
+                        table_data = _report_table_data(source.get_report_data())
+                    self._fill(j, table_data)
+                    self._loaded[j] = True
+        return j
+
+    def _nationwide_column(self, indicator: str) -> int:
+        """지표 열 번호 (전국 요약 값까지 채움)"""
+        j = self._column(indicator)
+        if not self._nationwide_loaded[j]:
+            with self._lock:
+                if not self._nationwide_loaded[j]:
+                    nationwide_data = self._sources[j].get_report_data().get('nationwide_data') or {}
+                    if isinstance(nationwide_data, dict):
+                        self.nationwide_change[j] = _to_number(_first_present(nationwide_data, self.NATIONWIDE_CHANGE_KEYS))
+                        self.nationwide_value[j] = _to_number(_first_present(nationwide_data, self.NATIONWIDE_VALUE_KEYS))
+                    self._nationwide_loaded[j] = True
+        return j
+
+    def _fill(self, j: int, table_data: List[Dict[str, Any]]) -> None:
+        for row in table_data:
+            if not isinstance(row, dict):
+                continue
+            raw_i = self.region_index.get(row.get('region_name', row.get('region', '')))
+            if raw_i is not None and (raw_i, j) not in self._region_rows:
+                self._region_rows[(raw_i, j)] = {'value': row.get('value'), 'change_rate': row.get('change_rate')}
+            region_name = row.get('region_name') or row.get('region') or row.get('name')
+            i = self.region_index.get(region_name)
+            if i is None:
+                continue
+            self.present[i, j] = True
+            self.value[i, j] = _to_number(_first_present(row, self.VALUE_KEYS))
+            self.change[i, j] = _to_number(_first_present(row, self.CHANGE_KEYS))
+            self.rate[i, j] = _to_number(row.get('youth_rate'))
+            self.series[i, j, :] = np.nan
+            for key, value in zip(row.get('quarterly_keys') or [], row.get('quarterly_values') or []):
+                k = self.period_index.get(_period_of(key))
+                if k is not None:
+                    self.series[i, j, k] = _to_number(value)
+
+    # ----- 조회 -----
+
+    def _region_positions(self, regions: Sequence[str]) -> np.ndarray:
+        """지역명 → 행 번호 (큐브에 없는 지역은 -1)"""
+        return np.fromiter((self.region_index.get(region, -1) for region in regions), dtype=np.intp, count=len(regions))
+
+    def region_row(self, indicator: str, region: str) -> Optional[Dict[str, Any]]:
+        """지역 한 곳의 지표 값 {'region_name', 'value', 'change_rate'} (테이블 원본 값, 행이 없으면 None)"""
+        j = self._column(indicator)
+        i = self.region_index.get(region)
+        raw = self._region_rows.get((i, j)) if i is not None else None
+        if raw is None:
+            return None
+        return {'region_name': region, **raw}
+
+    def period_view(self, indicator: str, region: str) -> Dict[Period, float]:
+        """지역 한 곳의 분기별 값 (값 있는 분기만)"""
+        j = self._column(indicator)
+        i = self.region_index.get(region)
+        if i is None:
+            return {}
+        values = self.series[i, j]
+        return {self.periods[k]: float(values[k]) for k in np.flatnonzero(~np.isnan(values))}
+
+    def chart_data(
+        self,
+        indicator: str,
+        regions: Sequence[str],
+        is_trade: bool = False,
+        is_employment: bool = False
+    ) -> Dict[str, Any]:
+        """
+        요약 차트 구조 (증가/감소 상위 지역, 전국 값, 지역별 차트 행)
+
+        테이블에 행이 없는 지역은 증감률/값 0.0, 행은 있으나 값이 없으면 증감률 0.0/값 None입니다.
+        """
+        j = self._nationwide_column(indicator)
+        regions = list(regions)
+        positions = self._region_positions(regions)
+        known = positions >= 0
+        rows = np.where(known, positions, 0)
+        present = known & self.present[rows, j]
+
+        changes = np.where(present, self.change[rows, j], 0.0)
+        changes = np.where(np.isnan(changes), 0.0, changes)
+        values = self.value[rows, j]
+
+        chart_data = []
+        for region, change_val, value_val, has_row in zip(regions, changes.tolist(), values.tolist(), present.tolist()):
+            if not has_row:
+                value_val = 0.0
+            elif np.isnan(value_val):
+                value_val = None
+            data_row = {
+                'name': region,
+                'value': change_val,
+                'index': value_val,
+                'change': change_val,
+                'rate': value_val
+            }
+            if is_trade:
+                amount = value_val if value_val is not None else 0.0
+                data_row['amount'] = amount
+                data_row['amount_normalized'] = min(100, max(0, amount * 10))
+            chart_data.append(data_row)
+
+        # 증가: 내림차순, 감소: 오름차순 (같은 값은 지역 순서 유지)
+        increase = np.flatnonzero(changes >= 0)
+        decrease = np.flatnonzero(changes < 0)
+        increase = increase[np.argsort(-changes[increase], kind='stable')]
+        decrease = decrease[np.argsort(changes[decrease], kind='stable')]
+        increase_regions = [chart_data[k] for k in increase.tolist()]
+        decrease_regions = [chart_data[k] for k in decrease.tolist()]
+
+        nationwide_change = _number_or_none(self.nationwide_change[j])
+        nationwide_value = _number_or_none(self.nationwide_value[j])
+        if is_employment and nationwide_change is None:
+            nationwide_change = 0.0
+        nationwide = {'change': nationwide_change}
+        # change_rate 필드 보장
+        nationwide['change_rate'] = nationwide_change if nationwide_change is not None else 0.0
+        if is_trade:
+            nationwide['amount'] = nationwide_value if nationwide_value is not None else 0.0
+        else:
+            nationwide['index'] = nationwide_value
+            if is_employment:
+                nationwide['rate'] = nationwide_value if nationwide_value is not None else 0.0
+
+        def _empty():
+            return [{'name': '-', 'value': 0.0}]
+
+        return {
+            'nationwide': nationwide,
+            'increase_regions': increase_regions[:3] if increase_regions else _empty(),
+            'decrease_regions': decrease_regions[:3] if decrease_regions else _empty(),
+            'increase_count': len(increase_regions),
+            'decrease_count': len(decrease_regions),
+            'above_regions': increase_regions[:3] if increase_regions else _empty(),
+            'below_regions': decrease_regions[:3] if decrease_regions else _empty(),
+            'above_count': len(increase_regions),
+            'below_count': len(decrease_regions),
+            'chart_data': chart_data[:18]
+        }
+
+    def get_info(self) -> Dict[str, Any]:
+        return {
+            'shape': self.series.shape,
+            'loaded': [indicator for indicator, loaded in zip(self.indicators, self._loaded.tolist()) if loaded],
+            'nbytes': int(self.series.nbytes + self.value.nbytes + self.change.nbytes + self.rate.nbytes),
+        }
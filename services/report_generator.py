@@ -3,7 +3,7 @@
 보도자료 생성 서비스
 """
 
-import importlib.util
+import copy
 import json
 import inspect
 import warnings
@@ -15,9 +15,10 @@ from config.settings import TEMPLATES_DIR, SCHEMAS_DIR, UPLOAD_FOLDER, TEMP_OUTP
 from config.reports import SECTOR_REPORTS, VALID_REGIONS
 from utils.filters import is_missing, format_value
 from utils.text_utils import get_josa, get_terms, get_comparative_terms
-from utils.excel_utils import load_generator_module
 from utils.data_utils import check_missing_data
 from .excel_cache import get_excel_file, clear_excel_cache, get_sector_data, set_sector_data
+from .sector_dataset import get_sector_dataset
+from .generator_registry import get_generator_module, get_generator_class
 
 
 def _fixed_period_labels(year: int | None, quarter: int | None, age_label: str = "15-29세") -> tuple[list[str], list[str], list[str]]:
@@ -157,28 +158,29 @@ def _generate_from_schema(template_name, report_id, year, quarter, excel_path=No
         return None, f"스키마 기반 보도자료 생성 오류: {str(e)}", []
 
 
-def _generate_from_schema_with_excel(template_name, report_id, year, quarter, excel_path=None, custom_data=None):
-    """스키마 기본값으로 보도자료 생성 (엑셀 경로 전달 가능, 실제 데이터 우선 사용)"""
+def _generate_from_schema_with_excel(template_name, report_id, year, quarter, excel_path=None, custom_data=None, summary_service=None):
+    """스키마 기본값으로 보도자료 생성 (엑셀 경로 전달 가능, 실제 데이터 우선 사용)
+
+    summary_service: 일괄 생성에서 공유하는 SummaryDataService (없으면 이 호출에서만 생성)
+    """
     try:
         # 요약 보도자료는 실제 데이터를 사용하도록 처리
-        from services.summary_data import (
-            get_summary_overview_data, get_summary_table_data,
-            get_production_summary_data, get_consumption_construction_data,
-            get_trade_price_data, get_employment_population_data
-        )
+        from services.summary_data import SummaryDataService
         
         data = None
         
         # 요약 보도자료별 실제 데이터 생성 시도
         if excel_path and Path(excel_path).exists():
             try:
+                if summary_service is None:
+                    summary_service = SummaryDataService(excel_path, year, quarter)
                 if report_id == 'summary_overview':
                     # 요약-지역경제동향: 실제 데이터 사용
-                    summary_data = get_summary_overview_data(excel_path, year, quarter)
+                    summary_data = summary_service.overview()
                     if not summary_data:
                         raise ValueError("get_summary_overview_data가 None 반환")
                     # 템플릿에서 summary 키를 사용하므로 데이터를 summary로 감싸기
-                    table_data = get_summary_table_data(excel_path, year, quarter)
+                    table_data = summary_service.table_data()
                     
                     # table_data를 템플릿에서 사용하는 table_df 형식으로 변환
                     # 템플릿에서는 table_df (리스트 of 딕셔너리) 또는 table_data.region_rows를 사용
@@ -218,25 +220,25 @@ def _generate_from_schema_with_excel(template_name, report_id, year, quarter, ex
                 
                 elif report_id == 'summary_production':
                     # 요약-생산: 실제 데이터 사용
-                    data = get_production_summary_data(excel_path, year, quarter)
+                    data = summary_service.production()
                     if not data:
                         raise ValueError("get_production_summary_data가 None 반환")
                 
                 elif report_id == 'summary_consumption':
                     # 요약-소비건설: 실제 데이터 사용
-                    data = get_consumption_construction_data(excel_path, year, quarter)
+                    data = summary_service.consumption_construction()
                     if not data:
                         raise ValueError("get_consumption_construction_data가 None 반환")
                 
                 elif report_id == 'summary_trade_price':
                     # 요약-수출물가: 실제 데이터 사용 (이미 generate_report_html에서 처리됨)
-                    data = get_trade_price_data(excel_path, year, quarter)
+                    data = summary_service.trade_price()
                     if not data:
                         raise ValueError("get_trade_price_data가 None 반환")
                 
                 elif report_id == 'summary_employment':
                     # 요약-고용인구: 실제 데이터 사용
-                    data = get_employment_population_data(excel_path, year, quarter)
+                    data = summary_service.employment_population()
                     if not data:
                         raise ValueError("get_employment_population_data가 None 반환")
             except Exception as data_error:
@@ -311,7 +313,22 @@ def _generate_from_schema_with_excel(template_name, report_id, year, quarter, ex
         return None, f"스키마 기반 보도자료 생성 오류: {str(e)}", []
 
 
-def generate_report_html(excel_path, report_config, year, quarter, custom_data=None, excel_file=None):
+def _report_id_of(report_config: dict) -> str | None:
+    return report_config.get('report_id') or report_config.get('id')
+
+
+def _uses_sector_dataset(report_config: dict) -> bool:
+    """통합 Generator로 만드는 부문 보고서인지 (공유 부문 데이터셋 대상)"""
+    if report_config.get('generator') != 'unified_generator.py':
+        return False
+    report_id = _report_id_of(report_config)
+    return any(
+        isinstance(r, dict) and (r.get('report_id') or r.get('id')) == report_id
+        for r in SECTOR_REPORTS
+    )
+
+
+def generate_report_html(excel_path, report_config, year, quarter, custom_data=None, excel_file=None, summary_service=None):
     """보도자료 HTML 생성 (최적화 버전 - 엑셀 파일 캐싱 지원)
     
     Args:
@@ -321,11 +338,13 @@ def generate_report_html(excel_path, report_config, year, quarter, custom_data=N
         quarter: 분기
         custom_data: 커스텀 데이터 (선택)
         excel_file: 캐시된 ExcelFile 객체 (선택사항, 있으면 재사용)
+        summary_service: 요약 보도자료용 SummaryDataService (선택사항, 일괄 생성 시 한 번 만들어 공유)
     
     주의: 기초자료 수집표는 사용하지 않으며, 분석표만 사용합니다.
     """
     try:
         generator = None
+        sector_dataset = None
         
         # 파일 존재 및 접근 가능 여부 확인
         excel_path_obj = Path(excel_path)
@@ -353,10 +372,13 @@ def generate_report_html(excel_path, report_config, year, quarter, custom_data=N
         # Generator가 None인 경우 (요약 보도자료 등) 실제 데이터 사용 또는 스키마 기본값
         if generator_name is None:
             # 요약-수출물가는 실제 데이터 사용
+            if summary_service is None:
+                from services.summary_data import SummaryDataService
+                summary_service = SummaryDataService(excel_path, year, quarter, excel_file=excel_file)
+            
             if report_id == 'summary_trade_price':
-                from services.summary_data import get_trade_price_data
                 try:
-                    trade_price_data = get_trade_price_data(excel_path, year, quarter)
+                    trade_price_data = summary_service.trade_price()
                     # amount를 숫자로 보장
                     if trade_price_data and 'exports' in trade_price_data:
                         exports = trade_price_data['exports']
@@ -402,7 +424,9 @@ def generate_report_html(excel_path, report_config, year, quarter, custom_data=N
                     return None, f"요약-수출물가 데이터 생성 오류: {str(e)}", []
             
             # 기타 요약 보도자료는 스키마 기본값 사용 (엑셀 경로 전달)
-            return _generate_from_schema_with_excel(template_name, report_id, year, quarter, excel_path, custom_data)
+            return _generate_from_schema_with_excel(
+                template_name, report_id, year, quarter, excel_path, custom_data, summary_service=summary_service
+            )
         
         # Generator 모듈 로드 (안전한 처리)
         if not generator_name or not isinstance(generator_name, str):
@@ -411,10 +435,12 @@ def generate_report_html(excel_path, report_config, year, quarter, custom_data=N
             return None, error_msg, []
         
         try:
-            module = load_generator_module(generator_name)
+            module = get_generator_module(generator_name)
             if not module:
                 print(f"[ERROR] Generator 모듈을 찾을 수 없습니다: {generator_name}")
                 return None, f"Generator 모듈을 찾을 수 없습니다: {generator_name}", []
+            # Generator 클래스 (config의 class_name 우선, 없으면 자동 탐색 - BaseGenerator 제외)
+            generator_class = get_generator_class(generator_name, report_config.get('class_name'))
         except Exception as e:
             import traceback
             error_msg = f"Generator 모듈 로드 중 오류 발생: {str(e)}"
@@ -425,25 +451,6 @@ def generate_report_html(excel_path, report_config, year, quarter, custom_data=N
         # 사용 가능한 함수 확인
         available_funcs = [name for name in dir(module) if not name.startswith('_')]
         
-        # Generator 클래스 찾기 (BaseGenerator 제외)
-        generator_class = None
-        
-        # config에서 class_name이 지정되어 있으면 우선 사용
-        if 'class_name' in report_config:
-            class_name = report_config['class_name']
-            if hasattr(module, class_name):
-                generator_class = getattr(module, class_name)
-                print(f"[보도자료 생성] 클래스명으로 찾음: {class_name}")
-        
-        # class_name으로 못 찾았으면 자동 탐색
-        if generator_class is None:
-            for name in dir(module):
-                obj = getattr(module, name)
-                if isinstance(obj, type) and name.endswith('Generator') and name != 'BaseGenerator':
-                    generator_class = obj
-                    print(f"[보도자료 생성] 자동 탐색으로 찾음: {name}")
-                    break
-        
         data = None
         
         # 방법 1: generate_report_data 함수 사용
@@ -498,7 +505,22 @@ def generate_report_html(excel_path, report_config, year, quarter, custom_data=N
             except (TypeError, AttributeError):
                 data = module.generate_report(excel_path, template_path, output_path)
         
-        # 방법 3: Generator 클래스 사용 (안전한 처리)
+        # 방법 3: 공유 부문 데이터셋 사용 (통합 Generator 부문 보고서, 시도별/요약 단계와 공유)
+        elif generator_class and _uses_sector_dataset(report_config) and excel_path:
+            try:
+                sector_dataset = get_sector_dataset(
+                    excel_path, year, quarter, _report_id_of(report_config), excel_file=excel_file
+                )
+                generator = sector_dataset.generator
+                data = sector_dataset.get_report_data()
+            except Exception as extract_error:
+                import traceback
+                error_msg = f"데이터 추출 중 오류 발생: {str(extract_error)}"
+                print(f"[ERROR] {error_msg}")
+                traceback.print_exc()
+                return None, error_msg, []
+
+        # 방법 4: Generator 클래스 사용 (안전한 처리)
         elif generator_class:
             try:
                 # __init__ 시그니처 확인하여 year, quarter, excel_file 전달 시도
@@ -574,14 +596,16 @@ def generate_report_html(excel_path, report_config, year, quarter, custom_data=N
                 for r in SECTOR_REPORTS
                 if isinstance(r, dict)
             }
-            current_report_id = report_config.get('report_id') or report_config.get('id')
+            current_report_id = _report_id_of(report_config)
 
             if current_report_id in sector_report_ids and excel_path:
                 cached_sector = get_sector_data(excel_path, year, quarter, current_report_id)
                 if cached_sector is None:
-                    sector_payload = {'data': data}
-                    if isinstance(data, dict) and 'table_data' in data:
-                        sector_payload['table_data'] = data.get('table_data')
+                    # 아래에서 보고서 정보 등을 덧붙이기 전의 추출 결과를 별도 복사본으로 캐시
+                    undecorated = copy.deepcopy(data)
+                    sector_payload = {'data': undecorated}
+                    if isinstance(undecorated, dict) and 'table_data' in undecorated:
+                        sector_payload['table_data'] = undecorated.get('table_data')
 
                     # 전처리 DF 저장
                     try:
@@ -602,7 +626,18 @@ def generate_report_html(excel_path, report_config, year, quarter, custom_data=N
                         print(f"[WARNING] 전처리 DF 캐시 저장 실패: {cache_df_error}")
 
                     industries_by_region = {}
-                    if generator is not None and hasattr(generator, '_extract_industry_data'):
+                    if sector_dataset is not None:
+                        # 전 지역 업종 순위를 한 번에 계산 (시도별/요약 단계와 공유)
+                        try:
+                            industry_rankings = sector_dataset.get_industry_rankings()
+                        except Exception:
+                            industry_rankings = {}
+                        for region in VALID_REGIONS:
+                            ranked = industry_rankings.get(region)
+                            industries_by_region[region] = ranked['industries'] if ranked else []
+                        sector_payload['industries_by_region'] = industries_by_region
+                        sector_payload['industry_rankings'] = industry_rankings
+                    elif generator is not None and hasattr(generator, '_extract_industry_data'):
                         for region in VALID_REGIONS:
                             try:
                                 industries_by_region[region] = generator._extract_industry_data(region)
@@ -843,25 +878,36 @@ def generate_report_html(excel_path, report_config, year, quarter, custom_data=N
 
 def generate_regional_report_html(excel_path, region_name, is_reference=False, year=None, quarter=None, excel_file=None):
     """시도별 보도자료 HTML 생성 (unified_generator 사용)"""
+    results = generate_regional_reports_html(excel_path, [region_name], year=year, quarter=quarter, excel_file=excel_file)
+    return results[region_name]
+
+
+def generate_regional_reports_html(excel_path, region_names, year=None, quarter=None, excel_file=None):
+    """
+    여러 시도의 보도자료 HTML 일괄 생성
+    
+    RegionalReportGenerator를 (파일, 연도, 분기)당 한 번만 만들고, 부문 generator/테이블 데이터와
+    컴파일된 템플릿을 모든 지역이 공유합니다.
+    
+    Returns:
+        {지역명: (html_content, error)} (요청 순서 유지, 지역별 오류는 해당 항목에만 기록)
+    """
+    region_names = list(region_names)
     try:
         # 파일 존재 확인
         excel_path_obj = Path(excel_path)
         if not excel_path_obj.exists() or not excel_path_obj.is_file():
             error_msg = f"엑셀 파일을 찾을 수 없습니다: {excel_path}"
             print(f"[ERROR] {error_msg}")
-            return None, error_msg
-        
-        # unified_generator.py에서 RegionalReportGenerator 사용
-        generator_path = TEMPLATES_DIR / 'unified_generator.py'
-        if not generator_path.exists():
-            return None, f"unified_generator.py를 찾을 수 없습니다"
+            return {region_name: (None, error_msg) for region_name in region_names}
         
-        spec = importlib.util.spec_from_file_location('unified_generator', str(generator_path))
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # unified_generator.py에서 RegionalReportGenerator 사용 (레지스트리에 로드된 모듈)
+        module = get_generator_module('unified_generator.py')
+        if module is None:
+            return {region_name: (None, f"unified_generator.py를 찾을 수 없습니다") for region_name in region_names}
         
         if not hasattr(module, 'RegionalReportGenerator'):
-            return None, f"RegionalReportGenerator 클래스를 찾을 수 없습니다"
+            return {region_name: (None, f"RegionalReportGenerator 클래스를 찾을 수 없습니다") for region_name in region_names}
         
         # year, quarter가 없으면 기본값 사용
         if year is None:
@@ -871,17 +917,25 @@ def generate_regional_report_html(excel_path, region_name, is_reference=False, y
         
         generator = module.RegionalReportGenerator(excel_path, year=year, quarter=quarter, excel_file=excel_file)
         template_path = TEMPLATES_DIR / 'regional_economy_by_region_template.html'
-        
-        html_content = generator.render_html(region_name, str(template_path))
-        
-        return html_content, None
-        
     except Exception as e:
         import traceback
         error_msg = f"시도별 보도자료 생성 오류: {str(e)}"
         print(f"[ERROR] {error_msg}")
         traceback.print_exc()
-        return None, error_msg
+        return {region_name: (None, error_msg) for region_name in region_names}
+    
+    results = {}
+    with generator.batch_rendering():
+        for region_name in region_names:
+            try:
+                results[region_name] = (generator.render_html(region_name, str(template_path)), None)
+            except Exception as e:
+                import traceback
+                error_msg = f"시도별 보도자료 생성 오류: {str(e)}"
+                print(f"[ERROR] {error_msg}")
+                traceback.print_exc()
+                results[region_name] = (None, error_msg)
+    return results
 
 
 def generate_statistics_report_html(excel_path, year, quarter):
@@ -920,11 +974,8 @@ def generate_individual_statistics_html(excel_path, stat_config, year, quarter):
         table_name = stat_config.get('table_name')
         
         # 통계표 Generator 모듈 로드
-        generator_path = TEMPLATES_DIR / 'statistics_table_generator.py'
-        if generator_path.exists():
-            spec = importlib.util.spec_from_file_location('statistics_table_generator', str(generator_path))
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+        module = get_generator_module('statistics_table_generator.py')
+        if module is not None:
             
             # Generator 초기화 시그니처 확인하여 raw_excel_path 파라미터 제거
             import inspect
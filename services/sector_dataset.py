@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+부문 데이터셋 공유 레지스트리 (SectorDataset)
+
+일괄 생성 한 번에 같은 집계 시트를 부문 보고서(UnifiedReportGenerator), 시도별 보고서
+(RegionalReportGenerator), 요약(summary_data) 단계가 각각 다시 로드하던 것을 없애기 위해
+(파일 경로, 내용 해시, 연도, 분기, 부문) 단위로 로드된 생성기와 추출 결과를 한 번만 만들어 공유합니다.
+
+- 키: (경로, SHA-256, year, quarter, report_id) → 같은 경로의 파일 내용이 바뀌면 새 데이터셋.
+  생성기는 처음 로드한 뒤에도 자기 경로의 스냅샷을 다시 읽으므로 경로별로 두고,
+  clear(path)는 그 경로의 데이터셋만 정리 (같은 내용의 다른 경로 데이터셋은 유지)
+- 생성기: 처음 요청될 때 한 번만 생성/로드 (동시 요청은 데이터셋 lock으로 직렬화)
+- 추출 결과: table_data / extract_all_data() / 지역별 업종 데이터와 업종 순위를 처음 요청 시 계산 후 보관
+  (extract_all_data 결과는 호출자가 수정해도 보관본이 바뀌지 않도록 깊은 복사본으로 반환)
+- 용량 제한: 최근 사용 순(LRU)으로 max_datasets개까지 유지
+- 지역 큐브: (경로, SHA-256, year, quarter)당 RegionalIndicatorCube 하나 (요약/시도별 페이지가 공유)
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DatasetKey = Tuple[str, str, Any, Any, str]
+
+
+def _canonical_report_id(report_type: str) -> str:
+    """부문 별칭(mining 등)을 설정의 report_id로 정규화"""
+    from config.reports import get_report_spec
+
+    spec = get_report_spec(report_type)
+    return spec.report_id or spec.id or report_type
+
+
+class SectorDataset:
+    """한 부문의 로드된 생성기와 추출 결과 (Thread-safe, 결과는 읽기 전용으로 취급)"""
+
+    def __init__(self, key: DatasetKey, excel_file=None):
+        self.key = key
+        self.excel_path, self.file_digest, self.year, self.quarter, self.report_id = key
+        self._excel_file = excel_file
+        self._generator = None
+        self._table_data: Optional[List[Dict[str, Any]]] = None
+        self._report_data: Optional[Dict[str, Any]] = None
+        self._industries: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def generator(self):
+        """로드된 UnifiedReportGenerator (처음 접근 시 생성)"""
+        with self._lock:
+            if self._generator is None:
+                from templates.unified_generator import UnifiedReportGenerator
+
+                self._generator = UnifiedReportGenerator(
+                    self.report_id,
+                    self.excel_path,
+                    year=self.year,
+                    quarter=self.quarter,
+                    excel_file=self._excel_file
+                )
+                # 생성 후에는 ExcelFile 핸들을 붙잡지 않음 (핸들 수명은 ExcelCache가 관리)
+                self._excel_file = None
+                print(f"[부문 데이터셋] ✅ {self.report_id} 로드 ({self.file_digest[:12]})")
+            return self._generator
+
+    def attach_generator(self, generator, report_data: Optional[Dict[str, Any]] = None) -> None:
+        """부문 단계에서 이미 로드한 생성기/추출 결과 등록 (없는 항목만 채움)"""
+        with self._lock:
+            if self._generator is None:
+                self._generator = generator
+            if self._report_data is None and isinstance(report_data, dict):
+                self._report_data = report_data
+            if self._table_data is None and isinstance(report_data, dict):
+                table_data = report_data.get('table_data')
+                if isinstance(table_data, list):
+                    self._table_data = table_data
+
+    def get_table_data(self) -> List[Dict[str, Any]]:
+        """지역별 테이블 데이터 (_extract_table_data_ssot 결과)"""
+        with self._lock:
+            if self._table_data is None:
+                self._table_data = self.generator._extract_table_data_ssot()
+            return self._table_data
+
+    def get_report_data(self) -> Dict[str, Any]:
+        """extract_all_data() 결과 (호출자별 깊은 복사본 - 보고서 정보 등을 덧붙여도 보관본은 그대로)"""
+        with self._lock:
+            if self._report_data is None:
+                data = self.generator.extract_all_data()
+                self._report_data = data if isinstance(data, dict) else {}
+                if self._table_data is None and isinstance(self._report_data.get('table_data'), list):
+                    self._table_data = self._report_data['table_data']
+            return copy.deepcopy(self._report_data)
+
+    def get_industry_rankings(self, top_n: int = 3) -> Dict[str, Dict[str, Any]]:
+        """전 지역 업종 증가/감소 상위 top_n (생성기의 일괄 순위 결과, 부문/시도별/요약 공유)"""
+        with self._lock:
+            return self.generator.rank_industries_by_region(top_n)
+
+    def get_industries(self, region_name: str) -> List[Dict[str, Any]]:
+        """지역별 업종 데이터 (_extract_industry_data 결과)"""
+        with self._lock:
+            if region_name not in self._industries:
+                ranked = self.get_industry_rankings().get(region_name)
+                if ranked is not None:
+                    self._industries[region_name] = ranked['industries']
+                else:
+                    self._industries[region_name] = self.generator._extract_industry_data(region_name) or []
+            return self._industries[region_name]
+
+    def to_sector_payload(self) -> Dict[str, Any]:
+        """SectorDataCache와 같은 형태의 payload (요약 차트 생성용)"""
+        data = self.get_report_data()
+        return {
+            'data': data,
+            'table_data': self.get_table_data(),
+            'industry_rankings': self.get_industry_rankings(),
+        }
+
+
+class SectorDatasetRegistry:
+    """프로세스 전역 SectorDataset 레지스트리 (Thread-safe, LRU)"""
+
+    def __init__(self, max_datasets: int = 32):
+        self.max_datasets = max_datasets
+        self._datasets: "OrderedDict[DatasetKey, SectorDataset]" = OrderedDict()
+        self._cubes: "OrderedDict[Tuple[str, str, Any, Any], Any]" = OrderedDict()
+        # (경로, mtime, 크기) → SHA-256 (요청마다 파일 전체를 다시 해시하지 않도록)
+        self._digests: Dict[Tuple[str, float, int], str] = {}
+        self._lock = threading.Lock()
+
+    def _file_digest(self, excel_path: str) -> str:
+        from .sidecar_cache import compute_file_sha256
+
+        stat = Path(excel_path).stat()
+        stamp = (str(excel_path), stat.st_mtime, stat.st_size)
+        with self._lock:
+            digest = self._digests.get(stamp)
+        if digest is None:
+            digest = compute_file_sha256(excel_path)
+            with self._lock:
+                # 같은 경로의 이전 버전 해시는 제거
+                for old in [s for s in self._digests if s[0] == stamp[0]]:
+                    del self._digests[old]
+                self._digests[stamp] = digest
+        return digest
+
+    def get_dataset(self, excel_path: str, year, quarter, report_type: str, excel_file=None) -> SectorDataset:
+        """데이터셋 조회 (없으면 등록만 하고, 생성기 로드는 처음 사용할 때 수행)"""
+        key = (str(excel_path), self._file_digest(excel_path), year, quarter, _canonical_report_id(report_type))
+        with self._lock:
+            dataset = self._datasets.get(key)
+            if dataset is not None:
+                self._datasets.move_to_end(key)
+                return dataset
+            dataset = SectorDataset(key, excel_file=excel_file)
+            self._datasets[key] = dataset
+            while len(self._datasets) > self.max_datasets:
+                self._datasets.popitem(last=False)
+            return dataset
+
+    def get_cube(self, excel_path: str, year, quarter, excel_file=None):
+        """지역 × 지표 × 분기 큐브 조회 (지표 열은 처음 사용할 때 부문 데이터셋에서 채움)"""
+        from .regional_cube import RegionalIndicatorCube
+
+        key = (str(excel_path), self._file_digest(excel_path), year, quarter)
+        with self._lock:
+            cube = self._cubes.get(key)
+            if cube is not None:
+                self._cubes.move_to_end(key)
+                return cube
+
+            def _load(report_id: str) -> SectorDataset:
+                return self.get_dataset(excel_path, year, quarter, report_id, excel_file=excel_file)
+
+            cube = RegionalIndicatorCube(_load, year, quarter)
+            self._cubes[key] = cube
+            while len(self._cubes) > self.max_datasets:
+                self._cubes.popitem(last=False)
+            return cube
+
+    def clear(self, excel_path: Optional[str] = None) -> None:
+        with self._lock:
+            if excel_path is None:
+                self._datasets.clear()
+                self._cubes.clear()
+                self._digests.clear()
+                return
+            path_key = str(excel_path)
+            for stamp in [s for s in self._digests if s[0] == path_key]:
+                del self._digests[stamp]
+            for key in [k for k in self._datasets if k[0] == path_key]:
+                del self._datasets[key]
+            for key in [k for k in self._cubes if k[0] == path_key]:
+                del self._cubes[key]
+
+    def get_info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'datasets': len(self._datasets),
+                'cubes': len(self._cubes),
+                'max_datasets': self.max_datasets,
+                'keys': [(Path(path).name, digest[:12], year, quarter, report_id)
+                         for path, digest, year, quarter, report_id in self._datasets],
+            }
+
+
+# 전역 부문 데이터셋 레지스트리 인스턴스
+_dataset_registry = SectorDatasetRegistry()
+
+
+def get_sector_dataset(excel_path: str, year, quarter, report_type: str, excel_file=None) -> SectorDataset:
+    """전역 레지스트리에서 부문 데이터셋 가져오기"""
+    return _dataset_registry.get_dataset(excel_path, year, quarter, report_type, excel_file=excel_file)
+
+
+def get_regional_cube(excel_path: str, year, quarter, excel_file=None):
+    """전역 레지스트리에서 지역 × 지표 × 분기 큐브 가져오기"""
+    return _dataset_registry.get_cube(excel_path, year, quarter, excel_file=excel_file)
+
+
+def clear_sector_datasets(excel_path: Optional[str] = None) -> None:
+    """
+    부문 데이터셋 정리 (경로 지정 시 해당 경로의 데이터셋만)
+
+    생성기의 헤더 탐색 결과는 파일이 아닌 헤더 내용을 키로 여러 파일이 공유하므로
+    전체 정리(excel_path=None)일 때만 함께 삭제합니다.
+    """
+    _dataset_registry.clear(excel_path)
+    if excel_path is None:
+        from templates.unified_generator import UnifiedReportGenerator
+
+        UnifiedReportGenerator.clear_header_detections()
+
+
+def get_sector_dataset_info() -> Dict[str, Any]:
+    """부문 데이터셋 레지스트리 정보 반환"""
+    return _dataset_registry.get_info()
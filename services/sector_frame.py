@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+부문 집계 시트의 압축 표현 (SectorFrame)
+
+집계 시트는 header=None으로 읽은 object DataFrame이라 숫자는 모두 박싱되고 지역명/산업명은
+행마다 별도 문자열입니다. 생성기가 반복하는 필터(지역 일치, 산업명 조회)와 지수 추출을 위해
+데이터 시작 행부터 다음 형태로 한 번만 변환합니다.
+
+- 지역/산업코드/산업명 컬럼: 프레임별 어휘(Vocabulary)의 정수 코드 (int32)
+  (어휘는 프레임과 함께 해제되므로 업로드가 반복되어도 라벨이 누적되지 않음)
+- 기간 컬럼(target_col, prev_y_col, quarterly_cols 등): 연속 float64 배열 (값 없음 = NaN)
+
+필터는 문자열 비교 대신 정수 비교가 되며, 결과 위치(positions)는 원본 DataFrame의
+데이터 구간(data_start_row 이후)에 대한 iloc 위치와 같습니다. 지역별 행 위치는 생성 시
+한 번 그룹화해 두므로 지역 조회는 사전 조회(O(1))입니다.
+"""
+
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class Vocabulary:
+    """문자열 ↔ 정수 코드 어휘 (Thread-safe, 추가만 가능 - SectorFrame마다 따로 보유)"""
+
+    def __init__(self):
+        self._codes: Dict[str, int] = {}
+        self._labels: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def encode(self, labels: Iterable[str]) -> np.ndarray:
+        """라벨 목록 → 코드 배열 (처음 보는 라벨은 새 코드 부여)"""
+        with self._lock:
+            codes = self._codes
+            result = []
+            for label in labels:
+                code = codes.get(label)
+                if code is None:
+                    code = len(self._labels)
+                    codes[label] = code
+                    self._labels.append(label)
+                result.append(code)
+        return np.asarray(result, dtype=np.int32)
+
+    def code(self, label: str) -> int:
+        """라벨의 코드 (어휘에 없으면 -1)"""
+        return self._codes.get(label, -1)
+
+    def label(self, code: int) -> str:
+        return self._labels[code]
+
+    def codes_matching(self, pattern: str) -> np.ndarray:
+        """정규식과 일치하는(search) 라벨의 코드 배열"""
+        regex = re.compile(pattern)
+        with self._lock:
+            labels = list(self._labels)
+        return np.asarray([code for code, label in enumerate(labels) if regex.search(label)], dtype=np.int32)
+
+
+def _text_labels(series: pd.Series) -> List[str]:
+    """astype(str).str.strip()과 같은 문자열 라벨 (NaN은 'nan')"""
+    return [str(value).strip() for value in series.tolist()]
+
+
+def _group_positions(codes: np.ndarray) -> Dict[int, np.ndarray]:
+    """코드 배열 → {코드: 오름차순 행 위치 배열} (읽기 전용)"""
+    if len(codes) == 0:
+        return {}
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+    groups = {}
+    for code, positions in zip(sorted_codes[np.r_[0, boundaries]].tolist(), np.split(order, boundaries)):
+        positions.flags.writeable = False
+        groups[code] = positions
+    return groups
+
+
+def index_labels(series: pd.Series) -> Dict[str, np.ndarray]:
+    """
+    라벨 컬럼 → {astype(str).strip() 라벨: 행 위치 배열}
+
+    SectorFrame 밖의 시트(분석 시트 등)에서 지역별 행을 반복 조회할 때 한 번만 만들어 사용합니다.
+    """
+    codes, labels = pd.factorize(pd.Series(_text_labels(series), dtype=object))
+    return {labels[code]: positions for code, positions in _group_positions(codes).items()}
+
+
+def _numeric_column(series: pd.Series, to_float: Optional[Callable[[Any], Optional[float]]]) -> np.ndarray:
+    """
+    기간 컬럼 → float64 배열 (None → NaN)
+
+    to_float가 주어지면 object 셀은 그 규칙으로 변환합니다 (생성기는 safe_float(value, None) 전달).
+    """
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    if to_float is None:
+        return pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+    values = series.tolist()
+    result = np.full(len(values), np.nan, dtype=np.float64)
+    for i, value in enumerate(values):
+        number = to_float(value)
+        if number is not None:
+            result[i] = number
+    return result
+
+
+class SectorFrame:
+    """집계 시트 데이터 구간의 압축 표현 (읽기 전용)"""
+
+    __slots__ = (
+        'data_start_row', 'row_labels',
+        'region_col', 'industry_code_col', 'industry_name_col',
+        'region_codes', 'industry_code_codes', 'industry_name_codes',
+        'region_vocabulary', 'industry_code_vocabulary', 'industry_name_vocabulary',
+        'numeric_cols', 'numeric', 'region_rows',
+    )
+
+    def __init__(
+        self,
+        data_start_row: int,
+        row_labels: np.ndarray,
+        region_col: Optional[int],
+        industry_code_col: Optional[int],
+        industry_name_col: Optional[int],
+        region_codes: Optional[np.ndarray],
+        industry_code_codes: Optional[np.ndarray],
+        industry_name_codes: Optional[np.ndarray],
+        numeric_cols: Dict[int, int],
+        numeric: np.ndarray,
+        region_vocabulary: Optional[Vocabulary] = None,
+        industry_code_vocabulary: Optional[Vocabulary] = None,
+        industry_name_vocabulary: Optional[Vocabulary] = None
+    ):
+        self.data_start_row = data_start_row
+        self.row_labels = row_labels
+        self.region_col = region_col
+        self.industry_code_col = industry_code_col
+        self.industry_name_col = industry_name_col
+        self.region_codes = region_codes
+        self.industry_code_codes = industry_code_codes
+        self.industry_name_codes = industry_name_codes
+        self.region_vocabulary = region_vocabulary or Vocabulary()
+        self.industry_code_vocabulary = industry_code_vocabulary or Vocabulary()
+        self.industry_name_vocabulary = industry_name_vocabulary or Vocabulary()
+        self.numeric_cols = numeric_cols
+        self.numeric = numeric
+        for array in (row_labels, region_codes, industry_code_codes, industry_name_codes, numeric):
+            if array is not None:
+                array.flags.writeable = False
+        # 지역 코드 → 행 위치 (지역 조회 O(1))
+        self.region_rows = _group_positions(region_codes) if region_codes is not None else {}
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        data_start_row: Optional[int],
+        region_col: Optional[int],
+        industry_code_col: Optional[int] = None,
+        industry_name_col: Optional[int] = None,
+        numeric_cols: Sequence[Optional[int]] = (),
+        to_float: Optional[Callable[[Any], Optional[float]]] = None
+    ) -> 'SectorFrame':
+        """
+        header=None 집계 DataFrame에서 생성
+
+        data_start_row가 범위를 벗어나면 생성기와 같이 전체 DataFrame을 사용합니다.
+        컬럼 인덱스는 위치(iloc) 기준이며, 범위를 벗어난 컬럼은 무시합니다.
+        to_float: object 셀 숫자 변환 규칙 (None이면 pd.to_numeric(errors='coerce'))
+        """
+        start = data_start_row if data_start_row is not None and 0 <= data_start_row < len(df) else 0
+        data_df = df.iloc[start:]
+        width = len(df.columns)
+
+        def _valid(col: Optional[int]) -> Optional[int]:
+            return col if col is not None and 0 <= col < width else None
+
+        def _encode(col: Optional[int], vocabulary: Vocabulary) -> Optional[np.ndarray]:
+            if col is None:
+                return None
+            return vocabulary.encode(_text_labels(data_df.iloc[:, col]))
+
+        region_col = _valid(region_col)
+        industry_code_col = _valid(industry_code_col)
+        industry_name_col = _valid(industry_name_col)
+
+        region_vocabulary = Vocabulary()
+        industry_code_vocabulary = Vocabulary()
+        industry_name_vocabulary = Vocabulary()
+
+        cols = sorted({col for col in map(_valid, numeric_cols) if col is not None})
+        numeric = np.empty((len(data_df), len(cols)), dtype=np.float64)
+        for j, col in enumerate(cols):
+            numeric[:, j] = _numeric_column(data_df.iloc[:, col], to_float)
+
+        return cls(
+            data_start_row=start,
+            row_labels=np.asarray(data_df.index),
+            region_col=region_col,
+            industry_code_col=industry_code_col,
+            industry_name_col=industry_name_col,
+            region_codes=_encode(region_col, region_vocabulary),
+            industry_code_codes=_encode(industry_code_col, industry_code_vocabulary),
+            industry_name_codes=_encode(industry_name_col, industry_name_vocabulary),
+            numeric_cols={col: j for j, col in enumerate(cols)},
+            numeric=np.ascontiguousarray(numeric),
+            region_vocabulary=region_vocabulary,
+            industry_code_vocabulary=industry_code_vocabulary,
+            industry_name_vocabulary=industry_name_vocabulary,
+        )
+
+    def __len__(self) -> int:
+        return len(self.row_labels)
+
+    @property
+    def nbytes(self) -> int:
+        """보관 중인 배열 메모리 크기 (어휘 문자열 제외)"""
+        arrays = (self.row_labels, self.region_codes, self.industry_code_codes,
+                  self.industry_name_codes, self.numeric)
+        index_bytes = sum(positions.nbytes for positions in self.region_rows.values())
+        return int(sum(array.nbytes for array in arrays if array is not None) + index_bytes)
+
+    # ----- 필터 (정수 비교) -----
+
+    def region_positions(self, region_name: str) -> np.ndarray:
+        """지역명이 정확히 일치하는 행 위치 (데이터 구간 기준 iloc, 읽기 전용)"""
+        positions = self.region_rows.get(self.region_vocabulary.code(region_name))
+        if positions is None:
+            return np.empty(0, dtype=np.intp)
+        return positions
+
+    def region_positions_matching(self, pattern: str) -> np.ndarray:
+        """지역명이 정규식과 일치하는(str.contains) 행 위치"""
+        if self.region_codes is None:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(np.isin(self.region_codes, self.region_vocabulary.codes_matching(pattern)))
+
+    # ----- 값 조회 -----
+
+    def has_column(self, col: Optional[int]) -> bool:
+        return col is not None and col in self.numeric_cols
+
+    def column(self, col: int) -> np.ndarray:
+        """기간 컬럼 값 (float64, 값 없음 = NaN)"""
+        return self.numeric[:, self.numeric_cols[col]]
+
+    def industry_names(self, positions: Optional[np.ndarray] = None) -> List[str]:
+        """산업명 라벨 (astype(str).strip() 기준, 빈 셀은 'nan')"""
+        if self.industry_name_codes is None:
+            return []
+        codes = self.industry_name_codes if positions is None else self.industry_name_codes[positions]
+        return [self.industry_name_vocabulary.label(code) for code in codes]
+
+    def get_info(self) -> Dict[str, Any]:
+        return {
+            'rows': len(self),
+            'numeric_cols': list(self.numeric_cols),
+            'nbytes': self.nbytes,
+            'region_vocabulary': len(self.region_vocabulary),
+            'industry_name_vocabulary': len(self.industry_name_vocabulary),
+        }
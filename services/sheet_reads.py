@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+시트 읽기 추적
+
+증분 재생성은 보도자료가 실제로 읽은 시트의 지문으로 재사용 여부를 판단해야 하므로,
+보도자료 생성 구간을 track_sheet_reads()로 감싸면 그 안에서 WorkbookSnapshot/LazyWorkbook을
+통해 읽힌 시트 이름을 모읍니다. 추적 중이 아니면 note_sheet_read()는 아무 일도 하지 않습니다.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Set, Tuple
+
+
+# 현재 컨텍스트(스레드/요청)에서 활성화된 추적 집합 (중첩 시 바깥 구간에도 함께 기록)
+_active_reads: ContextVar[Tuple[Set[str], ...]] = ContextVar('sheet_reads', default=())
+
+
+@contextmanager
+def track_sheet_reads() -> Iterator[Set[str]]:
+    """구간 안에서 읽힌 시트 이름 집합을 반환하는 컨텍스트 매니저"""
+    reads: Set[str] = set()
+    token = _active_reads.set(_active_reads.get() + (reads,))
+    try:
+        yield reads
+    finally:
+        _active_reads.reset(token)
+
+
+def note_sheet_read(sheet_name: str) -> None:
+    """시트 읽기 기록 (추적 중인 모든 구간에 추가)"""
+    for reads in _active_reads.get():
+        reads.add(sheet_name)
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+업로드 파일 사이드카 캐시
+
+같은 분석표를 다시 업로드하면(검토 주기 중 흔함) 전처리와 시트 파싱을 건너뛰도록,
+업로드 파일의 SHA-256을 키로 디코딩된 집계/분석 시트를 exports/_temp/sidecar 아래에
+바이너리(pickle)로 저장합니다.
+
+- 버전 스탬프: config/reports.py, 시트 디코더 소스, 저장 형식 버전으로 생성, 불일치 항목은 폐기
+- 저장/인덱스/용량 제한(SIDECAR_CACHE_MAX_BYTES, LRU)은 content_store.ContentStore 사용
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from config.settings import BASE_DIR, TEMP_SIDECAR_DIR, SIDECAR_CACHE_MAX_BYTES
+
+from .content_store import ContentStore
+
+
+# 저장 형식이 바뀌면 올려서 기존 항목을 무효화
+SIDECAR_FORMAT_VERSION = 3
+SIDECAR_SUFFIX = '.sidecar.pkl'
+REPORTS_CONFIG_PATH = BASE_DIR / 'config' / 'reports.py'
+# 저장된 DataFrame을 만든 디코더 (수정되면 기존 항목을 자동 무효화)
+DECODER_MODULE_PATHS = (
+    BASE_DIR / 'services' / 'xlsx_stream_reader.py',
+    BASE_DIR / 'services' / 'workbook_snapshot.py',
+    BASE_DIR / 'services' / 'parallel_decode.py',
+)
+
+
+def compute_file_sha256(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용의 SHA-256 해시 (청크 단위로 읽어 메모리 사용 최소화)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# 소스 파일 (경로, mtime, 크기) 목록 → 내용 해시 (파일이 바뀌면 스탬프가 달라져 다시 계산)
+SOURCE_DIGEST_MAX_ENTRIES = 16
+_source_digests: "OrderedDict[Tuple[Tuple[str, Optional[int], Optional[int]], ...], str]" = OrderedDict()
+_source_digest_lock = threading.Lock()
+
+
+def _source_stamp(path: Path) -> Tuple[str, Optional[int], Optional[int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return str(path), None, None
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _source_digest(paths: Tuple[Path, ...]) -> str:
+    """소스 파일 내용 해시"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(Path(path).relative_to(BASE_DIR)).encode('utf-8'))
+        try:
+            digest.update(Path(path).read_bytes())
+        except OSError:
+            digest.update(b'missing')
+    return digest.hexdigest()
+
+
+def source_digest(paths: Iterable[Path]) -> str:
+    """
+    여러 소스 파일의 내용 해시 (코드 수정 시 캐시/결과 무효화용)
+
+    (경로, mtime, 크기)가 같으면 이전 해시를 재사용하므로, 실행 중 템플릿/Generator를 수정해
+    generator_registry가 모듈을 reload한 경우에도 새 코드 기준 해시를 돌려줍니다.
+    """
+    paths = tuple(Path(path) for path in paths)
+    stamps = tuple(_source_stamp(path) for path in paths)
+    with _source_digest_lock:
+        cached = _source_digests.get(stamps)
+        if cached is not None:
+            _source_digests.move_to_end(stamps)
+            return cached
+    digest = _source_digest(paths)
+    with _source_digest_lock:
+        _source_digests[stamps] = digest
+        while len(_source_digests) > SOURCE_DIGEST_MAX_ENTRIES:
+            _source_digests.popitem(last=False)
+    return digest
+
+
+def get_version_stamp() -> str:
+    """config/reports.py 내용 + 디코더 소스 + 저장 형식 버전으로 만든 버전 스탬프"""
+    digest = hashlib.sha256(f"format={SIDECAR_FORMAT_VERSION}".encode('utf-8'))
+    digest.update(REPORTS_CONFIG_PATH.read_bytes())
+    digest.update(source_digest(DECODER_MODULE_PATHS).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+class SidecarCache:
+    """SHA-256 키 기반 디코딩 시트 디스크 캐시 (Thread-safe, 프로세스 간 공유)"""
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self._store = ContentStore(cache_dir, SIDECAR_SUFFIX, max_bytes, label='사이드카')
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._store.store_dir
+
+    @property
+    def max_bytes(self) -> int:
+        return self._store.max_bytes
+
+    def load(self, file_digest: str) -> Optional[Dict[str, Any]]:
+        """
+        사이드카 항목 로드
+
+        Returns:
+            {'sheet_names': [...], 'frames': {시트명: DataFrame}}
+            또는 None (없거나 버전 불일치)
+        """
+        return self._store.load(file_digest, get_version_stamp())
+
+    def save(
+        self,
+        file_digest: str,
+        sheet_names: List[str],
+        frames: Dict[str, pd.DataFrame]
+    ) -> Optional[Path]:
+        """사이드카 항목 저장 (원자적 기록 후 용량 정리)"""
+        payload = {
+            'version': get_version_stamp(),
+            'sha256': file_digest,
+            'sheet_names': list(sheet_names),
+            'frames': dict(frames),
+        }
+        return self._store.save(file_digest, payload, meta={'sheet_count': len(payload['frames'])})
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        return self._store.get_info()
+
+
+# 전역 사이드카 캐시 인스턴스
+_sidecar_cache = SidecarCache(TEMP_SIDECAR_DIR, SIDECAR_CACHE_MAX_BYTES)
+
+
+def load_sidecar(file_digest: str) -> Optional[Dict[str, Any]]:
+    """전역 사이드카 캐시에서 디코딩된 시트 로드"""
+    return _sidecar_cache.load(file_digest)
+
+
+def save_sidecar(
+    file_digest: str,
+    sheet_names: List[str],
+    frames: Dict[str, pd.DataFrame]
+) -> Optional[Path]:
+    """전역 사이드카 캐시에 디코딩된 시트 저장"""
+    return _sidecar_cache.save(file_digest, sheet_names, frames)
+
+
+def get_sidecar_cache_info() -> Dict[str, Any]:
+    """사이드카 캐시 정보 반환"""
+    return _sidecar_cache.get_cache_info()
@@ -3,12 +3,18 @@
 요약 보도자료 데이터 추출 서비스
 """
 
+import copy
+import threading
+
+import numpy as np
 import pandas as pd
-from pathlib import Path
 from utils.excel_utils import load_generator_module
-from services.excel_processor import preprocess_excel
+from services.formula_overlay import get_calculated_snapshot
 from config.reports import REGION_GROUPS
 from services.excel_cache import get_sector_data
+from services.sector_dataset import get_regional_cube
+from services.sheet_reads import note_sheet_read, track_sheet_reads
+from services.workbook_snapshot import get_workbook_snapshot
 
 
 def safe_float(value, default=None):
@@ -71,42 +77,60 @@ def _get_excel_path(xl_or_path):
     return xl_or_path
 
 
-def _get_calculated_excel_path(excel_path: str) -> str:
-    """수식 계산 로직으로 계산된 임시 파일 경로 반환 (전역 캐시 사용)."""
-    from services.excel_cache import get_cached_calculated_path, set_cached_calculated_path
-    from config.settings import TEMP_CALCULATED_DIR
-
-    cached_path = get_cached_calculated_path(excel_path)
-    if cached_path:
-        return cached_path
-
-    TEMP_CALCULATED_DIR.mkdir(parents=True, exist_ok=True)
-    output_path = TEMP_CALCULATED_DIR / f"{Path(excel_path).stem}_calculated.xlsx"
-    result_path, success, _ = preprocess_excel(
-        excel_path,
-        str(output_path),
-        force_calculation=True
-    )
-
-    if success and result_path:
-        set_cached_calculated_path(excel_path, result_path)
-
-    return result_path
-
-
 def _read_sheet_df(xl_or_path, sheet_name, data_only=None):
     """분석 시트는 수식 계산값(data_only)으로 읽는다."""
     excel_path = _get_excel_path(xl_or_path)
     if data_only is None:
         data_only = '분석' in sheet_name
 
+    # 업로드 파일당 한 번만 파싱된 스냅샷 공유 (반환 DataFrame 수정 금지)
     if data_only:
-        calculated_path = _get_calculated_excel_path(excel_path)
-        return pd.read_excel(calculated_path, sheet_name=sheet_name, header=None)
+        snapshot = get_calculated_snapshot(excel_path)
+    else:
+        snapshot = get_workbook_snapshot(excel_path)
+    df = snapshot.get_sheet(sheet_name)
+    if df is None:
+        raise ValueError(f"시트를 찾을 수 없습니다: {sheet_name}")
+    return df
 
-    if isinstance(xl_or_path, pd.ExcelFile):
-        return pd.read_excel(xl_or_path, sheet_name=sheet_name, header=None)
-    return pd.read_excel(excel_path, sheet_name=sheet_name, header=None)
+
+def _label_array(df, col):
+    """컬럼 → str(값).strip() 라벨 배열 (빈 셀은 '', col이 None이면 전부 '')"""
+    if col is None:
+        return np.full(len(df), '', dtype=object)
+    series = df[col]
+    labels = series.astype(str).str.strip().to_numpy(dtype=object)
+    labels[series.isna().to_numpy()] = ''
+    return labels
+
+
+def _total_rows(df, region_col, code_col, total_code, skip_rows=0, required=(), normalize=False):
+    """
+    합계 행(분류 코드 == total_code)의 위치와 지역명 (시트 순서)
+
+    행마다 str().strip()을 반복하지 않도록 지역/코드 컬럼을 한 번에 정규화한 뒤 마스크로 고릅니다.
+    skip_rows: 행 레이블이 이보다 작은 행(헤더)은 제외
+    required: 값을 읽을 컬럼 (시트에 없으면 합계 행 없음으로 처리)
+    normalize: 지역명을 약칭으로 정규화 (normalize_region_name)
+    """
+    columns = [region_col, *required] + ([code_col] if code_col is not None else [])
+    if any(col not in df.columns for col in columns):
+        return np.empty(0, dtype=np.intp), []
+
+    mask = _label_array(df, code_col) == str(total_code)
+    if skip_rows:
+        mask &= np.asarray(df.index) >= skip_rows
+    positions = np.flatnonzero(mask)
+
+    regions = _label_array(df, region_col)[positions].tolist()
+    if normalize:
+        regions = [normalize_region_name(region) for region in regions]
+    return positions, regions
+
+
+def _cells(df, col, positions):
+    """선택한 행 위치의 원본 셀 값 목록"""
+    return df[col].to_numpy(dtype=object)[positions].tolist()
 
 
 def _build_chart_data_from_sector_cache(sector_payload: dict, is_trade: bool = False, is_employment: bool = False) -> dict:
@@ -220,6 +244,363 @@ def _build_chart_data_from_sector_cache(sector_payload: dict, is_trade: bool = F
     }
 
 
+class SummaryDataService:
+    """
+    요약 보도자료 데이터 서비스 (일괄 생성 한 번에 하나)
+
+    요약 함수마다 pd.ExcelFile을 새로 열고, 같은 분석 시트 차트('A 분석' 광공업 등)를 페이지마다
+    다시 계산하던 것을 한 객체로 묶습니다.
+
+    - 워크북: 공유 스냅샷(get_workbook_snapshot) 하나 (excel_file을 넘기면 그 핸들로 시트 목록 확인)
+    - 차트: (시트, is_trade, is_employment) 단위로 한 번만 계산 (지역 큐브 → SectorDataCache payload → 시트 순)
+    - 페이지 데이터: 6개 요약 계산을 메서드 단위로 메모이즈 (실패한 계산은 보관하지 않음)
+    - 반환값: 호출자가 수정해도 되도록 매번 깊은 복사본 (Thread-safe)
+    - 시트 읽기: 계산 중 읽은 시트를 결과와 함께 보관했다가 메모 결과를 돌려줄 때 다시 기록
+      (증분 생성이 메모 결과를 받은 요약 보도자료의 의존 시트도 알 수 있도록)
+    """
+
+    def __init__(self, excel_path, year=None, quarter=None, excel_file=None):
+        self.excel_path = str(excel_path)
+        self.year = year
+        self.quarter = quarter
+        self.snapshot = get_workbook_snapshot(self.excel_path, excel_file=excel_file)
+        self._results = {}
+        self._lock = threading.RLock()
+
+    @property
+    def sheet_names(self):
+        return self.snapshot.sheet_names
+
+    def _memo(self, key, compute):
+        with self._lock:
+            if key not in self._results:
+                with track_sheet_reads() as reads:
+                    result = compute()
+                self._results[key] = (result, frozenset(reads))
+            result, reads = self._results[key]
+            for sheet_name in reads:
+                note_sheet_read(sheet_name)
+            return copy.deepcopy(result)
+
+    def chart(self, sheet_name, is_trade=False, is_employment=False):
+        """분석 시트 차트 데이터 (_extract_chart_data 결과)"""
+        return self._memo(
+            ('chart', sheet_name, is_trade, is_employment),
+            lambda: _extract_chart_data(
+                self.excel_path, sheet_name, is_trade=is_trade, is_employment=is_employment,
+                year=self.year, quarter=self.quarter
+            )
+        )
+
+    def construction_chart(self):
+        """건설수주액 차트 데이터 (_extract_construction_chart_data 결과)"""
+        return self._memo(
+            ('construction_chart',),
+            lambda: _extract_construction_chart_data(
+                self.excel_path, self.sheet_names, year=self.year, quarter=self.quarter
+            )
+        )
+
+    def overview(self):
+        """
+        요약-지역경제동향 데이터 추출
+    
+        ★ 핵심 원칙: [행렬 데이터 구축 -> 열 단위 분석 -> 문장 생성] 순서
+        - Step 1: 통합 매트릭스(comprehensive_table) 생성 (SSOT)
+        - Step 2: 부문별(Column) 분석 - comprehensive_table에서 각 부문 데이터 추출
+        - Step 3: 부문별 요약 문장 생성 - 추출된 데이터로 나레이션 생성
+        """
+        return self._memo(('overview',), self._compute_overview)
+
+    def _compute_overview(self):
+        try:
+            mining = self.chart('A 분석')
+            service = self.chart('B 분석')
+            consumption = self.chart('C 분석')
+            exports = self.chart('G 분석', is_trade=True)
+            price = self.chart('E(품목성질물가)분석')
+            employment = self.chart('D(고용률)분석', is_employment=True)
+
+            return {
+                'production': {
+                    'mining': _summary_from_chart(mining),
+                    'service': _summary_from_chart(service)
+                },
+                'consumption': _summary_from_chart(consumption),
+                'exports': _summary_from_chart(exports),
+                'price': _summary_from_chart(price, include_above_below=True),
+                'employment': _summary_from_chart(employment)
+            }
+
+        except Exception as e:
+            print(f"🔍 [디버그] 요약 데이터 추출 오류:")
+            print(f"  - 오류: {e}")
+            print(f"  - excel_path: {self.excel_path}")
+            print(f"  - year: {self.year}, quarter: {self.quarter}")
+            import traceback
+            traceback.print_exc()
+            # 기본값/폴백 사용 금지: ValueError 발생
+            raise ValueError(f"요약 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+
+    def table_data(self):
+        """요약-지역경제동향 하단 표 데이터"""
+        return self._memo(('table_data',), self._compute_table_data)
+
+    def _compute_table_data(self):
+        try:
+            # 연도/분기가 있으면 모두 지역 큐브에서 조회 (_extract_chart_data 참고)
+            mining = self.chart('A 분석')
+            service = self.chart('B 분석')
+            retail = self.chart('C 분석')
+            exports = self.chart('G 분석', is_trade=True)
+            price = self.chart('E(품목성질물가)분석')
+            employment = self.chart('D(고용률)분석', is_employment=True)
+
+            mining = mining or {}
+            service = service or {}
+            retail = retail or {}
+            exports = exports or {}
+            price = price or {}
+            employment = employment or {}
+
+            mining_map = _build_region_value_map(mining)
+            service_map = _build_region_value_map(service)
+            retail_map = _build_region_value_map(retail)
+            exports_map = _build_region_value_map(exports)
+            price_map = _build_region_value_map(price)
+            employment_map = _build_region_value_map(employment)
+
+            nationwide = {
+                'mining_production': mining.get('nationwide', {}).get('change'),
+                'service_production': service.get('nationwide', {}).get('change'),
+                'retail_sales': retail.get('nationwide', {}).get('change'),
+                'exports': exports.get('nationwide', {}).get('change'),
+                'price': price.get('nationwide', {}).get('change'),
+                'employment': employment.get('nationwide', {}).get('change')
+            }
+
+            region_groups = []
+            for group_name, regions in REGION_GROUPS.items():
+                group_regions = []
+                for region in regions:
+                    group_regions.append({
+                        'name': region,
+                        'mining_production': mining_map.get(region, 0.0),
+                        'service_production': service_map.get(region, 0.0),
+                        'retail_sales': retail_map.get(region, 0.0),
+                        'exports': exports_map.get(region, 0.0),
+                        'price': price_map.get(region, 0.0),
+                        'employment': employment_map.get(region, 0.0)
+                    })
+                region_groups.append({'name': group_name, 'regions': group_regions})
+
+            return {
+                'nationwide': nationwide,
+                'region_groups': region_groups
+            }
+        except Exception as e:
+            print(f"🔍 [디버그] 요약 표 데이터 추출 오류:")
+            print(f"  - 오류: {e}")
+            print(f"  - excel_path: {self.excel_path}")
+            import traceback
+            traceback.print_exc()
+            raise ValueError(f"요약 표 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+
+    def production(self):
+        """요약-생산 데이터"""
+        return self._memo(('production',), self._compute_production)
+
+    def _compute_production(self):
+        try:
+            mining = self.chart('A 분석')
+            service = self.chart('B 분석')
+
+            return {
+                'mining_production': mining,
+                'service_production': service,
+                'report_info': {'year': self.year, 'quarter': self.quarter, 'page_number': ''}
+            }
+        except Exception as e:
+            print(f"🔍 [디버그] 생산 요약 데이터 추출 오류:")
+            print(f"  - 오류: {e}")
+            print(f"  - excel_path: {self.excel_path}")
+            import traceback
+            traceback.print_exc()
+            raise ValueError(f"생산 요약 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+
+    def consumption_construction(self):
+        """요약-소비/건설 데이터"""
+        return self._memo(('consumption_construction',), self._compute_consumption_construction)
+
+    def _compute_consumption_construction(self):
+        try:
+            retail = self.chart('C 분석')
+            retail['qoq_change'] = None
+
+            construction = self.construction_chart()
+
+            return {
+                'retail_sales': retail,
+                'construction': construction,
+                'report_info': {'year': self.year, 'quarter': self.quarter, 'page_number': ''}
+            }
+        except Exception as e:
+            print(f"소비건설 요약 데이터 오류: {e}")
+            print(f"🔍 [디버그] 소비건설 데이터 추출 오류:")
+            print(f"  - 오류: {e}")
+            print(f"  - excel_path: {self.excel_path}")
+            import traceback
+            traceback.print_exc()
+            raise ValueError(f"소비건설 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+
+    def trade_price(self):
+        """요약-수출물가 데이터"""
+        return self._memo(('trade_price',), self._compute_trade_price)
+
+    def _compute_trade_price(self):
+        try:
+            exports = self.chart('G 분석', is_trade=True)
+            price = self.chart('E(품목성질물가)분석')
+
+            comparison = _compute_above_below_by_nationwide(price)
+            if comparison:
+                above_regions, below_regions = comparison
+                price['above_regions'] = above_regions[:3] if above_regions else [{'name': '-', 'value': 0.0}]
+                price['below_regions'] = below_regions[:3] if below_regions else [{'name': '-', 'value': 0.0}]
+                price['above_count'] = len(above_regions)
+                price['below_count'] = len(below_regions)
+
+            price['below_phrase'] = _build_region_phrase(price.get('below_regions'), price.get('below_count'))
+            price['above_phrase'] = _build_region_phrase(price.get('above_regions'), price.get('above_count'))
+        
+            return {
+                'exports': exports,
+                'price': price
+            }
+        except Exception as e:
+            print(f"🔍 [디버그] 수출물가 데이터 추출 오류:")
+            print(f"  - 오류: {e}")
+            print(f"  - excel_path: {self.excel_path}")
+            print(f"  - year: {self.year}, quarter: {self.quarter}")
+            import traceback
+            traceback.print_exc()
+            # 기본값/폴백 사용 금지: ValueError 발생
+            raise ValueError(f"수출물가 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+
+    def employment_population(self):
+        """요약-고용인구 데이터"""
+        return self._memo(('employment_population',), self._compute_employment_population)
+
+    def _compute_employment_population(self):
+        try:
+            employment = self.chart('D(고용률)분석', is_employment=True)
+        
+            # 집계 시트에서 실제 고용률 값 추출 (분석 시트에서는 증감률만 추출됨)
+            try:
+                if 'D(고용률)집계' in self.sheet_names:
+                    df_rate = _read_sheet_df(self.excel_path, 'D(고용률)집계', data_only=False)
+                    # 시트 구조: 열1=지역이름, 열2=분류단계(0=합계), 열21=2025 3/4 고용률 (헤더 3행 스킵)
+                    positions, total_regions = _total_rows(df_rate, 1, 2, '0', skip_rows=3, required=(21,))
+                    rate_cells = _cells(df_rate, 21, positions)
+
+                    if '전국' in total_regions:
+                        rate_val = safe_float(rate_cells[total_regions.index('전국')])
+                        if rate_val is not None:
+                            employment['nationwide']['rate'] = round(rate_val, 1)
+                            employment['nationwide']['index'] = round(rate_val, 1)
+                
+                    # 지역별 고용률도 추출 (chart_data에서 해당 지역 찾아서 rate 업데이트)
+                    chart_items = {}
+                    for item in employment.get('chart_data', []):
+                        chart_items.setdefault(item.get('name'), item)
+                    for region, rate_cell in zip(total_regions, rate_cells):
+                        region = normalize_region_name(region)
+                        item = chart_items.get(region) if region in VALID_REGIONS else None
+                        rate_val = safe_float(rate_cell) if item is not None else None
+                        if rate_val is not None:
+                            item['rate'] = round(rate_val, 1)
+                            item['index'] = round(rate_val, 1)
+            except Exception as rate_error:
+                print(f"고용률 집계 데이터 추출 오류: {rate_error}")
+        
+            population = {
+                'inflow_regions': [],
+                'outflow_regions': [],
+                'inflow_count': 0,
+                'outflow_count': 0,
+                'chart_data': []
+            }
+            try:
+                df = _read_sheet_df(self.excel_path, 'I(순인구이동)집계', data_only=False)
+                regions = VALID_REGIONS.copy()
+            
+                # 시트 구조: col4=지역이름, col5=분류단계(0=합계), col25=2025 2/4분기
+                # 합계(분류단계 0) 행만 추출
+                processed_regions = set()
+                region_data = {}  # 지역별 데이터 저장
+            
+                positions, total_regions = _total_rows(df, 4, 5, '0', required=(25,))
+                for region, curr_cell in zip(total_regions, _cells(df, 25, positions)):
+                    # 중복 지역 방지
+                    if region in regions and region not in processed_regions:
+                        try:
+                            # 2025 2/4분기 데이터 (열 25)
+                            curr_value = safe_float(curr_cell)
+                            value = int(round(curr_value / 1000)) if curr_value is not None else 0
+                            # 국내인구이동은 증감률 계산하지 않음 (raw data만 사용)
+                            change = None
+                        
+                            processed_regions.add(region)
+                            region_data[region] = {'value': value, 'change': change}
+                        
+                            if value > 0:
+                                population['inflow_regions'].append({'name': region, 'value': value})
+                            else:
+                                population['outflow_regions'].append({'name': region, 'value': abs(value)})
+                        except:
+                            continue
+            
+                population['inflow_regions'].sort(key=lambda x: x['value'], reverse=True)
+                population['outflow_regions'].sort(key=lambda x: x['value'], reverse=True)
+                population['inflow_count'] = len(population['inflow_regions'])
+                population['outflow_count'] = len(population['outflow_regions'])
+            
+                # chart_data 구성 - 지역 순서대로
+                for region in regions:
+                    if region in region_data:
+                        data = region_data[region]
+                        population['chart_data'].append({
+                            'name': region,
+                            'value': data['value'],  # 순이동량 (천명)
+                            'change': data['change']  # 전년동분기대비 증감률 (%)
+                        })
+                    else:
+                        population['chart_data'].append({
+                            'name': region,
+                            'value': 0,
+                            'change': None
+                        })
+                    
+            except Exception as e:
+                print(f"인구이동 데이터 오류: {e}")
+                import traceback
+                traceback.print_exc()
+        
+            return {
+                'employment': employment,
+                'population': population
+            }
+        except Exception as e:
+            print(f"🔍 [디버그] 고용인구 요약 데이터 추출 오류:")
+            print(f"  - 오류: {e}")
+            print(f"  - excel_path: {self.excel_path}")
+            print(f"  - year: {self.year}, quarter: {self.quarter}")
+            import traceback
+            traceback.print_exc()
+            # 기본값/폴백 사용 금지: ValueError 발생
+            raise ValueError(f"고용인구 요약 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+
+
 def get_summary_overview_data(excel_path, year, quarter):
     """
     요약-지역경제동향 데이터 추출
@@ -229,36 +610,7 @@ def get_summary_overview_data(excel_path, year, quarter):
     - Step 2: 부문별(Column) 분석 - comprehensive_table에서 각 부문 데이터 추출
     - Step 3: 부문별 요약 문장 생성 - 추출된 데이터로 나레이션 생성
     """
-    try:
-        xl = pd.ExcelFile(excel_path)
-
-        mining = _extract_chart_data(xl, 'A 분석', year=year, quarter=quarter)
-        service = _extract_chart_data(xl, 'B 분석', year=year, quarter=quarter)
-        consumption = _extract_chart_data(xl, 'C 분석', year=year, quarter=quarter)
-        exports = _extract_chart_data(xl, 'G 분석', is_trade=True, year=year, quarter=quarter)
-        price = _extract_chart_data(xl, 'E(품목성질물가)분석', year=year, quarter=quarter)
-        employment = _extract_chart_data(xl, 'D(고용률)분석', is_employment=True, year=year, quarter=quarter)
-
-        return {
-            'production': {
-                'mining': _summary_from_chart(mining),
-                'service': _summary_from_chart(service)
-            },
-            'consumption': _summary_from_chart(consumption),
-            'exports': _summary_from_chart(exports),
-            'price': _summary_from_chart(price, include_above_below=True),
-            'employment': _summary_from_chart(employment)
-        }
-
-    except Exception as e:
-        print(f"🔍 [디버그] 요약 데이터 추출 오류:")
-        print(f"  - 오류: {e}")
-        print(f"  - excel_path: {excel_path}")
-        print(f"  - year: {year}, quarter: {quarter}")
-        import traceback
-        traceback.print_exc()
-        # 기본값/폴백 사용 금지: ValueError 발생
-        raise ValueError(f"요약 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+    return SummaryDataService(excel_path, year, quarter).overview()
 
 
 def _build_comprehensive_table(excel_path, year=None, quarter=None):
@@ -424,124 +776,22 @@ def _build_region_value_map(chart_data):
 
 def get_summary_table_data(excel_path, year=None, quarter=None):
     """요약-지역경제동향 하단 표 데이터"""
-    try:
-        xl = pd.ExcelFile(excel_path)
-
-        def _chart_from_cache(report_id, is_trade=False, is_employment=False):
-            if year is None or quarter is None:
-                return None
-            cached = get_sector_data(excel_path, year, quarter, report_id)
-            if cached:
-                return _build_chart_data_from_sector_cache(cached, is_trade=is_trade, is_employment=is_employment)
-            return None
-
-        mining = _chart_from_cache('manufacturing') or _extract_chart_data(xl, 'A 분석', year=year, quarter=quarter)
-        service = _chart_from_cache('service') or _extract_chart_data(xl, 'B 분석', year=year, quarter=quarter)
-        retail = _chart_from_cache('consumption') or _extract_chart_data(xl, 'C 분석', year=year, quarter=quarter)
-        exports = _chart_from_cache('export', is_trade=True) or _extract_chart_data(xl, 'G 분석', is_trade=True, year=year, quarter=quarter)
-        price = _chart_from_cache('price') or _extract_chart_data(xl, 'E(품목성질물가)분석', year=year, quarter=quarter)
-        employment = _chart_from_cache('employment', is_employment=True) or _extract_chart_data(xl, 'D(고용률)분석', is_employment=True, year=year, quarter=quarter)
-
-        mining = mining or {}
-        service = service or {}
-        retail = retail or {}
-        exports = exports or {}
-        price = price or {}
-        employment = employment or {}
-
-        mining_map = _build_region_value_map(mining)
-        service_map = _build_region_value_map(service)
-        retail_map = _build_region_value_map(retail)
-        exports_map = _build_region_value_map(exports)
-        price_map = _build_region_value_map(price)
-        employment_map = _build_region_value_map(employment)
-
-        nationwide = {
-            'mining_production': mining.get('nationwide', {}).get('change'),
-            'service_production': service.get('nationwide', {}).get('change'),
-            'retail_sales': retail.get('nationwide', {}).get('change'),
-            'exports': exports.get('nationwide', {}).get('change'),
-            'price': price.get('nationwide', {}).get('change'),
-            'employment': employment.get('nationwide', {}).get('change')
-        }
-
-        region_groups = []
-        for group_name, regions in REGION_GROUPS.items():
-            group_regions = []
-            for region in regions:
-                group_regions.append({
-                    'name': region,
-                    'mining_production': mining_map.get(region, 0.0),
-                    'service_production': service_map.get(region, 0.0),
-                    'retail_sales': retail_map.get(region, 0.0),
-                    'exports': exports_map.get(region, 0.0),
-                    'price': price_map.get(region, 0.0),
-                    'employment': employment_map.get(region, 0.0)
-                })
-            region_groups.append({'name': group_name, 'regions': group_regions})
-
-        return {
-            'nationwide': nationwide,
-            'region_groups': region_groups
-        }
-    except Exception as e:
-        print(f"🔍 [디버그] 요약 표 데이터 추출 오류:")
-        print(f"  - 오류: {e}")
-        print(f"  - excel_path: {excel_path}")
-        import traceback
-        traceback.print_exc()
-        raise ValueError(f"요약 표 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+    return SummaryDataService(excel_path, year, quarter).table_data()
 
 
 def get_production_summary_data(excel_path, year, quarter):
     """요약-생산 데이터"""
-    try:
-        xl = pd.ExcelFile(excel_path)
-        mining = _extract_chart_data(xl, 'A 분석', year=year, quarter=quarter)
-        service = _extract_chart_data(xl, 'B 분석', year=year, quarter=quarter)
-
-        return {
-            'mining_production': mining,
-            'service_production': service,
-            'report_info': {'year': year, 'quarter': quarter, 'page_number': ''}
-        }
-    except Exception as e:
-        print(f"🔍 [디버그] 생산 요약 데이터 추출 오류:")
-        print(f"  - 오류: {e}")
-        print(f"  - excel_path: {excel_path}")
-        import traceback
-        traceback.print_exc()
-        raise ValueError(f"생산 요약 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+    return SummaryDataService(excel_path, year, quarter).production()
 
 
 def get_consumption_construction_data(excel_path, year, quarter):
     """요약-소비/건설 데이터"""
-    try:
-        xl = pd.ExcelFile(excel_path)
-        retail = _extract_chart_data(xl, 'C 분석', year=year, quarter=quarter)
-        retail['qoq_change'] = None
-
-        construction = _extract_construction_chart_data(xl, year=year, quarter=quarter)
-
-        return {
-            'retail_sales': retail,
-            'construction': construction,
-            'report_info': {'year': year, 'quarter': quarter, 'page_number': ''}
-        }
-    except Exception as e:
-        print(f"소비건설 요약 데이터 오류: {e}")
-        print(f"🔍 [디버그] 소비건설 데이터 추출 오류:")
-        print(f"  - 오류: {e}")
-        print(f"  - excel_path: {excel_path}")
-        import traceback
-        traceback.print_exc()
-        raise ValueError(f"소비건설 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+    return SummaryDataService(excel_path, year, quarter).consumption_construction()
 
 
-def _extract_construction_chart_data(xl, year=None, quarter=None):
+def _extract_construction_chart_data(excel_path, sheet_names, year=None, quarter=None):
     """건설수주액 차트 데이터 추출"""
     try:
-        excel_path = _get_excel_path(xl)
         cached = None
         if year is not None and quarter is not None:
             cached = get_sector_data(excel_path, year, quarter, SHEET_REPORT_ID_MAP.get("F'(건설)집계"))
@@ -565,47 +815,44 @@ def _extract_construction_chart_data(xl, year=None, quarter=None):
         chart_data = []
         
         # F'(건설)집계 시트에서 데이터 추출
-        if "F'(건설)집계" in xl.sheet_names:
-            df = _read_sheet_df(xl, "F'(건설)집계", data_only=False)
+        if "F'(건설)집계" in sheet_names:
+            df = _read_sheet_df(excel_path, "F'(건설)집계", data_only=False)
             
-            for i, row in df.iterrows():
+            # 총계 행 (code == '0'), 현재 분기 값 (열 19)과 전년동분기 값 (열 15)
+            positions, total_regions = _total_rows(df, 1, 2, '0', required=(19, 15))
+            rows = zip(total_regions, _cells(df, 19, positions), _cells(df, 15, positions))
+            for region, curr_cell, prev_cell in rows:
                 try:
-                    region = str(row[1]).strip() if pd.notna(row[1]) else ''
-                    code = str(row[2]).strip() if pd.notna(row[2]) else ''
+                    curr_val = safe_float(curr_cell)
+                    prev_val = safe_float(prev_cell)
                     
-                    # 총계 행 (code == '0')
-                    if code == '0':
-                        # 현재 분기 값 (열 19)과 전년동분기 값 (열 15)
-                        curr_val = safe_float(row[19])
-                        prev_val = safe_float(row[15])
+                    # 증감률 계산
+                    if prev_val is not None and prev_val != 0:
+                        change = round((curr_val - prev_val) / prev_val * 100, 1)
+                    else:
+                        change = None
+                    
+                    # 금액 (조원 단위)
+                    amount = round(curr_val / 10000, 1) if curr_val is not None else 0
+                    amount_normalized = min(100, max(0, amount * 10))
+                    
+                    if region == '전국':
+                        nationwide['amount'] = amount
+                        nationwide['change'] = change
+                    elif region in regions:
+                        data = {
+                            'name': region,
+                            'value': change,
+                            'amount': amount,
+                            'amount_normalized': amount_normalized,
+                            'change': change
+                        }
                         
-                        # 증감률 계산
-                        if prev_val is not None and prev_val != 0:
-                            change = round((curr_val - prev_val) / prev_val * 100, 1)
+                        if change >= 0:
+                            increase_regions.append(data)
                         else:
-                            change = None
-                        
-                        # 금액 (조원 단위)
-                        amount = round(curr_val / 10000, 1) if curr_val is not None else 0
-                        amount_normalized = min(100, max(0, amount * 10))
-                        
-                        if region == '전국':
-                            nationwide['amount'] = amount
-                            nationwide['change'] = change
-                        elif region in regions:
-                            data = {
-                                'name': region,
-                                'value': change,
-                                'amount': amount,
-                                'amount_normalized': amount_normalized,
-                                'change': change
-                            }
-                            
-                            if change >= 0:
-                                increase_regions.append(data)
-                            else:
-                                decrease_regions.append(data)
-                            chart_data.append(data)
+                            decrease_regions.append(data)
+                        chart_data.append(data)
                 except:
                     continue
         
@@ -642,158 +889,12 @@ def _get_default_construction_data():
 
 def get_trade_price_data(excel_path, year, quarter):
     """요약-수출물가 데이터"""
-    try:
-        xl = pd.ExcelFile(excel_path)
-        exports = _extract_chart_data(xl, 'G 분석', is_trade=True, year=year, quarter=quarter)
-        price = _extract_chart_data(xl, 'E(품목성질물가)분석', year=year, quarter=quarter)
-
-        comparison = _compute_above_below_by_nationwide(price)
-        if comparison:
-            above_regions, below_regions = comparison
-            price['above_regions'] = above_regions[:3] if above_regions else [{'name': '-', 'value': 0.0}]
-            price['below_regions'] = below_regions[:3] if below_regions else [{'name': '-', 'value': 0.0}]
-            price['above_count'] = len(above_regions)
-            price['below_count'] = len(below_regions)
-
-        price['below_phrase'] = _build_region_phrase(price.get('below_regions'), price.get('below_count'))
-        price['above_phrase'] = _build_region_phrase(price.get('above_regions'), price.get('above_count'))
-        
-        return {
-            'exports': exports,
-            'price': price
-        }
-    except Exception as e:
-        print(f"🔍 [디버그] 수출물가 데이터 추출 오류:")
-        print(f"  - 오류: {e}")
-        print(f"  - excel_path: {excel_path}")
-        print(f"  - year: {year}, quarter: {quarter}")
-        import traceback
-        traceback.print_exc()
-        # 기본값/폴백 사용 금지: ValueError 발생
-        raise ValueError(f"수출물가 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+    return SummaryDataService(excel_path, year, quarter).trade_price()
 
 
 def get_employment_population_data(excel_path, year, quarter):
     """요약-고용인구 데이터"""
-    try:
-        xl = pd.ExcelFile(excel_path)
-        employment = _extract_chart_data(xl, 'D(고용률)분석', is_employment=True, year=year, quarter=quarter)
-        
-        # 집계 시트에서 실제 고용률 값 추출 (분석 시트에서는 증감률만 추출됨)
-        try:
-            if 'D(고용률)집계' in xl.sheet_names:
-                df_rate = pd.read_excel(xl, sheet_name='D(고용률)집계', header=None)
-                # 시트 구조: 열1=지역이름, 열2=분류단계, 열21=2025 3/4 고용률
-                for i, row in df_rate.iterrows():
-                    if i < 3:  # 헤더 스킵
-                        continue
-                    region = str(row[1]).strip() if pd.notna(row[1]) else ''
-                    division = str(row[2]).strip() if pd.notna(row[2]) else ''
-                    
-                    if region == '전국' and division == '0':
-                        rate_val = safe_float(row[21])  # 2025 3/4 열
-                        if rate_val is not None:
-                            employment['nationwide']['rate'] = round(rate_val, 1)
-                            employment['nationwide']['index'] = round(rate_val, 1)
-                        break
-                
-                # 지역별 고용률도 추출
-                for i, row in df_rate.iterrows():
-                    if i < 3:
-                        continue
-                    region = normalize_region_name(str(row[1]).strip() if pd.notna(row[1]) else '')
-                    division = str(row[2]).strip() if pd.notna(row[2]) else ''
-                    
-                    if division == '0' and region in VALID_REGIONS:
-                        rate_val = safe_float(row[21])
-                        if rate_val is not None:
-                            # chart_data에서 해당 지역 찾아서 rate 업데이트
-                            for item in employment.get('chart_data', []):
-                                if item.get('name') == region:
-                                    item['rate'] = round(rate_val, 1)
-                                    item['index'] = round(rate_val, 1)
-                                    break
-        except Exception as rate_error:
-            print(f"고용률 집계 데이터 추출 오류: {rate_error}")
-        
-        population = {
-            'inflow_regions': [],
-            'outflow_regions': [],
-            'inflow_count': 0,
-            'outflow_count': 0,
-            'chart_data': []
-        }
-        try:
-            df = _read_sheet_df(xl, 'I(순인구이동)집계', data_only=False)
-            regions = VALID_REGIONS.copy()
-            
-            # 시트 구조: col4=지역이름, col5=분류단계(0=합계), col25=2025 2/4분기
-            # 합계(분류단계 0) 행만 추출
-            processed_regions = set()
-            region_data = {}  # 지역별 데이터 저장
-            
-            for i, row in df.iterrows():
-                region = str(row[4]).strip() if pd.notna(row[4]) else ''
-                division = str(row[5]).strip() if pd.notna(row[5]) else ''
-                
-                # 합계 행 (분류단계 0)만 처리, 중복 지역 방지
-                if division == '0' and region in regions and region not in processed_regions:
-                    try:
-                        # 2025 2/4분기 데이터 (열 25)
-                        curr_value = safe_float(row[25])
-                        value = int(round(curr_value / 1000)) if curr_value is not None else 0
-                        # 국내인구이동은 증감률 계산하지 않음 (raw data만 사용)
-                        change = None
-                        
-                        processed_regions.add(region)
-                        region_data[region] = {'value': value, 'change': change}
-                        
-                        if value > 0:
-                            population['inflow_regions'].append({'name': region, 'value': value})
-                        else:
-                            population['outflow_regions'].append({'name': region, 'value': abs(value)})
-                    except:
-                        continue
-            
-            population['inflow_regions'].sort(key=lambda x: x['value'], reverse=True)
-            population['outflow_regions'].sort(key=lambda x: x['value'], reverse=True)
-            population['inflow_count'] = len(population['inflow_regions'])
-            population['outflow_count'] = len(population['outflow_regions'])
-            
-            # chart_data 구성 - 지역 순서대로
-            for region in regions:
-                if region in region_data:
-                    data = region_data[region]
-                    population['chart_data'].append({
-                        'name': region,
-                        'value': data['value'],  # 순이동량 (천명)
-                        'change': data['change']  # 전년동분기대비 증감률 (%)
-                    })
-                else:
-                    population['chart_data'].append({
-                        'name': region,
-                        'value': 0,
-                        'change': None
-                    })
-                    
-        except Exception as e:
-            print(f"인구이동 데이터 오류: {e}")
-            import traceback
-            traceback.print_exc()
-        
-        return {
-            'employment': employment,
-            'population': population
-        }
-    except Exception as e:
-        print(f"🔍 [디버그] 고용인구 요약 데이터 추출 오류:")
-        print(f"  - 오류: {e}")
-        print(f"  - excel_path: {excel_path}")
-        print(f"  - year: {year}, quarter: {quarter}")
-        import traceback
-        traceback.print_exc()
-        # 기본값/폴백 사용 금지: ValueError 발생
-        raise ValueError(f"고용인구 요약 데이터 추출 실패: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+    return SummaryDataService(excel_path, year, quarter).employment_population()
 
 
 def _extract_employment_from_aggregate(xl, config, regions):
@@ -810,24 +911,21 @@ def _extract_employment_from_aggregate(xl, config, regions):
     region_changes = {}
     region_indices = {}
 
-    for _, row in df_rate.iterrows():
-        try:
-            region_raw = str(row[rate_region_col]).strip() if pd.notna(row[rate_region_col]) else ''
-            region = normalize_region_name(region_raw)
-
-            is_total = False
-            if rate_code_col is not None:
-                code = str(row[rate_code_col]).strip() if pd.notna(row[rate_code_col]) else ''
-                is_total = (code == rate_total_code)
-            elif rate_division_col is not None:
-                division = str(row[rate_division_col]).strip() if pd.notna(row[rate_division_col]) else ''
-                is_total = (division == rate_total_code)
-
-            if not is_total:
-                continue
+    # 합계 판정 컬럼: 코드 컬럼 우선, 없으면 분류단계 컬럼 (둘 다 없으면 합계 행 없음)
+    total_col = rate_code_col if rate_code_col is not None else rate_division_col
+    if total_col is None:
+        positions, total_regions = np.empty(0, dtype=np.intp), []
+    else:
+        positions, total_regions = _total_rows(
+            df_rate, rate_region_col, total_col, rate_total_code,
+            required=(rate_value_col, prev_rate_col), normalize=True
+        )
+    rows = zip(total_regions, _cells(df_rate, rate_value_col, positions), _cells(df_rate, prev_rate_col, positions))
 
-            rate_val = safe_float(row[rate_value_col])
-            prev_rate = safe_float(row[prev_rate_col])
+    for region, rate_cell, prev_cell in rows:
+        try:
+            rate_val = safe_float(rate_cell)
+            prev_rate = safe_float(prev_cell)
             if rate_val is None or prev_rate is None:
                 continue
 
@@ -900,12 +998,18 @@ def _extract_chart_data(xl, sheet_name, is_trade=False, is_employment=False, yea
     regions = VALID_REGIONS.copy()
     excel_path = _get_excel_path(xl)
     
-    # 캐시된 데이터 확인
+    # 부문/시도별 단계와 공유하는 지역 큐브 사용 (부문 열은 처음 조회 시 한 번만 채움)
     report_id = SHEET_REPORT_ID_MAP.get(sheet_name)
     if report_id and year is not None and quarter is not None:
+        try:
+            cube = get_regional_cube(excel_path, year, quarter)
+            return cube.chart_data(report_id, regions, is_trade=is_trade, is_employment=is_employment)
+        except Exception as e:
+            print(f"[요약] {report_id} 지역 큐브 사용 실패: {e}")
         cached = get_sector_data(excel_path, year, quarter, report_id)
         if cached:
             return _build_chart_data_from_sector_cache(cached, is_trade=is_trade, is_employment=is_employment)
+        print(f"[요약] {report_id} 부문 데이터 없음, 분석 시트에서 추출")
     
     # 시트별 컬럼 매핑 (컬럼 인덱스: 지역명, 분류단계, 증감률)
     # 각 시트의 실제 구조에 맞게 매핑
@@ -929,11 +1033,7 @@ def _extract_chart_data(xl, sheet_name, is_trade=False, is_employment=False, yea
     
     # 시트 데이터 읽기 (분석 시트는 이미 계산된 값이므로 data_only=False로 읽음)
     try:
-        # xl이 ExcelFile이면 직접 읽고, 그렇지 않으면 경로로 읽음
-        if isinstance(xl, pd.ExcelFile):
-            df = pd.read_excel(xl, sheet_name=sheet_name, header=None)
-        else:
-            df = pd.read_excel(excel_path, sheet_name=sheet_name, header=None)
+        df = _read_sheet_df(excel_path, sheet_name, data_only=False)
     except Exception as e:
         raise ValueError(f"시트 읽기 실패: {sheet_name}, {e}")
     
@@ -948,33 +1048,24 @@ def _extract_chart_data(xl, sheet_name, is_trade=False, is_employment=False, yea
     chart_data = []
     nationwide_change_set = False
     
-    # 데이터 행 순회 (헤더 스킵: 처음 3행)
-    for i, row in df.iterrows():
-        if i < 3:  # 헤더 행 스킵
-            continue
-        try:
-            region = str(row[region_col]).strip() if pd.notna(row[region_col]) else ''
-            division = str(row[division_col]).strip() if pd.notna(row[division_col]) else ''
-            
-            # 총지수/합계 행만 처리 (분류단계 = 0)
-            if division != total_code:
-                continue
-            
-            # 증감률 값 추출
-            change_val = safe_float(row[change_col], None)
-            if change_val is not None:
-                change_val = round(change_val, 1)
-            
-            if region == '전국':
-                if not nationwide_change_set and change_val is not None:
-                    nationwide['change'] = change_val
-                    nationwide['change_rate'] = change_val
-                    nationwide_change_set = True
-            elif region in regions and change_val is not None:
-                if region not in region_changes:
-                    region_changes[region] = change_val
-        except Exception as e:
+    # 총지수/합계 행(분류단계 = 0)만 선택 (헤더 스킵: 처음 3행)
+    positions, total_regions = _total_rows(
+        df, region_col, division_col, total_code, skip_rows=3, required=(change_col,)
+    )
+    for region, change_cell in zip(total_regions, _cells(df, change_col, positions)):
+        # 증감률 값 추출
+        change_val = safe_float(change_cell, None)
+        if change_val is None:
             continue
+        change_val = round(change_val, 1)
+        
+        if region == '전국':
+            if not nationwide_change_set:
+                nationwide['change'] = change_val
+                nationwide['change_rate'] = change_val
+                nationwide_change_set = True
+        elif region in regions and region not in region_changes:
+            region_changes[region] = change_val
     
     # 전국 데이터가 없으면 오류
     if not nationwide_change_set:
@@ -1045,16 +1136,12 @@ def _extract_chart_data_from_aggregate(xl, config, regions, is_trade=False):
         decrease_regions = []
         chart_data = []
         
-        for i, row in df.iterrows():
-            region = str(row[region_col]).strip() if pd.notna(row[region_col]) else ''
-            code = str(row[code_col]).strip() if code_col is not None and pd.notna(row[code_col]) else ''
-            
-            # 총계 코드 확인
-            if code != str(total_code):
-                continue
-                
-            curr_val = safe_float(row[curr_col], 0)
-            prev_val = safe_float(row[prev_col], 0)
+        # 총계 코드 행만 선택
+        positions, total_regions = _total_rows(df, region_col, code_col, total_code, required=(curr_col, prev_col))
+        rows = zip(total_regions, _cells(df, curr_col, positions), _cells(df, prev_col, positions))
+        for region, curr_cell, prev_cell in rows:
+            curr_val = safe_float(curr_cell, 0)
+            prev_val = safe_float(prev_cell, 0)
             
             if prev_val is not None and prev_val != 0:
                 change = round((curr_val - prev_val) / prev_val * 100, 1)
@@ -0,0 +1,505 @@
+# -*- coding: utf-8 -*-
+"""
+워크북 스냅샷 서비스
+
+업로드된 분석표를 한 번만 파싱하여 시트별 DataFrame을 메모리에 보관합니다.
+Generator, 요약 데이터 추출, 연도/분기 추출 등 모든 호출부가 같은 스냅샷을
+공유하므로 동일한 xlsx의 XML 압축 해제가 반복되지 않습니다.
+
+주의: 반환되는 DataFrame/ndarray는 여러 호출부가 공유하는 읽기 전용 데이터입니다.
+수정이 필요하면 반드시 .copy() 후 사용하세요.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.settings import EXCEL_CACHE_TTL_SECONDS, SNAPSHOT_CACHE_MAX_BYTES, SNAPSHOT_CACHE_MAX_ENTRIES
+from .excel_cache import register_companion_cache
+from .lazy_workbook import estimate_frame_bytes
+from .sheet_reads import note_sheet_read
+from .xlsx_stream_reader import RangeBounds
+
+
+# 스냅샷 생성 시 한 번에 디코딩하는 데이터 시트 키워드
+DATA_SHEET_KEYWORDS = ('집계', '분석')
+
+
+def is_data_sheet(sheet_name: str) -> bool:
+    """집계/분석 시트 여부"""
+    return any(keyword in sheet_name for keyword in DATA_SHEET_KEYWORDS)
+
+
+def normalize_range(range_dict: Dict[str, Any]) -> RangeBounds:
+    """
+    aggregation_range(1-based 행, 열 문자 또는 0-based 열 번호)를 0-based 경계로 변환
+
+    Returns:
+        (row_start, row_end, col_start, col_end) - 끝 경계는 미포함, None이면 시트 끝까지
+    """
+    from openpyxl.utils import column_index_from_string
+
+    def _col_to_index(col_value):
+        if col_value is None:
+            return None
+        if isinstance(col_value, int):
+            return col_value
+        if isinstance(col_value, str) and col_value.strip():
+            return column_index_from_string(col_value.strip().upper()) - 1
+        return None
+
+    start_row = range_dict.get('start_row')
+    end_row = range_dict.get('end_row')
+    start_col = _col_to_index(range_dict.get('start_col'))
+    end_col = _col_to_index(range_dict.get('end_col'))
+
+    row_start = max((start_row - 1) if isinstance(start_row, int) else 0, 0)
+    row_end = end_row if isinstance(end_row, int) else None
+    col_start = start_col if isinstance(start_col, int) else 0
+    col_end = (end_col + 1) if isinstance(end_col, int) else None
+    return row_start, row_end, col_start, col_end
+
+
+class WorkbookSnapshot:
+    """업로드된 워크북의 읽기 전용 스냅샷 (시트당 한 번만 디코딩)"""
+
+    def __init__(
+        self,
+        excel_path: str,
+        excel_file: Optional[pd.ExcelFile] = None,
+        sheet_names: Optional[List[str]] = None,
+        frames: Optional[Dict[str, pd.DataFrame]] = None
+    ):
+        """
+        Args:
+            excel_path: 엑셀 파일 경로
+            excel_file: 캐시된 ExcelFile 객체 (선택사항, 있으면 재사용)
+            sheet_names: 시트 목록 (사이드카 캐시 등에서 복원한 경우, 파일을 열지 않음)
+            frames: 이미 디코딩된 시트별 DataFrame (사이드카 캐시 복원용)
+        """
+        self.excel_path = str(excel_path)
+        self.mtime = Path(excel_path).stat().st_mtime
+        self._xl = excel_file
+        self._stream_reader = None
+        self._stream_reader_checked = False
+        if sheet_names is None:
+            reader = self._get_stream_reader()
+            source = reader if reader is not None else self._get_excel_file()
+            sheet_names = list(source.sheet_names)
+        self.sheet_names: List[str] = list(sheet_names)
+        self._frames: Dict[str, pd.DataFrame] = dict(frames or {})
+        # 범위 DataFrame은 시트 전체에서 잘라낸 뷰 (별도 디코딩 없음)
+        self._range_frames: Dict[Tuple, pd.DataFrame] = {}
+        self._values: Dict[str, np.ndarray] = {}
+        # 병렬 디코딩 결과가 사용하는 공유 메모리 블록 (services.parallel_decode.SharedBlock)
+        self._shared_blocks: List[Any] = []
+        self._blocks_lock = threading.Lock()
+        self._lock = threading.RLock()
+        # 디코딩된 시트/값 배열의 추정 메모리 (스냅샷 캐시 상한 계산용, lock 없이 읽음)
+        self._resident_bytes = sum(estimate_frame_bytes(df) for df in self._frames.values())
+
+    @property
+    def resident_bytes(self) -> int:
+        """현재 보관 중인 디코딩 데이터의 추정 메모리 크기"""
+        return self._resident_bytes
+
+    def _store_frames(self, frames: Dict[str, pd.DataFrame]) -> None:
+        """디코딩한 시트 보관 (lock 보유 상태에서 호출)"""
+        for name, df in frames.items():
+            self._frames[name] = df
+            self._resident_bytes += estimate_frame_bytes(df)
+
+    def _get_excel_file(self) -> pd.ExcelFile:
+        """디코딩되지 않은 시트가 필요할 때만 ExcelFile을 연다."""
+        if self._xl is None:
+            from .excel_cache import get_excel_file
+            self._xl = get_excel_file(self.excel_path)
+            if self._xl is None:
+                raise ValueError(f"엑셀 파일을 열 수 없습니다: {self.excel_path}")
+        return self._xl
+
+    def _get_stream_reader(self):
+        """xlsx 스트리밍 리더 (설정에서 꺼져 있거나 xlsx가 아니면 None)"""
+        if not self._stream_reader_checked:
+            self._stream_reader_checked = True
+            from config.settings import USE_STREAMING_XLSX_READER
+            if USE_STREAMING_XLSX_READER and Path(self.excel_path).suffix.lower() in ('.xlsx', '.xlsm'):
+                try:
+                    from .xlsx_stream_reader import StreamingExcelFile
+                    self._stream_reader = StreamingExcelFile(self.excel_path)
+                except Exception as e:
+                    print(f"[WorkbookSnapshot] 스트리밍 리더 사용 불가, pandas로 대체: {e}")
+        return self._stream_reader
+
+    def _decode_sheets(self, sheet_names: List[str]) -> Dict[str, pd.DataFrame]:
+        """시트 전체 디코딩 (스트리밍 리더 우선, 실패 시 pandas)"""
+        reader = self._get_stream_reader()
+        if reader is not None:
+            try:
+                return reader.parse(sheet_names, header=None)
+            except Exception as e:
+                print(f"[WorkbookSnapshot] 스트리밍 디코딩 실패, pandas로 대체: {e}")
+        return self._get_excel_file().parse(sheet_names, header=None)
+
+    def has_sheet(self, sheet_name: str) -> bool:
+        return sheet_name in self.sheet_names
+
+    def preload(self, sheet_names: Optional[List[str]] = None) -> None:
+        """
+        시트를 미리 디코딩 (기본값: 모든 집계/분석 시트)
+
+        범위가 설정된 집계 시트도 요약 보도자료가 시트 전체를 읽으므로 전체를 디코딩하고,
+        get_range는 이를 잘라서 반환합니다.
+
+        Args:
+            sheet_names: 디코딩할 시트 목록 (None이면 집계/분석 시트 전체)
+        """
+        if sheet_names is None:
+            sheet_names = [name for name in self.sheet_names if is_data_sheet(name)]
+        with self._lock:
+            pending = [
+                name for name in sheet_names
+                if name in self.sheet_names and name not in self._frames
+            ]
+            if not pending or self._preload_parallel(pending):
+                return
+            self._store_frames(self._decode_sheets(pending))
+
+    def _preload_parallel(self, pending: List[str]) -> bool:
+        """
+        시트를 프로세스 풀로 병렬 디코딩 (lock 보유 상태에서 호출)
+
+        Returns:
+            병렬 디코딩 완료 여부 (False면 호출부에서 직렬 처리)
+        """
+        if self._get_stream_reader() is None:
+            return False
+
+        from .parallel_decode import decode_sheets_parallel, resolve_worker_count
+
+        workers = resolve_worker_count(self.excel_path, len(pending))
+        if workers <= 1:
+            return False
+
+        try:
+            frames, blocks = decode_sheets_parallel(self.excel_path, pending, workers)
+        except Exception as e:
+            print(f"[WorkbookSnapshot] 병렬 디코딩 실패, 직렬 모드로 대체: {e}")
+            return False
+
+        # float64 열은 공유 메모리 블록의 뷰 (스냅샷 해제 시 unlink)
+        with self._blocks_lock:
+            self._shared_blocks.extend(blocks)
+        self._store_frames(frames)
+        print(f"[WorkbookSnapshot] 병렬 디코딩 완료: {len(pending)}개 시트, 워커 {workers}개")
+        return True
+
+    def release(self) -> None:
+        """
+        스냅샷이 캐시에서 빠질 때 호출: 공유 메모리 블록 이름 해제
+
+        이미 받아 간 DataFrame은 계속 사용할 수 있으며, 마지막 참조가 사라질 때 매핑이 닫힙니다.
+        캐시 lock을 보유한 상태에서도 호출되므로 디코딩 lock은 잡지 않습니다.
+        """
+        with self._blocks_lock:
+            blocks, self._shared_blocks = self._shared_blocks, []
+        for block in blocks:
+            block.unlink()
+
+    def get_sheet(self, sheet_name: str) -> Optional[pd.DataFrame]:
+        """
+        시트 DataFrame 반환 (header=None, 공유 객체이므로 수정 금지)
+
+        Returns:
+            DataFrame 또는 None (시트가 없는 경우)
+        """
+        if sheet_name not in self.sheet_names:
+            return None
+        note_sheet_read(sheet_name)
+        with self._lock:
+            df = self._frames.get(sheet_name)
+            if df is None:
+                df = self._decode_sheets([sheet_name])[sheet_name]
+                self._store_frames({sheet_name: df})
+            return df
+
+    def get_range(self, sheet_name: str, range_dict: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """
+        aggregation_range로 지정된 범위만 DataFrame으로 반환 (공유 객체이므로 수정 금지)
+
+        시트 전체 DataFrame을 잘라서 반환하므로 행/열 라벨은 시트 기준 위치를 유지합니다.
+
+        Returns:
+            DataFrame 또는 None (시트가 없는 경우)
+        """
+        if sheet_name not in self.sheet_names:
+            return None
+        return self._get_range_by_bounds(sheet_name, normalize_range(range_dict))
+
+    def _get_range_by_bounds(self, sheet_name: str, bounds: RangeBounds) -> pd.DataFrame:
+        key = (sheet_name,) + tuple(bounds)
+        with self._lock:
+            df = self._range_frames.get(key)
+            if df is not None:
+                return df
+            row_start, row_end, col_start, col_end = bounds
+            df = self.get_sheet(sheet_name).iloc[row_start:row_end, col_start:col_end]
+            self._range_frames[key] = df
+            return df
+
+    def get_values(self, sheet_name: str) -> Optional[np.ndarray]:
+        """
+        시트 값을 읽기 전용 object ndarray로 반환
+
+        Returns:
+            ndarray 또는 None (시트가 없는 경우)
+        """
+        with self._lock:
+            values = self._values.get(sheet_name)
+            if values is not None:
+                return values
+            df = self.get_sheet(sheet_name)
+            if df is None:
+                return None
+            values = df.to_numpy(dtype=object, copy=True)
+            values.flags.writeable = False
+            self._values[sheet_name] = values
+            self._resident_bytes += values.nbytes
+            return values
+
+    def get_cell(self, sheet_name: str, row: int, col: int) -> Any:
+        """0-based 셀 값 반환 (범위 밖이거나 시트가 없으면 None)"""
+        values = self.get_values(sheet_name)
+        if values is None or row >= values.shape[0] or col >= values.shape[1]:
+            return None
+        return values[row, col]
+
+    def apply_frames(self, frames: Dict[str, pd.DataFrame]) -> None:
+        """시트 DataFrame 교체 (메모리 내 수식 계산 결과 반영용, 파생 캐시도 함께 폐기)"""
+        with self._lock:
+            for name, df in frames.items():
+                self._frames[name] = df
+                self._values.pop(name, None)
+                for key in [key for key in self._range_frames if key[0] == name]:
+                    del self._range_frames[key]
+            self._resident_bytes = self._measure_bytes()
+
+    def _measure_bytes(self) -> int:
+        """보관 중인 데이터 메모리 재계산 (교체/해제 후 호출, lock 보유 상태)"""
+        return (
+            sum(estimate_frame_bytes(df) for df in self._frames.values())
+            + sum(values.nbytes for values in self._values.values())
+        )
+
+    def get_decoded_frames(self) -> Dict[str, pd.DataFrame]:
+        """현재까지 디코딩된 시트별 DataFrame (사이드카 캐시 저장용)"""
+        with self._lock:
+            return dict(self._frames)
+
+    def get_info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'excel_path': self.excel_path,
+                'sheet_count': len(self.sheet_names),
+                'decoded_sheets': list(self._frames.keys()),
+                'decoded_ranges': [key[0] for key in self._range_frames.keys()],
+                'decoded_bytes': self._resident_bytes,
+            }
+
+
+class WorkbookSnapshotCache:
+    """
+    파일 경로별 워크북 스냅샷 캐시 (Thread-safe, 메모리 상한 LRU + TTL)
+
+    스냅샷은 디코딩된 시트를 보관하므로 ExcelCache와 같은 방식으로 상한을 유지합니다.
+    - 추정 메모리(resident_bytes) 합계/항목 수 상한 초과 시 오래 사용되지 않은 스냅샷부터 제거
+    - TTL 동안 사용되지 않은 스냅샷 제거
+    - 생성 작업이 사용 중(ExcelCache lease)인 파일의 스냅샷은 상한 정리에서 제외
+    - ExcelCache가 파일 항목을 제거하면 같은 파일의 스냅샷도 함께 제거 (evict)
+
+    제거된 스냅샷을 이미 받아 간 호출부는 그대로 사용할 수 있으며, 캐시에서만 빠집니다.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = SNAPSHOT_CACHE_MAX_BYTES,
+        max_entries: int = SNAPSHOT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = EXCEL_CACHE_TTL_SECONDS
+    ):
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.evictions = 0
+
+    def get_snapshot(self, excel_path: str, excel_file: Optional[pd.ExcelFile] = None) -> WorkbookSnapshot:
+        """
+        스냅샷을 캐시에서 가져오거나 새로 생성 (파일 수정 시각으로 유효성 확인)
+
+        Args:
+            excel_path: 엑셀 파일 경로
+            excel_file: 캐시된 ExcelFile 객체 (선택사항)
+        """
+        cache_key = str(excel_path)
+        file_mtime = Path(excel_path).stat().st_mtime
+
+        with self._lock:
+            snapshot = self._lookup(cache_key, file_mtime)
+        if snapshot is None:
+            # 생성 시 ExcelCache를 열 수 있으므로 lock 밖에서 생성 (lock 순서: ExcelCache → 스냅샷 캐시)
+            created = WorkbookSnapshot(cache_key, excel_file=excel_file)
+            # 업로드 전처리에서 계산값을 등록한 파일은 다시 만든 스냅샷에도 계산값 반영
+            from .formula_overlay import attach_registered_overlay
+            attach_registered_overlay(created)
+            with self._lock:
+                snapshot = self._lookup(cache_key, file_mtime)
+                if snapshot is None:
+                    snapshot = created
+                    self._store(cache_key, snapshot)
+        self._enforce_limits(keep=cache_key)
+        return snapshot
+
+    def _lookup(self, cache_key: str, file_mtime: float) -> Optional[WorkbookSnapshot]:
+        """유효한 스냅샷 조회 및 최근 사용 갱신 (lock 보유 상태에서 호출)"""
+        entry = self._cache.get(cache_key)
+        if entry is None or entry['snapshot'].mtime != file_mtime:
+            return None
+        entry['last_access'] = time.monotonic()
+        self._cache.move_to_end(cache_key)
+        return entry['snapshot']
+
+    def _drop(self, cache_key: str) -> None:
+        """스냅샷을 캐시에서 제거하고 공유 메모리 블록 해제 (lock 보유 상태에서 호출)"""
+        entry = self._cache.pop(cache_key, None)
+        if entry is not None:
+            entry['snapshot'].release()
+
+    def _store(self, cache_key: str, snapshot: WorkbookSnapshot) -> None:
+        previous = self._cache.get(cache_key)
+        if previous is not None and previous['snapshot'] is not snapshot:
+            previous['snapshot'].release()
+        self._cache[cache_key] = {
+            'snapshot': snapshot,
+            'timestamp': datetime.now(),
+            'last_access': time.monotonic()
+        }
+        self._cache.move_to_end(cache_key)
+
+    def seed_snapshot(
+        self,
+        excel_path: str,
+        sheet_names: List[str],
+        frames: Dict[str, pd.DataFrame]
+    ) -> WorkbookSnapshot:
+        """이미 디코딩된 시트로 스냅샷 등록 (파일을 다시 파싱하지 않음)"""
+        cache_key = str(excel_path)
+        snapshot = WorkbookSnapshot(cache_key, sheet_names=sheet_names, frames=frames)
+        with self._lock:
+            self._store(cache_key, snapshot)
+        self._enforce_limits(keep=cache_key)
+        return snapshot
+
+    def _over_limits(self) -> bool:
+        now = time.monotonic()
+        if len(self._cache) > self.max_entries:
+            return True
+        if any(now - entry['last_access'] > self.ttl_seconds for entry in self._cache.values()):
+            return True
+        return sum(entry['snapshot'].resident_bytes for entry in self._cache.values()) > self.max_bytes
+
+    def _enforce_limits(self, keep: Optional[str] = None) -> None:
+        """
+        TTL 초과 스냅샷 정리 후, 항목 수/메모리 상한을 넘으면 오래 사용되지 않은 스냅샷부터 제거
+
+        Args:
+            keep: 방금 반환할 스냅샷 키 (상한을 넘어도 제거하지 않음)
+        """
+        with self._lock:
+            if not self._over_limits():
+                return
+        # 사용 중인 파일 목록은 스냅샷 캐시 lock 밖에서 조회 (ExcelCache가 evict 호출 시 역순 lock 방지)
+        from .excel_cache import get_leased_paths
+        leased = get_leased_paths()
+
+        with self._lock:
+            now = time.monotonic()
+            for cache_key, entry in list(self._cache.items()):
+                if cache_key == keep or cache_key in leased:
+                    continue
+                if now - entry['last_access'] > self.ttl_seconds:
+                    self._drop(cache_key)
+                    self.evictions += 1
+
+            total_bytes = sum(entry['snapshot'].resident_bytes for entry in self._cache.values())
+            remaining = len(self._cache)
+            for cache_key, entry in list(self._cache.items()):
+                if total_bytes <= self.max_bytes and remaining <= self.max_entries:
+                    break
+                if cache_key == keep or cache_key in leased:
+                    continue
+                total_bytes -= entry['snapshot'].resident_bytes
+                remaining -= 1
+                self._drop(cache_key)
+                self.evictions += 1
+                print(f"[WorkbookSnapshot] 상한 초과로 스냅샷 해제: {cache_key}")
+
+    def evict(self, excel_path: Optional[str] = None) -> None:
+        """ExcelCache에서 파일 항목이 제거될 때 호출 (ExcelCache를 다시 호출하지 않음)"""
+        self.clear_cache(excel_path)
+
+    def clear_cache(self, excel_path: Optional[str] = None):
+        with self._lock:
+            keys = [str(excel_path)] if excel_path else list(self._cache)
+            for cache_key in keys:
+                self._drop(cache_key)
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'cached_files': len(self._cache),
+                'resident_bytes': sum(entry['snapshot'].resident_bytes for entry in self._cache.values()),
+                'max_bytes': self.max_bytes,
+                'evictions': self.evictions,
+                'snapshots': [entry['snapshot'].get_info() for entry in self._cache.values()]
+            }
+
+
+# 전역 스냅샷 캐시 인스턴스 (ExcelCache가 파일 항목을 제거하면 스냅샷도 제거)
+_snapshot_cache = WorkbookSnapshotCache()
+register_companion_cache(_snapshot_cache.evict)
+
+
+def get_workbook_snapshot(excel_path: str, excel_file: Optional[pd.ExcelFile] = None) -> WorkbookSnapshot:
+    """전역 캐시에서 워크북 스냅샷 가져오기"""
+    return _snapshot_cache.get_snapshot(excel_path, excel_file)
+
+
+def seed_workbook_snapshot(
+    excel_path: str,
+    sheet_names: List[str],
+    frames: Dict[str, pd.DataFrame]
+) -> WorkbookSnapshot:
+    """디코딩된 시트로 전역 스냅샷 등록"""
+    return _snapshot_cache.seed_snapshot(excel_path, sheet_names, frames)
+
+
+def get_snapshot_sheet(excel_path: str, sheet_name: str) -> Optional[pd.DataFrame]:
+    """전역 스냅샷에서 시트 DataFrame 가져오기 (header=None, 수정 금지)"""
+    return get_workbook_snapshot(excel_path).get_sheet(sheet_name)
+
+
+def clear_snapshot_cache(excel_path: Optional[str] = None):
+    """스냅샷 캐시 초기화"""
+    _snapshot_cache.clear_cache(excel_path)
+
+
+def get_snapshot_cache_info() -> Dict[str, Any]:
+    """스냅샷 캐시 정보 반환"""
+    return _snapshot_cache.get_cache_info()
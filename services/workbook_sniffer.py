@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+업로드 파일 스니핑 (시트 파싱 없는 빠른 확인)
+
+파일 유형 판별, 시트 구조 검증, 연도/분기 추출에는 시트명과 몇 개의 셀(K17/M17, 헤더 행)만
+필요하므로, xlsx(zip)에서 xl/workbook.xml과 해당 시트 XML의 필요한 행까지만 읽습니다.
+
+- sheet_names: xl/workbook.xml만 읽음
+- read_cells: 지정 범위의 마지막 행까지만 시트 XML을 순회하고 중단
+- sharedStrings.xml: 필요한 인덱스까지만 순차 해석 (이후 호출에서 이어서 해석)
+- 같은 파일의 모든 확인 작업은 전역 캐시를 통해 하나의 zip 핸들을 공유
+"""
+
+import math
+import posixpath
+import threading
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from xml.etree.ElementTree import iterparse
+
+from .xlsx_stream_reader import (
+    RangeBounds, _NS_MAIN, _NS_PKG_REL, _NS_REL,
+    _TAG_CELL, _TAG_INLINE, _TAG_ROW, _TAG_SHEET_DATA, _TAG_SI, _TAG_VALUE,
+    _column_index, _rich_text,
+)
+
+
+CellMap = Dict[Tuple[int, int], Any]
+
+
+def cell_ref_to_index(cell_ref: str) -> Tuple[int, int]:
+    """'K17' → (16, 10) 0-based (행, 열)"""
+    return _column_index(cell_ref.upper())
+
+
+class WorkbookSniffer:
+    """xlsx zip을 직접 읽는 최소 판독기 (Thread-safe)"""
+
+    def __init__(self, excel_path: str):
+        """
+        Raises:
+            ValueError: xlsx(zip) 형식이 아닌 경우 (xls 등은 호출부에서 pandas로 대체)
+        """
+        self.excel_path = str(excel_path)
+        self.mtime = Path(excel_path).stat().st_mtime
+        try:
+            self._zip = zipfile.ZipFile(self.excel_path)
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"xlsx 형식이 아닙니다: {self.excel_path}") from e
+        self._lock = threading.RLock()
+        self._sheet_ids: Optional[Dict[str, str]] = None
+        self._sheet_paths: Optional[Dict[str, str]] = None
+        self._shared_strings: List[str] = []
+        self._shared_string_iter: Optional[Iterator[str]] = None
+        self._shared_strings_done = False
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """시트 목록 (xl/workbook.xml만 읽음)"""
+        with self._lock:
+            if self._sheet_ids is None:
+                sheet_ids = {}
+                with self._zip.open('xl/workbook.xml') as f:
+                    for _, element in iterparse(f):
+                        if element.tag == f'{_NS_MAIN}sheet':
+                            sheet_ids[element.get('name')] = element.get(f'{_NS_REL}id')
+                self._sheet_ids = sheet_ids
+            return list(self._sheet_ids)
+
+    def has_sheet(self, sheet_name: str) -> bool:
+        return sheet_name in self.sheet_names
+
+    def _get_sheet_path(self, sheet_name: str) -> str:
+        if not self.has_sheet(sheet_name):
+            raise ValueError(f"시트를 찾을 수 없습니다: {sheet_name}")
+        if self._sheet_paths is None:
+            rels = {}
+            with self._zip.open('xl/_rels/workbook.xml.rels') as f:
+                for _, element in iterparse(f):
+                    if element.tag == f'{_NS_PKG_REL}Relationship':
+                        target = element.get('Target', '')
+                        if target.startswith('/'):
+                            target = target.lstrip('/')
+                        else:
+                            target = posixpath.normpath(posixpath.join('xl', target))
+                        rels[element.get('Id')] = target
+            self._sheet_paths = {name: rels.get(rid) for name, rid in self._sheet_ids.items()}
+        return self._sheet_paths[sheet_name]
+
+    def _iter_shared_strings(self) -> Iterator[str]:
+        if 'xl/sharedStrings.xml' not in self._zip.namelist():
+            return
+        with self._zip.open('xl/sharedStrings.xml') as f:
+            for _, element in iterparse(f):
+                if element.tag == _TAG_SI:
+                    yield _rich_text(element)
+                    element.clear()
+
+    def _shared_string(self, index: int) -> str:
+        """index번째 공유 문자열 (필요한 위치까지만 해석)"""
+        if self._shared_string_iter is None and not self._shared_strings_done:
+            self._shared_string_iter = self._iter_shared_strings()
+        while index >= len(self._shared_strings) and not self._shared_strings_done:
+            try:
+                self._shared_strings.append(next(self._shared_string_iter))
+            except StopIteration:
+                self._shared_strings_done = True
+                self._shared_string_iter = None
+        if index >= len(self._shared_strings):
+            raise ValueError(f"공유 문자열 인덱스가 범위를 벗어났습니다: {index}")
+        return self._shared_strings[index]
+
+    def read_cells(self, sheet_name: str, bounds: RangeBounds) -> CellMap:
+        """
+        범위 내 값이 있는 셀만 {(행, 열): 값}으로 반환 (0-based, 시트 기준 위치)
+
+        숫자는 정수값이면 int (pd.read_excel과 동일), 오류 셀은 NaN, 날짜 서식은 해석하지 않습니다.
+        row_end 이후 행은 읽지 않습니다.
+        """
+        row_start, row_end, col_start, col_end = bounds
+        raw_cells: List[Tuple[int, int, str, str]] = []
+        with self._lock:
+            sheet_path = self._get_sheet_path(sheet_name)
+            with self._zip.open(sheet_path) as f:
+                current_row = -1
+                for _, element in iterparse(f):
+                    tag = element.tag
+                    if tag == _TAG_SHEET_DATA:
+                        break
+                    if tag != _TAG_ROW:
+                        continue
+                    row_ref = element.get('r')
+                    current_row = int(row_ref) - 1 if row_ref else current_row + 1
+                    if row_end is not None and current_row >= row_end:
+                        break
+                    if current_row < row_start:
+                        element.clear()
+                        continue
+
+                    next_col = 0
+                    for cell in element:
+                        if cell.tag != _TAG_CELL:
+                            continue
+                        cell_ref = cell.get('r')
+                        col = _column_index(cell_ref)[1] if cell_ref else next_col
+                        next_col = col + 1
+                        if col < col_start or (col_end is not None and col >= col_end):
+                            continue
+                        cell_type = cell.get('t', 'n')
+                        if cell_type == 'inlineStr':
+                            inline = cell.find(_TAG_INLINE)
+                            if inline is not None:
+                                raw_cells.append((current_row, col, cell_type, _rich_text(inline)))
+                            continue
+                        raw = cell.findtext(_TAG_VALUE)
+                        if raw:
+                            raw_cells.append((current_row, col, cell_type, raw))
+                    element.clear()
+
+            cells: CellMap = {}
+            for row, col, cell_type, raw in raw_cells:
+                if cell_type == 'n':
+                    number = float(raw)
+                    cells[(row, col)] = int(number) if number.is_integer() else number
+                elif cell_type == 's':
+                    cells[(row, col)] = self._shared_string(int(raw))
+                elif cell_type == 'b':
+                    cells[(row, col)] = raw == '1'
+                elif cell_type == 'e':
+                    cells[(row, col)] = math.nan
+                else:
+                    cells[(row, col)] = raw
+            return cells
+
+    def get_cell(self, sheet_name: str, cell_ref: str) -> Any:
+        """단일 셀 값 (예: 'K17'), 값이 없으면 None"""
+        row, col = cell_ref_to_index(cell_ref)
+        return self.read_cells(sheet_name, (row, row + 1, col, col + 1)).get((row, col))
+
+    def close(self) -> None:
+        with self._lock:
+            self._shared_string_iter = None
+            self._zip.close()
+
+
+class WorkbookSnifferCache:
+    """파일별 스니퍼 캐시 (같은 업로드의 모든 확인 작업이 zip 핸들 하나를 공유)"""
+
+    def __init__(self, max_entries: int = 4):
+        self._cache: "OrderedDict[str, WorkbookSniffer]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+
+    def get_sniffer(self, excel_path: str) -> WorkbookSniffer:
+        """
+        Raises:
+            ValueError: xlsx(zip) 형식이 아닌 경우
+        """
+        key = str(excel_path)
+        file_mtime = Path(excel_path).stat().st_mtime
+        with self._lock:
+            sniffer = self._cache.get(key)
+            if sniffer is not None:
+                if sniffer.mtime == file_mtime:
+                    self._cache.move_to_end(key)
+                    return sniffer
+                # 전처리 등으로 파일이 바뀌었으면 새로 연다
+                sniffer.close()
+                del self._cache[key]
+
+            sniffer = WorkbookSniffer(key)
+            self._cache[key] = sniffer
+            while len(self._cache) > self.max_entries:
+                _, oldest = self._cache.popitem(last=False)
+                oldest.close()
+            return sniffer
+
+    def close(self, excel_path: Optional[str] = None) -> None:
+        """zip 핸들 해제 (업로드 파일 삭제 전 호출)"""
+        with self._lock:
+            keys = list(self._cache) if excel_path is None else [str(excel_path)]
+            for key in keys:
+                sniffer = self._cache.pop(key, None)
+                if sniffer is not None:
+                    sniffer.close()
+
+
+# 전역 스니퍼 캐시 인스턴스
+_sniffer_cache = WorkbookSnifferCache()
+
+
+def get_workbook_sniffer(excel_path: str) -> WorkbookSniffer:
+    """전역 캐시에서 파일 스니퍼 가져오기 (xlsx가 아니면 ValueError)"""
+    return _sniffer_cache.get_sniffer(excel_path)
+
+
+def close_workbook_sniffer(excel_path: Optional[str] = None) -> None:
+    """전역 캐시의 스니퍼 zip 핸들 해제"""
+    _sniffer_cache.close(excel_path)
@@ -0,0 +1,492 @@
+# -*- coding: utf-8 -*-
+"""
+스트리밍 xlsx 시트 리더
+
+고정 레이아웃의 집계/분석 시트를 읽을 때 openpyxl 객체 모델을 거치지 않고,
+xlsx(zip)를 직접 열어 sharedStrings.xml을 한 번만 해석한 뒤 각 sheetN.xml을
+iterparse로 순회하며 NumPy 배열(실수값 float64 + 문자열 라벨 object)에 바로 기록합니다.
+
+- 배열은 시트의 <dimension ref> 크기로 미리 할당하고, 벗어나는 셀이 있으면 두 배씩 확장
+- DataFrame 변환 시 라벨이 없는 열(숫자/빈 셀만)은 배열에서 바로 int64/float64 열을 만들고,
+  문자열/날짜가 섞인 열만 pandas TextParser로 타입을 추론
+- 날짜 셀은 workbookPr date1904 설정에 맞는 기준일로 변환
+- 문자열 intern 표는 리더 인스턴스별 (리더를 닫으면 함께 해제)
+
+pandas.ExcelFile과 호환되는 StreamingExcelFile(sheet_names, parse, close)을 제공하며,
+parse(header=None) 결과는 pd.read_excel(header=None)과 동일한 값/행열 라벨을 갖습니다.
+(수식 셀은 저장된 계산값을 사용 - openpyxl data_only=True와 동일)
+"""
+
+import posixpath
+import re
+import threading
+import zipfile
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from xml.etree.ElementTree import iterparse
+
+import numpy as np
+import pandas as pd
+
+
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+_TAG_ROW = f'{_NS_MAIN}row'
+_TAG_CELL = f'{_NS_MAIN}c'
+_TAG_VALUE = f'{_NS_MAIN}v'
+_TAG_INLINE = f'{_NS_MAIN}is'
+_TAG_TEXT = f'{_NS_MAIN}t'
+_TAG_RUN = f'{_NS_MAIN}r'
+_TAG_SI = f'{_NS_MAIN}si'
+_TAG_SHEET_DATA = f'{_NS_MAIN}sheetData'
+_TAG_WORKBOOK_PR = f'{_NS_MAIN}workbookPr'
+
+# int64로 정확히 표현되는 실수 범위 (2^63 이상은 astype 시 오버플로)
+_INT64_LIMIT = 2.0 ** 63
+# <dimension>이 비정상적으로 큰 경우(A1:XFD1048576 등) 처음 할당할 최대 셀 수 (초과 시 확장으로 대응)
+_PREALLOC_MAX_CELLS = 4_000_000
+_GROW_START_SHAPE = (1024, 64)
+# <dimension>은 sheetData 앞(sheetPr 다음)에 있으므로 시트 XML 앞부분만 검사
+_DIMENSION_SCAN_BYTES = 4096
+_DIMENSION_RE = re.compile(rb'<(?:\w+:)?dimension\s+ref="([A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?)"')
+
+# 0-based [row_start, row_end), [col_start, col_end) 경계 (끝이 None이면 시트 끝까지)
+RangeBounds = Tuple[int, Optional[int], int, Optional[int]]
+
+
+def _column_index(cell_ref: str) -> Tuple[int, int]:
+    """'AB12' → (11, 27) 0-based (행, 열)"""
+    col = 0
+    pos = 0
+    for ch in cell_ref:
+        if 'A' <= ch <= 'Z':
+            col = col * 26 + (ord(ch) - 64)
+            pos += 1
+        else:
+            break
+    return int(cell_ref[pos:]) - 1, col - 1
+
+
+def _rich_text(element) -> str:
+    """<si>/<is> 요소의 텍스트 (서식 run 연결, 윗주 rPh 제외)"""
+    text = element.find(_TAG_TEXT)
+    if text is not None:
+        return text.text or ''
+    return ''.join((run.findtext(_TAG_TEXT) or '') for run in element.iter(_TAG_RUN))
+
+
+class SheetArrays:
+    """
+    디코딩된 시트 배열
+
+    Attributes:
+        values: float64 (rows, cols) - 숫자 셀 값, 그 외는 NaN
+        labels: object (rows, cols) - 문자열/불리언/날짜 셀 값, 그 외는 None
+        row_offset, col_offset: 배열 [0, 0]의 시트 기준 0-based 위치
+    """
+
+    __slots__ = ('values', 'labels', 'row_offset', 'col_offset')
+
+    def __init__(self, values: np.ndarray, labels: np.ndarray, row_offset: int, col_offset: int):
+        self.values = values
+        self.labels = labels
+        self.row_offset = row_offset
+        self.col_offset = col_offset
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.values.shape
+
+    def to_rows(self) -> List[List[Any]]:
+        """pandas openpyxl 리더와 같은 행 목록 (빈 셀은 '', 정수형 실수는 int)"""
+        cells = self.labels.copy()
+        is_number = np.equal(cells, None) & ~np.isnan(self.values)
+        with np.errstate(invalid='ignore'):
+            is_integer = is_number & (np.mod(self.values, 1) == 0)
+        is_float = is_number & ~is_integer
+        # int64로 바꿀 수 있는 범위만 배열로 변환하고, 그 밖(|값| >= 2^63)은 float.is_integer와 같이 int()로 변환
+        in_int64 = is_integer & (np.abs(self.values) < _INT64_LIMIT)
+        cells[in_int64] = self.values[in_int64].astype(np.int64).astype(object)
+        big_integer = is_integer & ~in_int64
+        if big_integer.any():
+            cells[big_integer] = [int(value) for value in self.values[big_integer].tolist()]
+        cells[is_float] = self.values[is_float].astype(object)
+        cells[np.equal(cells, None)] = ''
+        return cells.tolist()
+
+    def _numeric_column(self, col: int, n_rows: int) -> Optional[np.ndarray]:
+        """
+        라벨 없는 열 → int64/float64 배열 (pandas 추론과 같은 결과, 해당하지 않으면 None)
+
+        빈 셀/오류가 있거나 소수가 있으면 float64, 모두 int64 범위 정수면 int64.
+        2^63 이상의 정수는 pandas가 Python int로 다루므로 TextParser에 맡깁니다.
+        """
+        if not np.equal(self.labels[:n_rows, col], None).all():
+            return None
+        column = self.values[:n_rows, col]
+        present = ~np.isnan(column)
+        with np.errstate(invalid='ignore'):
+            integral = present & (np.mod(column, 1) == 0)
+        if (integral & (np.abs(column) >= _INT64_LIMIT)).any():
+            return None
+        if present.all() and integral.all():
+            return column.astype(np.int64)
+        return column.copy()
+
+    def to_frame(self, nrows: Optional[int] = None) -> pd.DataFrame:
+        """pd.read_excel(header=None)과 동일한 타입 추론으로 DataFrame 생성"""
+        from pandas.io.parsers import TextParser
+
+        if self.values.size == 0:
+            return pd.DataFrame()
+        n_rows = self.values.shape[0] if nrows is None else min(nrows, self.values.shape[0])
+        if n_rows == 0:
+            # nrows=0: 열 폭만 있는 빈 표 (열 타입은 pandas 그대로)
+            df = TextParser(self.to_rows(), header=None, skip_blank_lines=False, nrows=nrows).read(nrows)
+            df.index = pd.RangeIndex(self.row_offset, self.row_offset)
+            df.columns = pd.RangeIndex(self.col_offset, self.col_offset + len(df.columns))
+            return df
+        columns: Dict[int, Any] = {}
+        mixed_cols: List[int] = []
+        for col in range(self.values.shape[1]):
+            column = self._numeric_column(col, n_rows)
+            if column is None:
+                mixed_cols.append(col)
+            else:
+                columns[col] = column
+        if mixed_cols:
+            # 문자열/날짜/불리언이 섞인 열만 모아 한 번에 셀 단위 타입 추론
+            cells = SheetArrays(self.values[:n_rows, mixed_cols], self.labels[:n_rows, mixed_cols], 0, 0)
+            parsed = TextParser(cells.to_rows(), header=None, skip_blank_lines=False).read()
+            for position, col in enumerate(mixed_cols):
+                columns[col] = parsed.iloc[:, position].array
+        df = pd.DataFrame({col: columns[col] for col in range(self.values.shape[1])}, copy=False)
+        df.index = pd.RangeIndex(self.row_offset, self.row_offset + n_rows)
+        df.columns = pd.RangeIndex(self.col_offset, self.col_offset + len(df.columns))
+        return df
+
+
+class _GridBuffer:
+    """스트리밍 디코딩용 (행, 열) 배열 버퍼 (미리 할당, 범위를 벗어난 셀이 오면 두 배씩 확장)"""
+
+    __slots__ = ('values', 'labels', 'last_row', 'last_col')
+
+    def __init__(self, n_rows: int, n_cols: int):
+        self.values = np.full((n_rows, n_cols), np.nan, dtype=np.float64)
+        self.labels = np.full((n_rows, n_cols), None, dtype=object)
+        # 빈 문자열이 아닌 값이 있는 마지막 행/열 (후행 빈 행/열 제거용)
+        self.last_row = -1
+        self.last_col = -1
+
+    def _reserve(self, n_rows: int, n_cols: int) -> None:
+        old_rows, old_cols = self.values.shape
+        if n_rows <= old_rows and n_cols <= old_cols:
+            return
+        new_rows, new_cols = max(old_rows, 1), max(old_cols, 1)
+        while new_rows < n_rows:
+            new_rows *= 2
+        while new_cols < n_cols:
+            new_cols *= 2
+        values = np.full((new_rows, new_cols), np.nan, dtype=np.float64)
+        labels = np.full((new_rows, new_cols), None, dtype=object)
+        values[:old_rows, :old_cols] = self.values
+        labels[:old_rows, :old_cols] = self.labels
+        self.values, self.labels = values, labels
+
+    def put(self, row: int, col: int, value: Any, is_number: bool) -> None:
+        if row >= self.values.shape[0] or col >= self.values.shape[1]:
+            self._reserve(row + 1, col + 1)
+        if is_number:
+            self.values[row, col] = value
+        else:
+            self.labels[row, col] = value
+            # 빈 문자열 셀은 pandas에서 빈 셀('')과 같아 후행 행/열 판단에서 제외
+            if value == '':
+                return
+        if row > self.last_row:
+            self.last_row = row
+        if col > self.last_col:
+            self.last_col = col
+
+    def finish(self, n_cols: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """후행 빈 행/열을 잘라낸 (values, labels) - n_cols 지정 시 열 폭 고정"""
+        if self.last_row < 0:
+            n_rows, n_cols = 0, 0
+        else:
+            n_rows = self.last_row + 1
+            n_cols = n_cols if n_cols is not None else self.last_col + 1
+        self._reserve(n_rows, n_cols)
+        if self.values.shape == (n_rows, n_cols):
+            return self.values, self.labels
+        # 미리 할당한 여유분은 남기지 않도록 잘라낸 크기로 복사
+        return self.values[:n_rows, :n_cols].copy(), self.labels[:n_rows, :n_cols].copy()
+
+
+class XlsxStreamReader:
+    """xlsx zip을 직접 읽는 스트리밍 리더 (sharedStrings/스타일은 한 번만 해석)"""
+
+    def __init__(self, excel_path: str):
+        self.excel_path = str(excel_path)
+        self._zip = zipfile.ZipFile(self.excel_path)
+        self._lock = threading.Lock()
+        self._date1904 = False
+        self._sheet_paths = self._read_sheet_paths()
+        self._shared_strings: Optional[List[str]] = None
+        self._date_styles: Optional[set] = None
+        # 이 리더가 읽은 라벨 문자열 intern 표 (시트 간 반복되는 지역명/산업명이 하나의 객체를 공유)
+        self._interned: Dict[str, str] = {}
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self._sheet_paths.keys())
+
+    def close(self) -> None:
+        self._zip.close()
+        self._interned = {}
+
+    def _intern(self, text: str) -> str:
+        return self._interned.setdefault(text, text)
+
+    def _read_sheet_paths(self) -> Dict[str, str]:
+        """workbook.xml + rels로 시트명 → zip 내부 경로 매핑 (workbookPr date1904도 함께 읽음)"""
+        rels = {}
+        with self._zip.open('xl/_rels/workbook.xml.rels') as f:
+            for _, element in iterparse(f):
+                if element.tag == f'{_NS_PKG_REL}Relationship':
+                    target = element.get('Target', '')
+                    if target.startswith('/'):
+                        target = target.lstrip('/')
+                    else:
+                        target = posixpath.normpath(posixpath.join('xl', target))
+                    rels[element.get('Id')] = target
+
+        sheet_paths = {}
+        with self._zip.open('xl/workbook.xml') as f:
+            for _, element in iterparse(f):
+                if element.tag == f'{_NS_MAIN}sheet':
+                    sheet_paths[element.get('name')] = rels.get(element.get(f'{_NS_REL}id'))
+                elif element.tag == _TAG_WORKBOOK_PR:
+                    self._date1904 = element.get('date1904', '').lower() in ('1', 'true')
+        return sheet_paths
+
+    def _get_shared_strings(self) -> List[str]:
+        if self._shared_strings is None:
+            strings = []
+            if 'xl/sharedStrings.xml' in self._zip.namelist():
+                with self._zip.open('xl/sharedStrings.xml') as f:
+                    for _, element in iterparse(f):
+                        if element.tag == _TAG_SI:
+                            # 동일 문자열은 하나의 객체를 공유 (intern)
+                            strings.append(self._intern(_rich_text(element)))
+                            element.clear()
+            self._shared_strings = strings
+        return self._shared_strings
+
+    def _get_date_styles(self) -> set:
+        """날짜 서식이 적용된 셀 스타일(cellXfs) 인덱스 집합"""
+        if self._date_styles is None:
+            from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+
+            date_styles = set()
+            if 'xl/styles.xml' in self._zip.namelist():
+                custom_formats = {}
+                in_cell_xfs = False
+                xf_index = 0
+                with self._zip.open('xl/styles.xml') as f:
+                    for event, element in iterparse(f, events=('start', 'end')):
+                        tag = element.tag
+                        if tag == f'{_NS_MAIN}numFmt' and event == 'end':
+                            custom_formats[int(element.get('numFmtId'))] = element.get('formatCode', '')
+                        elif tag == f'{_NS_MAIN}cellXfs':
+                            in_cell_xfs = event == 'start'
+                        elif tag == f'{_NS_MAIN}xf' and in_cell_xfs and event == 'end':
+                            fmt_id = int(element.get('numFmtId', 0))
+                            fmt_code = custom_formats.get(fmt_id, BUILTIN_FORMATS.get(fmt_id, ''))
+                            if fmt_code and is_date_format(fmt_code):
+                                date_styles.add(xf_index)
+                            xf_index += 1
+            self._date_styles = date_styles
+        return self._date_styles
+
+    def _sheet_path(self, sheet_name: str) -> str:
+        sheet_path = self._sheet_paths.get(sheet_name)
+        if sheet_path is None:
+            raise ValueError(f"시트를 찾을 수 없습니다: {sheet_name}")
+        return sheet_path
+
+    def _sheet_dimension(self, sheet_name: str) -> Optional[Tuple[int, int]]:
+        """<dimension ref="A1:Z129"> → (행 수, 열 수) (시트 XML 앞부분만 읽음, 없거나 해석할 수 없으면 None)"""
+        with self._zip.open(self._sheet_path(sheet_name)) as f:
+            head = f.read(_DIMENSION_SCAN_BYTES)
+        match = _DIMENSION_RE.search(head)
+        if match is None:
+            return None
+        try:
+            last_row, last_col = _column_index(match.group(1).decode('ascii').split(':')[-1])
+        except ValueError:
+            return None
+        return last_row + 1, last_col + 1
+
+    def _iter_cells(self, sheet_name: str, bounds: RangeBounds) -> Iterator[Tuple[int, int, Any, bool]]:
+        """
+        범위 내 (행, 열, 값, 숫자 여부) 순회
+
+        값이 없는 셀은 건너뛰고, 범위 밖 셀은 값을 해석하지 않으며, row_end 이후 행에서 중단합니다.
+        """
+        from openpyxl.utils.datetime import CALENDAR_MAC_1904, WINDOWS_EPOCH
+
+        sheet_path = self._sheet_path(sheet_name)
+        row_start, row_end, col_start, col_end = bounds
+        shared_strings = self._get_shared_strings()
+        date_styles = self._get_date_styles()
+        epoch = CALENDAR_MAC_1904 if self._date1904 else WINDOWS_EPOCH
+        intern = self._intern
+
+        with self._zip.open(sheet_path) as f:
+            current_row = -1
+            # 'end' 이벤트만 사용하고 행 단위로 셀을 처리 (이벤트 수 절반)
+            for _, element in iterparse(f):
+                tag = element.tag
+                if tag == _TAG_SHEET_DATA:
+                    return
+                if tag != _TAG_ROW:
+                    continue
+
+                row_ref = element.get('r')
+                current_row = int(row_ref) - 1 if row_ref else current_row + 1
+                if row_end is not None and current_row >= row_end:
+                    return
+                if current_row < row_start:
+                    element.clear()
+                    continue
+
+                next_col = 0
+                for cell in element:
+                    if cell.tag != _TAG_CELL:
+                        continue
+                    cell_ref = cell.get('r')
+                    col = _column_index(cell_ref)[1] if cell_ref else next_col
+                    next_col = col + 1
+                    if col < col_start or (col_end is not None and col >= col_end):
+                        continue
+
+                    cell_type = cell.get('t', 'n')
+                    if cell_type == 'inlineStr':
+                        inline = cell.find(_TAG_INLINE)
+                        if inline is not None:
+                            yield current_row, col, intern(_rich_text(inline)), False
+                        continue
+
+                    raw = cell.findtext(_TAG_VALUE)
+                    if not raw:
+                        # 계산값이 저장되지 않은 수식 셀은 빈 셀 (openpyxl data_only와 동일)
+                        continue
+                    if cell_type == 'n':
+                        number = float(raw)
+                        style = cell.get('s')
+                        if style is not None and date_styles and int(style) in date_styles:
+                            from openpyxl.utils.datetime import from_excel
+                            yield current_row, col, from_excel(number, epoch=epoch), False
+                        else:
+                            yield current_row, col, number, True
+                    elif cell_type == 's':
+                        yield current_row, col, shared_strings[int(raw)], False
+                    elif cell_type == 'str':
+                        yield current_row, col, intern(raw), False
+                    elif cell_type == 'b':
+                        yield current_row, col, raw == '1', False
+                    elif cell_type == 'e':
+                        # 오류 셀(#DIV/0! 등)은 pandas와 동일하게 NaN
+                        yield current_row, col, float('nan'), True
+                    elif cell_type == 'd':
+                        yield current_row, col, pd.Timestamp(raw).to_pydatetime(), False
+                element.clear()
+
+    def read_sheet_arrays(self, sheet_name: str, bounds: Optional[RangeBounds] = None) -> SheetArrays:
+        """
+        시트(또는 지정 범위)를 NumPy 배열로 디코딩
+
+        Args:
+            sheet_name: 시트 이름
+            bounds: 0-based (row_start, row_end, col_start, col_end), None이면 시트 전체
+        """
+        row_start, row_end, col_start, col_end = bounds or (0, None, 0, None)
+
+        with self._lock:
+            # 시트 크기(<dimension>)로 범위만큼 미리 할당 (없거나 너무 크면 작은 크기에서 확장)
+            dimension = self._sheet_dimension(sheet_name)
+            if dimension is not None:
+                n_rows = (min(dimension[0], row_end) if row_end is not None else dimension[0]) - row_start
+                n_cols = (min(dimension[1], col_end) if col_end is not None else dimension[1]) - col_start
+                n_rows, n_cols = max(n_rows, 0), max(n_cols, 0)
+            else:
+                n_rows, n_cols = _GROW_START_SHAPE
+            if n_rows * n_cols > _PREALLOC_MAX_CELLS:
+                n_rows, n_cols = min(n_rows, _GROW_START_SHAPE[0]), min(n_cols, _GROW_START_SHAPE[1])
+
+            grid = _GridBuffer(n_rows, n_cols)
+            for row, col, value, is_number in self._iter_cells(sheet_name, (row_start, row_end, col_start, col_end)):
+                grid.put(row - row_start, col - col_start, value, is_number)
+
+        # 후행 빈 행/열 제거 (pd.read_excel과 동일), 범위 지정 시 열 폭은 유지
+        values, labels = grid.finish((col_end - col_start) if col_end is not None else None)
+        return SheetArrays(values, labels, row_start, col_start)
+
+    def read_sheet(self, sheet_name: str, bounds: Optional[RangeBounds] = None) -> pd.DataFrame:
+        """시트(또는 지정 범위)를 pd.read_excel(header=None)과 동일한 DataFrame으로 반환"""
+        return self.read_sheet_arrays(sheet_name, bounds).to_frame()
+
+
+class StreamingExcelFile:
+    """pd.ExcelFile 호환 파사드 (header=None 파싱 전용)"""
+
+    def __init__(self, path_or_buffer: str):
+        self.io = str(path_or_buffer)
+        self._reader = XlsxStreamReader(self.io)
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return self._reader.sheet_names
+
+    def parse(
+        self,
+        sheet_name: Union[str, int, List[Union[str, int]], None] = 0,
+        header: Optional[int] = 0,
+        nrows: Optional[int] = None,
+        **kwargs
+    ) -> Union[pd.DataFrame, Dict[Union[str, int], pd.DataFrame]]:
+        """
+        pd.ExcelFile.parse 호환 (header=None만 지원)
+
+        Raises:
+            ValueError: header=None이 아니거나 지원하지 않는 옵션을 지정한 경우
+        """
+        if header is not None:
+            raise ValueError("StreamingExcelFile은 header=None 파싱만 지원합니다.")
+        if kwargs:
+            raise ValueError(f"StreamingExcelFile에서 지원하지 않는 옵션입니다: {sorted(kwargs)}")
+
+        if isinstance(sheet_name, list) or sheet_name is None:
+            names = self.sheet_names if sheet_name is None else sheet_name
+            return {name: self._parse_one(name, nrows) for name in names}
+        return self._parse_one(sheet_name, nrows)
+
+    def _parse_one(self, sheet_name: Union[str, int], nrows: Optional[int]) -> pd.DataFrame:
+        if isinstance(sheet_name, int):
+            sheet_name = self.sheet_names[sheet_name]
+        # pandas와 동일하게 nrows + 1행까지 읽어 열 폭을 정하고, 타입 추론은 nrows 행 기준
+        bounds = (0, nrows + 1, 0, None) if nrows is not None else None
+        return self._reader.read_sheet_arrays(sheet_name, bounds).to_frame(nrows)
+
+    def read_sheet_arrays(self, sheet_name: str, bounds: Optional[RangeBounds] = None) -> SheetArrays:
+        return self._reader.read_sheet_arrays(sheet_name, bounds)
+
+    def close(self) -> None:
+        self._reader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -37,42 +37,21 @@ class BaseGenerator(ABC):
         self.xl = excel_file  # 캐시된 ExcelFile 객체 재사용
         self.df_cache: Dict[str, pd.DataFrame] = {}  # 시트별 DataFrame 캐시
         self._xl_owner = excel_file is not None  # 외부에서 전달된 경우 소유권 없음
-        self._calculated_excel_path = None
         
     def load_excel(self) -> pd.ExcelFile:
-        """엑셀 파일 로드 (캐싱)"""
+        """엑셀 파일 로드 (전역 캐시의 지연 로딩 프록시 사용, 시트는 접근 시에만 디코딩)"""
         if self.xl is None:
-            self.xl = pd.ExcelFile(self.excel_path)
-            self._xl_owner = True
+            from services.excel_cache import get_excel_file
+            self.xl = get_excel_file(self.excel_path)
+            if self.xl is None:
+                raise ValueError(f"엑셀 파일을 열 수 없습니다: {self.excel_path}")
         return self.xl
 
-    def _get_calculated_excel_path(self) -> str:
-        """수식 계산 로직으로 계산된 임시 파일 경로 반환 (전역 캐시 사용)."""
-        from services.excel_processor import preprocess_excel
-        from services.excel_cache import get_cached_calculated_path, set_cached_calculated_path
-        from config.settings import TEMP_CALCULATED_DIR
+    def _get_calculated_snapshot(self):
+        """분석 시트에 수식 계산값이 반영된 스냅샷 (메모리 내 계산, 전역 캐시 사용)"""
+        from services.formula_overlay import get_calculated_snapshot
 
-        if self._calculated_excel_path and Path(self._calculated_excel_path).exists():
-            return self._calculated_excel_path
-
-        cached_path = get_cached_calculated_path(self.excel_path)
-        if cached_path:
-            self._calculated_excel_path = cached_path
-            return cached_path
-
-        TEMP_CALCULATED_DIR.mkdir(parents=True, exist_ok=True)
-        output_path = TEMP_CALCULATED_DIR / f"{Path(self.excel_path).stem}_calculated.xlsx"
-        result_path, success, _ = preprocess_excel(
-            self.excel_path,
-            str(output_path),
-            force_calculation=True
-        )
-
-        if success and result_path:
-            set_cached_calculated_path(self.excel_path, result_path)
-            self._calculated_excel_path = result_path
-
-        return result_path
+        return get_calculated_snapshot(self.excel_path)
     
     def get_sheet(self, sheet_name: str, use_cache: bool = True) -> Optional[pd.DataFrame]:
         """
@@ -88,15 +67,17 @@ class BaseGenerator(ABC):
         if use_cache and sheet_name in self.df_cache:
             return self.df_cache[sheet_name]
         
+        from services.workbook_snapshot import get_workbook_snapshot
+
         xl = self.load_excel()
         if sheet_name not in xl.sheet_names:
             return None
         
+        # 업로드 파일당 한 번만 파싱된 스냅샷에서 가져옴 (공유 객체이므로 수정 금지)
         if '분석' in sheet_name:
-            calculated_path = self._get_calculated_excel_path()
-            df = pd.read_excel(calculated_path, sheet_name=sheet_name, header=None)  # type: ignore
+            df = self._get_calculated_snapshot().get_sheet(sheet_name)
         else:
-            df = pd.read_excel(xl, sheet_name=sheet_name, header=None)  # type: ignore
+            df = get_workbook_snapshot(self.excel_path, excel_file=xl).get_sheet(sheet_name)
         
         if use_cache:
             self.df_cache[sheet_name] = df
@@ -499,82 +480,64 @@ class BaseGenerator(ABC):
         Returns:
             생성된 나레이션 문자열
         """
-        # 1. 어휘 선택 (엄격한 매핑)
         try:
-            from utils.text_utils import get_terms, get_josa
+            from utils.narrative_compiler import get_narrative_compiler
         except ImportError:
             # 상대 import 시도
             import sys
             from pathlib import Path
             sys.path.insert(0, str(Path(__file__).parent.parent))
-            from utils.text_utils import get_terms, get_josa
-        
-        # 조사 선택
-        josa = get_josa(region, "은/는")
-        
-        # 주요 업종 문자열
-        industries_str = ', '.join(main_industries[:3]) if main_industries else "주요 업종"
+            from utils.narrative_compiler import get_narrative_compiler
         
-        # 어휘 선택
-        cause_verb, result_noun, _ = get_terms(report_id, growth_rate)
-        
-        # 2. 패턴별 문장 생성
-        if pattern == 'pattern_a':
-            # 패턴 A (순접): "[지역]은 [업종] 등이 늘어 전년동분기대비 5.2% 증가."
-            if cause_verb is None:  # 보합 예외 처리
-                return f"{region}{josa} 전년동분기대비 {result_noun}."
-            
-            return (
-                f"{region}{josa} {industries_str} 등이 {cause_verb} "
-                f"전년동분기대비 {abs(growth_rate):.1f}% {result_noun}."
-            )
-        
-        elif pattern == 'pattern_b':
-            # 패턴 B (역접): "[지역]은 [반대업종] 등이 줄었으나, [주요업종] 등이 늘어 5.2% 증가."
-            contrast_str = ', '.join(contrast_industries[:2]) if contrast_industries else "일부 업종"
-            
-            # 반대 방향 어휘
-            if growth_rate > 0:
-                opposite_verb = "줄었으나"
-            else:
-                opposite_verb = "늘었으나"
-            
-            return (
-                f"{region}{josa} {contrast_str} 등이 {opposite_verb}, "
-                f"{industries_str} 등이 {cause_verb} "
-                f"전년동분기대비 {abs(growth_rate):.1f}% {result_noun}."
-            )
-        
-        elif pattern == 'pattern_c':
-            # 패턴 C (보합): "[지역]은 [증가업종] 등은 늘었으나, [감소업종] 등이 줄어 보합."
-            inc_str = ', '.join(main_industries[:2]) if main_industries else "일부 업종"
-            dec_str = ', '.join(contrast_industries[:2]) if contrast_industries else "일부 업종"
-            
-            return (
-                f"{region}{josa} {inc_str} 등은 늘었으나, "
-                f"{dec_str} 등이 줄어 전년동분기대비 {result_noun}."
-            )
-        
-        elif pattern == 'pattern_d':
-            # 패턴 D (추세): "[지역]은 전분기 증가하였으나, 이번 분기 [업종] 등이 줄어 3.1% 감소."
-            if prev_rate is not None:
-                _, prev_result, _ = get_terms(report_id, prev_rate)
-            else:
-                prev_result = "변동"
-            
-            return (
-                f"{region}{josa} 전분기 {prev_result}하였으나, "
-                f"이번 분기 {industries_str} 등이 {cause_verb} "
-                f"{abs(growth_rate):.1f}% {result_noun}."
-            )
-        
-        # Fallback (도달 불가능)
-        return f"{region}{josa} [패턴 오류: {pattern}]"
+        # 패턴별로 한 번 컴파일된 문장 클로저 사용 (어휘/조사는 조회표에서 선택)
+        narrate = get_narrative_compiler().pattern(pattern)
+        return narrate(region, growth_rate, prev_rate, main_industries, contrast_industries, report_id)
     
     # ============================================================================
     # [문서 3] 기여도 기반 업종 정렬 (Weighted Contribution)
     # ============================================================================
     
+    # 주요 업종 목록 (가중치 없을 때 fallback)
+    MAJOR_INDUSTRIES = (
+        '반도체', '전자부품', '자동차', '기계',
+        '화학', '전기장비', '1차금속', '의약품'
+    )
+    
+    def _contribution_weight(self, ind: Dict[str, Any]) -> float:
+        """업종 가중치 (가중치 없으면 주요 업종 여부로 가산점)"""
+        weight = self.safe_float(ind.get('weight'), 0)
+        # Fallback: 가중치 없으면 주요 업종 여부로 가산점
+        if weight is None or weight == 0 or pd.isna(weight):
+            is_major = any(major in ind.get('name', '') for major in self.MAJOR_INDUSTRIES)
+            weight = 10 if is_major else 1
+        return float(weight)
+    
+    def _rank_rows_by_contribution(
+        self,
+        rows: List[List[Dict[str, Any]]],
+        top_n: int
+    ) -> List[List[Dict[str, Any]]]:
+        """업종 리스트 여러 개(지역별)의 기여도 순위를 행렬 한 번으로 계산"""
+        from services.contribution import ContributionRanking, pack_rows
+        
+        growth = pack_rows([[self.safe_float(ind.get('change_rate'), 0) for ind in items] for items in rows])
+        weight = pack_rows([[self._contribution_weight(ind) for ind in items] for items in rows])
+        ranking = ContributionRanking(growth, weight)
+        
+        result = []
+        for i, items in enumerate(rows):
+            # 기여도 = |증감률 × 가중치|
+            for ind, contribution in zip(items, ranking.contributions[i, :len(items)].tolist()):
+                ind['contribution'] = contribution
+            if ranking.has_nan(i, len(items)):
+                # 계산 불가(NaN) 기여도가 섞인 경우는 기존 정렬 순서 유지
+                ranked = sorted(items, key=lambda x: x.get('contribution', 0), reverse=True)
+            else:
+                # 기여도 순 정렬 (내림차순, 같은 값은 원래 순서)
+                ranked = [items[j] for j in ranking.order[i].tolist()]
+            result.append(ranked[:top_n])
+        return result
+    
     def rank_by_contribution(
         self,
         industries: List[Dict[str, Any]],
@@ -593,29 +556,22 @@ class BaseGenerator(ABC):
         Note:
             가중치 없으면 주요 업종 여부로 가산점 (Fallback)
         """
-        # 주요 업종 목록 (가중치 없을 때 fallback)
-        MAJOR_INDUSTRIES = [
-            '반도체', '전자부품', '자동차', '기계', 
-            '화학', '전기장비', '1차금속', '의약품'
-        ]
-        
-        for ind in industries:
-            weight = self.safe_float(ind.get('weight'), 0)
-            change_rate = self.safe_float(ind.get('change_rate'), 0)
-            # Fallback: 가중치 없으면 주요 업종 여부로 가산점
-            if weight is None or weight == 0 or pd.isna(weight):
-                is_major = any(major in ind.get('name', '') for major in MAJOR_INDUSTRIES)
-                weight = 10 if is_major else 1
-            if change_rate is None or pd.isna(change_rate):
-                change_rate = 0.0
-            # 기여도 = |증감률 × 가중치|
-            ind['contribution'] = abs(float(change_rate) * float(weight))
+        return self._rank_rows_by_contribution([industries], top_n)[0]
+    
+    def rank_regions_by_contribution(
+        self,
+        industries_by_region: Dict[str, List[Dict[str, Any]]],
+        top_n: int = 3
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        [문서 3] 전 지역 업종 기여도 순위 일괄 계산
         
-        # 기여도 순 정렬 (내림차순)
-        ranked = sorted(
-            industries, 
-            key=lambda x: x.get('contribution', 0), 
-            reverse=True
-        )
+        지역 × 업종 증감률/가중치 행렬로 기여도를 한 번에 계산합니다.
+        지역별 결과는 rank_by_contribution(industries, top_n)과 같습니다.
         
-        return ranked[:top_n]
+        Returns:
+            {지역명: 기여도 순 상위 top_n 업종 리스트}
+        """
+        regions = list(industries_by_region)
+        rows = [industries_by_region[region] or [] for region in regions]
+        return dict(zip(regions, self._rank_rows_by_contribution(rows, top_n)))
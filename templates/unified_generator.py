@@ -1,30 +1,48 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import hashlib
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
 import pandas as pd
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
 try:
     from .base_generator import BaseGenerator
-    from config.reports import REPORT_ORDER, SECTOR_REPORTS, REGIONAL_REPORTS, REGION_DISPLAY_MAPPING, REGION_GROUPS, VALID_REGIONS
+    from config.reports import REPORT_ORDER, SECTOR_REPORTS, REGIONAL_REPORTS, REGION_DISPLAY_MAPPING, REGION_GROUPS, VALID_REGIONS, get_report_spec
+    from services.sector_dataset import get_sector_dataset, get_regional_cube
+    from utils.narrative_compiler import get_narrative_compiler
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from templates.base_generator import BaseGenerator
-    from config.reports import REPORT_ORDER, SECTOR_REPORTS, REGIONAL_REPORTS, REGION_DISPLAY_MAPPING, REGION_GROUPS, VALID_REGIONS
+    from config.reports import REPORT_ORDER, SECTOR_REPORTS, REGIONAL_REPORTS, REGION_DISPLAY_MAPPING, REGION_GROUPS, VALID_REGIONS, get_report_spec
+    from services.sector_dataset import get_sector_dataset, get_regional_cube
+    from utils.narrative_compiler import get_narrative_compiler
 
-def get_report_config(report_type: str) -> dict:
-    """Return the config matching either id or report_id; accept legacy aliases."""
-    aliases = {
-        'mining': 'manufacturing',  # legacy name used in 일부 호출
-    }
-    normalized = aliases.get(report_type, report_type)
-    for config in SECTOR_REPORTS:
-        # 지원: id 매칭 혹은 report_id 매칭
-        if config.get('id') == normalized or config.get('report_id') == normalized:
-            return config
-    raise ValueError(f"Unknown report type: {report_type}")
+def get_report_config(report_type: str) -> Mapping[str, Any]:
+    """Return the (read-only) config matching either id or report_id; accept legacy aliases (mining 등)."""
+    return get_report_spec(report_type).config
+
+
+# 집계 시트 헤더 셀 정규화에서 제거할 문자
+_HEADER_STRIP_RE = re.compile(r'[^0-9a-zA-Z가-힣분기년Q/4 ]')
+
+
+def _normalize_header(value: Any) -> str:
+    """연도/분기 헤더 비교용 정규화 ('2025 3/4', '2025. 3/4' → '202534')"""
+    return _HEADER_STRIP_RE.sub('', str(value)).replace('  ', ' ').replace(' ', '').replace('.', '').replace('/', '').replace('-', '').replace('년', '').replace('분기', '').replace('Q', '').lower()
+
+
+def _copy_detected(value: Any) -> Any:
+    """헤더 탐색 결과 값 복사 (dict/list는 인스턴스별 사본)"""
+    return type(value)(value) if isinstance(value, (dict, list)) else value
 
 
 class UnifiedReportGenerator(BaseGenerator):
@@ -35,32 +53,60 @@ class UnifiedReportGenerator(BaseGenerator):
 
     # 데이터 시작 행은 동적으로 찾음 (하드코딩 제거)
 
+    # 전국 + 17개 시도 (테이블/업종 순위 추출 순서)
+    ALL_REGIONS = ['전국', '서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종',
+                   '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+
+    # 지역명 별칭 (명칭 변경/정식 명칭 표기 차이)
+    REGION_ALIASES = {
+        '전북': ['전라북도', '전북특별자치도'],
+        '강원': ['강원도', '강원특별자치도'],
+        '경기': ['경기도'],
+        '충북': ['충청북도'],
+        '충남': ['충청남도'],
+        '전남': ['전라남도'],
+        '경북': ['경상북도'],
+        '경남': ['경상남도'],
+        '제주': ['제주특별자치도', '제주도', '제주'],
+        '세종': ['세종특별자치시'],
+        '서울': ['서울특별시'],
+        '부산': ['부산광역시'],
+        '대구': ['대구광역시'],
+        '인천': ['인천광역시'],
+        '광주': ['광주광역시'],
+        '대전': ['대전광역시'],
+        '울산': ['울산광역시'],
+    }
+
+    # 업종명 총계 키워드 ('계' 단독 키워드는 '단계' 등과 오탐 가능하므로 제외)
+    TOTAL_ROW_KEYWORDS = ['총계', '합계', '총지수', '전체', '전산업', '전 산업']
+
+    # 헤더 자동 탐색: 검사할 상단 행 수와 키워드
+    HEADER_SCAN_ROWS = 10
+    REGION_HEADER_KEYWORDS = ('지역', '시도', '구분', '행정구역')
+    VALUE_HEADER_KEYWORDS = ('지수', '값', '실적', '금액', '규모', '수치', '매출', '생산', '수출', '수입', '고용', '취업', '실업', '인구')
+    # 헤더 탐색이 설정하는 속성 (결과 재사용 시 그대로 적용)
+    HEADER_DETECTION_FIELDS = (
+        'region_name_col', 'target_col', 'data_start_row', 'year', 'quarter',
+        'prev_y_col', 'prev_prev_y_col', 'prev_prev_prev_y_col', 'quarterly_cols', 'quarterly_keys',
+    )
+    # (부문, 시트명, 헤더 지문, 연도, 분기) → 탐색 결과 (프로세스 전역 공유, LRU)
+    HEADER_DETECTION_MAX_ENTRIES = 128
+    _header_detections: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+    _header_detection_lock = threading.Lock()
+
     def __init__(self, report_type: str, excel_path: str, year=None, quarter=None, excel_file=None):
         super().__init__(excel_path, year, quarter, excel_file)
 
-        # 설정 로드
-        self.config = get_report_config(report_type)
-        if not self.config:
-            raise ValueError(f"Unknown report type: {report_type}")
+        # 설정 로드 (import 시 컴파일/검증된 명세 공유, 필수 설정 누락 시 ValueError)
+        self.spec = get_report_spec(report_type).validate()
+        self.config = self.spec.config
 
         self.report_type = report_type
-        # report_id 누락 시 id로 폴백하여 KeyError 방지
-        self.report_id = self.config.get('report_id', self.config.get('id', report_type))
-        if 'name_mapping' not in self.config:
-            raise ValueError(f"[{self.config['name']}] ❌ 설정에서 'name_mapping'을 찾을 수 없습니다. 기본값 사용 금지.")
-        self.name_mapping = self.config['name_mapping']
-
-        if 'aggregation_structure' not in self.config:
-            raise ValueError(f"[{self.config['name']}] ❌ 설정에서 'aggregation_structure'를 찾을 수 없습니다. 기본값 사용 금지.")
-        # metadata_columns는 컬럼 존재 여부 힌트일 뿐, 키워드 탐색에는 기본 키워드 목록을 사용
-        meta = self.config.get('metadata_columns', {})
-        if isinstance(meta, dict):
-            self.metadata_cols = meta
-        elif isinstance(meta, list):
-            # 단순 보존
-            self.metadata_cols = {c: c for c in meta}
-        else:
-            self.metadata_cols = {}
+        # report_id 누락 시 id로 폴백 (명세에서 해석됨)
+        self.report_id = self.spec.report_id or report_type
+        self.name_mapping = self.spec.name_mapping
+        self.metadata_cols = self.spec.metadata_cols
         # 동적으로 할당되는 주요 속성들 기본값 None으로 초기화
         self.region_name_col = None
         self.industry_code_col = None
@@ -71,10 +117,13 @@ class UnifiedReportGenerator(BaseGenerator):
         self._warned_industry_col_missing = False
         self.df_analysis = None
         self.df_aggregation = None
-        self.df_aggregation_raw = None
-        self.df_aggregation_table = None
-        self.preprocessed_table_df = None
+        # extract_all_data의 표 데이터 (preprocessed_table_df는 필요할 때 이것으로 생성)
+        self._preprocessed_table_data = None
         self.df_reference = None
+        # 집계 시트 압축 표현 (지역 코드 + float64 기간 컬럼, 처음 필터할 때 생성)
+        self._sector_frame = None
+        self._trade_region_index = None
+        self._industry_rankings = {}
         self.target_col = None
         self.prev_y_col = None
         self.prev_prev_y_col = None
@@ -89,168 +138,189 @@ class UnifiedReportGenerator(BaseGenerator):
         self.analysis_quarterly_cols = {}
         # 인스턴스 생성 시 데이터프레임 등 필드 자동 초기화
         self.load_data()
-        # region_name_col, target_col, prev_y_col 등 주요 컬럼 자동 탐색
+        # region_name_col, target_col, prev_y_col 등 주요 컬럼 자동 탐색 (같은 헤더면 이전 결과 재사용)
         if self.df_aggregation is not None and self.year is not None and self.quarter is not None:
-            import re
-            max_header_rows = min(10, len(self.df_aggregation))
-            # 1. 지역명 컬럼(기존대로)
-            if self.region_name_col is None:
-                region_keywords = ['지역', '시도', '구분', '행정구역']
-                found = False
-                for row_idx in range(max_header_rows):
-                    row = self.df_aggregation.iloc[row_idx]
-                    for col_idx, val in enumerate(row):
-                        if pd.isna(val):
-                            continue
-                        val_str = str(val).strip()
-                        if any(kw in val_str for kw in region_keywords):
-                            self.region_name_col = col_idx
-                            found = True
-                            print(f"[자동탐색] 헤더 {row_idx+1}행에서 지역명 컬럼 인덱스 자동설정: {col_idx} ({val_str})")
-                            break
-                    if found:
+            self._apply_header_detection()
+
+    def _header_detection_key(self) -> tuple:
+        """(부문, 집계 시트명, 헤더 지문, 연도, 분기) - 헤더 행 내용이 같으면 탐색 결과도 같음"""
+        header = self.df_aggregation.iloc[:self.HEADER_SCAN_ROWS]
+        fingerprint = hashlib.sha1(repr(header.to_numpy().tolist()).encode('utf-8')).hexdigest()
+        return (self.report_id, self.spec.aggregation_sheet, fingerprint, self.year, self.quarter)
+
+    def _apply_header_detection(self) -> None:
+        """헤더 기반 컬럼 자동 탐색 (시트명/헤더 지문별 결과 메모이즈)"""
+        key = self._header_detection_key()
+        detections = UnifiedReportGenerator._header_detections
+        with UnifiedReportGenerator._header_detection_lock:
+            detected = detections.get(key)
+            if detected is not None:
+                detections.move_to_end(key)
+        if detected is None:
+            self._detect_header_columns()
+            detected = {name: _copy_detected(getattr(self, name)) for name in self.HEADER_DETECTION_FIELDS}
+            with UnifiedReportGenerator._header_detection_lock:
+                detections[key] = detected
+                while len(detections) > self.HEADER_DETECTION_MAX_ENTRIES:
+                    detections.popitem(last=False)
+            return
+        print(f"[자동탐색] {self.spec.aggregation_sheet}: 헤더 탐색 결과 재사용")
+        for name, value in detected.items():
+            # 분기 컬럼 매핑은 인스턴스별로 보강될 수 있으므로 복사해서 사용
+            setattr(self, name, _copy_detected(value))
+
+    @classmethod
+    def clear_header_detections(cls) -> None:
+        """헤더 탐색 결과 전체 삭제 (키가 파일이 아닌 헤더 내용 기준이므로 경로별로 나누지 않음)"""
+        with UnifiedReportGenerator._header_detection_lock:
+            UnifiedReportGenerator._header_detections.clear()
+
+    def _detect_header_columns(self) -> None:
+        """헤더 행(최대 HEADER_SCAN_ROWS행)에서 지역명/당분기/분기별 컬럼과 데이터 시작 행 탐색"""
+        max_header_rows = min(self.HEADER_SCAN_ROWS, len(self.df_aggregation))
+        # 헤더 행 셀 (NaN 제외, 한 번만 변환)
+        header_cells = [
+            [(col_idx, val) for col_idx, val in enumerate(self.df_aggregation.iloc[row_idx]) if not pd.isna(val)]
+            for row_idx in range(max_header_rows)
+        ]
+        # 1. 지역명 컬럼(기존대로)
+        if self.region_name_col is None:
+            found = False
+            for row_idx in range(max_header_rows):
+                for col_idx, val in header_cells[row_idx]:
+                    val_str = str(val).strip()
+                    if any(kw in val_str for kw in self.REGION_HEADER_KEYWORDS):
+                        self.region_name_col = col_idx
+                        found = True
+                        print(f"[자동탐색] 헤더 {row_idx+1}행에서 지역명 컬럼 인덱스 자동설정: {col_idx} ({val_str})")
                         break
-                if not found:
-                    print("[자동탐색] 지역명 컬럼을 헤더에서 찾지 못했습니다. 기존 로직을 사용합니다.")
-
-            # 2. 지수/값 컬럼 (target_col, 기존대로)
-            if self.target_col is None:
-                value_keywords = ['지수', '값', '실적', '금액', '규모', '수치', '매출', '생산', '수출', '수입', '고용', '취업', '실업', '인구']
-                found = False
-                for row_idx in range(max_header_rows):
-                    row = self.df_aggregation.iloc[row_idx]
-                    for col_idx, val in enumerate(row):
-                        if pd.isna(val):
-                            continue
-                        val_str = str(val).strip()
-                        if any(kw in val_str for kw in value_keywords):
-                            self.target_col = col_idx
-                            found = True
-                            print(f"[자동탐색] 헤더 {row_idx+1}행에서 지수/값 컬럼 인덱스 자동설정: {col_idx} ({val_str})")
-                            break
-                    if found:
+                if found:
+                    break
+            if not found:
+                print("[자동탐색] 지역명 컬럼을 헤더에서 찾지 못했습니다. 기존 로직을 사용합니다.")
+
+        # 2. 지수/값 컬럼 (target_col, 기존대로)
+        if self.target_col is None:
+            found = False
+            for row_idx in range(max_header_rows):
+                for col_idx, val in header_cells[row_idx]:
+                    val_str = str(val).strip()
+                    if any(kw in val_str for kw in self.VALUE_HEADER_KEYWORDS):
+                        self.target_col = col_idx
+                        found = True
+                        print(f"[자동탐색] 헤더 {row_idx+1}행에서 지수/값 컬럼 인덱스 자동설정: {col_idx} ({val_str})")
                         break
-                if not found:
-                    print("[자동탐색] 지수/값 컬럼을 헤더에서 찾지 못했습니다. 기존 로직을 사용합니다.")
+                if found:
+                    break
+            if not found:
+                print("[자동탐색] 지수/값 컬럼을 헤더에서 찾지 못했습니다. 기존 로직을 사용합니다.")
+
+        # 3. 현재 분기명 패턴 추출 및 변형으로 prev_y_col 등 동적 탐색
+        # 헤더에서 현재 분기명(연도/분기) 패턴 찾기 (정규화는 셀마다 한 번만)
+        normalized_cells = [[(c, _normalize_header(v)) for c, v in cells] for cells in header_cells]
+
+        def find_col_by_pattern(pattern):
+            norm_pat = _normalize_header(pattern)
+            best_idx = None
+            best_score = 0
+            found_row = -1
+            for r in range(max_header_rows):
+                for c, norm_v in normalized_cells[r]:
+                    if norm_v == norm_pat:
+                        return c, r
+                    if norm_pat in norm_v or norm_v in norm_pat:
+                        score = min(len(norm_pat), len(norm_v))
+                        if score > best_score:
+                            best_score = score
+                            best_idx = c
+                            found_row = r
+            return best_idx, found_row
+
+        header_found_row = -1
 
-            # 3. 현재 분기명 패턴 추출 및 변형으로 prev_y_col 등 동적 탐색
-            # 헤더에서 현재 분기명(연도/분기) 패턴 찾기
-            max_header_rows = min(10, len(self.df_aggregation))
-            
-            def normalize(s):
-                import re
-                return re.sub(r'[^0-9a-zA-Z가-힣분기년Q/4 ]', '', str(s)).replace('  ', ' ').replace(' ', '').replace('.', '').replace('/', '').replace('-', '').replace('년', '').replace('분기', '').replace('Q', '').lower()
-
-            def find_col_by_pattern(pattern):
-                norm_pat = normalize(pattern)
-                best_idx = None
-                best_score = 0
-                found_row = -1
-                for r in range(max_header_rows):
-                    row = self.df_aggregation.iloc[r]
-                    for c, v in enumerate(row):
-                        if pd.isna(v):
-                            continue
-                        norm_v = normalize(v)
-                        if norm_v == norm_pat:
-                            return c, r
-                        if norm_pat in norm_v or norm_v in norm_pat:
-                            score = min(len(norm_pat), len(norm_v))
-                            if score > best_score:
-                                best_score = score
-                                best_idx = c
-                                found_row = r
-                return best_idx, found_row
-
-            header_found_row = -1
-
-            if self.year is not None and self.quarter is not None:
-                # 사용자가 지정한 연도/분기를 기준으로 탐색
-                cur_year = self.year
-                cur_q = self.quarter
-                target_pat = f"{cur_year} {cur_q}4"  # normalize 하면 '202534' 형태가 됨 (2025 3/4 -> 202534)
-                
-                # 명시적 패턴 탐색
-                idx, r_idx = find_col_by_pattern(f"{cur_year} {cur_q}/4")
-                if idx is None:
-                     idx, r_idx = find_col_by_pattern(f"{cur_year}. {cur_q}/4")
-                
-                if idx is not None:
-                    self.target_col = idx
-                    header_found_row = r_idx
-                    print(f"[자동탐색] '{cur_year} {cur_q}/4' 패턴으로 당분기 컬럼 인덱스 자동설정: {idx} (행: {r_idx})")
-                else:
-                    print(f"[자동탐색] '{cur_year} {cur_q}/4' 패턴을 헤더에서 찾지 못했습니다.")
-            
+        if self.year is not None and self.quarter is not None:
+            # 사용자가 지정한 연도/분기를 기준으로 탐색
+            cur_year = self.year
+            cur_q = self.quarter
+            target_pat = f"{cur_year} {cur_q}4"  # normalize 하면 '202534' 형태가 됨 (2025 3/4 -> 202534)
+
+            # 명시적 패턴 탐색
+            idx, r_idx = find_col_by_pattern(f"{cur_year} {cur_q}/4")
+            if idx is None:
+                 idx, r_idx = find_col_by_pattern(f"{cur_year}. {cur_q}/4")
+
+            if idx is not None:
+                self.target_col = idx
+                header_found_row = r_idx
+                print(f"[자동탐색] '{cur_year} {cur_q}/4' 패턴으로 당분기 컬럼 인덱스 자동설정: {idx} (행: {r_idx})")
             else:
-                # 연도/분기 미지정 시 최신 패턴 탐색
-                current_patterns = []
-                import re
-                for row_idx in range(max_header_rows):
-                    row = self.df_aggregation.iloc[row_idx]
-                    for col_idx, val in enumerate(row):
-                        if pd.isna(val):
-                            continue
-                        val_str = str(val).strip()
-                        m = re.match(r'(20\d{2})[.\-/년 ]+([1-4])[분기Q/4 ]*', val_str)
-                        if m:
-                            current_patterns.append((row_idx, col_idx, val_str, m.group(1), m.group(2)))
-                
-                if current_patterns:
-                    current_patterns.sort(key=lambda x: (int(x[3]), int(x[4])), reverse=True)
-                    row_idx, col_idx, cur_val, cur_year, cur_q = current_patterns[0]
-                    self.target_col = col_idx
-                    self.year = int(cur_year)
-                    self.quarter = int(cur_q)
-                    header_found_row = row_idx
-                    print(f"[자동탐색] 최신 패턴 '{cur_val}'으로 당분기 컬럼 인덱스 자동설정: {col_idx} (행: {row_idx})")
-                    cur_year = int(cur_year)
-                    cur_q = int(cur_q)
-                else:
-                    cur_year = None
-                    cur_q = None
-
-            # 데이터 시작 행 자동 설정 (헤더 바로 다음 행)
-            if header_found_row >= 0 and self.data_start_row is None:
-                self.data_start_row = header_found_row + 1
-                print(f"[자동탐색] 데이터 시작 행 자동설정: {self.data_start_row}")
-
-            if cur_year is not None and cur_q is not None:
-                # 최근 9분기 컬럼 자동 탐색 (현재 분기 포함, 2년 전 동분기까지 포함)
-                # 이를 통해 prev_q_col 등 테이블에서 요구하는 이전 분기 컬럼을 동적으로 확보
-                temp_year, temp_q = cur_year, cur_q
-                for _ in range(9):
-                    pat = f"{temp_year} {temp_q}/4"
-                    key = self._format_quarter_key(temp_year, temp_q)
-                    
-                    # 이미 설정에 있는 컬럼은 유지, 없는 경우만 탐색
-                    if key not in self.quarterly_cols:
-                        idx, _ = find_col_by_pattern(pat)
-                        if idx is None:
-                            # 보조 패턴: '2025. 3/4'
-                            idx, _ = find_col_by_pattern(f"{temp_year}. {temp_q}/4")
-                        
-                        if idx is not None:
-                            self.quarterly_cols[key] = idx
-                            print(f"[자동탐색] '{pat}' 패턴으로 컬럼 인덱스 자동설정: {idx}")
-                    
-                    # 전 분기로 이동
-                    temp_y_prev, temp_q_prev = self._previous_quarter(temp_year, temp_q)
-                    
-                    # 전년 동기 컬럼들도 특별히 속성에 저장 (하위 호환성)
-                    if temp_year == cur_year - 1 and temp_q == cur_q:
-                        if self.prev_y_col is None:
-                            self.prev_y_col = self.quarterly_cols.get(key)
-                    elif temp_year == cur_year - 2 and temp_q == cur_q:
-                        if self.prev_prev_y_col is None:
-                            self.prev_prev_y_col = self.quarterly_cols.get(key)
-                    elif temp_year == cur_year - 3 and temp_q == cur_q:
-                        if self.prev_prev_prev_y_col is None:
-                            self.prev_prev_prev_y_col = self.quarterly_cols.get(key)
-                    
-                    temp_year, temp_q = temp_y_prev, temp_q_prev
-
-                self.quarterly_keys = list(self.quarterly_cols.keys())
+                print(f"[자동탐색] '{cur_year} {cur_q}/4' 패턴을 헤더에서 찾지 못했습니다.")
+
+        else:
+            # 연도/분기 미지정 시 최신 패턴 탐색
+            current_patterns = []
+            for row_idx in range(max_header_rows):
+                for col_idx, val in header_cells[row_idx]:
+                    val_str = str(val).strip()
+                    m = re.match(r'(20\d{2})[.\-/년 ]+([1-4])[분기Q/4 ]*', val_str)
+                    if m:
+                        current_patterns.append((row_idx, col_idx, val_str, m.group(1), m.group(2)))
+
+            if current_patterns:
+                current_patterns.sort(key=lambda x: (int(x[3]), int(x[4])), reverse=True)
+                row_idx, col_idx, cur_val, cur_year, cur_q = current_patterns[0]
+                self.target_col = col_idx
+                self.year = int(cur_year)
+                self.quarter = int(cur_q)
+                header_found_row = row_idx
+                print(f"[자동탐색] 최신 패턴 '{cur_val}'으로 당분기 컬럼 인덱스 자동설정: {col_idx} (행: {row_idx})")
+                cur_year = int(cur_year)
+                cur_q = int(cur_q)
+            else:
+                cur_year = None
+                cur_q = None
+
+        # 데이터 시작 행 자동 설정 (헤더 바로 다음 행)
+        if header_found_row >= 0 and self.data_start_row is None:
+            self.data_start_row = header_found_row + 1
+            print(f"[자동탐색] 데이터 시작 행 자동설정: {self.data_start_row}")
+
+        if cur_year is not None and cur_q is not None:
+            # 최근 9분기 컬럼 자동 탐색 (현재 분기 포함, 2년 전 동분기까지 포함)
+            # 이를 통해 prev_q_col 등 테이블에서 요구하는 이전 분기 컬럼을 동적으로 확보
+            temp_year, temp_q = cur_year, cur_q
+            for _ in range(9):
+                pat = f"{temp_year} {temp_q}/4"
+                key = self._format_quarter_key(temp_year, temp_q)
+
+                # 이미 설정에 있는 컬럼은 유지, 없는 경우만 탐색
+                if key not in self.quarterly_cols:
+                    idx, _ = find_col_by_pattern(pat)
+                    if idx is None:
+                        # 보조 패턴: '2025. 3/4'
+                        idx, _ = find_col_by_pattern(f"{temp_year}. {temp_q}/4")
+
+                    if idx is not None:
+                        self.quarterly_cols[key] = idx
+                        print(f"[자동탐색] '{pat}' 패턴으로 컬럼 인덱스 자동설정: {idx}")
+
+                # 전 분기로 이동
+                temp_y_prev, temp_q_prev = self._previous_quarter(temp_year, temp_q)
+
+                # 전년 동기 컬럼들도 특별히 속성에 저장 (하위 호환성)
+                if temp_year == cur_year - 1 and temp_q == cur_q:
+                    if self.prev_y_col is None:
+                        self.prev_y_col = self.quarterly_cols.get(key)
+                elif temp_year == cur_year - 2 and temp_q == cur_q:
+                    if self.prev_prev_y_col is None:
+                        self.prev_prev_y_col = self.quarterly_cols.get(key)
+                elif temp_year == cur_year - 3 and temp_q == cur_q:
+                    if self.prev_prev_prev_y_col is None:
+                        self.prev_prev_prev_y_col = self.quarterly_cols.get(key)
+
+                temp_year, temp_q = temp_y_prev, temp_q_prev
+
+            self.quarterly_keys = list(self.quarterly_cols.keys())
     def _get_region_display_name(self, region: str) -> str:
         try:
             return REGION_DISPLAY_MAPPING.get(region, region)
@@ -308,8 +378,7 @@ class UnifiedReportGenerator(BaseGenerator):
         """
         if df is None or df.empty or name_col is None:
             return None
-        # '계' 단독 키워드는 '단계' 등과 오탐 가능하므로 제외
-        keywords = ['총계', '합계', '총지수', '전체', '전산업', '전 산업']
+        keywords = UnifiedReportGenerator.TOTAL_ROW_KEYWORDS
         try:
             series = df.iloc[:, name_col].astype(str).str.strip()
         except Exception:
@@ -345,6 +414,81 @@ class UnifiedReportGenerator(BaseGenerator):
                 return matched.head(1)
         return None
 
+    def _locate_region_totals(self, df_source: pd.DataFrame, regions: List[str], total_code: Any) -> Dict[str, int]:
+        """
+        전 지역의 총계 행 위치를 한 번에 탐색
+
+        지역명 컬럼을 한 번만 정규화(factorize)한 뒤 지역별 이름 후보(약칭 → 정식 명칭 → 별칭)를
+        정수 코드로 조회하고, 해당 행들 중 총계 행(업종명 키워드 → total_code → 첫 행)을 고릅니다.
+        규칙은 _select_region_total의 정확/정식명/별칭 단계와 같으며, 여기서 찾지 못한 지역은
+        결과에 넣지 않아 호출자가 기존 단일 지역 탐색(부분 일치 등)으로 처리합니다.
+
+        Returns:
+            {지역명: 데이터 구간(data_start_row 이후) 기준 iloc 위치}
+        """
+        from config.reports import REGION_DISPLAY_MAPPING
+
+        region_col = self.region_name_col
+        if df_source is None or df_source.empty or region_col is None:
+            return {}
+        start_row = max(self.data_start_row or 0, 0)
+        local_df = df_source.iloc[start_row:] if start_row < len(df_source) else df_source
+        width = len(local_df.columns)
+        if not 0 <= region_col < width:
+            return {}
+
+        codes, labels = pd.factorize(local_df.iloc[:, region_col].astype(str).str.strip())
+        code_of = {label: code for code, label in enumerate(labels)}
+
+        name_hits = None
+        name_col = self.industry_name_col
+        if name_col is not None and name_col != region_col and 0 <= name_col < width:
+            names = local_df.iloc[:, name_col].astype(str).str.strip()
+            name_hits = names.str.contains('|'.join(self.TOTAL_ROW_KEYWORDS), na=False).to_numpy()
+
+        first_row_fallback = self.report_type in ['employment', 'unemployment', 'migration']
+        exclude_cols = [region_col]
+        if not first_row_fallback:
+            exclude_cols.append(name_col)
+        code_str = str(total_code).strip() if total_code else None
+        code_hits: Dict[int, Optional[np.ndarray]] = {}
+
+        def _code_hits(col_idx: int) -> Optional[np.ndarray]:
+            if col_idx not in code_hits:
+                try:
+                    code_hits[col_idx] = (local_df.iloc[:, col_idx].astype(str).str.strip() == code_str).to_numpy()
+                except Exception:
+                    code_hits[col_idx] = None
+            return code_hits[col_idx]
+
+        positions: Dict[str, int] = {}
+        for region_name in regions:
+            candidates = [region_name, REGION_DISPLAY_MAPPING.get(region_name)]
+            candidates.extend(self.REGION_ALIASES.get(region_name, []))
+            code = next((code_of[name] for name in candidates if name in code_of), None)
+            if code is None:
+                continue
+            rows = np.flatnonzero(codes == code)
+
+            if name_hits is not None and name_hits[rows].any():
+                positions[region_name] = int(rows[np.argmax(name_hits[rows])])
+                continue
+            if code_str is not None:
+                found = None
+                for col_idx in range(width):
+                    if col_idx in exclude_cols:
+                        continue
+                    hits = _code_hits(col_idx)
+                    if hits is not None and hits[rows].any():
+                        found = int(rows[np.argmax(hits[rows])])
+                        break
+                if found is not None:
+                    positions[region_name] = found
+                    continue
+            if first_row_fallback:
+                positions[region_name] = int(rows[0])
+        return positions
+
     @staticmethod
     def _previous_quarter(year: int, quarter: int) -> tuple[int, int]:
         if quarter <= 1:
@@ -421,95 +565,160 @@ class UnifiedReportGenerator(BaseGenerator):
         - 요청한 연도/분기가 없으면 최신 데이터를 자동으로 사용
         - 설정에서 require_analysis_sheet=False면 분석시트 요구 안 함
         """
-        import openpyxl
-        wb = openpyxl.load_workbook(self.excel_path, data_only=True)
-        agg_sheet_name = self.config['aggregation_structure']['sheet']
+        from services.workbook_snapshot import get_workbook_snapshot
+        # 업로드 파일당 한 번만 파싱된 스냅샷을 공유 (시트별 중복 디코딩 방지)
+        snapshot = get_workbook_snapshot(self.excel_path, excel_file=self.xl)
+        # 다시 로드하면 이전 데이터 기준 업종 순위는 폐기
+        self._industry_rankings = {}
+        spec = self.spec
+        agg_sheet_name = spec.aggregation_sheet
         print(f"[디버그] config['aggregation_structure']: {self.config.get('aggregation_structure')}")
         print(f"[디버그] agg_sheet_name: {agg_sheet_name}")
-        print(f"[디버그] wb.sheetnames: {wb.sheetnames}")
+        print(f"[디버그] wb.sheetnames: {snapshot.sheet_names}")
         if not agg_sheet_name:
             raise ValueError('집계 시트명이 설정에 없습니다.')
         # 헤더 행을 보존하기 위해 header=None으로 읽어 병합 헤더 탐색과 데이터 시작 행 탐색을 일관되게 처리
-        self.df_aggregation = pd.read_excel(self.excel_path, sheet_name=agg_sheet_name, header=None)
-        # 집계 범위가 설정되어 있으면 해당 범위만 사용
-        agg_range = self.config.get('aggregation_range')
-        if isinstance(agg_range, dict) and self.df_aggregation is not None:
-            from openpyxl.utils import column_index_from_string
-
-            def _col_to_index(col_value):
-                if col_value is None:
-                    return None
-                if isinstance(col_value, int):
-                    return col_value
-                if isinstance(col_value, str) and col_value.strip():
-                    return column_index_from_string(col_value.strip().upper()) - 1
-                return None
-
-            start_row = agg_range.get('start_row')
-            end_row = agg_range.get('end_row')
-            start_col = _col_to_index(agg_range.get('start_col'))
-            end_col = _col_to_index(agg_range.get('end_col'))
-
-            row_start = max((start_row - 1) if isinstance(start_row, int) else 0, 0)
-            row_end = end_row if isinstance(end_row, int) else len(self.df_aggregation)
-            col_start = start_col if isinstance(start_col, int) else 0
-            col_end = (end_col + 1) if isinstance(end_col, int) else len(self.df_aggregation.columns)
-
-            self.df_aggregation = self.df_aggregation.iloc[row_start:row_end, col_start:col_end].copy()
+        # 집계 범위가 설정되어 있으면 해당 범위만 디코딩 (행/열 라벨은 시트 기준 유지)
+        agg_range = spec.aggregation_range
+        self.df_aggregation = self._read_aggregation(snapshot, agg_sheet_name, agg_range)
+        if self.df_aggregation is None:
+            raise ValueError(f"집계 시트를 찾을 수 없습니다: {agg_sheet_name}")
+        # 스냅샷에서 다시 읽을 수 있으므로 SectorFrame 생성 후에는 약한 참조로만 보관
+        self._aggregation_source = (agg_sheet_name, agg_range)
+        if agg_range is not None:
             print(
-                f"[{self.config['name']}] ✅ 집계 범위 적용: rows {start_row}-{end_row}, cols {agg_range.get('start_col')}-{agg_range.get('end_col')}"
+                f"[{self.config['name']}] ✅ 집계 범위 적용: rows {agg_range.get('start_row')}-{agg_range.get('end_row')}, cols {agg_range.get('start_col')}-{agg_range.get('end_col')}"
             )
-        # 원본 보관
-        self.df_aggregation_raw = self.df_aggregation
-        # 헤더 포함 표를 DataFrame으로 분리 저장
-        if self.config.get('header_included') and self.df_aggregation is not None and not self.df_aggregation.empty:
-            try:
-                df_table = self.df_aggregation.copy()
-                df_table.columns = df_table.iloc[0].tolist()
-                df_table = df_table.iloc[1:].reset_index(drop=True)
-                self.df_aggregation_table = df_table
-            except Exception as e:
-                print(f"[{self.config['name']}] ⚠️ 헤더 포함 테이블 변환 실패: {e}")
-        self.target_col = None
-        # 정적 컬럼 인덱스 로드 (동적 탐색 제거)
-        column_indices = self.config.get('aggregation_columns') or self.config.get('column_indices') or {}
-        self.target_col = column_indices.get('target_col')
-        self.prev_y_col = column_indices.get('prev_y_col')
-        self.prev_prev_y_col = column_indices.get('prev_prev_y_col')
-        self.prev_prev_prev_y_col = column_indices.get('prev_prev_prev_y_col')
-        self.quarterly_cols = column_indices.get('quarterly_cols', {}) or {}
+        # 정적 컬럼 인덱스 로드 (명세에서 해석됨, 분기 매핑은 인스턴스별 사본)
+        columns = spec.aggregation_columns
+        self.target_col = columns.target_col
+        self.prev_y_col = columns.prev_y_col
+        self.prev_prev_y_col = columns.prev_prev_y_col
+        self.prev_prev_prev_y_col = columns.prev_prev_prev_y_col
+        self.quarterly_cols = dict(columns.quarterly_cols)
         self.quarterly_keys = list(self.quarterly_cols.keys())
 
-        wb.close()
-
-        # 정적 메타 컬럼 설정 (동적 탐색 제거)
-        header_rows = self.config.get('header_rows', 1)
-        agg_struct = self.config.get('aggregation_structure', {}) if isinstance(self.config, dict) else {}
-        self.region_name_col = agg_struct.get('region_name_col')
-        self.industry_code_col = agg_struct.get('industry_code_col')
+        # 정적 메타 컬럼 설정
+        self.region_name_col = spec.region_name_col
+        self.industry_code_col = spec.industry_code_col
         if self.industry_name_col is None:
-            self.industry_name_col = self.config.get('industry_name_col') or agg_struct.get('industry_name_col')
+            self.industry_name_col = spec.industry_name_col
         if self.data_start_row is None:
-            # aggregation_structure.data_start_row 우선 (0도 유효한 값이므로 is not None 체크)
-            agg_data_start = agg_struct.get('data_start_row')
-            if agg_data_start is not None:
-                self.data_start_row = agg_data_start
-            else:
-                self.data_start_row = self.config.get('data_start_row', header_rows)
-        analysis_sheet = self.config.get('analysis_sheet')
+            self.data_start_row = spec.data_start_row
+        analysis_sheet = spec.analysis_sheet
         if analysis_sheet and analysis_sheet != agg_sheet_name:
             try:
-                self.df_analysis = pd.read_excel(self.excel_path, sheet_name=analysis_sheet, header=None)
-                analysis_columns = self.config.get('analysis_columns') or self.config.get('analysis_column_indices') or {}
-                self.analysis_target_col = analysis_columns.get('target_col')
-                self.analysis_prev_y_col = analysis_columns.get('prev_y_col')
-                self.analysis_prev_prev_y_col = analysis_columns.get('prev_prev_y_col')
-                self.analysis_prev_prev_prev_y_col = analysis_columns.get('prev_prev_prev_y_col')
-                self.analysis_quarterly_cols = analysis_columns.get('quarterly_cols', {}) or {}
+                self.df_analysis = snapshot.get_sheet(analysis_sheet)
+                if self.df_analysis is None:
+                    raise ValueError(f"시트를 찾을 수 없습니다: {analysis_sheet}")
+                analysis_columns = spec.analysis_columns
+                self.analysis_target_col = analysis_columns.target_col
+                self.analysis_prev_y_col = analysis_columns.prev_y_col
+                self.analysis_prev_prev_y_col = analysis_columns.prev_prev_y_col
+                self.analysis_prev_prev_prev_y_col = analysis_columns.prev_prev_prev_y_col
+                self.analysis_quarterly_cols = dict(analysis_columns.quarterly_cols)
                 self.analysis_quarterly_keys = list(self.analysis_quarterly_cols.keys())
             except Exception as e:
                 print(f"[{self.config['name']}] ⚠️ 분석 시트 로드 실패: {analysis_sheet} ({e})")
     
+    # ----- 집계 DataFrame (SectorFrame 생성 후에는 스냅샷이 보관, 생성기는 약한 참조만) -----
+
+    @property
+    def df_aggregation(self) -> Optional[pd.DataFrame]:
+        """집계 시트 DataFrame (스냅샷 공유 객체이므로 수정 금지)"""
+        df = self._df_aggregation
+        if df is None and self._df_aggregation_ref is not None:
+            df = self._df_aggregation_ref()
+            if df is None:
+                # 스냅샷이 캐시에서 해제된 경우 다시 읽음
+                df = self._reload_aggregation()
+                self._df_aggregation_ref = weakref.ref(df) if df is not None else None
+        return df
+
+    @df_aggregation.setter
+    def df_aggregation(self, df: Optional[pd.DataFrame]) -> None:
+        self._df_aggregation = df
+        self._df_aggregation_ref = None
+        self._aggregation_source = None
+
+    @staticmethod
+    def _read_aggregation(snapshot, sheet_name: str, agg_range: Optional[Dict[str, Any]]) -> Optional[pd.DataFrame]:
+        if agg_range is not None:
+            return snapshot.get_range(sheet_name, agg_range)
+        return snapshot.get_sheet(sheet_name)
+
+    def _reload_aggregation(self) -> Optional[pd.DataFrame]:
+        from services.workbook_snapshot import get_workbook_snapshot
+
+        sheet_name, agg_range = self._aggregation_source
+        return self._read_aggregation(get_workbook_snapshot(self.excel_path, excel_file=self.xl), sheet_name, agg_range)
+
+    def _release_aggregation(self) -> None:
+        """SectorFrame이 생긴 뒤에는 스냅샷에서 읽은 집계 DataFrame을 약한 참조로만 보관"""
+        if self._aggregation_source is None or self._df_aggregation is None:
+            return
+        self._df_aggregation_ref = weakref.ref(self._df_aggregation)
+        self._df_aggregation = None
+
+    @property
+    def df_aggregation_table(self) -> Optional[pd.DataFrame]:
+        """헤더 포함 집계 표 (첫 행을 컬럼명으로 분리, 보관하지 않고 요청 시 생성)"""
+        df = self.df_aggregation
+        if not self.spec.header_included or df is None or df.empty:
+            return None
+        try:
+            # 스냅샷 공유 DataFrame은 수정하지 않고 헤더 행만 분리 (전체 복사 없음)
+            df_table = df.iloc[1:].reset_index(drop=True)
+            df_table.columns = df.iloc[0].tolist()
+            return df_table
+        except Exception as e:
+            print(f"[{self.config['name']}] ⚠️ 헤더 포함 테이블 변환 실패: {e}")
+            return None
+
+    @property
+    def preprocessed_table_df(self) -> Optional[pd.DataFrame]:
+        """전처리 결과 표 (extract_all_data의 table_data로 요청 시 생성)"""
+        table_data = self._preprocessed_table_data
+        if not isinstance(table_data, list):
+            return None
+        try:
+            return pd.DataFrame(table_data)
+        except Exception as e:
+            print(f"[{self.config['name']}] ⚠️ 전처리 결과 DF 생성 실패: {e}")
+            return None
+
+    def _get_sector_frame(self):
+        """
+        집계 시트의 압축 표현 (SectorFrame)
+
+        data_start_row/지역명 컬럼이 확정된 뒤 처음 호출될 때 한 번 만들고, 이 값이 바뀌면 다시 만듭니다.
+        지역 필터는 정수 코드 비교, 기간 값은 float64 배열로 조회합니다.
+        """
+        from services.sector_frame import SectorFrame
+
+        if self.df_aggregation is None or self.region_name_col is None:
+            return None
+        start_row = self.data_start_row if self.data_start_row is not None else 0
+        frame = self._sector_frame
+        if frame is not None and frame.region_col == self.region_name_col and frame.data_start_row == (
+            start_row if 0 <= start_row < len(self.df_aggregation) else 0
+        ):
+            return frame
+
+        numeric_cols = [self.target_col, self.prev_y_col, self.prev_prev_y_col, self.prev_prev_prev_y_col]
+        numeric_cols.extend(self.quarterly_cols.values())
+        self._sector_frame = SectorFrame.from_frame(
+            self.df_aggregation,
+            start_row,
+            self.region_name_col,
+            industry_code_col=self.industry_code_col,
+            industry_name_col=self.industry_name_col,
+            numeric_cols=[col for col in numeric_cols if isinstance(col, int)],
+            to_float=lambda value: self.safe_float(value, None)
+        )
+        self._release_aggregation()
+        return self._sector_frame
+
     def _find_latest_data_col(self, target_year=None):
         """
         동적 데이터 탐색 기능은 제거되었습니다.
@@ -536,10 +745,10 @@ class UnifiedReportGenerator(BaseGenerator):
             self.data_start_row = 0
         
         if self.data_start_row < len(df):
-            data_df = df.iloc[self.data_start_row:].copy()
+            data_df = df.iloc[self.data_start_row:]
         else:
             print(f"[{self.config['name']}] ⚠️ data_start_row({self.data_start_row})가 DataFrame 길이({len(df)})를 초과합니다. 전체 DataFrame 사용")
-            data_df = df.copy()
+            data_df = df
         
         # 분기 단위 전체 범위 컬럼은 설정 기반으로만 사용
         header_rows = self.config.get('header_rows', 5)
@@ -554,8 +763,7 @@ class UnifiedReportGenerator(BaseGenerator):
         use_analysis_rates = self.config.get('value_type') == 'change_rate' and self.df_analysis is not None
         
         # 지역 목록
-        regions = ['전국', '서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종',
-                   '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+        regions = self.ALL_REGIONS
         
         table_data = []
         total_code = None
@@ -631,7 +839,7 @@ class UnifiedReportGenerator(BaseGenerator):
             else:
                 start_row = max(self.data_start_row, 0)
             if start_row < len(df_source):
-                local_df = df_source.iloc[start_row:].copy()
+                local_df = df_source.iloc[start_row:]
             else:
                 local_df = df_source.copy()
             region_col = self.region_name_col
@@ -663,43 +871,28 @@ class UnifiedReportGenerator(BaseGenerator):
                 from config.reports import REGION_DISPLAY_MAPPING
                 full_name = REGION_DISPLAY_MAPPING.get(region_name)
                 
+                # 집계 시트 지역명 컬럼은 SectorFrame 코드 비교 (위치는 local_df 기준 iloc)
+                sector_frame = None
+                if df_source is self.df_aggregation and region_col == self.region_name_col:
+                    sector_frame = self._get_sector_frame()
+
+                def _exact_region_rows(name: str) -> pd.DataFrame:
+                    if sector_frame is not None:
+                        return local_df.iloc[sector_frame.region_positions(name)]
+                    return local_df[local_df.iloc[:, region_col].astype(str).str.strip() == name]
+
                 # 1. Exact match (short name)
-                region_filter = local_df[
-                    local_df.iloc[:, region_col].astype(str).str.strip() == region_name
-                ]
+                region_filter = _exact_region_rows(region_name)
                 
                 # 2. Exact match (full name)
                 if region_filter.empty and full_name:
-                    region_filter = local_df[
-                        local_df.iloc[:, region_col].astype(str).str.strip() == full_name
-                    ]
+                    region_filter = _exact_region_rows(full_name)
 
                 # 3. Alias match (Historical/Nomenclature variations)
                 if region_filter.empty:
-                    REGION_ALIASES = {
-                        '전북': ['전라북도', '전북특별자치도'],
-                        '강원': ['강원도', '강원특별자치도'],
-                        '경기': ['경기도'],
-                        '충북': ['충청북도'],
-                        '충남': ['충청남도'],
-                        '전남': ['전라남도'],
-                        '경북': ['경상북도'],
-                        '경남': ['경상남도'],
-                        '제주': ['제주특별자치도', '제주도', '제주'],
-                        '세종': ['세종특별자치시'],
-                        '서울': ['서울특별시'],
-                        '부산': ['부산광역시'],
-                        '대구': ['대구광역시'],
-                        '인천': ['인천광역시'],
-                        '광주': ['광주광역시'],
-                        '대전': ['대전광역시'],
-                        '울산': ['울산광역시'],
-                    }
-                    aliases = REGION_ALIASES.get(region_name, [])
+                    aliases = self.REGION_ALIASES.get(region_name, [])
                     for alias in aliases:
-                        region_filter = local_df[
-                            local_df.iloc[:, region_col].astype(str).str.strip() == alias
-                        ]
+                        region_filter = _exact_region_rows(alias)
                         if not region_filter.empty:
                             break
                 
@@ -793,9 +986,9 @@ class UnifiedReportGenerator(BaseGenerator):
                 start_row = max(self.data_start_row, 0)
             
             if start_row < len(df_source):
-                local_df = df_source.iloc[start_row:].copy()
+                local_df = df_source.iloc[start_row:]
             else:
-                local_df = df_source.copy()
+                local_df = df_source
             
             # 지역명 컬럼과 연령계층 컬럼 - 설정에서 가져오기
             agg_struct = self.config.get('aggregation_structure', {})
@@ -806,43 +999,116 @@ class UnifiedReportGenerator(BaseGenerator):
             age_patterns = ['15.*29', '15~29', '15-29', '15∼29', '15～29', '15 - 29']
             
             try:
-                youth_filter = None
+                # 지역 행 위치 (집계 시트 지역명 컬럼이면 SectorFrame 지역 인덱스 사용)
+                sector_frame = None
+                if df_source is self.df_aggregation and region_col == self.region_name_col:
+                    sector_frame = self._get_sector_frame()
+                if sector_frame is not None and sector_frame.data_start_row == (start_row if start_row < len(df_source) else 0):
+                    region_positions = sector_frame.region_positions(region_name)
+                else:
+                    sector_frame = None
+                    region_positions = np.flatnonzero(
+                        (local_df.iloc[:, region_col].astype(str).str.strip() == region_name).to_numpy()
+                    )
+                region_ages = local_df.iloc[region_positions, age_col]
+
+                youth_position = None
                 for age_pattern in age_patterns:
                     try:
-                        # 지역명과 연령계층 조건으로 필터링
-                        temp_filter = local_df[
-                            (local_df.iloc[:, region_col].astype(str).str.strip() == region_name) &
-                            (local_df.iloc[:, age_col].astype(str).str.strip().str.contains(age_pattern, regex=True, na=False))
-                        ]
-                        
-                        if not temp_filter.empty:
-                            youth_filter = temp_filter
+                        # 지역 행 중 연령계층 조건으로 필터링
+                        hits = region_ages.astype(str).str.strip().str.contains(age_pattern, regex=True, na=False).to_numpy()
+                        if hits.any():
+                            youth_position = int(region_positions[np.argmax(hits)])
                             break
                     except Exception:
                         continue
                 
-                if youth_filter is None or youth_filter.empty:
+                if youth_position is None:
                     # 디버그: 왜 찾지 못했는지 로그
-                    unique_ages = local_df[local_df.iloc[:, region_col].astype(str).str.strip() == region_name].iloc[:, age_col].unique()
+                    unique_ages = region_ages.unique()
                     if len(unique_ages) > 0:
                         print(f"[{self.config['name']}] ⚠️ {region_name} 청년층 데이터 찾기 실패. 연령계층 후보: {unique_ages[:5]}...")
                     return None
                 
-                youth_row = youth_filter.iloc[0]
-                if target_col_idx is not None and target_col_idx < len(youth_row):
-                    return self.safe_float(youth_row.iloc[target_col_idx], None)
+                if target_col_idx is not None and target_col_idx < len(local_df.columns):
+                    if sector_frame is not None and sector_frame.has_column(target_col_idx):
+                        value = sector_frame.column(target_col_idx)[youth_position]
+                        return None if np.isnan(value) else float(value)
+                    return self.safe_float(local_df.iloc[youth_position, target_col_idx], None)
             except Exception as e:
                 print(f"[{self.config['name']}] ⚠️ {region_name} 청년층 데이터 추출 실패: {e}")
             
             return None
 
-        for region in regions:
-            row = _select_region_total(df, region)
+        # 전 지역 총계 행을 한 번에 찾고, 지수/전년 값과 증감률은 배열 연산으로 미리 계산
+        # (여기서 찾지 못한 지역만 _select_region_total의 부분 일치 등 단일 지역 탐색 사용)
+        total_positions = self._locate_region_totals(df, regions, total_code)
+        analysis_positions = (
+            self._locate_region_totals(self.df_analysis, regions, total_code) if use_analysis_rates else {}
+        )
+        row_width = len(df.columns)
+        sector_frame = self._get_sector_frame() if total_positions else None
+        if sector_frame is not None and sector_frame.data_start_row != max(self.data_start_row, 0):
+            sector_frame = None
+
+        scale_factor = 1.0
+        if self.report_type == 'construction':
+            # 10억원 단위 → 100억원 단위 (1/10)
+            scale_factor = 0.1
+        elif self.report_type in ['export', 'import']:
+            # 백만달러 단위 → 억달러 단위 (1/100)
+            scale_factor = 0.01
+
+        bulk_growth: Dict[str, float] = {}
+        if (
+            sector_frame is not None
+            and sector_frame.has_column(self.target_col)
+            and sector_frame.has_column(self.prev_y_col)
+        ):
+            bulk_regions = list(total_positions)
+            bulk_rows = np.asarray([total_positions[r] for r in bulk_regions], dtype=np.intp)
+            current = sector_frame.column(self.target_col)[bulk_rows]
+            prev_year = sector_frame.column(self.prev_y_col)[bulk_rows]
+            if scale_factor != 1.0:
+                current = current * scale_factor
+                prev_year = prev_year * scale_factor
+            with np.errstate(divide='ignore', invalid='ignore'):
+                if self.report_type in ['employment', 'unemployment']:
+                    growth = current - prev_year
+                else:
+                    growth = ((current - prev_year) / prev_year) * 100
+            valid = ~np.isnan(current) & ~np.isnan(prev_year) & (prev_year != 0)
+            bulk_growth = {
+                region: float(rate)
+                for region, rate, ok in zip(bulk_regions, growth.tolist(), valid.tolist()) if ok
+            }
+
+        def _row_value(row: Optional[pd.Series], position: Optional[int], col_idx: int) -> Optional[float]:
+            if position is not None and sector_frame is not None and sector_frame.has_column(col_idx):
+                value = sector_frame.column(col_idx)[position]
+                return None if np.isnan(value) else float(value)
             if row is None:
-                print(f"[{self.config['name']}] ⚠️ {region}: 총계 행을 찾지 못했습니다. 스킵합니다.")
-                continue
+                row = data_df.iloc[position]
+            return self.safe_float(row.iloc[col_idx], None)
+
+        for region in regions:
+            position = total_positions.get(region)
+            row = None
+            if position is None:
+                row = _select_region_total(df, region)
+                if row is None:
+                    print(f"[{self.config['name']}] ⚠️ {region}: 총계 행을 찾지 못했습니다. 스킵합니다.")
+                    continue
 
-            analysis_row = _select_region_total(self.df_analysis, region) if use_analysis_rates else None
+            analysis_row = None
+            if use_analysis_rates:
+                analysis_position = analysis_positions.get(region)
+                if analysis_position is not None:
+                    start_row = max(self.data_start_row, 0)
+                    analysis_df = self.df_analysis.iloc[start_row:] if start_row < len(self.df_analysis) else self.df_analysis
+                    analysis_row = analysis_df.iloc[analysis_position]
+                else:
+                    analysis_row = _select_region_total(self.df_analysis, region)
             
             # 청년층(15-29세) 데이터 추출 (실업률/고용률만)
             youth_rate = _select_youth_rate(df, region, self.target_col)
@@ -855,12 +1121,12 @@ class UnifiedReportGenerator(BaseGenerator):
                 continue
             
             # 인덱스 범위 체크
-            if self.target_col is None or self.target_col >= len(row):
-                print(f"[{self.config['name']}] ⚠️ Target 컬럼 인덱스({self.target_col})가 행 길이({len(row)})를 초과합니다. 스킵합니다.")
+            if self.target_col is None or self.target_col >= row_width:
+                print(f"[{self.config['name']}] ⚠️ Target 컬럼 인덱스({self.target_col})가 행 길이({row_width})를 초과합니다. 스킵합니다.")
                 continue
             
-            if self.prev_y_col is None or self.prev_y_col >= len(row):
-                print(f"[{self.config['name']}] ⚠️ 전년 컬럼 인덱스({self.prev_y_col})가 행 길이({len(row)})를 초과합니다. 스킵합니다.")
+            if self.prev_y_col is None or self.prev_y_col >= row_width:
+                print(f"[{self.config['name']}] ⚠️ 전년 컬럼 인덱스({self.prev_y_col})가 행 길이({row_width})를 초과합니다. 스킵합니다.")
                 continue
 
             def _compute_quarterly_growth(current: Optional[float], previous: Optional[float]) -> Optional[float]:
@@ -878,14 +1144,14 @@ class UnifiedReportGenerator(BaseGenerator):
             
             # 지수 추출
             try:
-                idx_current = self.safe_float(row.iloc[self.target_col], None)
-                idx_prev_year = self.safe_float(row.iloc[self.prev_y_col], None)
+                idx_current = _row_value(row, position, self.target_col)
+                idx_prev_year = _row_value(row, position, self.prev_y_col)
                 idx_prev_prev_year = None
                 idx_prev_prev_prev_year = None
-                if self.prev_prev_y_col is not None and self.prev_prev_y_col < len(row):
-                    idx_prev_prev_year = self.safe_float(row.iloc[self.prev_prev_y_col], None)
-                if self.prev_prev_prev_y_col is not None and self.prev_prev_prev_y_col < len(row):
-                    idx_prev_prev_prev_year = self.safe_float(row.iloc[self.prev_prev_prev_y_col], None)
+                if self.prev_prev_y_col is not None and self.prev_prev_y_col < row_width:
+                    idx_prev_prev_year = _row_value(row, position, self.prev_prev_y_col)
+                if self.prev_prev_prev_y_col is not None and self.prev_prev_prev_y_col < row_width:
+                    idx_prev_prev_prev_year = _row_value(row, position, self.prev_prev_prev_y_col)
             except (IndexError, KeyError) as e:
                 print(f"[{self.config['name']}] ⚠️ 데이터 추출 오류: {e}. 스킵합니다.")
                 continue
@@ -914,23 +1180,12 @@ class UnifiedReportGenerator(BaseGenerator):
             if self.quarterly_keys:
                 for key in self.quarterly_keys:
                     col_idx = self.quarterly_cols.get(key)
-                    if col_idx is not None and col_idx < len(row):
-                        quarterly_values.append(self.safe_float(row.iloc[col_idx], None))
+                    if col_idx is not None and col_idx < row_width:
+                        quarterly_values.append(_row_value(row, position, col_idx))
                     else:
                         quarterly_values.append(None)
 
-            # 단위 보정
-            scale_factor = 1.0
-            if self.report_type == 'construction':
-                # 10억원 단위 → 100억원 단위 (1/10)
-                scale_factor = 0.1
-            elif self.report_type in ['export', 'import']:
-                # 백만달러 단위 → 억달러 단위 (1/100)
-                scale_factor = 0.01
-            elif self.report_type == 'migration':
-                # 연령별 계산 등이 복잡하므로 원형(명) 유지, 템플릿(val_thousand)에서 나누기 수행
-                scale_factor = 1.0
-
+            # 단위 보정 (scale_factor는 루프 전에 결정, 국내인구이동은 원형(명) 유지)
             if scale_factor != 1.0:
                 idx_current = (idx_current * scale_factor) if idx_current is not None else None
                 idx_prev_year = (idx_prev_year * scale_factor) if idx_prev_year is not None else None
@@ -955,8 +1210,8 @@ class UnifiedReportGenerator(BaseGenerator):
 
             # 직전 분기 값
             idx_prev_quarter = None
-            if prev_q_col is not None and prev_q_col < len(row):
-                idx_prev_quarter = self.safe_float(row.iloc[prev_q_col], None)
+            if prev_q_col is not None and prev_q_col < row_width:
+                idx_prev_quarter = _row_value(row, position, prev_q_col)
 
             if idx_prev_quarter is not None and scale_factor != 1.0:
                 idx_prev_quarter = idx_prev_quarter * scale_factor
@@ -995,6 +1250,9 @@ class UnifiedReportGenerator(BaseGenerator):
             elif self.config.get('value_type') == 'change_rate':
                 # 시트에 이미 증감률이 계산되어 있는 경우 (예: C 분석)
                 change_rate = round(rate_current, 1) if rate_current is not None else round(idx_current, 1)
+            elif region in bulk_growth:
+                # 배열 연산으로 미리 계산한 증감률/증감(p)
+                change_rate = round(bulk_growth[region], 1)
             elif idx_prev_year is not None and idx_prev_year != 0:
                 if self.report_type in ['employment', 'unemployment']:
                     # 퍼센트포인트 차이 (p)
@@ -1103,9 +1361,9 @@ class UnifiedReportGenerator(BaseGenerator):
         # 데이터 시작 행
         start_row = self.data_start_row if self.data_start_row is not None else 0
         if start_row < len(df):
-            data_df = df.iloc[start_row:].copy()
+            data_df = df.iloc[start_row:]
         else:
-            data_df = df.copy()
+            data_df = df
         
         # 지역명 컬럼과 연령계층 컬럼 - 설정에서 가져오기
         agg_struct = self.config.get('aggregation_structure', {})
@@ -1132,30 +1390,45 @@ class UnifiedReportGenerator(BaseGenerator):
             return []
         
         try:
-            # 지역 필터링
-            region_filter = data_df[
-                data_df.iloc[:, region_col].astype(str).str.strip() == region
-            ]
+            # 지역 필터링 (집계 시트 지역명 컬럼이면 SectorFrame 지역 인덱스 사용)
+            sector_frame = self._get_sector_frame() if region_col == self.region_name_col else None
+            if sector_frame is not None and sector_frame.data_start_row == (start_row if 0 <= start_row < len(df) else 0):
+                positions = sector_frame.region_positions(region)
+            else:
+                sector_frame = None
+                positions = np.flatnonzero(
+                    (data_df.iloc[:, region_col].astype(str).str.strip() == region).to_numpy()
+                )
             
-            if region_filter.empty:
+            if len(positions) == 0:
                 # 디버그: 사용 가능한 지역명 확인
                 unique_regions = data_df.iloc[:, region_col].astype(str).str.strip().unique()
                 print(f"[{self.config['name']}] ⚠️ {region} 연령별 데이터 없음. 사용 가능한 지역: {unique_regions[:5]}...")
                 return []
             
-            # 연령별 데이터 추출
+            # 연령별 데이터 추출 (지역 행 위치의 NumPy 배열로 처리)
+            width = len(data_df.columns)
+
+            def _values(col_idx: int) -> List[Optional[float]]:
+                if col_idx >= width:
+                    return [None] * len(positions)
+                if sector_frame is not None and sector_frame.has_column(col_idx):
+                    return [None if np.isnan(v) else v for v in sector_frame.column(col_idx)[positions].tolist()]
+                return [self.safe_float(v, None) for v in data_df.iloc[positions, col_idx].tolist()]
+
+            age_names = (
+                [str(v).strip() for v in data_df.iloc[positions, age_col].tolist()]
+                if age_col < width else [''] * len(positions)
+            )
+            current_values = _values(target_col)
+            prev_values = _values(prev_y_col)
+
             age_groups = []
-            for idx, row in region_filter.iterrows():
-                age_name = str(row.iloc[age_col]).strip() if age_col < len(row) else ''
-                
+            for age_name, current_val, prev_val in zip(age_names, current_values, prev_values):
                 # '계' (합계)는 제외
                 if age_name in ['계', '합계', '전체', '']:
                     continue
                 
-                # 현재 값과 전년 동분기 값 추출
-                current_val = self.safe_float(row.iloc[target_col], None) if target_col < len(row) else None
-                prev_val = self.safe_float(row.iloc[prev_y_col], None) if prev_y_col < len(row) else None
-                
                 # 증감(%p) 계산
                 if current_val is not None and prev_val is not None:
                     change = round(current_val - prev_val, 1)
@@ -1218,9 +1491,9 @@ class UnifiedReportGenerator(BaseGenerator):
             self.data_start_row = 0
         
         if self.data_start_row < len(df):
-            data_df = df.iloc[self.data_start_row:].copy()
+            data_df = df.iloc[self.data_start_row:]
         else:
-            data_df = df.copy()
+            data_df = df
         
         # 지역 필터링 (안전한 인덱스 접근)
         # 정확한 매칭 또는 부분 문자열 매칭 (예: "부산" → "부산광역시")
@@ -1245,26 +1518,25 @@ class UnifiedReportGenerator(BaseGenerator):
             '제주': '제주',
         }
         try:
-            region_col_values = data_df.iloc[:, self.region_name_col].astype(str).str.strip()
+            # 지역명 코드 비교 (SectorFrame, 위치는 data_df 기준 iloc)
+            sector_frame = self._get_sector_frame()
             # 1차: 정확한 매칭
-            region_filter = data_df[region_col_values == region]
+            positions = sector_frame.region_positions(region)
             
             # 2차: 정확한 매칭 실패 시 패턴 매칭 (물가 등에서 "경남" → "경상남도" 처리)
-            if region_filter.empty and region != '전국':
+            if len(positions) == 0 and region != '전국':
                 pattern = region_name_patterns.get(region, region)
-                region_filter = data_df[region_col_values.str.contains(pattern, na=False, regex=True)]
+                positions = sector_frame.region_positions_matching(pattern)
         except (IndexError, KeyError) as e:
             print(f"[{self.config['name']}] ⚠️ {region} 필터링 오류: {e}")
             return []
         
-        if region_filter.empty:
+        if len(positions) == 0:
             return []
         
         industries = []
         # 기본값/폴백 사용 금지
-        if 'name_mapping' not in self.config:
-            raise ValueError(f"[{self.config['name']}] ❌ 설정에서 'name_mapping'을 찾을 수 없습니다. 기본값 사용 금지.")
-        name_mapping = self.config['name_mapping']
+        name_mapping = self.name_mapping
         
         # 산업명 컬럼 찾기 (동적으로 찾은 값 사용)
         if self.industry_name_col is None:
@@ -1289,18 +1561,37 @@ class UnifiedReportGenerator(BaseGenerator):
         if industry_name_col is not None and industry_name_col < 0:
             industry_name_col = 0
         
-        for idx, row in region_filter.iterrows():
+        # 행 순회 대신 지역 행 위치의 NumPy 배열로 처리
+        # (지수는 SectorFrame의 float64 컬럼 = safe_float 적용 결과, NaN = None)
+        width = len(df.columns)
+        if self.target_col is None or self.prev_y_col is None:
+            return []
+        if not (0 <= self.target_col < width and 0 <= self.prev_y_col < width):
+            return []
+
+        def _values(col_idx: int) -> List[Optional[float]]:
+            if sector_frame.has_column(col_idx):
+                return [None if np.isnan(v) else v for v in sector_frame.column(col_idx)[positions].tolist()]
+            return [self.safe_float(v, None) for v in data_df.iloc[positions, col_idx].tolist()]
+
+        current_values = _values(self.target_col)
+        prev_year_values = _values(self.prev_y_col)
+        raw_names = None
+        if industry_name_col is not None and industry_name_col < width:
+            raw_names = data_df.iloc[positions, industry_name_col].tolist()
+        
+        for row_pos in range(len(positions)):
             # 산업명 추출 우선 (총계 키워드면 스킵)
             industry_name = ''
-            if industry_name_col is not None and industry_name_col < len(row) and pd.notna(row.iloc[industry_name_col]):
-                industry_name = str(row.iloc[industry_name_col]).strip()
+            if raw_names is not None and pd.notna(raw_names[row_pos]):
+                industry_name = str(raw_names[row_pos]).strip()
             if not industry_name:
                 # 고용률/실업률은 산업명이 없어도 진행 가능
                 if self.report_type not in ['employment', 'unemployment']:
                     continue
             
             # 총계 키워드 스킵 (오탐 방지를 위해 '계' 제외)
-            if any(kw in industry_name for kw in ['총계', '합계', '총지수', '전체', '전산업', '전 산업']):
+            if any(kw in industry_name for kw in self.TOTAL_ROW_KEYWORDS):
                 continue
             
             # 산업명 컬럼이 없으면 스킵 (고용률/실업률 제외)
@@ -1314,23 +1605,8 @@ class UnifiedReportGenerator(BaseGenerator):
             if not industry_name:
                 continue
             
-            # 지수 추출 (안전한 인덱스 접근)
-            try:
-                if self.target_col is None or self.prev_y_col is None:
-                    continue
-                
-                # 인덱스 범위 체크
-                if self.target_col < 0 or self.target_col >= len(row):
-                    continue
-                if self.prev_y_col < 0 or self.prev_y_col >= len(row):
-                    continue
-                    
-                idx_current = self.safe_float(row.iloc[self.target_col], None)
-                idx_prev_year = self.safe_float(row.iloc[self.prev_y_col], None)
-            except (IndexError, KeyError, AttributeError) as e:
-                print(f"[{self.config['name']}] ⚠️ 데이터 추출 오류 (인덱스 {self.target_col}/{self.prev_y_col}): {e}")
-                continue
-            
+            idx_current = current_values[row_pos]
+            idx_prev_year = prev_year_values[row_pos]
             if idx_current is None:
                 continue
             
@@ -1395,37 +1671,52 @@ class UnifiedReportGenerator(BaseGenerator):
         
         # 데이터 행만 추출
         if data_start < len(df):
-            data_df = df.iloc[data_start:].copy()
+            data_df = df.iloc[data_start:]
         else:
-            data_df = df.copy()
+            data_df = df
         
-        # 지역 필터링 (전국 또는 특정 지역)
+        # 지역 필터링 (전국 또는 특정 지역) - 지역명 → 행 위치 인덱스는 시트당 한 번만 생성
         try:
-            if region == '전국':
-                # 전국의 경우 '합계', '전국' 등으로 표시될 수 있음
-                region_filter = data_df[
-                    data_df.iloc[:, region_col].astype(str).str.strip().isin(['전국', '합계', '전 국'])
-                ]
-            else:
-                region_filter = data_df[
-                    data_df.iloc[:, region_col].astype(str).str.strip() == region
-                ]
+            from services.sector_frame import index_labels
+
+            index_key = (region_col, data_start)
+            cached = self._trade_region_index
+            if cached is None or cached['df'] is not df or cached['key'] != index_key:
+                cached = {'df': df, 'key': index_key, 'index': index_labels(data_df.iloc[:, region_col])}
+                self._trade_region_index = cached
+            region_index = cached['index']
+            # 전국의 경우 '합계', '전국' 등으로 표시될 수 있음
+            labels = ['전국', '합계', '전 국'] if region == '전국' else [region]
+            matched = [region_index[label] for label in labels if label in region_index]
+            positions = np.sort(np.concatenate(matched)) if matched else np.empty(0, dtype=np.intp)
         except (IndexError, KeyError) as e:
             print(f"[{self.config['name']}] ⚠️ {region} 필터링 오류: {e}")
             return []
         
-        if region_filter.empty:
+        if len(positions) == 0:
             print(f"[{self.config['name']}] ⚠️ {region} 품목 데이터 없음 (필터 결과 없음)")
             return []
         
         products = []
-        name_mapping = self.config.get('name_mapping', {})
-        
-        for idx, row in region_filter.iterrows():
+        name_mapping = self.name_mapping
+        width = len(df.columns)
+        if product_col >= width:
+            return []
+
+        def _values(col_idx: Optional[int]) -> List[Optional[float]]:
+            if col_idx is None or col_idx >= width:
+                return [None] * len(positions)
+            return [self.safe_float(v, None) for v in data_df.iloc[positions, col_idx].tolist()]
+
+        rows = zip(
+            data_df.iloc[positions, product_col].tolist(),
+            _values(contribution_col),
+            _values(self.target_col),
+            _values(self.prev_y_col),
+        )
+        for raw_name, contribution_rate, value, prev_value in rows:
             # 품목명 추출
-            if product_col >= len(row):
-                continue
-            product_name = str(row.iloc[product_col]).strip() if pd.notna(row.iloc[product_col]) else ''
+            product_name = str(raw_name).strip() if pd.notna(raw_name) else ''
             
             if not product_name:
                 continue
@@ -1438,19 +1729,6 @@ class UnifiedReportGenerator(BaseGenerator):
             if product_name in name_mapping:
                 product_name = name_mapping[product_name]
             
-            # 기여율 추출 (있으면)
-            contribution_rate = None
-            if contribution_col is not None and contribution_col < len(row):
-                contribution_rate = self.safe_float(row.iloc[contribution_col], None)
-            
-            # 금액/지수 추출
-            value = None
-            prev_value = None
-            if self.target_col is not None and self.target_col < len(row):
-                value = self.safe_float(row.iloc[self.target_col], None)
-            if self.prev_y_col is not None and self.prev_y_col < len(row):
-                prev_value = self.safe_float(row.iloc[self.prev_y_col], None)
-            
             # 증감률 계산 (기여율이 없으면 증감률 사용)
             change_rate = None
             if value is not None and prev_value is not None and prev_value != 0:
@@ -1467,16 +1745,83 @@ class UnifiedReportGenerator(BaseGenerator):
             })
         
         # 기여율 또는 증감률의 절대값 기준으로 정렬 (상위 영향력 품목 우선)
-        try:
+        # 점수: 기여율이 0/없음이면 증감률, 둘 다 0/없음이면 0 (같은 점수는 원래 순서)
+        contribution = np.array([p['contribution_rate'] or 0.0 for p in products], dtype=np.float64)
+        growth = np.array([p['change_rate'] or 0.0 for p in products], dtype=np.float64)
+        scores = np.abs(np.where(contribution != 0, contribution, growth))
+        if np.isnan(scores).any():
+            # 계산 불가(NaN) 값이 섞인 경우는 기존 정렬 순서 유지
             products.sort(
                 key=lambda x: abs(x.get('contribution_rate') or x.get('change_rate') or 0),
                 reverse=True
             )
-        except (TypeError, AttributeError):
-            pass
+            return products
+        
+        from services.contribution import rank_descending
         
-        return products
+        return [products[j] for j in rank_descending(scores)[0].tolist()]
     
+    @staticmethod
+    def _top_n_columns(scores: np.ndarray, top_n: int) -> List[List[int]]:
+        """
+        행별 점수 상위 top_n 열 위치 (점수 내림차순, 같은 점수는 열 순서 유지, -inf 제외)
+
+        argpartition으로 행마다 top_n번째 점수(경계값)를 구한 뒤, 경계값 이상인 열만 안정 정렬합니다.
+        경계값과 같은 점수를 모두 후보에 넣으므로 결과는 전체 안정 정렬의 앞 top_n개와 같습니다.
+        """
+        n_rows, n_cols = scores.shape
+        if n_cols == 0 or top_n <= 0:
+            return [[] for _ in range(n_rows)]
+        k = min(top_n, n_cols)
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        kth = np.take_along_axis(scores, part, axis=1).min(axis=1)
+        candidates = (scores >= kth[:, None]) & np.isfinite(scores)
+        result = []
+        for i in range(n_rows):
+            cols = np.flatnonzero(candidates[i])
+            result.append(cols[np.argsort(-scores[i, cols], kind='stable')][:top_n].tolist())
+        return result
+
+    def rank_industries_by_region(self, top_n: int = 3) -> Dict[str, Dict[str, Any]]:
+        """
+        전 지역 업종 증가/감소 상위 top_n 일괄 계산 (결과는 생성기에 캐시)
+
+        지역별 업종 데이터를 한 번씩만 추출해 지역×업종 증감률 행렬(없음 = NaN)을 만들고,
+        증가(> 0, 내림차순)/감소(< 0, 오름차순) 상위 업종을 행렬 단위 부분 정렬로 구합니다.
+        순서 규칙은 _get_top_industries_for_region의 안정 정렬과 같습니다.
+
+        Returns:
+            {지역명: {'industries': 업종 리스트, 'increase': 상위 증가 업종 또는 None, 'decrease': 상위 감소 업종 또는 None}}
+        """
+        cached = self._industry_rankings.get(top_n)
+        if cached is not None:
+            return cached
+
+        regions = self.ALL_REGIONS
+        industries_by_region = {region: self._extract_industry_data(region) or [] for region in regions}
+        width = max((len(items) for items in industries_by_region.values()), default=0)
+        growth = np.full((len(regions), width), np.nan, dtype=np.float64)
+        for i, region in enumerate(regions):
+            for j, ind in enumerate(industries_by_region[region]):
+                rate = ind.get('change_rate') if isinstance(ind, dict) else None
+                if rate is not None:
+                    growth[i, j] = rate
+
+        with np.errstate(invalid='ignore'):
+            increase_cols = self._top_n_columns(np.where(growth > 0, growth, -np.inf), top_n)
+            decrease_cols = self._top_n_columns(np.where(growth < 0, -growth, -np.inf), top_n)
+
+        rankings = {}
+        for i, region in enumerate(regions):
+            items = industries_by_region[region]
+            rankings[region] = {
+                'industries': items,
+                'increase': [items[j] for j in increase_cols[i]] or None,
+                'decrease': [items[j] for j in decrease_cols[i]] or None,
+            }
+        self._industry_rankings[top_n] = rankings
+        return rankings
+
     def _get_top_industries_for_region(self, region: str, increase: bool = True, top_n: int = 3) -> List[Dict[str, Any]]:
         """
         특정 지역의 상위 업종 추출
@@ -1492,6 +1837,14 @@ class UnifiedReportGenerator(BaseGenerator):
         if not region or not isinstance(region, str):
             return []
         
+        # 시도/전국은 일괄 순위 결과 사용
+        ranked = self.rank_industries_by_region(top_n).get(region)
+        if ranked is not None:
+            if not ranked['industries']:
+                return []
+            top = ranked['increase'] if increase else ranked['decrease']
+            return list(top) if top else None
+        
         industries = self._extract_industry_data(region)
         
         # 안전한 필터링
@@ -2657,13 +3010,8 @@ class UnifiedReportGenerator(BaseGenerator):
         
         # Table Data (SSOT)
         table_data = self._extract_table_data_ssot()
-        # 전처리 결과 DF 저장
-        self.preprocessed_table_df = None
-        if isinstance(table_data, list):
-            try:
-                self.preprocessed_table_df = pd.DataFrame(table_data)
-            except Exception as e:
-                print(f"[{self.config['name']}] ⚠️ 전처리 결과 DF 생성 실패: {e}")
+        # 전처리 결과 표 (DataFrame은 preprocessed_table_df 요청 시 생성)
+        self._preprocessed_table_data = table_data
         
         # Text Data
         nationwide = self.extract_nationwide_data(table_data)
@@ -2698,29 +3046,8 @@ class UnifiedReportGenerator(BaseGenerator):
             region_name = r['region_name']
             
             try:
-                # 지역별 업종 데이터 추출
-                region_industries = self._extract_industry_data(region_name)
-                # 기본값/폴백 사용 금지: 빈 리스트는 그대로 사용 (데이터가 없는 경우)
-                # 하지만 None 체크는 필요
-                if region_industries is None:
-                    raise ValueError(f"[{self.config['name']}] ❌ {region_name} 업종 데이터를 추출할 수 없습니다. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
-                
-                # 증가 업종만 필터링 및 정렬 (안전한 처리)
-                increase_industries = [
-                    ind for ind in region_industries 
-                    if ind and isinstance(ind, dict) and 
-                    ind.get('change_rate') is not None and 
-                    ind['change_rate'] > 0
-                ]
-                try:
-                    # 기본값/폴백 사용 금지: change_rate가 None이면 정렬에서 제외
-                    increase_industries = [x for x in increase_industries if x and isinstance(x, dict) and x.get('change_rate') is not None]
-                    increase_industries.sort(key=lambda x: x['change_rate'], reverse=True)
-                except (TypeError, AttributeError):
-                    pass  # 정렬 실패 시 원본 유지
-                
-                # 상위 3개 업종 추출
-                top_industries = increase_industries[:3] if increase_industries and len(increase_industries) > 0 else None
+                # 상위 3개 증가 업종 (전 지역 일괄 순위 결과, 없으면 None)
+                top_industries = self._get_top_industries_for_region(region_name, increase=True, top_n=3) or None
                 # 업종 이름만 추출한 리스트 (템플릿에서 industries_names로 사용)
                 industries_names = [ind.get('name', '') for ind in (top_industries or []) if ind and isinstance(ind, dict) and ind.get('name')]
                 
@@ -2773,30 +3100,8 @@ class UnifiedReportGenerator(BaseGenerator):
             region_name = r['region_name']
             
             try:
-                # 지역별 업종 데이터 추출
-                region_industries = self._extract_industry_data(region_name)
-                # 기본값/폴백 사용 금지: 빈 리스트는 그대로 사용 (데이터가 없는 경우)
-                # 하지만 None 체크는 필요
-                if region_industries is None:
-                    raise ValueError(f"[{self.config['name']}] ❌ {region_name} 업종 데이터를 추출할 수 없습니다. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
-                
-                # 감소 업종만 필터링 및 정렬 (안전한 처리)
-                decrease_industries = [
-                    ind for ind in region_industries 
-                    if ind and isinstance(ind, dict) and 
-                    ind.get('change_rate') is not None and 
-                    ind['change_rate'] < 0
-                ]
-                try:
-                    # 기본값/폴백 사용 금지: change_rate가 None이면 정렬에서 제외
-                    decrease_industries_filtered = [x for x in decrease_industries if x and isinstance(x, dict) and x.get('change_rate') is not None]
-                    decrease_industries_filtered.sort(key=lambda x: x['change_rate'])
-                    decrease_industries = decrease_industries_filtered
-                except (TypeError, AttributeError, KeyError) as e:
-                    print(f"[{self.config['name']}] 🔍 [디버그] decrease_industries 정렬 오류:")
-                    print(f"  - 오류: {e}")
-                    print(f"  - decrease_industries 샘플: {decrease_industries[:3] if decrease_industries else '없음'}")
-                    raise ValueError(f"[{self.config['name']}] ❌ decrease_industries 정렬 오류: {e}. 기본값 사용 금지: 반드시 데이터를 찾아야 합니다.")
+                # 상위 3개 감소 업종 (전 지역 일괄 순위 결과, 감소폭 큰 순)
+                decrease_industries = self._get_top_industries_for_region(region_name, increase=False, top_n=3) or []
                 
                 # 소비동향용 주요 업태 (첫 번째 감소 업종, 기본값/폴백 사용 금지)
                 main_business = None
@@ -3054,13 +3359,9 @@ class RegionalEconomyByRegionGenerator(BaseGenerator):
     def _get_generator(self, report_type: str) -> UnifiedReportGenerator:
         """부문별 Generator 캐시 또는 생성"""
         if report_type not in self.generators:
-            self.generators[report_type] = UnifiedReportGenerator(
-                report_type, 
-                self.excel_path, 
-                self.year, 
-                self.quarter, 
-                self.xl
-            )
+            self.generators[report_type] = get_sector_dataset(
+                self.excel_path, self.year, self.quarter, report_type, excel_file=self.xl
+            ).generator
         return self.generators[report_type]
     
     def extract_regional_section(self, region_name: str, report_type: str) -> Dict[str, Any]:
@@ -3092,9 +3393,9 @@ class RegionalEconomyByRegionGenerator(BaseGenerator):
                     industries = industries_by_region.get(region_name)
 
             if table_data is None:
-                gen = self._get_generator(report_type)
-                gen.load_data()
-                table_data = gen._extract_table_data_ssot()
+                table_data = get_sector_dataset(
+                    self.excel_path, self.year, self.quarter, report_type, excel_file=self.xl
+                ).get_table_data()
 
             region_data = next(
                 (d for d in (table_data or []) if d.get('region_name') == region_name),
@@ -3104,21 +3405,30 @@ class RegionalEconomyByRegionGenerator(BaseGenerator):
             if not region_data:
                 return None
 
+            ranked = None
             if industries is None:
-                gen = self._get_generator(report_type)
-                industries = gen._extract_industry_data(region_name)
-            increase_industries = [
-                ind for ind in (industries or [])
-                if ind and ind.get('change_rate', 0) > 0
-            ]
-            increase_industries.sort(key=lambda x: x.get('change_rate', 0), reverse=True)
+                dataset = get_sector_dataset(
+                    self.excel_path, self.year, self.quarter, report_type, excel_file=self.xl
+                )
+                ranked = dataset.get_industry_rankings().get(region_name)
+                industries = ranked['industries'] if ranked else dataset.get_industries(region_name)
+            if ranked is not None:
+                # 부문 데이터셋의 전 지역 일괄 순위 결과 공유
+                top_increase = ranked['increase'] or []
+            else:
+                increase_industries = [
+                    ind for ind in (industries or [])
+                    if ind and ind.get('change_rate', 0) > 0
+                ]
+                increase_industries.sort(key=lambda x: x.get('change_rate', 0), reverse=True)
+                top_increase = increase_industries[:3]
             
             # 나레이션 생성
             narrative = self._generate_narrative(
                 region_name,
                 report_type,
                 region_data,
-                increase_industries[:3] if increase_industries else []
+                top_increase
             )
             
             # 템플릿 요구: narrative는 반드시 리스트, table.data는 [지표값, 증감률] 순서 보장
@@ -3149,68 +3459,14 @@ class RegionalEconomyByRegionGenerator(BaseGenerator):
         top_industries: List[Dict]
     ) -> List[str]:
         """나레이션 생성"""
-        narratives = []
-
         try:
-            value = region_data.get('value')
-            change_rate = region_data.get('change_rate')
-
-            if value is None:
-                return narratives
-
-            try:
-                from utils.text_utils import get_terms
-            except ImportError:
-                import sys
-                from pathlib import Path
-                sys.path.insert(0, str(Path(__file__).parent.parent))
-                from utils.text_utils import get_terms
-
-            # 보고서별 나레이션 템플릿
-            template_map = {
-                'mining': '{region}의 광공업생산은 {products_phrase}{changes}',
-                'service': '{region}의 서비스업생산은 {products_phrase}{changes}',
-                'consumption': '{region}의 소비는 {products_phrase}{changes}',
-                'construction': '{region}의 건설은 {products_phrase}{changes}',
-                'export': '{region}의 수출은 {products_phrase}{changes}',
-                'import': '{region}의 수입은 {products_phrase}{changes}',
-                'employment': '{region}의 고용률은 {changes}',
-                'unemployment': '{region}의 실업률은 {changes}',
-                'price': '{region}의 물가는 {products_phrase}{changes}',
-                'migration': '{region}의 순인구이동은 {changes}',
-            }
-
-            template = template_map.get(report_type, '{region}는 {changes}')
-
-            # 제품/항목 텍스트 생성
-            products_text = ''
-            if top_industries:
-                product_names = [ind.get('name', '') for ind in top_industries[:2] if ind.get('name')]
-                products_text = ', '.join(product_names)
-
-            products_phrase = f"{products_text}이 " if products_text else ''
-
-            # 증감 텍스트 (어휘 매핑 준수)
-            if change_rate is None:
-                changes_text = '변화'
-            else:
-                _, result_noun, _ = get_terms(report_type, change_rate)
-                if abs(change_rate) < 0.01:
-                    changes_text = '전년동기대비 보합'
-                else:
-                    changes_text = f'전년동기대비 {abs(change_rate):.1f}% {result_noun}'
-
-            narrative_text = template.format(
-                region=region_name,
-                products_phrase=products_phrase,
-                changes=changes_text
-            )
-            narratives.append(narrative_text)
+            # 보고서별 나레이션 템플릿은 부문별로 한 번 컴파일된 클로저 사용
+            return get_narrative_compiler().region_section(report_type)(region_name, region_data, top_industries)
 
         except Exception as e:
             print(f"[지역경제동향] ⚠️ 나레이션 생성 실패: {e}")
 
-        return narratives
+        return []
     
     def _get_table_periods(self, gen: UnifiedReportGenerator) -> List[str]:
         """테이블 기간 목록 생성"""
@@ -3292,6 +3548,11 @@ class RegionalReportGenerator(BaseGenerator):
         # 부문별 generator 캐시
         self._sector_generators = {}
         self._sector_data_cache = {}
+        # 템플릿 경로 → 컴파일된 Jinja2 템플릿 (여러 지역 렌더링 시 재사용)
+        self._templates = {}
+        # 부문 → {지역명: 나레이션} (일괄 렌더링 중에만 17개 시도 일괄 생성 결과 보관)
+        self._section_narratives = {}
+        self._batch_depth = 0
     
     def _get_sector_generator(self, sector_key: str) -> Optional['UnifiedReportGenerator']:
         """부문별 generator 가져오기 (캐싱)"""
@@ -3304,13 +3565,15 @@ class RegionalReportGenerator(BaseGenerator):
             return None
         
         try:
-            generator = UnifiedReportGenerator(
-                report_type, 
-                self.excel_path, 
-                year=self.year, 
-                quarter=self.quarter, 
+            # 부문 보고서/요약 단계와 같은 데이터셋을 공유 (집계 시트 재로드 방지)
+            dataset = get_sector_dataset(
+                self.excel_path,
+                self.year,
+                self.quarter,
+                report_type,
                 excel_file=self.xl  # BaseGenerator에서 excel_file은 self.xl로 저장됨
             )
+            generator = dataset.generator
             self._sector_generators[sector_key] = generator
             return generator
         except Exception as e:
@@ -3322,12 +3585,15 @@ class RegionalReportGenerator(BaseGenerator):
         if sector_key in self._sector_data_cache:
             return self._sector_data_cache[sector_key]
         
-        generator = self._get_sector_generator(sector_key)
-        if not generator:
+        report_type = self.SECTOR_MAPPING.get(sector_key)
+        if not report_type:
+            print(f"[지역경제동향] 알 수 없는 부문: {sector_key}")
             return []
         
         try:
-            table_data = generator._extract_table_data_ssot()
+            table_data = get_sector_dataset(
+                self.excel_path, self.year, self.quarter, report_type, excel_file=self.xl
+            ).get_table_data()
             self._sector_data_cache[sector_key] = table_data
             return table_data
         except Exception as e:
@@ -3335,7 +3601,17 @@ class RegionalReportGenerator(BaseGenerator):
             return []
     
     def _get_region_data_from_sector(self, sector_key: str, region_name: str) -> Optional[Dict[str, Any]]:
-        """특정 부문에서 특정 지역의 데이터 추출"""
+        """특정 부문에서 특정 지역의 데이터 추출 (지역 큐브 우선, 큐브에 없는 지역은 테이블 탐색)"""
+        report_type = self.SECTOR_MAPPING.get(sector_key)
+        if report_type:
+            try:
+                cube = get_regional_cube(self.excel_path, self.year, self.quarter, excel_file=self.xl)
+                report_id = get_report_spec(report_type).report_id
+                if region_name in cube.region_index:
+                    return cube.region_row(report_id, region_name)
+            except Exception as e:
+                print(f"[지역경제동향] {sector_key} 큐브 조회 실패, 테이블에서 조회: {e}")
+        
         table_data = self._get_sector_table_data(sector_key)
         if not table_data:
             return None
@@ -3375,62 +3651,35 @@ class RegionalReportGenerator(BaseGenerator):
         Returns:
             나레이션 리스트
         """
-        if not sector_data:
-            return []
-        
+        # 부문별 나레이션 템플릿은 한 번 컴파일된 클로저 사용
+        return get_narrative_compiler().section(sector_key)(region_name, sector_data)
+    
+    @contextmanager
+    def batch_rendering(self):
+        """여러 지역을 연달아 렌더링하는 동안 부문 나레이션을 17개 시도 일괄 생성/재사용"""
+        self._batch_depth += 1
         try:
-            from utils.text_utils import get_terms
-        except ImportError:
-            import sys
-            from pathlib import Path
-            sys.path.insert(0, str(Path(__file__).parent.parent))
-            from utils.text_utils import get_terms
-        
-        value = sector_data.get('value')
-        change_rate = sector_data.get('change_rate')
-        
-        if value is None:
-            return []
-        
-        # 부문별 나레이션 템플릿
-        template_map = {
-            'mining': '{region}의 광공업생산은 {changes}',
-            'service': '{region}의 서비스업생산은 {changes}',
-            'consumption': '{region}의 소비는 {changes}',
-            'construction': '{region}의 건설은 {changes}',
-            'export': '{region}의 수출은 {changes}',
-            'import': '{region}의 수입은 {changes}',
-            'employment': '{region}의 고용률은 {changes}',
-            'unemployment': '{region}의 실업률은 {changes}',
-            'price': '{region}의 물가는 {changes}',
-            'migration': '{region}의 순인구이동은 {changes}',
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._section_narratives.clear()
+    
+    def _get_section_narratives(self, sector_key: str, region_name: str) -> Dict[str, List[str]]:
+        """부문 하나의 나레이션 (일괄 렌더링 중이면 17개 시도 일괄 생성, 아니면 요청 지역만)"""
+        narratives = self._section_narratives.get(sector_key)
+        if narratives is not None:
+            return narratives
+        if self._batch_depth == 0:
+            region_rows = {region_name: self._get_region_data_from_sector(sector_key, region_name)}
+            return get_narrative_compiler().narrate_regions(sector_key, region_rows)
+        region_rows = {
+            info['name']: self._get_region_data_from_sector(sector_key, info['name'])
+            for info in self.REGIONS.values()
         }
-        
-        template = template_map.get(sector_key, '{region}는 {changes}')
-        
-        # 증감 텍스트 생성
-        if change_rate is None:
-            changes_text = '변화'
-        else:
-            try:
-                change_float = float(change_rate)
-                _, result_noun, _ = get_terms(sector_key, change_float)
-                if abs(change_float) < 0.01:
-                    changes_text = '전년동기대비 보합'
-                elif sector_key == 'migration':
-                    # 순인구이동은 인원수(명)로 표시
-                    changes_text = f'전년동기대비 {abs(int(change_float)):,}명 {result_noun}'
-                else:
-                    changes_text = f'전년동기대비 {abs(change_float):.1f}% {result_noun}'
-            except (ValueError, TypeError):
-                changes_text = '변화'
-        
-        narrative_text = template.format(
-            region=region_name,
-            changes=changes_text
-        )
-        
-        return [narrative_text]
+        narratives = get_narrative_compiler().narrate_regions(sector_key, region_rows)
+        self._section_narratives[sector_key] = narratives
+        return narratives
     
     def extract_all_data(self, region: Optional[str] = None) -> Dict[str, Any]:
         """시도별 모든 데이터 추출
@@ -3507,7 +3756,11 @@ class RegionalReportGenerator(BaseGenerator):
             change_value = self._format_value(data.get(change_key))
             
             # 나레이션 생성
-            narrative = self._generate_section_narrative(region_name, sector_key, data)
+            narratives = self._get_section_narratives(sector_key, region_name)
+            if region_name in narratives:
+                narrative = list(narratives[region_name])
+            else:
+                narrative = self._generate_section_narrative(region_name, sector_key, data)
             
             return {
                 'table': {
@@ -3546,37 +3799,25 @@ class RegionalReportGenerator(BaseGenerator):
             'sections': sections,        # 하단 부문별 표 및 나레이션
         }
     
-    def render_html(self, region: str, template_path: str) -> str:
-        """시도별 HTML 보도자료 렌더링
-        
-        Args:
-            region: 지역 키 (e.g., 'region_seoul')
-            template_path: 템플릿 파일 경로
+    def _get_template(self, template_path: str):
+        """Jinja2 템플릿 로드 (경로별로 한 번만 컴파일)"""
+        template = self._templates.get(str(template_path))
+        if template is not None:
+            return template
         
-        Returns:
-            렌더링된 HTML 문자열
-        """
         from jinja2 import Environment, FileSystemLoader
         
         # 필터 임포트
         try:
             from utils.filters import format_value, is_missing
-            from utils.text_utils import get_josa, get_terms, get_comparative_terms
+            from utils.text_utils import get_josa
         except ImportError:
             import sys
             sys.path.insert(0, str(Path(__file__).parent.parent))
             from utils.filters import format_value, is_missing
-            from utils.text_utils import get_josa, get_terms, get_comparative_terms
+            from utils.text_utils import get_josa
         
-        # 데이터 추출
-        data = self.extract_all_data(region)
-        
-        # 데이터 검증
-        if not isinstance(data, dict):
-            print(f"[경고] 데이터가 dict가 아닙니다: {type(data)}")
-            data = {}
-        
-        # 템플릿 경로 및 렌더링
+        # 템플릿 경로 확인
         template_path_obj = Path(template_path)
         if not template_path_obj.exists():
             raise ValueError(f"템플릿 파일을 찾을 수 없습니다: {template_path}")
@@ -3590,6 +3831,35 @@ class RegionalReportGenerator(BaseGenerator):
         env.filters['josa'] = get_josa
         
         template = env.get_template(template_path_obj.name)
+        self._templates[str(template_path)] = template
+        return template
+    
+    def render_html(self, region: str, template_path: str) -> str:
+        """시도별 HTML 보도자료 렌더링
+        
+        Args:
+            region: 지역 키 (e.g., 'region_seoul')
+            template_path: 템플릿 파일 경로
+        
+        Returns:
+            렌더링된 HTML 문자열
+        """
+        try:
+            from utils.text_utils import get_terms, get_comparative_terms
+        except ImportError:
+            import sys
+            sys.path.insert(0, str(Path(__file__).parent.parent))
+            from utils.text_utils import get_terms, get_comparative_terms
+        
+        # 데이터 추출
+        data = self.extract_all_data(region)
+        
+        # 데이터 검증
+        if not isinstance(data, dict):
+            print(f"[경고] 데이터가 dict가 아닙니다: {type(data)}")
+            data = {}
+        
+        template = self._get_template(template_path)
         
         # 유틸리티 함수 데이터에 추가
         data['get_terms'] = get_terms
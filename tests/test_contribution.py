@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+기여도 순위 엔진 테스트
+
+rank_descending/ContributionRanking이 이전 정렬(sorted(..., reverse=True))과 같은 순서를
+만드는지(같은 값은 원래 순서), NaN 칸을 순위에서 빼는지, 비중 계산과 입력 검증을 확인합니다.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from services.contribution import ContributionRanking, pack_rows, rank_descending
+from templates.base_generator import BaseGenerator
+
+
+def _legacy_order(scores):
+    """이전 구현과 같은 안정 내림차순 정렬 위치"""
+    return [i for i, _ in sorted(enumerate(scores), key=lambda item: item[1], reverse=True)]
+
+
+def test_pack_rows_pads_ragged_rows_with_nan():
+    matrix = pack_rows([[1.0, None, 3.0], [], [4.0]])
+    assert matrix.shape == (3, 3)
+    np.testing.assert_array_equal(matrix[0], [1.0, np.nan, 3.0])
+    assert np.isnan(matrix[1]).all()
+    np.testing.assert_array_equal(matrix[2], [4.0, np.nan, np.nan])
+    assert pack_rows([]).shape == (0, 0)
+
+
+def test_rank_descending_keeps_tie_order():
+    scores = [2.0, 5.0, 2.0, 5.0, 0.0, 2.0]
+    assert rank_descending(scores)[0].tolist() == [1, 3, 0, 2, 5, 4]
+    assert rank_descending(scores)[0].tolist() == _legacy_order(scores)
+
+
+def test_rank_descending_matches_sorted_on_random_ties():
+    rng = random.Random(0)
+    for _ in range(200):
+        scores = [float(rng.choice([0, 1, 1.5, 2, 3])) for _ in range(rng.randint(1, 12))]
+        assert rank_descending(scores)[0].tolist() == _legacy_order(scores)
+
+
+def test_rank_descending_drops_nan_and_limits_top_n():
+    scores = np.array([
+        [1.0, np.nan, 3.0, 3.0],
+        [np.nan, np.nan, np.nan, np.nan],
+        [0.5, 2.0, np.nan, np.nan],
+    ])
+    order = rank_descending(scores)
+    assert [row.tolist() for row in order] == [[2, 3, 0], [], [1, 0]]
+
+    top = rank_descending(scores, top_n=2)
+    assert [row.tolist() for row in top] == [[2, 3], [], [1, 0]]
+    assert [row.tolist() for row in rank_descending(scores, top_n=-1)] == [[], [], []]
+
+
+def test_contribution_ranking_values_and_shares():
+    growth = np.array([[2.0, -3.0, 0.5], [0.0, 0.0, np.nan]])
+    weight = np.array([[1.0, 2.0, 4.0], [5.0, 1.0, np.nan]])
+    ranking = ContributionRanking(growth, weight)
+
+    np.testing.assert_allclose(ranking.contributions[0], [2.0, 6.0, 2.0])
+    np.testing.assert_allclose(ranking.shares[0], [0.2, 0.6, 0.2])
+    # 합계 0인 행은 비중 0, NaN 칸은 순위에서 제외
+    np.testing.assert_array_equal(ranking.shares[1], [0.0, 0.0, 0.0])
+    assert [row.tolist() for row in ranking.order] == [[1, 0, 2], [0, 1]]
+    assert not ranking.contributions.flags.writeable
+    assert not ranking.shares.flags.writeable
+
+
+def test_contribution_ranking_top_n_and_nan_detection():
+    growth = np.array([[np.inf, 1.0, 2.0]])
+    weight = np.array([[0.0, 3.0, 1.0]])
+    ranking = ContributionRanking(growth, weight, top_n=1)
+
+    # inf × 0 = NaN → 호출부가 이전 정렬로 대체할 수 있도록 알림
+    assert ranking.has_nan(0, 3)
+    assert not ranking.has_nan(0, 0)
+    assert ranking.order[0].tolist() == [1]
+
+
+def test_contribution_ranking_rejects_shape_mismatch():
+    with pytest.raises(ValueError):
+        ContributionRanking(np.zeros((2, 3)), np.zeros((2, 2)))
+
+
+class _RankingGenerator(BaseGenerator):
+    def extract_all_data(self):
+        return {}
+
+
+def _legacy_rank(generator, industries, top_n):
+    """엔진 도입 전 rank_by_contribution"""
+    for ind in industries:
+        weight = generator._contribution_weight(ind)
+        change_rate = generator.safe_float(ind.get('change_rate'), 0)
+        ind['contribution'] = abs(float(change_rate or 0.0) * weight)
+    return sorted(industries, key=lambda x: x.get('contribution', 0), reverse=True)[:top_n]
+
+
+def test_rank_by_contribution_matches_legacy_sort():
+    generator = object.__new__(_RankingGenerator)
+    rng = random.Random(1)
+    names = ['반도체', '자동차', '섬유', '식료품', '기계', '가구']
+    for _ in range(100):
+        industries = [
+            {
+                'name': rng.choice(names),
+                'change_rate': rng.choice([None, '-', -2.0, 0.0, 1.0, 1.0, 3.5]),
+                'weight': rng.choice([None, 0, 1.0, 2.0, 2.0]),
+            }
+            for _ in range(rng.randint(0, 8))
+        ]
+        expected = _legacy_rank(generator, [dict(ind) for ind in industries], 3)
+        actual = generator.rank_by_contribution([dict(ind) for ind in industries], 3)
+        assert actual == expected
+
+        regions = {'서울': [dict(ind) for ind in industries], '부산': [dict(ind) for ind in industries[::-1]]}
+        batch = generator.rank_regions_by_contribution(regions, 3)
+        assert batch['서울'] == expected
+        assert batch['부산'] == _legacy_rank(generator, [dict(ind) for ind in industries[::-1]], 3)
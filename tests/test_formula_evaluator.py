@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+분석 시트 수식 평가기 테스트
+
+evaluate_formula_grids에 0-based 값 배열을 넘겨 엑셀과 같은 계산값이 나오는지,
+지원하지 않는 수식/오류/순환 참조는 계산하지 않는지 확인합니다.
+"""
+
+import numpy as np
+import pytest
+
+from services.formula_evaluator import UnsupportedFormulaError, evaluate_formula_grids, parse_formula
+
+
+def _grid(rows):
+    """행 목록 → 직사각형 object 배열 (짧은 행은 None으로 채움)"""
+    width = max(len(row) for row in rows)
+    grid = np.full((len(rows), width), None, dtype=object)
+    for row_idx, row in enumerate(rows):
+        grid[row_idx, :len(row)] = row
+    return grid
+
+
+def _evaluate(rows, other_sheets=None, sheet_name='A 분석'):
+    other_sheets = {name: _grid(values) for name, values in (other_sheets or {}).items()}
+
+    def _load_values(name, n_rows, n_cols):
+        values = other_sheets.get(name)
+        return None if values is None else values[:n_rows, :n_cols]
+
+    results, formula_count = evaluate_formula_grids({sheet_name: _grid(rows)}, _load_values)
+    return results.get(sheet_name, {}), formula_count
+
+
+def test_arithmetic_and_operator_precedence():
+    cells, count = _evaluate([
+        [2, 3, '=A1+B1*2', '=(A1+B1)*2', '=B1^A1', '=-A1^2', '=B1/A1-1', '=50%*A1'],
+    ])
+    assert count == 6
+    assert cells[(0, 2)] == 8.0
+    assert cells[(0, 3)] == 10.0
+    assert cells[(0, 4)] == 9.0
+    # 엑셀은 단항 부호가 거듭제곱보다 우선
+    assert cells[(0, 5)] == 4.0
+    assert cells[(0, 6)] == pytest.approx(0.5)
+    assert cells[(0, 7)] == 1.0
+
+
+def test_copied_relative_formulas_follow_their_row():
+    cells, count = _evaluate([
+        [1, 10, '=B1-A1'],
+        [2, 30, '=B2-A2'],
+        [3, 60, '=B3-A3'],
+        [None, None, '=SUM(C1:C3)'],
+    ])
+    assert count == 4
+    assert [cells[(r, 2)] for r in range(3)] == [9.0, 28.0, 57.0]
+    assert cells[(3, 2)] == 94.0
+
+
+def test_absolute_and_cross_sheet_references():
+    cells, _ = _evaluate(
+        [
+            ['=\'B 집계\'!B2*$D$1', None, None, 10],
+            ['=\'B 집계\'!B3*$D$1'],
+            ["='B 집계'!A2"],
+        ],
+        other_sheets={'B 집계': [['지역', '값'], ['서울', 1.5], ['부산', 2]]},
+    )
+    assert cells[(0, 0)] == 15.0
+    assert cells[(1, 0)] == 20.0
+    # 단독 참조는 참조한 값 그대로 (문자열 포함)
+    assert cells[(2, 0)] == '서울'
+
+
+def test_chained_formulas_are_evaluated_in_dependency_order():
+    cells, _ = _evaluate([
+        ['=B1*2', '=C1+1', 4],
+    ])
+    assert cells[(0, 1)] == 5.0
+    assert cells[(0, 0)] == 10.0
+
+
+def test_if_and_comparisons():
+    cells, _ = _evaluate([
+        [5, 3, '=IF(A1>B1,A1-B1,0)', '=IF(A1<=B1,"작음","큼")', '=IF(A1=5,1)', '=IF(A1<>5,1)', '=A1>=B1'],
+    ])
+    assert cells[(0, 2)] == 2.0
+    assert cells[(0, 3)] == '큼'
+    assert cells[(0, 4)] == 1.0
+    # 거짓이고 세 번째 인자가 없으면 FALSE
+    assert cells[(0, 5)] is False
+    assert cells[(0, 6)] is True
+
+
+@pytest.mark.parametrize('formula, expected', [
+    ('=ROUND(2.5,0)', 3.0),
+    ('=ROUND(-2.5,0)', -3.0),
+    ('=ROUND(1.005,2)', 1.01),
+    ('=ROUND(1234.5678,-2)', 1200.0),
+    ('=ROUND(0.125,2)', 0.13),
+])
+def test_round_half_away_from_zero(formula, expected):
+    cells, _ = _evaluate([[formula]])
+    assert cells[(0, 0)] == pytest.approx(expected)
+
+
+def test_empty_cells_in_references():
+    cells, _ = _evaluate([
+        [None, '=A1', '=A1+1', '=SUM(A1:A3)'],
+    ])
+    # 빈 셀 단독 참조는 빈 값(결과 없음), 연산/함수에서는 0
+    assert (0, 1) not in cells
+    assert cells[(0, 2)] == 1.0
+    assert cells[(0, 3)] == 0.0
+
+
+def test_errors_and_unsupported_formulas_are_not_resolved():
+    cells, count = _evaluate([
+        [1, 0, '=A1/B1', '=C1+1', '=VLOOKUP(A1,B1:C1,1)', '=D1*2', "='없는 시트'!A1"],
+    ])
+    assert count == 5
+    # #DIV/0!과 이를 참조하는 수식, 지원하지 않는 함수, 없는 시트 참조는 계산하지 않음
+    assert cells == {}
+
+
+def test_circular_references_are_not_resolved():
+    cells, count = _evaluate([
+        ['=B1+1', '=A1+1', '=5*2'],
+    ])
+    assert count == 3
+    assert cells == {(0, 2): 10.0}
+
+
+def test_text_in_arithmetic_is_an_error():
+    cells, _ = _evaluate([
+        ['문자', '=A1+1', '=SUM(A1,2)'],
+    ])
+    assert (0, 1) not in cells
+    # SUM은 참조된 문자열을 건너뜀
+    assert cells[(0, 2)] == 2.0
+
+
+@pytest.mark.parametrize('formula', ['=A1:B2', '=IF(A1:A2,1,0)', '=ROUND(1)', '=1+', '=A1&B1'])
+def test_parse_formula_rejects_unsupported_forms(formula):
+    with pytest.raises(UnsupportedFormulaError):
+        parse_formula(formula, 'A 분석', 0, 0)
+
+
+def test_no_formulas():
+    assert _evaluate([[1, 2, '문자']]) == ({}, 0)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+시트 병렬 디코딩 테스트
+
+워커 프로세스가 만든 DataFrame이 직렬 디코딩 결과와 같고, float64 열이 공유 메모리 블록의
+뷰이며, unlink 후에도 이미 받은 DataFrame을 사용할 수 있는지 확인합니다.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+openpyxl = pytest.importorskip('openpyxl')
+
+from services.parallel_decode import decode_sheets_parallel
+from services.xlsx_stream_reader import StreamingExcelFile
+
+
+@pytest.fixture(scope='module')
+def workbook_path(tmp_path_factory):
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    for sheet_idx in range(3):
+        ws = wb.create_sheet(f'{sheet_idx} 집계')
+        ws.append(['지역', '코드', '2024', '2025', '비고'])
+        for row_idx in range(50):
+            ws.append([f'지역{row_idx}', row_idx, row_idx * 1.5 + sheet_idx, None if row_idx % 7 == 0 else row_idx / 3, '메모' if row_idx % 5 == 0 else None])
+    path = tmp_path_factory.mktemp('parallel') / 'parallel.xlsx'
+    wb.save(path)
+    return str(path)
+
+
+def test_parallel_frames_match_serial_and_share_memory(workbook_path):
+    with StreamingExcelFile(workbook_path) as xl:
+        sheet_names = xl.sheet_names
+        expected = {name: xl.parse(name, header=None) for name in sheet_names}
+
+    frames, blocks = decode_sheets_parallel(workbook_path, sheet_names, 2)
+    try:
+        assert set(frames) == set(sheet_names)
+        for name in sheet_names:
+            pd.testing.assert_frame_equal(frames[name], expected[name])
+        assert len(blocks) == len(sheet_names)
+
+        df = frames[sheet_names[0]]
+        float_columns = [col for col in df.columns if df[col].dtype == np.float64]
+        assert float_columns
+        assert any(np.shares_memory(df[col].to_numpy(), blocks[0].array) for col in float_columns)
+    finally:
+        for block in blocks:
+            block.unlink()
+
+    # unlink 후에도 매핑은 유지
+    pd.testing.assert_frame_equal(frames[sheet_names[0]], expected[sheet_names[0]])
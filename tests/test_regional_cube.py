@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+지역 큐브 테스트
+
+RegionalIndicatorCube.chart_data가 이전 부문 캐시 경로(_build_chart_data_from_sector_cache)와
+같은 증가/감소 순서(같은 값은 지역 순서 유지)와 값을 만드는지, region_row가 테이블 원본 값을
+그대로 돌려주는지 확인합니다.
+"""
+
+import pytest
+
+from services.regional_cube import RegionalIndicatorCube
+from services.summary_data import VALID_REGIONS, _build_chart_data_from_sector_cache
+
+
+class _FakeDataset:
+    """get_table_data/get_report_data만 제공하는 부문 데이터셋 대역"""
+
+    def __init__(self, table_data, nationwide_data=None):
+        self._table_data = table_data
+        self._nationwide_data = nationwide_data or {}
+
+    def get_table_data(self):
+        return self._table_data
+
+    def get_report_data(self):
+        return {'table_data': self._table_data, 'nationwide_data': self._nationwide_data}
+
+
+def _cube_for(table_data, nationwide_data=None):
+    dataset = _FakeDataset(table_data, nationwide_data)
+    cube = RegionalIndicatorCube(lambda indicator: dataset, 2025, 3)
+    return cube, cube.indicators[0]
+
+
+# 같은 증감률(1.5, -2.0, 0.0)이 여러 지역에 있어 정렬 안정성을 확인할 수 있는 표
+TIED_TABLE = [
+    {'region_name': '전국', 'value': 101.0, 'change_rate': 0.7},
+    {'region_name': '서울', 'value': 103.2, 'change_rate': 1.5},
+    {'region_name': '부산', 'value': 98.1, 'change_rate': -2.0},
+    {'region_name': '대구', 'value': 97.0, 'change_rate': 1.5},
+    {'region_name': '인천', 'value': 110.4, 'change_rate': 0.0},
+    {'region_name': '광주', 'value': 95.5, 'change_rate': -2.0},
+    {'region_name': '대전', 'value': None, 'change_rate': None},
+    {'region_name': '울산', 'value': 120.0, 'change_rate': 4.25},
+    {'region_name': '경기', 'value': 104.0, 'change_rate': 1.5},
+    {'region_name': '강원', 'value': 99.9, 'change_rate': -0.1},
+    {'region_name': '제주', 'value': 100.0, 'change_rate': 0.0},
+    # 세종/충북 등은 행이 없음 (증감률/값 0.0)
+]
+NATIONWIDE = {'growth_rate': 0.7, 'production_index': 101.0}
+
+
+@pytest.mark.parametrize('flags', [
+    {},
+    {'is_trade': True},
+    {'is_employment': True},
+])
+def test_chart_data_matches_sector_cache_path(flags):
+    cube, indicator = _cube_for(TIED_TABLE, NATIONWIDE)
+    expected = _build_chart_data_from_sector_cache(
+        {'data': {'table_data': TIED_TABLE, 'nationwide_data': NATIONWIDE}}, **flags
+    )
+    assert cube.chart_data(indicator, VALID_REGIONS, **flags) == expected
+
+
+def test_chart_data_orders_ties_by_region_order():
+    cube, indicator = _cube_for(TIED_TABLE, NATIONWIDE)
+    result = cube.chart_data(indicator, VALID_REGIONS)
+
+    assert [row['name'] for row in result['increase_regions']] == ['울산', '서울', '대구']
+    assert [row['name'] for row in result['decrease_regions']] == ['부산', '광주', '강원']
+    # 증감률 0.0과 행 없는 지역은 증가 쪽, 값 없는 행(대전)은 증감률 0.0/값 None
+    daejeon = next(row for row in result['chart_data'] if row['name'] == '대전')
+    sejong = next(row for row in result['chart_data'] if row['name'] == '세종')
+    assert daejeon['change'] == 0.0 and daejeon['index'] is None
+    assert sejong['change'] == 0.0 and sejong['index'] == 0.0
+    assert result['increase_count'] + result['decrease_count'] == len(VALID_REGIONS)
+    assert result['decrease_count'] == 3
+
+
+def test_chart_data_without_decreases_uses_placeholder():
+    table = [{'region_name': region, 'value': 100.0, 'change_rate': 1.0} for region in VALID_REGIONS]
+    cube, indicator = _cube_for(table)
+    result = cube.chart_data(indicator, VALID_REGIONS)
+    expected = _build_chart_data_from_sector_cache({'data': {'table_data': table}})
+
+    assert result == expected
+    assert result['decrease_regions'] == [{'name': '-', 'value': 0.0}]
+    assert [row['name'] for row in result['increase_regions']] == VALID_REGIONS[:3]
+
+
+def test_region_row_returns_raw_table_values():
+    table = [
+        {'region_name': '서울', 'value': '103.2', 'change_rate': '-'},
+        {'region_name': '서울', 'value': 1.0, 'change_rate': 2.0},
+        {'region': '부산', 'index': 5.0},
+    ]
+    cube, indicator = _cube_for(table)
+
+    # 같은 지역 행이 여러 개면 첫 행, 문자열은 변환하지 않음
+    assert cube.region_row(indicator, '서울') == {'region_name': '서울', 'value': '103.2', 'change_rate': '-'}
+    assert cube.region_row(indicator, '부산') == {'region_name': '부산', 'value': None, 'change_rate': None}
+    assert cube.region_row(indicator, '대구') is None
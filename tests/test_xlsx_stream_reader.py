@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+스트리밍 xlsx 리더 왕복 테스트
+
+openpyxl로 만든 워크북을 StreamingExcelFile과 pd.read_excel(header=None)로 각각 읽어
+값/dtype/행열 라벨이 같은지 확인합니다.
+"""
+
+import re
+import warnings
+import zipfile
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+openpyxl = pytest.importorskip('openpyxl')
+
+from services.xlsx_stream_reader import SheetArrays, StreamingExcelFile, XlsxStreamReader
+
+
+def _write_workbook(path, sheets):
+    """{시트명: 행 목록} → xlsx (None은 빈 셀)"""
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    for sheet_name, rows in sheets.items():
+        ws = wb.create_sheet(sheet_name)
+        for row_idx, row in enumerate(rows, start=1):
+            for col_idx, value in enumerate(row, start=1):
+                if value is not None:
+                    ws.cell(row=row_idx, column=col_idx, value=value)
+    wb.save(path)
+    _expand_empty_strings(path)
+    return path
+
+
+def _expand_empty_strings(path):
+    """openpyxl이 내용 없이 쓰는 빈 문자열 셀을 엑셀처럼 <is><t></t></is>로 기록"""
+    with zipfile.ZipFile(path) as src:
+        parts = {name: src.read(name) for name in src.namelist()}
+    for name, data in parts.items():
+        if name.startswith('xl/worksheets/'):
+            parts[name] = re.sub(rb'<c r="([A-Z]+\d+)" t="inlineStr" />', rb'<c r="\1" t="inlineStr"><is><t></t></is></c>', data)
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as dst:
+        for name, data in parts.items():
+            dst.writestr(name, data)
+
+
+def _assert_same_as_pandas(path, sheet_name, **kwargs):
+    expected = pd.read_excel(path, sheet_name=sheet_name, header=None, **kwargs)
+    with StreamingExcelFile(path) as xl:
+        actual = xl.parse(sheet_name, header=None, **kwargs)
+    pd.testing.assert_frame_equal(actual, expected)
+    return actual
+
+
+SHEETS = {
+    '집계': [
+        ['지역', '코드', '2023', '2024', '증감률'],
+        ['전국', 0, 101.5, 103, -0.25],
+        ['서울', 11, 99.0, 100.5, 1.5],
+        ['부산', 21, None, 98.25, None],
+        [None, None, None, None, None],
+        ['합계', 32, 200.5, 301.75, 1.25],
+    ],
+    '혼합': [
+        ['텍스트', 1, 2.5, True, datetime(2024, 3, 31)],
+        [3, '문자', None, False, 4.0],
+        [None, 5, 6, None, '끝'],
+    ],
+    '큰수': [
+        [1e20, -1e20, 2.0 ** 63, 2 ** 53, 1.5],
+        [123456789012, 1e15, -3, 0.0, 7],
+    ],
+    '후행빈칸': [
+        ['a', 1, '', ''],
+        ['b', 2, None, ''],
+        ['', '', None, None],
+        [None, '', None, None],
+    ],
+    '오류': [
+        ['#DIV/0!', 1, '#N/A'],
+        [2, '#REF!', 3],
+    ],
+    '빈시트': [],
+}
+
+
+@pytest.fixture(scope='module')
+def workbook_path(tmp_path_factory):
+    return str(_write_workbook(tmp_path_factory.mktemp('xlsx') / 'sample.xlsx', SHEETS))
+
+
+@pytest.mark.parametrize('sheet_name', list(SHEETS))
+def test_parse_matches_read_excel(workbook_path, sheet_name):
+    _assert_same_as_pandas(workbook_path, sheet_name)
+
+
+@pytest.mark.parametrize('nrows', [0, 1, 2, 4])
+def test_parse_nrows_matches_read_excel(workbook_path, nrows):
+    _assert_same_as_pandas(workbook_path, '집계', nrows=nrows)
+
+
+def test_large_integer_floats_do_not_overflow(workbook_path):
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        df = _assert_same_as_pandas(workbook_path, '큰수')
+    assert df.iloc[0, 0] == 1e20
+    assert df.iloc[0, 1] == -1e20
+
+
+def test_to_rows_converts_integers_outside_int64():
+    values = np.array([[1e20, 2.0 ** 63, -(2.0 ** 63), 3.0, 0.5, np.nan]])
+    labels = np.full(values.shape, None, dtype=object)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        rows = SheetArrays(values, labels, 0, 0).to_rows()
+    assert rows == [[10 ** 20, 2 ** 63, -(2 ** 63), 3, 0.5, '']]
+    assert all(type(value) is int for value in rows[0][:4])
+
+
+def test_trailing_blank_cells_are_trimmed(workbook_path):
+    reader = XlsxStreamReader(workbook_path)
+    try:
+        arrays = reader.read_sheet_arrays('후행빈칸')
+    finally:
+        reader.close()
+    # 빈 문자열만 있는 후행 행/열은 pandas와 같이 제외
+    assert arrays.shape == (2, 2)
+
+
+def test_sheet_names_and_index_selection(workbook_path):
+    with StreamingExcelFile(workbook_path) as xl:
+        assert xl.sheet_names == list(SHEETS)
+        pd.testing.assert_frame_equal(xl.parse(0, header=None), xl.parse('집계', header=None))
+
+
+def test_parse_rejects_header_rows(workbook_path):
+    with StreamingExcelFile(workbook_path) as xl:
+        with pytest.raises(ValueError):
+            xl.parse('집계', header=0)
+
+
+def test_range_bounds_keep_sheet_labels(workbook_path):
+    reader = XlsxStreamReader(workbook_path)
+    try:
+        df = reader.read_sheet('집계', (1, 4, 1, 4))
+    finally:
+        reader.close()
+    expected = pd.read_excel(workbook_path, sheet_name='집계', header=None).iloc[1:4, 1:4]
+    assert list(df.index) == [1, 2, 3]
+    assert list(df.columns) == [1, 2, 3]
+    np.testing.assert_array_equal(df.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+
+
+def test_date1904_workbook_uses_mac_epoch(tmp_path):
+    from openpyxl.utils.datetime import CALENDAR_MAC_1904
+
+    path = tmp_path / 'mac.xlsx'
+    wb = openpyxl.Workbook()
+    wb.epoch = CALENDAR_MAC_1904
+    ws = wb.active
+    ws.title = '날짜'
+    ws['A1'] = datetime(2024, 3, 31)
+    ws['B1'] = 1
+    wb.save(path)
+    with zipfile.ZipFile(path) as zf:
+        assert b'date1904' in zf.read('xl/workbook.xml')
+
+    df = _assert_same_as_pandas(str(path), '날짜')
+    assert df.iloc[0, 0] == pd.Timestamp(2024, 3, 31)
+
+
+def test_grid_grows_past_declared_dimension(workbook_path, monkeypatch):
+    expected = pd.read_excel(workbook_path, sheet_name='혼합', header=None)
+    # <dimension>이 실제보다 작거나 없는 파일도 배열을 확장해 같은 결과
+    for dimension in [(1, 1), None]:
+        monkeypatch.setattr(XlsxStreamReader, '_sheet_dimension', lambda self, name, d=dimension: d)
+        with StreamingExcelFile(workbook_path) as xl:
+            pd.testing.assert_frame_equal(xl.parse('혼합', header=None), expected)
+
+
+def test_intern_table_is_per_reader(workbook_path):
+    first = XlsxStreamReader(workbook_path)
+    second = XlsxStreamReader(workbook_path)
+    try:
+        first.read_sheet('집계')
+        assert '서울' in first._interned
+        assert second._interned == {}
+    finally:
+        first.close()
+        second.close()
+    assert first._interned == {}
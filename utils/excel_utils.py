@@ -42,14 +42,11 @@ def find_columns_by_period(df: pd.DataFrame, period_list: list, header_row: int
 엑셀 파일 관련 유틸리티 함수
 """
 
-import importlib.util
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 import pandas as pd
 
-from config.settings import TEMPLATES_DIR
-
 
 def get_previous_quarter():
     """현재 시점의 바로 이전 분기를 계산하여 반환
@@ -136,18 +133,9 @@ def get_period_context(target_year: int, target_quarter: int) -> Dict[str, Any]:
 
 
 def load_generator_module(generator_name):
-    """동적으로 generator 모듈 로드"""
-    generator_path = TEMPLATES_DIR / generator_name
-    if not generator_path.exists():
-        return None
-    
-    spec = importlib.util.spec_from_file_location(
-        generator_name.replace('.py', ''),
-        str(generator_path)
-    )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    """generator 모듈 로드 (전역 레지스트리 사용: 한 번만 import, 소스 변경 시에만 재로드)"""
+    from services.generator_registry import get_generator_module
+    return get_generator_module(generator_name)
 
 
 def extract_year_quarter_from_data(excel_path, default_year=None, default_quarter=None):
@@ -216,6 +204,42 @@ def extract_year_quarter_from_data(excel_path, default_year=None, default_quarte
         raise ValueError(f"데이터에서 연도/분기 추출 중 오류: {str(e)}")
 
 
+def _sniff_sheet_names(filepath) -> list:
+    """시트명 목록 (xlsx는 workbook.xml만 읽음, 그 외 형식은 pandas)"""
+    from services.workbook_sniffer import get_workbook_sniffer
+
+    try:
+        return get_workbook_sniffer(str(filepath)).sheet_names
+    except ValueError:
+        return list(pd.ExcelFile(filepath).sheet_names)
+
+
+def _sniff_cells(filepath, sheet_name: str, bounds: tuple) -> dict:
+    """범위 내 값이 있는 셀 {(행, 열): 값} (0-based, xlsx는 해당 행까지만 읽음)
+
+    Args:
+        bounds: (row_start, row_end, col_start, col_end) - 끝은 미포함
+    """
+    from services.workbook_sniffer import get_workbook_sniffer
+
+    try:
+        sniffer = get_workbook_sniffer(str(filepath))
+    except ValueError:
+        sniffer = None
+    if sniffer is not None:
+        return sniffer.read_cells(sheet_name, bounds)
+
+    row_start, row_end, col_start, col_end = bounds
+    df = pd.read_excel(filepath, sheet_name=sheet_name, header=None, nrows=row_end)
+    cells = {}
+    for row_idx in range(row_start, min(row_end, len(df))):
+        for col_idx in range(col_start, min(col_end, len(df.columns))):
+            value = df.iloc[row_idx, col_idx]
+            if pd.notna(value):
+                cells[(row_idx, col_idx)] = value
+    return cells
+
+
 def extract_year_quarter_from_excel(filepath, default_year=None, default_quarter=None):
     """엑셀 파일에서 최신 연도와 분기 추출 (분석표용) - 전면 재작성 버전
     
@@ -282,37 +306,33 @@ def extract_year_quarter_from_excel(filepath, default_year=None, default_quarter
     # 2순위: 엑셀 시트 정밀 탐색
     # ========================================
     try:
-        xl = pd.ExcelFile(filepath)
+        # 시트 전체를 파싱하지 않고 시트명과 필요한 셀만 zip에서 직접 읽음
+        sheet_names = set(_sniff_sheet_names(filepath))
         print(f"[연도/분기 추출] 2순위: 엑셀 시트 탐색 시작")
         
         # 2-1. '이용관련' 시트의 K17(연도), M17(분기) 확인
-        if '이용관련' in xl.sheet_names:
+        if '이용관련' in sheet_names:
             print(f"[연도/분기 추출] 2-1: '이용관련' 시트 확인 중...")
             try:
-                df_info = pd.read_excel(xl, sheet_name='이용관련', header=None)
+                # K17~M17 셀 (0-based: 행 16, 열 10~12)
+                info_cells = _sniff_cells(filepath, '이용관련', (16, 17, 10, 13))
                 
-                # K17 셀 (0-based: 행 16, 열 10)
-                if len(df_info) > 16 and len(df_info.columns) > 10:
-                    year_cell = df_info.iloc[16, 10]  # K17
-                    if pd.notna(year_cell):
-                        year_str = str(year_cell).strip()
-                        # 연도 추출 (숫자만)
-                        year_match = re.search(r'(\d{4})', year_str)
-                        if year_match:
-                            year = int(year_match.group(1))
-        
-                            # M17 셀 (0-based: 행 16, 열 12)
-                            if len(df_info.columns) > 12:
-                                quarter_cell = df_info.iloc[16, 12]  # M17
-                                if pd.notna(quarter_cell):
-                                    quarter_str = str(quarter_cell).strip()
-                                    # 분기 추출 (1-4 숫자)
-                                    quarter_match = re.search(r'(\d)', quarter_str)
-                                    if quarter_match:
-                                        quarter = int(quarter_match.group(1))
-                                        if 1 <= quarter <= 4:
-                                            print(f"[연도/분기 추출] ✅ 2-1 성공: '이용관련' 시트 K17/M17에서 추출 - {year}년 {quarter}분기")
-                                            return year, quarter
+                year_cell = info_cells.get((16, 10))  # K17
+                quarter_cell = info_cells.get((16, 12))  # M17
+                if year_cell is not None and pd.notna(year_cell):
+                    year_str = str(year_cell).strip()
+                    # 연도 추출 (숫자만)
+                    year_match = re.search(r'(\d{4})', year_str)
+                    if year_match and quarter_cell is not None and pd.notna(quarter_cell):
+                        year = int(year_match.group(1))
+                        quarter_str = str(quarter_cell).strip()
+                        # 분기 추출 (1-4 숫자)
+                        quarter_match = re.search(r'(\d)', quarter_str)
+                        if quarter_match:
+                            quarter = int(quarter_match.group(1))
+                            if 1 <= quarter <= 4:
+                                print(f"[연도/분기 추출] ✅ 2-1 성공: '이용관련' 시트 K17/M17에서 추출 - {year}년 {quarter}분기")
+                                return year, quarter
                 
                 print(f"[연도/분기 추출] 2-1 실패: '이용관련' 시트의 K17/M17에서 추출 실패")
             except Exception as e:
@@ -323,25 +343,19 @@ def extract_year_quarter_from_excel(filepath, default_year=None, default_quarter
         target_sheets = ['A 분석', 'B 분석', 'A(광공업생산)집계', 'B(서비스업생산)집계']
         
         for sheet_name in target_sheets:
-            if sheet_name not in xl.sheet_names:
+            if sheet_name not in sheet_names:
                 continue
             
             try:
-                # 헤더 행만 읽기 (2-3행, 0-based: 1-2행)
-                df = pd.read_excel(xl, sheet_name=sheet_name, header=None, nrows=3)
-                
-                if len(df) < 2:
-                    continue
+                # 헤더 행만 읽음 (2-3행, 0-based: 1-2행, 최대 30개 컬럼)
+                header_cells = _sniff_cells(filepath, sheet_name, (1, 3, 0, 30))
                 
                 # 헤더 행(1-2행, 0-based)에서 연도/분기 패턴 찾기
                 for row_idx in [1, 2]:
-                    if row_idx >= len(df):
-                        continue
-                    
                     # 모든 컬럼을 순회하며 패턴 찾기 (최대 30개 컬럼)
-                    for col_idx in range(min(30, len(df.columns))):
-                        cell_value = df.iloc[row_idx, col_idx]
-                        if pd.notna(cell_value):
+                    for col_idx in range(30):
+                        cell_value = header_cells.get((row_idx, col_idx))
+                        if cell_value is not None and pd.notna(cell_value):
                             cell_str = str(cell_value).strip()
                             
                             # 연도/분기 패턴
@@ -439,49 +453,48 @@ def extract_year_quarter_from_raw(filepath):
                 print(f"[기초자료 연도/분기 추출] 파일명에서 추출: {year}년 {quarter}분기")
                 return year, quarter
         
-        # 시트에서 연도/분기 정보 추출 시도
-        xl = pd.ExcelFile(filepath)
+        # 시트에서 연도/분기 정보 추출 시도 (시트명과 상단 10행만 읽음)
+        sheet_names = set(_sniff_sheet_names(filepath))
         
         # 기초자료 수집표의 주요 시트에서 헤더 확인
         target_sheets = ['광공업생산', '서비스업생산', '소비(소매, 추가)', '고용률']
         
         for sheet_name in target_sheets:
-            if sheet_name not in xl.sheet_names:
+            if sheet_name not in sheet_names:
                 continue
                 
             try:
-                df = pd.read_excel(xl, sheet_name=sheet_name, header=None, nrows=10)
+                header_cells = _sniff_cells(filepath, sheet_name, (0, 10, 0, 30))
                 
-                for row_idx in range(min(10, len(df))):
-                    for col_idx in range(min(30, len(df.columns))):
-                        cell = str(df.iloc[row_idx, col_idx])
-                        if pd.isna(df.iloc[row_idx, col_idx]):
-                            continue
-                        
-                        # "2025 2/4", "2025.2/4", "25.2/4", "2025년 2분기" 등 패턴 찾기
-                        patterns = [
-                            r'(\d{4})\s*\.?\s*(\d)/4',  # 2025 2/4, 2025.2/4
-                            r'(\d{2})\s*\.?\s*(\d)/4',   # 25 2/4, 25.2/4
-                            r'(\d{4})년\s*(\d)분기',      # 2025년 2분기
-                            r'(\d{2})년\s*(\d)분기',       # 25년 2분기
-                        ]
-                        
-                        for pattern in patterns:
-                            match = re.search(pattern, cell)
-                            if match:
-                                year_str = match.group(1)
-                                quarter = int(match.group(2))
-                                
-                                if len(year_str) == 2:
-                                    year = 2000 + int(year_str)
-                                else:
-                                    year = int(year_str)
-                                
-                                # 가장 최신 연도/분기 저장
-                                if year > latest_year or (year == latest_year and quarter > latest_quarter):
-                                    latest_year = year
-                                    latest_quarter = quarter
-                                    print(f"[기초자료 연도/분기 추출] {sheet_name}에서 발견: {year}년 {quarter}분기")
+                for (row_idx, col_idx), value in sorted(header_cells.items()):
+                    if pd.isna(value):
+                        continue
+                    cell = str(value)
+                    
+                    # "2025 2/4", "2025.2/4", "25.2/4", "2025년 2분기" 등 패턴 찾기
+                    patterns = [
+                        r'(\d{4})\s*\.?\s*(\d)/4',  # 2025 2/4, 2025.2/4
+                        r'(\d{2})\s*\.?\s*(\d)/4',   # 25 2/4, 25.2/4
+                        r'(\d{4})년\s*(\d)분기',      # 2025년 2분기
+                        r'(\d{2})년\s*(\d)분기',       # 25년 2분기
+                    ]
+                    
+                    for pattern in patterns:
+                        match = re.search(pattern, cell)
+                        if match:
+                            year_str = match.group(1)
+                            quarter = int(match.group(2))
+                            
+                            if len(year_str) == 2:
+                                year = 2000 + int(year_str)
+                            else:
+                                year = int(year_str)
+                            
+                            # 가장 최신 연도/분기 저장
+                            if year > latest_year or (year == latest_year and quarter > latest_quarter):
+                                latest_year = year
+                                latest_quarter = quarter
+                                print(f"[기초자료 연도/분기 추출] {sheet_name}에서 발견: {year}년 {quarter}분기")
             except Exception as e:
                 print(f"[경고] {sheet_name} 시트 읽기 실패: {e}")
                 continue
@@ -535,22 +548,11 @@ def detect_file_type(filepath: str) -> str:
             return 'analysis'
         
         # ========================================
-        # 2단계: 시트명만 빠르게 읽기 (openpyxl 사용 - pandas보다 빠름)
+        # 2단계: 시트명만 빠르게 읽기 (zip의 workbook.xml만 읽음)
         # ========================================
         print(f"[파일 유형 분석] 2단계: 시트명 읽기 시작...")
-        try:
-            import openpyxl
-            print(f"[파일 유형 분석] openpyxl로 파일 열기 시도...")
-            wb = openpyxl.load_workbook(filepath, read_only=True, data_only=False)
-            sheet_names = set(wb.sheetnames)
-            print(f"[파일 유형 분석] 시트명 읽기 완료: {len(sheet_names)}개 시트")
-            wb.close()
-        except Exception as e:
-            print(f"[파일 유형 분석] openpyxl 실패, pandas 사용: {e}")
-            # openpyxl 실패 시 pandas 사용 (fallback)
-            xl = pd.ExcelFile(filepath)
-            sheet_names = set(xl.sheet_names)
-            print(f"[파일 유형 분석] pandas로 시트명 읽기 완료: {len(sheet_names)}개 시트")
+        sheet_names = set(_sniff_sheet_names(filepath))
+        print(f"[파일 유형 분석] 시트명 읽기 완료: {len(sheet_names)}개 시트")
         
         sheet_count = len(sheet_names)
         
@@ -635,8 +637,7 @@ def get_file_type_details(filepath: str) -> dict:
         }
     """
     try:
-        xl = pd.ExcelFile(filepath)
-        sheet_names = set(xl.sheet_names)
+        sheet_names = set(_sniff_sheet_names(filepath))
         sheet_count = len(sheet_names)
         
         # 기초자료 전용 시트
@@ -717,8 +718,7 @@ def validate_sheet_structure(filepath: str, expected_type: str) -> dict:
         }
     """
     try:
-        xl = pd.ExcelFile(filepath)
-        sheet_names = set(xl.sheet_names)
+        sheet_names = set(_sniff_sheet_names(filepath))
         
         result = {
             'valid': True,
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+나레이션 컴파일러 (NarrativeCompiler)
+
+시도별 보도자료는 지역 × 부문마다 나레이션 템플릿 dict를 다시 만들고, 문장마다 어휘 타입과
+조사를 다시 판별했습니다. 이 모듈은 문장 패턴을 부문/패턴 단위로 한 번만 format 클로저로
+컴파일하고, 어휘(get_terms 조회표)와 조사(get_josa 메모)는 미리 계산된 값을 사용합니다.
+
+- 조사: REGION_DISPLAY_MAPPING의 지역명과 SECTOR_REPORTS name_mapping의 업종 표시명
+  (수출축약.csv 포함)을 처음 사용할 때 한 번 미리 계산
+- 문장: 부문별(시도별 섹션/지역경제동향) 및 패턴별(A~D) 클로저를 처음 요청 시 컴파일 후 보관
+- 일괄 생성: narrate_regions()로 한 부문의 전 지역 나레이션을 한 번에 생성
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from utils.text_utils import get_josa, get_terms, precompute_josa
+
+
+# 시도별 보도자료 부문 섹션 문장 ({region}, {changes})
+SECTION_TEMPLATES = {
+    'mining': '{region}의 광공업생산은 {changes}',
+    'service': '{region}의 서비스업생산은 {changes}',
+    'consumption': '{region}의 소비는 {changes}',
+    'construction': '{region}의 건설은 {changes}',
+    'export': '{region}의 수출은 {changes}',
+    'import': '{region}의 수입은 {changes}',
+    'employment': '{region}의 고용률은 {changes}',
+    'unemployment': '{region}의 실업률은 {changes}',
+    'price': '{region}의 물가는 {changes}',
+    'migration': '{region}의 순인구이동은 {changes}',
+}
+
+# 지역경제동향(시도별 통합) 부문 문장 ({region}, {products_phrase}, {changes})
+REGION_TEMPLATES = {
+    'mining': '{region}의 광공업생산은 {products_phrase}{changes}',
+    'service': '{region}의 서비스업생산은 {products_phrase}{changes}',
+    'consumption': '{region}의 소비는 {products_phrase}{changes}',
+    'construction': '{region}의 건설은 {products_phrase}{changes}',
+    'export': '{region}의 수출은 {products_phrase}{changes}',
+    'import': '{region}의 수입은 {products_phrase}{changes}',
+    'employment': '{region}의 고용률은 {changes}',
+    'unemployment': '{region}의 실업률은 {changes}',
+    'price': '{region}의 물가는 {products_phrase}{changes}',
+    'migration': '{region}의 순인구이동은 {changes}',
+}
+
+DEFAULT_TEMPLATE = '{region}는 {changes}'
+
+# [문서 2] 나레이션 패턴 A~D 문장
+# - A (순접): "[지역]은 [업종] 등이 늘어 전년동분기대비 5.2% 증가."
+# - B (역접): "[지역]은 [반대업종] 등이 줄었으나, [주요업종] 등이 늘어 5.2% 증가."
+# - C (보합): "[지역]은 [증가업종] 등은 늘었으나, [감소업종] 등이 줄어 보합."
+# - D (추세): "[지역]은 전분기 증가하였으나, 이번 분기 [업종] 등이 줄어 3.1% 감소."
+PATTERN_TEMPLATES = {
+    'pattern_a': '{region}{josa} {industries} 등이 {cause} 전년동분기대비 {rate:.1f}% {result}.',
+    'pattern_a_flat': '{region}{josa} 전년동분기대비 {result}.',
+    'pattern_b': '{region}{josa} {contrast} 등이 {opposite}, {industries} 등이 {cause} 전년동분기대비 {rate:.1f}% {result}.',
+    'pattern_c': '{region}{josa} {increase} 등은 늘었으나, {decrease} 등이 줄어 전년동분기대비 {result}.',
+    'pattern_d': '{region}{josa} 전분기 {prev_result}하였으나, 이번 분기 {industries} 등이 {cause} {rate:.1f}% {result}.',
+}
+
+SectionNarrator = Callable[[str, Optional[Dict[str, Any]]], List[str]]
+
+
+def _display_names() -> List[str]:
+    """조사를 미리 계산할 지역명/업종 표시명"""
+    from config.reports import REGION_DISPLAY_MAPPING, SECTOR_REPORTS
+
+    names = ['전국']
+    for short_name, full_name in REGION_DISPLAY_MAPPING.items():
+        names.extend((short_name, full_name))
+    for config in SECTOR_REPORTS:
+        names.extend((config.get('name_mapping') or {}).values())
+    return names
+
+
+def _compile_section(sector_key: str) -> SectionNarrator:
+    """부문 섹션 문장 → (지역명, 부문 데이터) → 나레이션 리스트 클로저"""
+    fmt = SECTION_TEMPLATES.get(sector_key, DEFAULT_TEMPLATE).format
+    _, up_result, _ = get_terms(sector_key, 1.0)
+    _, down_result, _ = get_terms(sector_key, -1.0)
+    is_migration = sector_key == 'migration'
+
+    def narrate(region_name: str, sector_data: Optional[Dict[str, Any]]) -> List[str]:
+        if not sector_data:
+            return []
+        change_rate = sector_data.get('change_rate')
+        if sector_data.get('value') is None:
+            return []
+
+        # 증감 텍스트 생성
+        if change_rate is None:
+            changes_text = '변화'
+        else:
+            try:
+                change_float = float(change_rate)
+                result_noun = up_result if change_float > 0 else down_result
+                if abs(change_float) < 0.01:
+                    changes_text = '전년동기대비 보합'
+                elif is_migration:
+                    # 순인구이동은 인원수(명)로 표시
+                    changes_text = f'전년동기대비 {abs(int(change_float)):,}명 {result_noun}'
+                else:
+                    changes_text = f'전년동기대비 {abs(change_float):.1f}% {result_noun}'
+            except (ValueError, TypeError):
+                changes_text = '변화'
+
+        return [fmt(region=region_name, changes=changes_text)]
+
+    return narrate
+
+
+def _compile_region_section(report_type: str) -> Callable[[str, Dict[str, Any], List[Dict[str, Any]]], List[str]]:
+    """지역경제동향 부문 문장 → (지역명, 지역 데이터, 상위 업종) → 나레이션 리스트 클로저"""
+    fmt = REGION_TEMPLATES.get(report_type, DEFAULT_TEMPLATE).format
+    _, up_result, _ = get_terms(report_type, 1.0)
+    _, down_result, _ = get_terms(report_type, -1.0)
+
+    def narrate(region_name: str, region_data: Dict[str, Any], top_industries: List[Dict[str, Any]]) -> List[str]:
+        change_rate = region_data.get('change_rate')
+        if region_data.get('value') is None:
+            return []
+
+        # 제품/항목 텍스트 생성
+        products_text = ''
+        if top_industries:
+            products_text = ', '.join(ind.get('name', '') for ind in top_industries[:2] if ind.get('name'))
+        products_phrase = f"{products_text}이 " if products_text else ''
+
+        # 증감 텍스트 (어휘 매핑 준수)
+        if change_rate is None:
+            changes_text = '변화'
+        elif abs(change_rate) < 0.01:
+            changes_text = '전년동기대비 보합'
+        else:
+            result_noun = up_result if change_rate > 0 else down_result
+            changes_text = f'전년동기대비 {abs(change_rate):.1f}% {result_noun}'
+
+        return [fmt(region=region_name, products_phrase=products_phrase, changes=changes_text)]
+
+    return narrate
+
+
+def _compile_pattern(pattern: str) -> Callable[..., str]:
+    """[문서 2] 패턴 문장 → (지역명, 증감률, 전분기 증감률, 주요/반대 업종, report_id) → 문장 클로저"""
+    if pattern == 'pattern_a':
+        fmt = PATTERN_TEMPLATES['pattern_a'].format
+        flat_fmt = PATTERN_TEMPLATES['pattern_a_flat'].format
+
+        def narrate(region, growth_rate, prev_rate, main_industries, contrast_industries, report_id):
+            josa = get_josa(region, "은/는")
+            industries_str = ', '.join(main_industries[:3]) if main_industries else "주요 업종"
+            cause_verb, result_noun, _ = get_terms(report_id, growth_rate)
+            if cause_verb is None:  # 보합 예외 처리
+                return flat_fmt(region=region, josa=josa, result=result_noun)
+            return fmt(region=region, josa=josa, industries=industries_str, cause=cause_verb,
+                       rate=abs(growth_rate), result=result_noun)
+
+    elif pattern == 'pattern_b':
+        fmt = PATTERN_TEMPLATES['pattern_b'].format
+
+        def narrate(region, growth_rate, prev_rate, main_industries, contrast_industries, report_id):
+            cause_verb, result_noun, _ = get_terms(report_id, growth_rate)
+            industries_str = ', '.join(main_industries[:3]) if main_industries else "주요 업종"
+            contrast_str = ', '.join(contrast_industries[:2]) if contrast_industries else "일부 업종"
+            # 반대 방향 어휘
+            opposite_verb = "줄었으나" if growth_rate > 0 else "늘었으나"
+            return fmt(region=region, josa=get_josa(region, "은/는"), contrast=contrast_str,
+                       opposite=opposite_verb, industries=industries_str, cause=cause_verb,
+                       rate=abs(growth_rate), result=result_noun)
+
+    elif pattern == 'pattern_c':
+        fmt = PATTERN_TEMPLATES['pattern_c'].format
+
+        def narrate(region, growth_rate, prev_rate, main_industries, contrast_industries, report_id):
+            _, result_noun, _ = get_terms(report_id, growth_rate)
+            inc_str = ', '.join(main_industries[:2]) if main_industries else "일부 업종"
+            dec_str = ', '.join(contrast_industries[:2]) if contrast_industries else "일부 업종"
+            return fmt(region=region, josa=get_josa(region, "은/는"), increase=inc_str,
+                       decrease=dec_str, result=result_noun)
+
+    elif pattern == 'pattern_d':
+        fmt = PATTERN_TEMPLATES['pattern_d'].format
+
+        def narrate(region, growth_rate, prev_rate, main_industries, contrast_industries, report_id):
+            cause_verb, result_noun, _ = get_terms(report_id, growth_rate)
+            if prev_rate is not None:
+                _, prev_result, _ = get_terms(report_id, prev_rate)
+            else:
+                prev_result = "변동"
+            industries_str = ', '.join(main_industries[:3]) if main_industries else "주요 업종"
+            return fmt(region=region, josa=get_josa(region, "은/는"), prev_result=prev_result,
+                       industries=industries_str, cause=cause_verb, rate=abs(growth_rate), result=result_noun)
+
+    else:
+        def narrate(region, growth_rate, prev_rate, main_industries, contrast_industries, report_id):
+            # Fallback (도달 불가능)
+            return f"{region}{get_josa(region, '은/는')} [패턴 오류: {pattern}]"
+
+    return narrate
+
+
+class NarrativeCompiler:
+    """부문/패턴별 컴파일된 나레이션 클로저 보관소 (Thread-safe)"""
+
+    def __init__(self, display_names: Optional[Callable[[], Iterable[str]]] = _display_names):
+        self._display_names = display_names
+        self._sections: Dict[str, SectionNarrator] = {}
+        self._region_sections: Dict[str, Callable[..., List[str]]] = {}
+        self._patterns: Dict[str, Callable[..., str]] = {}
+        self._josa_ready = False
+        self._lock = threading.Lock()
+
+    def _ensure_josa(self) -> None:
+        """지역명/업종 표시명 조사 미리 계산 (처음 한 번)"""
+        if self._josa_ready:
+            return
+        with self._lock:
+            if self._josa_ready:
+                return
+            try:
+                count = precompute_josa(self._display_names() if self._display_names else ())
+                print(f"[나레이션] ✅ 조사 미리 계산: {count}개")
+            except Exception as e:
+                print(f"[나레이션] 조사 미리 계산 실패 (호출 시 계산): {e}")
+            self._josa_ready = True
+
+    def _compiled(self, cache: Dict[str, Callable], key: str, compile_fn: Callable[[str], Callable]) -> Callable:
+        narrate = cache.get(key)
+        if narrate is None:
+            self._ensure_josa()
+            with self._lock:
+                narrate = cache.get(key)
+                if narrate is None:
+                    narrate = compile_fn(key)
+                    cache[key] = narrate
+        return narrate
+
+    def section(self, sector_key: str) -> SectionNarrator:
+        """시도별 부문 섹션 나레이션 클로저 (지역명, 부문 데이터) → 나레이션 리스트"""
+        return self._compiled(self._sections, sector_key, _compile_section)
+
+    def region_section(self, report_type: str) -> Callable[..., List[str]]:
+        """지역경제동향 부문 나레이션 클로저 (지역명, 지역 데이터, 상위 업종) → 나레이션 리스트"""
+        return self._compiled(self._region_sections, report_type, _compile_region_section)
+
+    def pattern(self, pattern: str) -> Callable[..., str]:
+        """[문서 2] 패턴 문장 클로저 (지역명, 증감률, 전분기 증감률, 주요 업종, 반대 업종, report_id) → 문장"""
+        return self._compiled(self._patterns, pattern, _compile_pattern)
+
+    def narrate_regions(
+        self,
+        sector_key: str,
+        region_rows: Mapping[str, Optional[Dict[str, Any]]]
+    ) -> Dict[str, List[str]]:
+        """한 부문의 전 지역 나레이션 일괄 생성 {지역명: 나레이션 리스트}"""
+        narrate = self.section(sector_key)
+        return {region_name: narrate(region_name, data) for region_name, data in region_rows.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sections.clear()
+            self._region_sections.clear()
+            self._patterns.clear()
+
+    def get_info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'sections': sorted(self._sections),
+                'region_sections': sorted(self._region_sections),
+                'patterns': sorted(self._patterns),
+                'josa_ready': self._josa_ready,
+            }
+
+
+# 전역 나레이션 컴파일러 인스턴스
+_narrative_compiler = NarrativeCompiler()
+
+
+def get_narrative_compiler() -> NarrativeCompiler:
+    """전역 나레이션 컴파일러 가져오기"""
+    return _narrative_compiler
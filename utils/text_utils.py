@@ -5,7 +5,8 @@
 어휘 통제 센터: 보고서 종류별 단어 사용 통제
 """
 
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Iterable, List, Dict, Optional, Tuple
 
 # ============================================================================
 # 어휘 통제 센터: 보고서 유형별 어휘 상수 (Master Vocabulary)
@@ -60,6 +61,25 @@ REPORT_TYPE_MAP = {
     'unemployment_rate': 'price',          # 실업률 (별칭)
 }
 
+# 어휘 타입별 (보합, 증가, 감소) 단어 세트 (get_terms 조회표, import 시 한 번 구성)
+_TERMS_TABLE: Dict[str, Tuple[Tuple[Optional[str], str, str], ...]] = {
+    n_type: (
+        (None, "보합", ""),
+        (vocabs['cause_up'], vocabs['result_up'], vocabs['conjunction_up']),
+        (vocabs['cause_down'], vocabs['result_down'], vocabs['conjunction_down']),
+    )
+    for n_type, vocabs in NARRATIVE_MAP.items()
+}
+
+# 어휘 타입별 (상승/증가 시, 하락/감소 시) 비교 표현 (get_comparative_terms 조회표)
+_COMPARATIVE_TABLE: Dict[str, Tuple[Tuple[str, str], Tuple[str, str]]] = {
+    n_type: (
+        (f"{vocabs['result_up']}률이 낮았으나", "높음"),
+        (f"{vocabs['result_down']}률이 낮았으나", "높음"),
+    )
+    for n_type, vocabs in NARRATIVE_MAP.items()
+}
+
 # ============================================================================
 # 푸터 통제 센터: 보고서별 자료 출처 매핑 (PDF 기준)
 # ============================================================================
@@ -128,18 +148,14 @@ def get_terms(report_id: str, value: float) -> Tuple[Optional[str], str, str]:
         - 활용형은 결과 서술어 뒤에 붙는 형태 (예: "증가하였으나", "감소하였으나")
     """
     # 1. 타입 결정 (기본값은 quantity)
-    n_type = REPORT_TYPE_MAP.get(report_id, 'quantity')
-    vocabs = NARRATIVE_MAP[n_type]
+    terms = _TERMS_TABLE[REPORT_TYPE_MAP.get(report_id, 'quantity')]
     
     # 2. 보합 처리 (최우선)
     if abs(value) < 0.01:  # 0.0%로 간주
-        return (None, "보합", "")
+        return terms[0]
     
     # 3. 증감 처리
-    if value > 0:
-        return vocabs['cause_up'], vocabs['result_up'], vocabs['conjunction_up']
-    else:
-        return vocabs['cause_down'], vocabs['result_down'], vocabs['conjunction_down']
+    return terms[1] if value > 0 else terms[2]
 
 
 def get_comparative_terms(report_id: str, nationwide_direction: int) -> Tuple[str, str]:
@@ -159,21 +175,9 @@ def get_comparative_terms(report_id: str, nationwide_direction: int) -> Tuple[st
         - 전국이 상승일 때: "상승률이 낮았으나" / "높음"
         - 전국이 하락일 때: "하락률이 낮았으나" / "높음"
     """
-    n_type = REPORT_TYPE_MAP.get(report_id, 'price')
-    vocabs = NARRATIVE_MAP[n_type]
-    
-    if nationwide_direction >= 0:
-        # 상승/증가 시
-        result_verb = vocabs['result_up']  # "상승" 또는 "증가"
-        low_expression = f"{result_verb}률이 낮았으나"
-        high_expression = "높음"
-    else:
-        # 하락/감소 시
-        result_verb = vocabs['result_down']  # "하락" 또는 "감소"
-        low_expression = f"{result_verb}률이 낮았으나"
-        high_expression = "높음"
-    
-    return low_expression, high_expression
+    low_high = _COMPARATIVE_TABLE[REPORT_TYPE_MAP.get(report_id, 'price')]
+    # 상승/증가 시 첫 번째, 하락/감소 시 두 번째 표현
+    return low_high[0] if nationwide_direction >= 0 else low_high[1]
 
 
 def get_cause_verb(value: float, report_id: str = 'quantity') -> str:
@@ -195,7 +199,7 @@ def get_cause_verb(value: float, report_id: str = 'quantity') -> str:
     if value == 0:
         return "보합세를 보여"
     
-    cause_verb, _ = get_terms(report_id, value)
+    cause_verb, _, _ = get_terms(report_id, value)
     return cause_verb
 
 
@@ -240,6 +244,20 @@ def get_josa(word: str, josa_pair: str = "은/는") -> str:
     if not word:
         return ""
     
+    try:
+        return _josa_of(word, josa_pair)
+    except TypeError:
+        # 조사 쌍이 해시 불가능한 값이면 메모 없이 계산
+        return _josa_of.__wrapped__(word, josa_pair)
+
+
+# 조사를 미리 계산해 두는 조사 쌍 (precompute_josa 기본값)
+JOSA_PAIRS = ("은/는", "이/가", "을/를", "와/과")
+
+
+@lru_cache(maxsize=8192)
+def _josa_of(word: str, josa_pair: str) -> str:
+    """비어 있지 않은 문자열 word의 조사 (get_josa 메모 본체)"""
     # 호환성: 기존 type 파라미터 지원
     if josa_pair in ["Topic", "Subject"]:
         if josa_pair == "Topic":
@@ -272,6 +290,24 @@ def get_josa(word: str, josa_pair: str = "은/는") -> str:
         return "는"
 
 
+def precompute_josa(words: Iterable[str], josa_pairs: Iterable[str] = JOSA_PAIRS) -> int:
+    """
+    지역명/업종명 등 자주 쓰는 단어의 조사를 미리 계산해 메모에 채움
+    
+    Returns:
+        int: 채운 (단어, 조사 쌍) 수
+    """
+    josa_pairs = tuple(josa_pairs)
+    count = 0
+    for word in words:
+        if not isinstance(word, str) or not word:
+            continue
+        for josa_pair in josa_pairs:
+            _josa_of(word, josa_pair)
+            count += 1
+    return count
+
+
 def get_contrast_narrative(nationwide_val: float, inc_regions: List[Dict], dec_regions: List[Dict], report_id: str = 'quantity') -> str:
     """
     지그재그 화법을 사용한 대조 나레이션 생성
@@ -294,8 +330,8 @@ def get_contrast_narrative(nationwide_val: float, inc_regions: List[Dict], dec_r
     """
     
     # 어휘 세트 가져오기
-    inc_cause, inc_result = get_terms(report_id, 1.0)  # 증가 지역용 (양수)
-    dec_cause, dec_result = get_terms(report_id, -1.0)  # 감소 지역용 (음수)
+    inc_cause, inc_result, _ = get_terms(report_id, 1.0)  # 증가 지역용 (양수)
+    dec_cause, dec_result, _ = get_terms(report_id, -1.0)  # 감소 지역용 (음수)
     
     # 1. 지역 텍스트 포맷팅 (리스트가 비었을 때 방어 로직 포함)
     if inc_regions: